@@ -7,9 +7,10 @@ from __future__ import annotations
 import os
 import sqlite3
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 from doctor.checks import (
-    _build_local_entity_set,
     check_backlog_status,
     check_brainstorm_status,
     check_branch_consistency,
@@ -26,6 +27,7 @@ from doctor.checks import (
     check_workflow_phase,
 )
 from doctor.models import CheckResult, DiagnosticReport, Issue
+from doctor.snapshot import build_snapshot
 
 
 # Ordered list of all check functions
@@ -46,6 +48,10 @@ CHECK_ORDER = [
     check_stale_worktrees,
 ]
 
+# Upper bound on concurrently running checks. Most checks are I/O bound
+# (git subprocesses, stat calls, SQLite reads), so this is not tied to CPUs.
+DEFAULT_MAX_WORKERS = 8
+
 # Checks that require entity DB
 _ENTITY_DB_CHECKS = {
     "check_feature_status",
@@ -86,20 +92,86 @@ def _make_failed_result(check_fn, message: str, fix_hint: str | None = None) ->
     )
 
 
+def _run_check(check_fn, ctx: dict, scope: set[str] | None = None) -> CheckResult:
+    """Run one check with per-check exception isolation."""
+    if scope is not None:
+        ctx = {**ctx, "scope": scope}
+    try:
+        return check_fn(**ctx)
+    except Exception as exc:
+        return _make_failed_result(check_fn, f"Check failed with exception: {exc}")
+
+
+def _run_checks_concurrently(
+    check_fns: list,
+    ctx: dict,
+    max_workers: int,
+    scopes: dict[str, set[str] | None] | None = None,
+) -> list[CheckResult]:
+    """Run independent checks on a thread pool, preserving input order.
+
+    Each check still measures its own elapsed_ms. With max_workers <= 1
+    (or a single check) the checks run sequentially on the calling thread.
+    """
+    scopes = scopes or {}
+    if max_workers <= 1 or len(check_fns) <= 1:
+        return [
+            _run_check(fn, ctx, scopes.get(fn.__name__)) for fn in check_fns
+        ]
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(check_fns)),
+        thread_name_prefix="pd-doctor",
+    ) as pool:
+        futures = [
+            pool.submit(_run_check, fn, ctx, scopes.get(fn.__name__))
+            for fn in check_fns
+        ]
+        return [f.result() for f in futures]
+
+
 def run_diagnostics(
     entities_db_path: str,
     memory_db_path: str,
     artifacts_root: str,
     project_root: str,
+    max_workers: int = DEFAULT_MAX_WORKERS,
 ) -> DiagnosticReport:
     """Run all diagnostic checks and return a structured report.
 
     Opens SQLite connections directly (not via MCP).
-    Checks run sequentially. DB Readiness (Check 8) runs first.
-    If a DB is locked, checks requiring it are skipped with an error issue.
+    DB Readiness (Check 8) runs first and gates the rest: if a DB is locked,
+    checks requiring it are skipped with an error issue. The entity tables
+    and artifact tree are then loaded once into a shared read-only
+    DoctorSnapshot, and the remaining checks run concurrently on up to
+    ``max_workers`` threads. Report order always follows CHECK_ORDER.
     """
     start = time.monotonic()
-    results: list[CheckResult] = []
+    results = _execute_checks(
+        entities_db_path, memory_db_path, artifacts_root, project_root,
+        max_workers=max_workers,
+    )
+    return _assemble_report(results, start)
+
+
+def _execute_checks(
+    entities_db_path: str,
+    memory_db_path: str,
+    artifacts_root: str,
+    project_root: str,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    select: Callable[[dict, list[str]], dict[str, set[str] | None]] | None = None,
+) -> dict[str, CheckResult]:
+    """Run readiness gating plus the selected checks; return results by fn name.
+
+    ``select(ctx, runnable_names)`` is called once readiness has passed, with
+    the open connections in ``ctx``. It returns the checks to actually run,
+    mapped to an optional feature-slug scope (None = whole project). Checks
+    it omits are absent from the returned dict so the caller can fill them
+    in (e.g. from the incremental cache). Without ``select`` everything
+    runnable runs unscoped.
+    """
+    results: dict[str, CheckResult] = {}
 
     # Self-resolve config for base_branch
     base_branch = "main"
@@ -116,21 +188,24 @@ def run_diagnostics(
     entity_db_exists = os.path.isfile(entities_db_path)
     memory_db_exists = os.path.isfile(memory_db_path)
 
-    # Build local entity IDs
-    local_entity_ids = _build_local_entity_set(artifacts_root)
-
     # Open connections (only if files exist)
     entities_conn = None
     memory_conn = None
 
     try:
+        # Connections are shared read-only across check threads; each
+        # check gets the same snapshot instead of issuing its own scans.
         if entity_db_exists:
-            entities_conn = sqlite3.connect(entities_db_path, timeout=5.0)
+            entities_conn = sqlite3.connect(
+                entities_db_path, timeout=5.0, check_same_thread=False,
+            )
             entities_conn.execute("PRAGMA busy_timeout = 5000")
             entities_conn.execute("PRAGMA journal_mode = WAL")
 
         if memory_db_exists:
-            memory_conn = sqlite3.connect(memory_db_path, timeout=5.0)
+            memory_conn = sqlite3.connect(
+                memory_db_path, timeout=5.0, check_same_thread=False,
+            )
             memory_conn.execute("PRAGMA busy_timeout = 5000")
             memory_conn.execute("PRAGMA journal_mode = WAL")
 
@@ -143,106 +218,121 @@ def run_diagnostics(
             "artifacts_root": artifacts_root,
             "project_root": project_root,
             "base_branch": base_branch,
-            "local_entity_ids": local_entity_ids,
         }
 
-        # Track skip conditions
-        entity_db_ok = True
+        # Phase 1: DB Readiness gates every other check
+        entity_db_ok = entity_db_exists
         memory_db_ok = True
+        if not entity_db_exists and not memory_db_exists:
+            results["check_db_readiness"] = CheckResult(
+                name="db_readiness",
+                passed=False,
+                issues=[
+                    Issue(
+                        check="db_readiness",
+                        severity="error",
+                        entity=None,
+                        message=f"Entity DB not found: {entities_db_path}",
+                        fix_hint=None,
+                    ),
+                    Issue(
+                        check="db_readiness",
+                        severity="error",
+                        entity=None,
+                        message=f"Memory DB not found: {memory_db_path}",
+                        fix_hint=None,
+                    ),
+                ],
+                elapsed_ms=0,
+                extras={"entity_db_ok": False, "memory_db_ok": False},
+            )
+            memory_db_ok = False
+        elif not entity_db_exists:
+            # Still run memory checks on db_readiness
+            results["check_db_readiness"] = CheckResult(
+                name="db_readiness",
+                passed=False,
+                issues=[
+                    Issue(
+                        check="db_readiness",
+                        severity="error",
+                        entity=None,
+                        message=f"Entity DB not found: {entities_db_path}",
+                        fix_hint=None,
+                    ),
+                ],
+                elapsed_ms=0,
+                extras={"entity_db_ok": False, "memory_db_ok": True},
+            )
+        else:
+            # Memory DB may be missing here: the check reports it itself
+            try:
+                readiness = check_db_readiness(**ctx)
+                entity_db_ok = readiness.extras.get("entity_db_ok", True)
+                memory_db_ok = readiness.extras.get("memory_db_ok", True)
+            except Exception as exc:
+                readiness = _make_failed_result(
+                    check_db_readiness, f"Check failed with exception: {exc}"
+                )
+            results["check_db_readiness"] = readiness
 
+        # Phase 2: resolve skips for the remaining checks
+        runnable = []
         for check_fn in CHECK_ORDER:
             fn_name = check_fn.__name__
+            if fn_name == "check_db_readiness":
+                continue
 
             # Handle missing DB files
             if not entity_db_exists and fn_name in _ENTITY_DB_CHECKS:
-                results.append(_make_failed_result(
+                results[fn_name] = _make_failed_result(
                     check_fn, "entity DB file not found"
-                ))
+                )
                 continue
             if not memory_db_exists and fn_name in _MEMORY_DB_CHECKS:
-                results.append(_make_failed_result(
+                results[fn_name] = _make_failed_result(
                     check_fn, "memory DB file not found"
-                ))
+                )
                 continue
 
-            # Handle missing DB files for check_db_readiness
-            if fn_name == "check_db_readiness":
-                if not entity_db_exists and not memory_db_exists:
-                    result = CheckResult(
-                        name="db_readiness",
-                        passed=False,
-                        issues=[
-                            Issue(
-                                check="db_readiness",
-                                severity="error",
-                                entity=None,
-                                message=f"Entity DB not found: {entities_db_path}",
-                                fix_hint=None,
-                            ),
-                            Issue(
-                                check="db_readiness",
-                                severity="error",
-                                entity=None,
-                                message=f"Memory DB not found: {memory_db_path}",
-                                fix_hint=None,
-                            ),
-                        ],
-                        elapsed_ms=0,
-                        extras={"entity_db_ok": False, "memory_db_ok": False},
-                    )
-                    results.append(result)
-                    entity_db_ok = False
-                    memory_db_ok = False
-                    continue
-                elif not entity_db_exists:
-                    result = CheckResult(
-                        name="db_readiness",
-                        passed=False,
-                        issues=[
-                            Issue(
-                                check="db_readiness",
-                                severity="error",
-                                entity=None,
-                                message=f"Entity DB not found: {entities_db_path}",
-                                fix_hint=None,
-                            ),
-                        ],
-                        elapsed_ms=0,
-                        extras={"entity_db_ok": False, "memory_db_ok": True},
-                    )
-                    # Still run memory checks on db_readiness
-                    results.append(result)
-                    entity_db_ok = False
-                    continue
-                elif not memory_db_exists:
-                    # Run check_db_readiness but patch memory path handling
-                    pass  # Fall through to normal execution
-
             # Skip checks based on DB lock status (from check 8 results)
-            if fn_name != "check_db_readiness":
-                if not entity_db_ok and fn_name in _ENTITY_DB_CHECKS:
-                    results.append(_make_failed_result(
-                        check_fn, "Skipped: entity DB locked or unavailable"
-                    ))
-                    continue
-                if not memory_db_ok and fn_name in _MEMORY_DB_CHECKS:
-                    results.append(_make_failed_result(
-                        check_fn, "Skipped: memory DB locked or unavailable"
-                    ))
-                    continue
-
-            # Run the check with per-check exception isolation
-            try:
-                result = check_fn(**ctx)
-                results.append(result)
+            if not entity_db_ok and fn_name in _ENTITY_DB_CHECKS:
+                results[fn_name] = _make_failed_result(
+                    check_fn, "Skipped: entity DB locked or unavailable"
+                )
+                continue
+            if not memory_db_ok and fn_name in _MEMORY_DB_CHECKS:
+                results[fn_name] = _make_failed_result(
+                    check_fn, "Skipped: memory DB locked or unavailable"
+                )
+                continue
 
-                # After check_db_readiness, update skip flags
-                if fn_name == "check_db_readiness":
-                    entity_db_ok = result.extras.get("entity_db_ok", True)
-                    memory_db_ok = result.extras.get("memory_db_ok", True)
+            runnable.append(check_fn)
 
-            except Exception as exc:
-                results.append(_make_failed_result(check_fn, f"Check failed with exception: {exc}"))
+        scopes: dict[str, set[str] | None] = {
+            fn.__name__: None for fn in runnable
+        }
+        if select is not None:
+            ctx["entity_db_ok"] = entity_db_ok
+            ctx["memory_db_ok"] = memory_db_ok
+            scopes = select(ctx, list(scopes))
+            runnable = [fn for fn in runnable if fn.__name__ in scopes]
+
+        if runnable:
+            # Phase 3: load the shared snapshot once (entity tables only
+            # when the entity DB passed readiness)
+            snapshot = build_snapshot(
+                entities_conn if entity_db_ok else None, artifacts_root,
+            )
+            ctx["snapshot"] = snapshot
+            ctx["local_entity_ids"] = set(snapshot.feature_dirs)
+
+        # Phase 4: independent checks run concurrently
+        for check_fn, result in zip(
+            runnable,
+            _run_checks_concurrently(runnable, ctx, max_workers, scopes),
+        ):
+            results[check_fn.__name__] = result
 
     finally:
         if entities_conn is not None:
@@ -256,19 +346,30 @@ def run_diagnostics(
             except Exception:
                 pass
 
+    return results
+
+
+def _assemble_report(
+    results: dict[str, CheckResult], start: float
+) -> DiagnosticReport:
+    """Order results by CHECK_ORDER and aggregate issue counts."""
+    ordered = [
+        results[fn.__name__] for fn in CHECK_ORDER if fn.__name__ in results
+    ]
+
     # Assemble report
     elapsed_ms = int((time.monotonic() - start) * 1000)
     all_issues = []
-    for r in results:
+    for r in ordered:
         all_issues.extend(r.issues)
 
     error_count = sum(1 for i in all_issues if i.severity == "error")
     warning_count = sum(1 for i in all_issues if i.severity == "warning")
-    healthy = all(r.passed for r in results)
+    healthy = all(r.passed for r in ordered)
 
     return DiagnosticReport(
         healthy=healthy,
-        checks=results,
+        checks=ordered,
         total_issues=len(all_issues),
         error_count=error_count,
         warning_count=warning_count,
@@ -4,6 +4,9 @@ Usage:
     python -m doctor --entities-db PATH --memory-db PATH --project-root PATH [--artifacts-root PATH]
     python -m doctor ... --fix          # Apply safe fixes and re-run diagnostics
     python -m doctor ... --fix --dry-run  # Show what would be fixed without applying
+    python -m doctor ... --max-workers 1  # Run checks sequentially
+    python -m doctor ... --incremental  # Re-check only what changed since last run
+    python -m doctor ... --full         # Full run, refresh the incremental baseline
 
 Outputs a single JSON object to stdout. Exit code is always 0.
 """
@@ -49,6 +52,30 @@ def main() -> None:
         help="Show what would be fixed without applying (use with --fix)",
     )
 
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Maximum checks run concurrently (default: 8; 1 = sequential)",
+    )
+
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse cached results for checks whose inputs are unchanged",
+    )
+    mode.add_argument(
+        "--full",
+        action="store_true",
+        help="Run every check and record a fresh incremental baseline",
+    )
+    parser.add_argument(
+        "--state-file",
+        default=None,
+        help="Incremental state path (default: ~/.claude/pd/doctor/state-<hash>.json)",
+    )
+
     args = parser.parse_args()
 
     # Resolve artifacts_root: CLI arg > config > "docs"
@@ -61,15 +88,37 @@ def main() -> None:
         except Exception:
             artifacts_root = "docs"
 
-    from doctor import run_diagnostics
+    from doctor import DEFAULT_MAX_WORKERS, run_diagnostics
 
-    report = run_diagnostics(
-        entities_db_path=args.entities_db,
-        memory_db_path=args.memory_db,
-        artifacts_root=artifacts_root,
-        project_root=args.project_root,
+    max_workers = (
+        args.max_workers if args.max_workers is not None else DEFAULT_MAX_WORKERS
     )
 
+    if args.incremental or args.full:
+        from doctor.incremental import run_incremental_diagnostics
+
+        def diagnose():
+            return run_incremental_diagnostics(
+                entities_db_path=args.entities_db,
+                memory_db_path=args.memory_db,
+                artifacts_root=artifacts_root,
+                project_root=args.project_root,
+                state_path=args.state_file,
+                full=args.full,
+                max_workers=max_workers,
+            )
+    else:
+        def diagnose():
+            return run_diagnostics(
+                entities_db_path=args.entities_db,
+                memory_db_path=args.memory_db,
+                artifacts_root=artifacts_root,
+                project_root=args.project_root,
+                max_workers=max_workers,
+            )
+
+    report = diagnose()
+
     if not args.fix:
         # Default: diagnostic only (backward compatible)
         output = {"diagnostic": report.to_dict()}
@@ -92,12 +141,7 @@ def main() -> None:
 
         if not args.dry_run:
             # Re-run diagnostics to verify fixes
-            post_report = run_diagnostics(
-                entities_db_path=args.entities_db,
-                memory_db_path=args.memory_db,
-                artifacts_root=artifacts_root,
-                project_root=args.project_root,
-            )
+            post_report = diagnose()
             output["post_fix"] = post_report.to_dict()
 
     print(json.dumps(output, indent=2))
@@ -10,11 +10,16 @@ import subprocess
 import time
 
 from doctor.models import CheckResult, Issue
+from doctor.snapshot import get_snapshot
 
 # Expected schema versions
 ENTITY_SCHEMA_VERSION = 9
 MEMORY_SCHEMA_VERSION = 4
 
+# Embedding dimensions of memory entries; BLOB sizes per storage format
+# come from semantic_memory.quantize.
+EMBEDDING_DIMS = 768
+
 
 def _build_local_entity_set(artifacts_root: str) -> set[str]:
     """Scan {artifacts_root}/features/*/ directories and return directory names.
@@ -306,63 +311,75 @@ _PHASE_VALUES = [
 ]
 
 
+def _is_rework(workflow_phase: str | None, last_completed: str | None) -> bool:
+    """True when workflow_phase is strictly before last_completed_phase."""
+    if not workflow_phase or not last_completed:
+        return False
+    wp_idx = (
+        _PHASE_VALUES.index(workflow_phase)
+        if workflow_phase in _PHASE_VALUES else -1
+    )
+    lcp_idx = (
+        _PHASE_VALUES.index(last_completed)
+        if last_completed in _PHASE_VALUES else -1
+    )
+    return wp_idx >= 0 and lcp_idx >= 0 and wp_idx < lcp_idx
+
+
 def check_feature_status(
     entities_conn: sqlite3.Connection, artifacts_root: str, **kwargs
 ) -> CheckResult:
     """Check 1: Feature Status Consistency.
 
     Compare .meta.json status against entity DB entities.status for all features.
+    An optional ``scope`` kwarg (set of feature slugs) restricts the
+    comparison to those features; used by incremental runs.
     """
     start = time.monotonic()
     issues: list[Issue] = []
     local_entity_ids = kwargs.get("local_entity_ids", set())
+    scope: set[str] | None = kwargs.get("scope")
+
+    snapshot = get_snapshot(kwargs, entities_conn, artifacts_root)
 
     # Collect features from .meta.json files
-    features_dir = os.path.join(artifacts_root, "features")
     meta_statuses: dict[str, str] = {}  # slug -> status
     meta_data: dict[str, dict] = {}  # slug -> full parsed meta
 
-    if os.path.isdir(features_dir):
-        for entry in os.listdir(features_dir):
-            feature_dir = os.path.join(features_dir, entry)
-            if not os.path.isdir(feature_dir):
-                continue
-            meta_path = os.path.join(feature_dir, ".meta.json")
-            if not os.path.isfile(meta_path):
-                # Feature directory exists but no .meta.json
-                if entry in local_entity_ids or not local_entity_ids:
-                    issues.append(Issue(
-                        check="feature_status",
-                        severity="warning",
-                        entity=f"feature:{entry}",
-                        message=f"Feature directory '{entry}' has no .meta.json",
-                        fix_hint="Create .meta.json or remove empty directory",
-                    ))
-                continue
-            try:
-                with open(meta_path) as f:
-                    meta = json.loads(f.read())
-                meta_statuses[entry] = meta.get("status", "")
-                meta_data[entry] = meta
-            except (json.JSONDecodeError, ValueError) as exc:
+    for entry in snapshot.feature_dirs:
+        if scope is not None and entry not in scope:
+            continue
+        if entry in snapshot.feature_meta_errors:
+            exc = snapshot.feature_meta_errors[entry]
+            issues.append(Issue(
+                check="feature_status",
+                severity="error",
+                entity=f"feature:{entry}",
+                message=f"Malformed .meta.json: {exc}",
+                fix_hint="Fix JSON syntax in .meta.json",
+            ))
+            continue
+        meta = snapshot.feature_meta.get(entry)
+        if meta is None:
+            # Feature directory exists but no .meta.json
+            if entry in local_entity_ids or not local_entity_ids:
                 issues.append(Issue(
                     check="feature_status",
-                    severity="error",
+                    severity="warning",
                     entity=f"feature:{entry}",
-                    message=f"Malformed .meta.json: {exc}",
-                    fix_hint="Fix JSON syntax in .meta.json",
+                    message=f"Feature directory '{entry}' has no .meta.json",
+                    fix_hint="Create .meta.json or remove empty directory",
                 ))
-
-    # Query DB for all feature entities
-    db_statuses: dict[str, str] = {}  # slug -> status
-    try:
-        cursor = entities_conn.execute(
-            "SELECT entity_id, status FROM entities WHERE entity_type = 'feature'"
-        )
-        for row in cursor:
-            db_statuses[row[0]] = row[1] or ""
-    except sqlite3.Error:
-        pass
+            continue
+        meta_statuses[entry] = meta.get("status", "")
+        meta_data[entry] = meta
+
+    # All feature entities from the DB snapshot
+    db_statuses: dict[str, str] = {  # slug -> status
+        e.entity_id: e.status or ""
+        for e in snapshot.entities_of_type("feature")
+        if scope is None or e.entity_id in scope
+    }
 
     # Compare: features in .meta.json
     for slug, meta_status in meta_statuses.items():
@@ -391,12 +408,12 @@ def check_feature_status(
                 ))
 
     # Compare: features in DB but not in .meta.json (only local)
+    feature_dir_set = set(snapshot.feature_dirs)
     for slug, db_status in db_statuses.items():
         if slug not in meta_statuses:
             if slug in local_entity_ids or not local_entity_ids:
                 # Only warn for local features (those with dirs)
-                feature_dir = os.path.join(features_dir, slug)
-                if os.path.isdir(feature_dir):
+                if slug in feature_dir_set:
                     issues.append(Issue(
                         check="feature_status",
                         severity="warning",
@@ -556,39 +573,24 @@ def check_workflow_phase(
                 ))
 
         # Backward transition awareness: check for rework state
-        # Use the shared entities_conn from ctx (passed via kwargs)
+        # Use the shared snapshot (or entities_conn) from ctx (via kwargs)
         entities_conn = kwargs.get("entities_conn")
-        try:
-            if entities_conn is None:
-                raise sqlite3.Error("No entities_conn in context")
-            cursor = entities_conn.execute(
-                "SELECT type_id, workflow_phase, last_completed_phase "
-                "FROM workflow_phases"
-            )
-            for row in cursor:
-                wp_type_id = row[0]
-                wp = row[1]
-                lcp = row[2]
-                if wp and lcp:
-                    wp_idx = (
-                        _PHASE_VALUES.index(wp) if wp in _PHASE_VALUES else -1
-                    )
-                    lcp_idx = (
-                        _PHASE_VALUES.index(lcp) if lcp in _PHASE_VALUES else -1
-                    )
-                    if wp_idx >= 0 and lcp_idx >= 0 and wp_idx < lcp_idx:
-                        issues.append(Issue(
-                            check="workflow_phase",
-                            severity="info",
-                            entity=wp_type_id,
-                            message=(
-                                f"Feature in rework state: workflow_phase='{wp}' "
-                                f"is before last_completed_phase='{lcp}'"
-                            ),
-                            fix_hint=None,
-                        ))
-        except sqlite3.Error:
-            pass
+        if kwargs.get("snapshot") is not None or entities_conn is not None:
+            snapshot = get_snapshot(kwargs, entities_conn)
+            for wp_row in snapshot.workflow_phases:
+                wp = wp_row.workflow_phase
+                lcp = wp_row.last_completed_phase
+                if _is_rework(wp, lcp):
+                    issues.append(Issue(
+                        check="workflow_phase",
+                        severity="info",
+                        entity=wp_row.type_id,
+                        message=(
+                            f"Feature in rework state: workflow_phase='{wp}' "
+                            f"is before last_completed_phase='{lcp}'"
+                        ),
+                        fix_hint=None,
+                    ))
 
     except sqlite3.OperationalError as exc:
         issues.append(Issue(
@@ -621,7 +623,7 @@ def check_workflow_phase(
 
 
 def check_brainstorm_status(
-    entities_conn: sqlite3.Connection, artifacts_root: str, **_
+    entities_conn: sqlite3.Connection, artifacts_root: str, **kwargs
 ) -> CheckResult:
     """Check 3: Brainstorm Status Consistency.
 
@@ -630,18 +632,14 @@ def check_brainstorm_status(
     """
     start = time.monotonic()
     issues: list[Issue] = []
+    snapshot = get_snapshot(kwargs, entities_conn, artifacts_root)
 
     # Get brainstorm entities that are not promoted
-    brainstorms: list[tuple[str, str, str]] = []  # (type_id, entity_id, status)
-    try:
-        cursor = entities_conn.execute(
-            "SELECT type_id, entity_id, status FROM entities "
-            "WHERE entity_type = 'brainstorm' "
-            "AND (status IS NULL OR status != 'promoted')"
-        )
-        brainstorms = [(row[0], row[1], row[2] or "") for row in cursor]
-    except sqlite3.Error:
-        pass
+    brainstorms: list[tuple[str, str, str]] = [  # (type_id, entity_id, status)
+        (e.type_id, e.entity_id, e.status or "")
+        for e in snapshot.entities_of_type("brainstorm")
+        if e.status is None or e.status != "promoted"
+    ]
 
     if not brainstorms:
         elapsed = int((time.monotonic() - start) * 1000)
@@ -653,48 +651,35 @@ def check_brainstorm_status(
         )
 
     # Scan feature .meta.json files for brainstorm_source references
-    features_dir = os.path.join(artifacts_root, "features")
     brainstorm_refs: dict[str, list[str]] = {}  # brainstorm_entity_id -> [feature_slugs]
 
-    if os.path.isdir(features_dir):
-        for entry in os.listdir(features_dir):
-            meta_path = os.path.join(features_dir, entry, ".meta.json")
-            if not os.path.isfile(meta_path):
-                continue
-            try:
-                with open(meta_path) as f:
-                    meta = json.loads(f.read())
-                bs_source = meta.get("brainstorm_source")
-                if bs_source:
-                    # Verify the brainstorm source file exists
-                    bs_path = os.path.join(artifacts_root, "brainstorms", bs_source)
-                    if not os.path.exists(bs_path):
-                        # Also try as just the entity_id (brainstorm_source might be filename or id)
-                        bs_dir = os.path.join(artifacts_root, "brainstorms")
-                        # Check if any file matching exists
-                        found = False
-                        if os.path.isdir(bs_dir):
-                            for bs_entry in os.listdir(bs_dir):
-                                if bs_source in bs_entry:
-                                    found = True
-                                    break
-                        if not found:
-                            issues.append(Issue(
-                                check="brainstorm_status",
-                                severity="warning",
-                                entity=f"feature:{entry}",
-                                message=(
-                                    f"brainstorm_source '{bs_source}' referenced "
-                                    f"in feature '{entry}' does not exist"
-                                ),
-                                fix_hint="Update brainstorm_source or create the brainstorm file",
-                            ))
-
-                    feature_status = meta.get("status", "")
-                    if feature_status in ("active", "completed", "finished"):
-                        brainstorm_refs.setdefault(bs_source, []).append(entry)
-            except (json.JSONDecodeError, ValueError):
-                continue
+    for entry, meta in snapshot.feature_meta.items():
+        bs_source = meta.get("brainstorm_source")
+        if not bs_source:
+            continue
+        # Verify the brainstorm source file exists
+        bs_path = os.path.join(artifacts_root, "brainstorms", bs_source)
+        if not os.path.exists(bs_path):
+            # Also try as just the entity_id (brainstorm_source might be filename or id)
+            found = any(
+                bs_source in bs_entry
+                for bs_entry, _, _ in snapshot.brainstorm_entries
+            )
+            if not found:
+                issues.append(Issue(
+                    check="brainstorm_status",
+                    severity="warning",
+                    entity=f"feature:{entry}",
+                    message=(
+                        f"brainstorm_source '{bs_source}' referenced "
+                        f"in feature '{entry}' does not exist"
+                    ),
+                    fix_hint="Update brainstorm_source or create the brainstorm file",
+                ))
+
+        feature_status = meta.get("status", "")
+        if feature_status in ("active", "completed", "finished"):
+            brainstorm_refs.setdefault(bs_source, []).append(entry)
 
     # Check each brainstorm: should it be promoted?
     for type_id, entity_id, status in brainstorms:
@@ -714,40 +699,26 @@ def check_brainstorm_status(
             continue
 
         # Fallback: check entity_dependencies for brainstorm->feature edges
-        try:
-            # Get brainstorm UUID
-            bs_row = entities_conn.execute(
-                "SELECT uuid FROM entities WHERE type_id = ?", (type_id,)
-            ).fetchone()
-            if bs_row:
-                bs_uuid = bs_row[0]
-                dep_cursor = entities_conn.execute(
-                    "SELECT blocked_by_uuid FROM entity_dependencies "
-                    "WHERE entity_uuid = ?",
-                    (bs_uuid,),
-                )
-                for dep_row in dep_cursor:
-                    blocked_by_uuid = dep_row[0]
-                    # Check if target is a completed feature
-                    feat_row = entities_conn.execute(
-                        "SELECT type_id, status FROM entities "
-                        "WHERE uuid = ? AND entity_type = 'feature'",
-                        (blocked_by_uuid,),
-                    ).fetchone()
-                    if feat_row and feat_row[1] in ("completed", "finished"):
-                        issues.append(Issue(
-                            check="brainstorm_status",
-                            severity="warning",
-                            entity=type_id,
-                            message=(
-                                f"Brainstorm '{entity_id}' should be promoted: "
-                                f"dependency edge to completed feature '{feat_row[0]}'"
-                            ),
-                            fix_hint="Update brainstorm entity status to 'promoted'",
-                        ))
-                        break
-        except sqlite3.Error:
-            pass
+        bs_uuid = snapshot.by_type_id[type_id].uuid
+        for blocked_by_uuid in snapshot.dependencies_by_entity.get(bs_uuid, []):
+            # Check if target is a completed feature
+            feat = snapshot.by_uuid.get(blocked_by_uuid)
+            if (
+                feat is not None
+                and feat.entity_type == "feature"
+                and feat.status in ("completed", "finished")
+            ):
+                issues.append(Issue(
+                    check="brainstorm_status",
+                    severity="warning",
+                    entity=type_id,
+                    message=(
+                        f"Brainstorm '{entity_id}' should be promoted: "
+                        f"dependency edge to completed feature '{feat.type_id}'"
+                    ),
+                    fix_hint="Update brainstorm entity status to 'promoted'",
+                ))
+                break
 
     elapsed = int((time.monotonic() - start) * 1000)
     passed = not any(i.severity in ("error", "warning") for i in issues)
@@ -765,7 +736,7 @@ def check_brainstorm_status(
 
 
 def check_backlog_status(
-    entities_conn: sqlite3.Connection, artifacts_root: str, **_
+    entities_conn: sqlite3.Connection, artifacts_root: str, **kwargs
 ) -> CheckResult:
     """Check 4: Backlog Status Consistency.
 
@@ -830,84 +801,72 @@ def check_backlog_status(
             elapsed_ms=elapsed,
         )
 
+    snapshot = get_snapshot(kwargs, entities_conn)
+    if "entities" in snapshot.errors:
+        # Entity table unreadable -- nothing to cross-reference
+        annotated_ids = set()
+        closed_ids = set()
+
     # Cross-ref annotated IDs with entity DB
     for backlog_id in annotated_ids:
         type_id = f"backlog:{backlog_id}"
-        try:
-            row = entities_conn.execute(
-                "SELECT status FROM entities WHERE type_id = ?", (type_id,)
-            ).fetchone()
-            if row:
-                db_status = row[0] or ""
-                if db_status != "promoted":
-                    issues.append(Issue(
-                        check="backlog_status",
-                        severity="warning",
-                        entity=type_id,
-                        message=(
-                            f"Backlog '{backlog_id}' annotated as promoted in "
-                            f"backlog.md but entity status is '{db_status}'"
-                        ),
-                        fix_hint="Update entity status to 'promoted'",
-                    ))
-            else:
+        row = snapshot.by_type_id.get(type_id)
+        if row is not None:
+            db_status = row.status or ""
+            if db_status != "promoted":
                 issues.append(Issue(
                     check="backlog_status",
                     severity="warning",
                     entity=type_id,
                     message=(
                         f"Backlog '{backlog_id}' annotated as promoted in "
-                        "backlog.md but entity not found in DB"
+                        f"backlog.md but entity status is '{db_status}'"
                     ),
-                    fix_hint="Register backlog entity or remove annotation",
+                    fix_hint="Update entity status to 'promoted'",
                 ))
-        except sqlite3.Error:
-            pass
+        else:
+            issues.append(Issue(
+                check="backlog_status",
+                severity="warning",
+                entity=type_id,
+                message=(
+                    f"Backlog '{backlog_id}' annotated as promoted in "
+                    "backlog.md but entity not found in DB"
+                ),
+                fix_hint="Register backlog entity or remove annotation",
+            ))
 
     # Cross-ref closed IDs with entity DB — expect status="dropped"
     for backlog_id in closed_ids:
         type_id = f"backlog:{backlog_id}"
-        try:
-            row = entities_conn.execute(
-                "SELECT status FROM entities WHERE type_id = ?", (type_id,)
-            ).fetchone()
-            if row:
-                db_status = row[0] or ""
-                if db_status != "dropped":
-                    issues.append(Issue(
-                        check="backlog_status",
-                        severity="warning",
-                        entity=type_id,
-                        message=(
-                            f"Backlog '{backlog_id}' annotated as closed in "
-                            f"backlog.md but entity status is '{db_status}'"
-                        ),
-                        fix_hint="Update entity status to 'dropped'",
-                    ))
-        except sqlite3.Error:
-            pass
-
-    # Check reverse: entities promoted but not annotated in backlog.md
-    try:
-        cursor = entities_conn.execute(
-            "SELECT entity_id, status FROM entities "
-            "WHERE entity_type = 'backlog' AND status = 'promoted'"
-        )
-        for row in cursor:
-            entity_id = row[0]
-            if entity_id not in annotated_ids:
+        row = snapshot.by_type_id.get(type_id)
+        if row is not None:
+            db_status = row.status or ""
+            if db_status != "dropped":
                 issues.append(Issue(
                     check="backlog_status",
-                    severity="info",
-                    entity=f"backlog:{entity_id}",
+                    severity="warning",
+                    entity=type_id,
                     message=(
-                        f"Backlog '{entity_id}' is promoted in DB but "
-                        "not annotated in backlog.md"
+                        f"Backlog '{backlog_id}' annotated as closed in "
+                        f"backlog.md but entity status is '{db_status}'"
                     ),
-                    fix_hint="Add (promoted -> feature) annotation to backlog.md",
+                    fix_hint="Update entity status to 'dropped'",
                 ))
-    except sqlite3.Error:
-        pass
+
+    # Check reverse: entities promoted but not annotated in backlog.md
+    for row in snapshot.entities_of_type("backlog"):
+        if row.status == "promoted" and row.entity_id not in annotated_ids:
+            issues.append(Issue(
+                check="backlog_status",
+                severity="info",
+                entity=f"backlog:{row.entity_id}",
+                message=(
+                    f"Backlog '{row.entity_id}' is promoted in DB but "
+                    "not annotated in backlog.md"
+                ),
+                fix_hint="Add (promoted -> feature) annotation to backlog.md",
+            ))
 
     elapsed = int((time.monotonic() - start) * 1000)
     passed = not any(i.severity in ("error", "warning") for i in issues)
@@ -1091,11 +1050,18 @@ def check_memory_health(memory_conn: sqlite3.Connection, **_) -> CheckResult:
     except sqlite3.Error:
         pass
 
-    # 8. length(embedding) != 3072 for non-NULL
+    # 8. length(embedding) fits no storage format for EMBEDDING_DIMS
     try:
+        from semantic_memory.quantize import EMBEDDING_FORMATS, embedding_nbytes
+
+        sizes = sorted({
+            embedding_nbytes(EMBEDDING_DIMS, fmt) for fmt in EMBEDDING_FORMATS
+        })
+        placeholders = ",".join("?" * len(sizes))
         bad_dim = memory_conn.execute(
-            "SELECT COUNT(*) FROM entries "
-            "WHERE embedding IS NOT NULL AND length(embedding) != 3072"
+            "SELECT COUNT(*) FROM entries WHERE embedding IS NOT NULL "
+            f"AND length(embedding) NOT IN ({placeholders})",
+            sizes,
         ).fetchone()[0]
         if bad_dim > 0:
             issues.append(Issue(
@@ -1104,7 +1070,7 @@ def check_memory_health(memory_conn: sqlite3.Connection, **_) -> CheckResult:
                 entity=None,
                 message=(
                     f"{bad_dim} entries have wrong embedding dimension "
-                    "(expected length 3072)"
+                    f"(expected length {' or '.join(map(str, sizes))})"
                 ),
                 fix_hint="Re-run embedding generation for affected entries",
             ))
@@ -1151,6 +1117,8 @@ def check_branch_consistency(
     """Check 6: Branch Consistency.
 
     For each active local feature, verify branch exists and check merge status.
+    An optional ``scope`` kwarg (set of feature slugs) limits the per-feature
+    git probes to those features; the base-branch probe always runs.
     """
     start = time.monotonic()
     issues: list[Issue] = []
@@ -1199,16 +1167,11 @@ def check_branch_consistency(
             elapsed_ms=elapsed,
         )
 
-    for entry in os.listdir(features_dir):
-        meta_path = os.path.join(features_dir, entry, ".meta.json")
-        if not os.path.isfile(meta_path):
+    snapshot = get_snapshot(kwargs, entities_conn, artifacts_root)
+    scope: set[str] | None = kwargs.get("scope")
+    for entry, meta in snapshot.feature_meta.items():
+        if scope is not None and entry not in scope:
             continue
-        try:
-            with open(meta_path) as f:
-                meta = json.loads(f.read())
-        except (json.JSONDecodeError, OSError):
-            continue
-
         status = meta.get("status", "")
         if status != "active":
             continue
@@ -1238,35 +1201,21 @@ def check_branch_consistency(
 
         if merged:
             # Check rework state
-            try:
-                wp_row = entities_conn.execute(
-                    "SELECT workflow_phase, last_completed_phase "
-                    "FROM workflow_phases WHERE type_id = ?",
-                    (type_id,),
-                ).fetchone()
-                if wp_row and wp_row[0] and wp_row[1]:
-                    wp_idx = (
-                        _PHASE_VALUES.index(wp_row[0])
-                        if wp_row[0] in _PHASE_VALUES else -1
-                    )
-                    lcp_idx = (
-                        _PHASE_VALUES.index(wp_row[1])
-                        if wp_row[1] in _PHASE_VALUES else -1
-                    )
-                    if wp_idx >= 0 and lcp_idx >= 0 and wp_idx < lcp_idx:
-                        issues.append(Issue(
-                            check="branch_consistency",
-                            severity="warning",
-                            entity=type_id,
-                            message=(
-                                f"Feature '{entry}' is in rework "
-                                "(branch merged but re-entered earlier phase)"
-                            ),
-                            fix_hint="Create a new branch for rework",
-                        ))
-                        continue
-            except sqlite3.Error:
-                pass
+            wp_row = snapshot.workflow_by_type_id.get(type_id)
+            if wp_row is not None and _is_rework(
+                wp_row.workflow_phase, wp_row.last_completed_phase
+            ):
+                issues.append(Issue(
+                    check="branch_consistency",
+                    severity="warning",
+                    entity=type_id,
+                    message=(
+                        f"Feature '{entry}' is in rework "
+                        "(branch merged but re-entered earlier phase)"
+                    ),
+                    fix_hint="Create a new branch for rework",
+                ))
+                continue
 
             issues.append(Issue(
                 check="branch_consistency",
@@ -1318,34 +1267,23 @@ def check_entity_orphans(
     project_root = kwargs.get("project_root", ".")
     local_entity_ids = kwargs.get("local_entity_ids", set())
 
-    # 1. Load all feature entities from DB (single query, reused for steps 1 and 2)
+    snapshot = get_snapshot(kwargs, entities_conn, artifacts_root)
+    feature_dir_set = set(snapshot.feature_dirs)
+
+    # 1. Feature entities from the DB snapshot (reused for steps 1 and 2)
     #    Filter by project_id when available to reduce cross-project noise.
     project_id = kwargs.get("project_id")
-    db_features: list[tuple] = []  # (type_id, entity_id, artifact_path)
-    db_feature_ids: set[str] = set()
+    db_features = [
+        e for e in snapshot.entities_of_type("feature")
+        if not project_id or e.project_id in (project_id, "__unknown__")
+    ]
+    db_feature_ids: set[str] = {e.entity_id for e in db_features}
     cross_project_count = 0
-    try:
-        if project_id:
-            cursor = entities_conn.execute(
-                "SELECT type_id, entity_id, artifact_path "
-                "FROM entities WHERE entity_type = 'feature' "
-                "AND (project_id = ? OR project_id = '__unknown__')",
-                (project_id,),
-            )
-        else:
-            cursor = entities_conn.execute(
-                "SELECT type_id, entity_id, artifact_path "
-                "FROM entities WHERE entity_type = 'feature'"
-            )
-        db_features = list(cursor)
-        db_feature_ids = {row[1] for row in db_features}
-    except sqlite3.Error:
-        pass
 
-    for type_id, entity_id, artifact_path in db_features:
-        feature_dir = os.path.join(artifacts_root, "features", entity_id)
+    for entity in db_features:
+        type_id, entity_id = entity.type_id, entity.entity_id
         if entity_id in local_entity_ids or not local_entity_ids:
-            if not os.path.isdir(feature_dir):
+            if entity_id not in feature_dir_set:
                 issues.append(Issue(
                     check="entity_orphans",
                     severity="warning",
@@ -1357,7 +1295,7 @@ def check_entity_orphans(
                     fix_hint="Remove stale entity or restore feature directory",
                 ))
         else:
-            if not os.path.isdir(feature_dir):
+            if entity_id not in feature_dir_set:
                 cross_project_count += 1
 
     if cross_project_count > 0:
@@ -1373,93 +1311,72 @@ def check_entity_orphans(
         ))
 
     # 2. Feature directories with .meta.json but no entity in DB
-    features_dir = os.path.join(artifacts_root, "features")
+    for entry in snapshot.feature_dirs:
+        if snapshot.has_meta_file(entry) and entry not in db_feature_ids:
+            issues.append(Issue(
+                check="entity_orphans",
+                severity="warning",
+                entity=f"feature:{entry}",
+                message=(
+                    f"Feature directory '{entry}' has .meta.json but "
+                    "no entity in DB"
+                ),
+                fix_hint="Register entity or remove stale directory",
+            ))
 
-    if os.path.isdir(features_dir):
-        for entry in os.listdir(features_dir):
-            entry_dir = os.path.join(features_dir, entry)
-            if not os.path.isdir(entry_dir):
-                continue
-            meta_path = os.path.join(entry_dir, ".meta.json")
-            if os.path.isfile(meta_path) and entry not in db_feature_ids:
+    # 3. artifact_path under project_root doesn't exist
+    abs_project_root = os.path.abspath(project_root)
+    for entity in snapshot.entities:
+        type_id, artifact_path = entity.type_id, entity.artifact_path
+        if not artifact_path:
+            continue
+        abs_artifact = os.path.abspath(artifact_path)
+        # Skip cross-project paths
+        if not abs_artifact.startswith(abs_project_root):
+            continue
+        if not os.path.exists(artifact_path):
+            issues.append(Issue(
+                check="entity_orphans",
+                severity="warning",
+                entity=type_id,
+                message=(
+                    f"Entity '{type_id}' artifact_path '{artifact_path}' "
+                    "does not exist"
+                ),
+                fix_hint="Update artifact_path or restore the artifact",
+            ))
+
+    # 4. Brainstorm .prd.md without entity
+    db_brainstorm_ids: set[str] = {
+        e.entity_id for e in snapshot.entities_of_type("brainstorm")
+    }
+
+    for entry, is_dir, has_prd in snapshot.brainstorm_entries:
+        if is_dir:
+            # Check for .prd.md inside brainstorm dir
+            if has_prd and entry not in db_brainstorm_ids:
                 issues.append(Issue(
                     check="entity_orphans",
                     severity="warning",
-                    entity=f"feature:{entry}",
+                    entity=f"brainstorm:{entry}",
                     message=(
-                        f"Feature directory '{entry}' has .meta.json but "
-                        "no entity in DB"
+                        f"Brainstorm '{entry}' has .prd.md but no entity in DB"
                     ),
-                    fix_hint="Register entity or remove stale directory",
+                    fix_hint="Register brainstorm entity or remove stale files",
                 ))
-
-    # 3. artifact_path under project_root doesn't exist
-    try:
-        cursor = entities_conn.execute(
-            "SELECT type_id, artifact_path FROM entities "
-            "WHERE artifact_path IS NOT NULL AND artifact_path != ''"
-        )
-        abs_project_root = os.path.abspath(project_root)
-        for row in cursor:
-            type_id, artifact_path = row
-            abs_artifact = os.path.abspath(artifact_path)
-            # Skip cross-project paths
-            if not abs_artifact.startswith(abs_project_root):
-                continue
-            if not os.path.exists(artifact_path):
+        elif entry.endswith(".prd.md"):
+            # Top-level .prd.md file
+            bs_id = entry.replace(".prd.md", "")
+            if bs_id not in db_brainstorm_ids:
                 issues.append(Issue(
                     check="entity_orphans",
                     severity="warning",
-                    entity=type_id,
+                    entity=f"brainstorm:{bs_id}",
                     message=(
-                        f"Entity '{type_id}' artifact_path '{artifact_path}' "
-                        "does not exist"
+                        f"Brainstorm file '{entry}' has no entity in DB"
                     ),
-                    fix_hint="Update artifact_path or restore the artifact",
+                    fix_hint="Register brainstorm entity or remove stale file",
                 ))
-    except sqlite3.Error:
-        pass
-
-    # 4. Brainstorm .prd.md without entity
-    brainstorms_dir = os.path.join(artifacts_root, "brainstorms")
-    db_brainstorm_ids: set[str] = set()
-    try:
-        cursor = entities_conn.execute(
-            "SELECT entity_id FROM entities WHERE entity_type = 'brainstorm'"
-        )
-        db_brainstorm_ids = {row[0] for row in cursor}
-    except sqlite3.Error:
-        pass
-
-    if os.path.isdir(brainstorms_dir):
-        for entry in os.listdir(brainstorms_dir):
-            entry_path = os.path.join(brainstorms_dir, entry)
-            if os.path.isdir(entry_path):
-                # Check for .prd.md inside brainstorm dir
-                prd_files = glob.glob(os.path.join(entry_path, "*.prd.md"))
-                if prd_files and entry not in db_brainstorm_ids:
-                    issues.append(Issue(
-                        check="entity_orphans",
-                        severity="warning",
-                        entity=f"brainstorm:{entry}",
-                        message=(
-                            f"Brainstorm '{entry}' has .prd.md but no entity in DB"
-                        ),
-                        fix_hint="Register brainstorm entity or remove stale files",
-                    ))
-            elif entry.endswith(".prd.md"):
-                # Top-level .prd.md file
-                bs_id = entry.replace(".prd.md", "")
-                if bs_id not in db_brainstorm_ids:
-                    issues.append(Issue(
-                        check="entity_orphans",
-                        severity="warning",
-                        entity=f"brainstorm:{bs_id}",
-                        message=(
-                            f"Brainstorm file '{entry}' has no entity in DB"
-                        ),
-                        fix_hint="Register brainstorm entity or remove stale file",
-                    ))
 
     elapsed = int((time.monotonic() - start) * 1000)
     passed = not any(i.severity in ("error", "warning") for i in issues)
@@ -1492,24 +1409,19 @@ def check_project_attribution(
     unknown_count = 0
     claimable_count = 0
 
-    try:
-        cursor = entities_conn.execute(
-            "SELECT type_id, artifact_path FROM entities "
-            "WHERE project_id = '__unknown__'"
-        )
-        abs_root = os.path.abspath(project_root) if project_root else None
-
-        for row in cursor:
-            type_id, artifact_path = row
-            unknown_count += 1
+    snapshot = get_snapshot(kwargs, entities_conn)
+    abs_root = os.path.abspath(project_root) if project_root else None
 
-            if abs_root and artifact_path:
-                abs_artifact = os.path.abspath(artifact_path)
-                if abs_artifact.startswith(abs_root + os.sep) or abs_artifact == abs_root:
-                    claimable_count += 1
+    for entity in snapshot.entities:
+        if entity.project_id != "__unknown__":
+            continue
+        artifact_path = entity.artifact_path
+        unknown_count += 1
 
-    except sqlite3.Error:
-        pass
+        if abs_root and artifact_path:
+            abs_artifact = os.path.abspath(artifact_path)
+            if abs_artifact.startswith(abs_root + os.sep) or abs_artifact == abs_root:
+                claimable_count += 1
 
     if unknown_count > 0:
         severity = "warning" if claimable_count > 0 else "info"
@@ -1549,7 +1461,7 @@ def check_project_attribution(
 
 
 def check_referential_integrity(
-    entities_conn: sqlite3.Connection, **_
+    entities_conn: sqlite3.Connection, **kwargs
 ) -> CheckResult:
     """Check 9: Referential Integrity.
 
@@ -1558,70 +1470,14 @@ def check_referential_integrity(
     """
     start = time.monotonic()
     issues: list[Issue] = []
+    snapshot = get_snapshot(kwargs, entities_conn)
 
-    # Build entity lookup
-    entities_by_type_id: dict[str, str] = {}  # type_id -> uuid
-    entities_by_uuid: dict[str, str] = {}  # uuid -> type_id
-    parent_map: dict[str, str | None] = {}  # type_id -> parent_type_id
-
-    try:
-        cursor = entities_conn.execute(
-            "SELECT uuid, type_id, parent_type_id, parent_uuid FROM entities"
-        )
-        for row in cursor:
-            uuid_val, type_id, parent_type_id, parent_uuid = row
-            entities_by_type_id[type_id] = uuid_val
-            entities_by_uuid[uuid_val] = type_id
-            parent_map[type_id] = parent_type_id
-
-            # 1. Dangling parent_type_id
-            if parent_type_id and parent_type_id not in entities_by_type_id:
-                # Defer -- need full set first
-                pass
-
-            # 4. Self-referential parent
-            if parent_type_id and parent_type_id == type_id:
-                issues.append(Issue(
-                    check="referential_integrity",
-                    severity="error",
-                    entity=type_id,
-                    message=f"Entity '{type_id}' is its own parent",
-                    fix_hint="Remove self-referential parent_type_id",
-                ))
-
-            # 5. parent_type_id set but parent_uuid NULL
-            if parent_type_id and not parent_uuid:
-                issues.append(Issue(
-                    check="referential_integrity",
-                    severity="error",
-                    entity=type_id,
-                    message=(
-                        f"Entity '{type_id}' has parent_type_id "
-                        f"'{parent_type_id}' but parent_uuid is NULL"
-                    ),
-                    fix_hint="Run migration to populate parent_uuid",
-                ))
-
-            # 2. parent_uuid mismatch
-            if parent_type_id and parent_uuid:
-                expected_uuid = entities_by_type_id.get(parent_type_id)
-                if expected_uuid is not None and expected_uuid != parent_uuid:
-                    issues.append(Issue(
-                        check="referential_integrity",
-                        severity="error",
-                        entity=type_id,
-                        message=(
-                            f"Entity '{type_id}' parent_uuid doesn't match "
-                            f"parent entity '{parent_type_id}'"
-                        ),
-                        fix_hint="Update parent_uuid to match parent entity's uuid",
-                    ))
-    except sqlite3.Error as exc:
+    if "entities" in snapshot.errors:
         issues.append(Issue(
             check="referential_integrity",
             severity="error",
             entity=None,
-            message=f"Cannot read entities table: {exc}",
+            message=f"Cannot read entities table: {snapshot.errors['entities']}",
             fix_hint=None,
         ))
         elapsed = int((time.monotonic() - start) * 1000)
@@ -1632,68 +1488,84 @@ def check_referential_integrity(
             elapsed_ms=elapsed,
         )
 
-    # 1. Dangling parent_type_id (second pass with full set)
-    try:
-        cursor = entities_conn.execute(
-            "SELECT type_id, parent_type_id, parent_uuid FROM entities "
-            "WHERE parent_type_id IS NOT NULL"
-        )
-        for row in cursor:
-            type_id, parent_type_id, parent_uuid = row
-            if parent_type_id not in entities_by_type_id:
-                issues.append(Issue(
-                    check="referential_integrity",
-                    severity="error",
-                    entity=type_id,
-                    message=(
-                        f"Entity '{type_id}' references non-existent "
-                        f"parent '{parent_type_id}'"
-                    ),
-                    fix_hint="Remove or fix dangling parent_type_id",
-                ))
-            # 2. parent_uuid mismatch (second pass for entities loaded after parent)
-            elif parent_uuid:
-                expected_uuid = entities_by_type_id.get(parent_type_id)
-                if expected_uuid and expected_uuid != parent_uuid:
-                    # Check if already reported
-                    already = any(
-                        i.entity == type_id and "parent_uuid" in i.message
-                        for i in issues
-                    )
-                    if not already:
-                        issues.append(Issue(
-                            check="referential_integrity",
-                            severity="error",
-                            entity=type_id,
-                            message=(
-                                f"Entity '{type_id}' parent_uuid doesn't match "
-                                f"parent entity '{parent_type_id}'"
-                            ),
-                            fix_hint="Update parent_uuid to match parent entity's uuid",
-                        ))
-    except sqlite3.Error:
-        pass
+    # Entity lookups come pre-indexed from the snapshot
+    entities_by_type_id = snapshot.by_type_id
+    entities_by_uuid = snapshot.by_uuid
+    parent_map: dict[str, str | None] = {  # type_id -> parent_type_id
+        e.type_id: e.parent_type_id for e in snapshot.entities
+    }
+
+    for entity in snapshot.entities:
+        type_id = entity.type_id
+        parent_type_id = entity.parent_type_id
+        parent_uuid = entity.parent_uuid
+
+        # 4. Self-referential parent
+        if parent_type_id and parent_type_id == type_id:
+            issues.append(Issue(
+                check="referential_integrity",
+                severity="error",
+                entity=type_id,
+                message=f"Entity '{type_id}' is its own parent",
+                fix_hint="Remove self-referential parent_type_id",
+            ))
+
+        # 5. parent_type_id set but parent_uuid NULL
+        if parent_type_id and not parent_uuid:
+            issues.append(Issue(
+                check="referential_integrity",
+                severity="error",
+                entity=type_id,
+                message=(
+                    f"Entity '{type_id}' has parent_type_id "
+                    f"'{parent_type_id}' but parent_uuid is NULL"
+                ),
+                fix_hint="Run migration to populate parent_uuid",
+            ))
+
+        if not parent_type_id:
+            continue
+
+        parent = entities_by_type_id.get(parent_type_id)
+        if parent is None:
+            # 1. Dangling parent_type_id
+            issues.append(Issue(
+                check="referential_integrity",
+                severity="error",
+                entity=type_id,
+                message=(
+                    f"Entity '{type_id}' references non-existent "
+                    f"parent '{parent_type_id}'"
+                ),
+                fix_hint="Remove or fix dangling parent_type_id",
+            ))
+        elif parent_uuid and parent.uuid != parent_uuid:
+            # 2. parent_uuid mismatch
+            issues.append(Issue(
+                check="referential_integrity",
+                severity="error",
+                entity=type_id,
+                message=(
+                    f"Entity '{type_id}' parent_uuid doesn't match "
+                    f"parent entity '{parent_type_id}'"
+                ),
+                fix_hint="Update parent_uuid to match parent entity's uuid",
+            ))
 
     # 3. workflow_phases FK
-    try:
-        cursor = entities_conn.execute(
-            "SELECT type_id FROM workflow_phases"
-        )
-        for row in cursor:
-            wp_type_id = row[0]
-            if wp_type_id not in entities_by_type_id:
-                issues.append(Issue(
-                    check="referential_integrity",
-                    severity="error",
-                    entity=wp_type_id,
-                    message=(
-                        f"workflow_phases entry '{wp_type_id}' references "
-                        "non-existent entity"
-                    ),
-                    fix_hint="Remove orphaned workflow_phases row",
-                ))
-    except sqlite3.Error:
-        pass
+    for wp_row in snapshot.workflow_phases:
+        wp_type_id = wp_row.type_id
+        if wp_type_id not in entities_by_type_id:
+            issues.append(Issue(
+                check="referential_integrity",
+                severity="error",
+                entity=wp_type_id,
+                message=(
+                    f"workflow_phases entry '{wp_type_id}' references "
+                    "non-existent entity"
+                ),
+                fix_hint="Remove orphaned workflow_phases row",
+            ))
 
     # 6. Circular parent chains
     for type_id in parent_map:
@@ -1729,57 +1601,43 @@ def check_referential_integrity(
             ))
 
     # 7. entity_dependencies orphans
-    try:
-        cursor = entities_conn.execute(
-            "SELECT entity_uuid, blocked_by_uuid FROM entity_dependencies"
-        )
-        for row in cursor:
-            src, tgt = row
-            if src not in entities_by_uuid:
-                issues.append(Issue(
-                    check="referential_integrity",
-                    severity="warning",
-                    entity=None,
-                    message=(
-                        f"entity_dependencies entity_uuid '{src}' "
-                        "references non-existent entity"
-                    ),
-                    fix_hint="Remove orphaned dependency row",
-                ))
-            if tgt not in entities_by_uuid:
-                issues.append(Issue(
-                    check="referential_integrity",
-                    severity="warning",
-                    entity=None,
-                    message=(
-                        f"entity_dependencies blocked_by_uuid '{tgt}' "
-                        "references non-existent entity"
-                    ),
-                    fix_hint="Remove orphaned dependency row",
-                ))
-    except sqlite3.Error:
-        pass
+    for src, tgt in snapshot.dependencies:
+        if src not in entities_by_uuid:
+            issues.append(Issue(
+                check="referential_integrity",
+                severity="warning",
+                entity=None,
+                message=(
+                    f"entity_dependencies entity_uuid '{src}' "
+                    "references non-existent entity"
+                ),
+                fix_hint="Remove orphaned dependency row",
+            ))
+        if tgt not in entities_by_uuid:
+            issues.append(Issue(
+                check="referential_integrity",
+                severity="warning",
+                entity=None,
+                message=(
+                    f"entity_dependencies blocked_by_uuid '{tgt}' "
+                    "references non-existent entity"
+                ),
+                fix_hint="Remove orphaned dependency row",
+            ))
 
     # 8. entity_tags orphans
-    try:
-        cursor = entities_conn.execute(
-            "SELECT entity_uuid, tag FROM entity_tags"
-        )
-        for row in cursor:
-            entity_uuid, tag = row
-            if entity_uuid not in entities_by_uuid:
-                issues.append(Issue(
-                    check="referential_integrity",
-                    severity="warning",
-                    entity=None,
-                    message=(
-                        f"entity_tags row with uuid '{entity_uuid}' "
-                        f"(tag='{tag}') references non-existent entity"
-                    ),
-                    fix_hint="Remove orphaned tag row",
-                ))
-    except sqlite3.Error:
-        pass
+    for entity_uuid, tag in snapshot.tags:
+        if entity_uuid not in entities_by_uuid:
+            issues.append(Issue(
+                check="referential_integrity",
+                severity="warning",
+                entity=None,
+                message=(
+                    f"entity_tags row with uuid '{entity_uuid}' "
+                    f"(tag='{tag}') references non-existent entity"
+                ),
+                fix_hint="Remove orphaned tag row",
+            ))
 
     elapsed = int((time.monotonic() - start) * 1000)
     passed = not any(i.severity in ("error", "warning") for i in issues)
@@ -1797,7 +1655,7 @@ def check_referential_integrity(
 
 
 def check_stale_dependencies(
-    entities_conn: sqlite3.Connection, **_
+    entities_conn: sqlite3.Connection, **kwargs
 ) -> CheckResult:
     """Check 11: Stale Dependencies.
 
@@ -1806,28 +1664,23 @@ def check_stale_dependencies(
     """
     start = time.monotonic()
     issues: list[Issue] = []
+    snapshot = get_snapshot(kwargs, entities_conn)
 
-    try:
-        cursor = entities_conn.execute(
-            "SELECT ed.entity_uuid, ed.blocked_by_uuid, e_blocker.type_id AS blocker_type_id "
-            "FROM entity_dependencies ed "
-            "JOIN entities e_blocker ON ed.blocked_by_uuid = e_blocker.uuid "
-            "WHERE e_blocker.status = 'completed'"
-        )
-        for row in cursor:
-            entity_uuid, blocked_by_uuid, blocker_type_id = row
-            issues.append(Issue(
-                check="stale_dependencies",
-                severity="warning",
-                entity=None,
-                message=(
-                    f"Stale blocked_by edge: entity '{entity_uuid}' "
-                    f"blocked by completed '{blocked_by_uuid}' ({blocker_type_id})"
-                ),
-                fix_hint=f"Remove stale dependency on completed '{blocker_type_id}'",
-            ))
-    except sqlite3.Error:
-        pass
+    for entity_uuid, blocked_by_uuid in snapshot.dependencies:
+        blocker = snapshot.by_uuid.get(blocked_by_uuid)
+        if blocker is None or blocker.status != "completed":
+            continue
+        blocker_type_id = blocker.type_id
+        issues.append(Issue(
+            check="stale_dependencies",
+            severity="warning",
+            entity=None,
+            message=(
+                f"Stale blocked_by edge: entity '{entity_uuid}' "
+                f"blocked by completed '{blocked_by_uuid}' ({blocker_type_id})"
+            ),
+            fix_hint=f"Remove stale dependency on completed '{blocker_type_id}'",
+        ))
 
     elapsed = int((time.monotonic() - start) * 1000)
     return CheckResult(
@@ -0,0 +1,552 @@
+"""Incremental pd:doctor runs backed by persisted per-check watermarks.
+
+A full run pays for every check even when nothing changed since the last
+session. run_incremental_diagnostics() records cheap change signals after
+each clean run:
+
+- entity DB: row counts, max(updated_at) and max(rowid) per table, plus
+  PRAGMA schema_version
+- phase_events: max(rowid)
+- artifacts: a manifest hash of .meta.json / brainstorm / backlog.md stats
+- memory DB, config, git refs, worktrees: file stat signatures
+
+Each check declares which signals it reads (_CHECK_INPUTS). On the next
+incremental run a check whose signals are unchanged reuses its cached
+result. Feature-keyed checks (_FEATURE_SCOPED_CHECKS) re-run only for the
+feature slugs whose entity rows or .meta.json changed, and their fresh
+issues are merged over the cached ones. check_db_readiness always runs.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+
+from doctor import (
+    DEFAULT_MAX_WORKERS,
+    _assemble_report,
+    _execute_checks,
+)
+from doctor.models import CheckResult, DiagnosticReport
+
+# Bump when the state layout or any check's semantics change so stale
+# caches are discarded instead of replayed.
+STATE_VERSION = 1
+
+_DEFAULT_STATE_DIR = "~/.claude/pd/doctor"
+
+# Change signals each check depends on (see module docstring).
+_CHECK_INPUTS: dict[str, tuple[str, ...]] = {
+    "check_feature_status": ("entities", "artifacts"),
+    "check_workflow_phase": ("entities", "artifacts", "phase_events"),
+    "check_brainstorm_status": ("entities", "artifacts"),
+    "check_backlog_status": ("entities", "artifacts"),
+    "check_memory_health": ("memory",),
+    "check_branch_consistency": ("entities", "artifacts", "git", "config"),
+    "check_entity_orphans": ("entities", "artifacts"),
+    "check_referential_integrity": ("entities",),
+    "check_stale_dependencies": ("entities",),
+    "check_project_attribution": ("entities",),
+    "check_config_validity": ("config",),
+    "check_security_review_command": ("security_review",),
+    "check_stale_worktrees": ("worktrees", "git"),
+}
+
+# Checks whose issues are all keyed by feature:{slug} (or global, entity
+# None). Their entity/artifact dependency is tracked per slug, so they can
+# be re-evaluated for just the changed features.
+_FEATURE_SCOPED_CHECKS = {
+    "check_feature_status",
+    "check_branch_consistency",
+}
+
+# Inputs tracked per feature slug for the scoped checks.
+_PER_FEATURE_INPUTS = {"entities", "artifacts"}
+
+
+# ---------------------------------------------------------------------------
+# Change signals
+# ---------------------------------------------------------------------------
+
+
+def _stat_sig(path: str) -> list[int] | None:
+    """Return [mtime_ns, size] for path, or None when it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _digest(value) -> str:
+    """Stable short hash of a JSON-serialisable value."""
+    raw = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+def _query_row(conn: sqlite3.Connection, sql: str):
+    try:
+        row = conn.execute(sql).fetchone()
+    except sqlite3.Error:
+        return None
+    return list(row) if row is not None else None
+
+
+def _entity_signals(conn: sqlite3.Connection) -> tuple[str, object]:
+    """Return (entities watermark, phase_events watermark).
+
+    The entities watermark is the ``data_generation`` counter that the
+    entity DB's triggers bump on every write to entities, workflow_phases,
+    entity_dependencies and entity_tags (migration 17). DBs without it fall
+    back to per-table row counts and maxima, which can miss an update made
+    within the same second as the newest ``updated_at``.
+    """
+    schema = _query_row(conn, "PRAGMA schema_version")
+    generation = _query_row(
+        conn, "SELECT value FROM _metadata WHERE key = 'data_generation'",
+    )
+    phase_events = _query_row(conn, "SELECT MAX(rowid) FROM phase_events")
+    if generation is not None:
+        return _digest({"schema": schema, "generation": generation}), phase_events
+
+    entities = {
+        "schema": schema,
+        "entities": _query_row(
+            conn,
+            "SELECT COUNT(*), MAX(updated_at), MAX(rowid) FROM entities",
+        ),
+        "workflow_phases": _query_row(
+            conn,
+            "SELECT COUNT(*), MAX(updated_at), MAX(rowid) FROM workflow_phases",
+        ),
+        "entity_dependencies": _query_row(
+            conn, "SELECT COUNT(*), MAX(rowid) FROM entity_dependencies",
+        ),
+        "entity_tags": _query_row(
+            conn, "SELECT COUNT(*), MAX(rowid) FROM entity_tags",
+        ),
+    }
+    return _digest(entities), phase_events
+
+
+def _feature_rows(conn: sqlite3.Connection) -> dict[str, str]:
+    """Map feature slug -> digest of its entity + workflow_phases timestamps."""
+    rows: dict[str, list] = {}
+    try:
+        cursor = conn.execute(
+            "SELECT e.entity_id, e.status, e.updated_at, "
+            "wp.workflow_phase, wp.last_completed_phase, wp.updated_at "
+            "FROM entities e "
+            "LEFT JOIN workflow_phases wp ON wp.type_id = e.type_id "
+            "WHERE e.entity_type = 'feature'"
+        )
+        for row in cursor:
+            rows.setdefault(row[0], []).append(list(row[1:]))
+    except sqlite3.Error:
+        return {}
+    return {slug: _digest(sorted(vals, key=str)) for slug, vals in rows.items()}
+
+
+def _artifact_manifest(artifacts_root: str) -> tuple[str, dict[str, object]]:
+    """Return (manifest hash, per-feature .meta.json stat map)."""
+    features: dict[str, object] = {}
+    features_dir = os.path.join(artifacts_root, "features")
+    if os.path.isdir(features_dir):
+        for entry in os.listdir(features_dir):
+            feature_dir = os.path.join(features_dir, entry)
+            if os.path.isdir(feature_dir):
+                features[entry] = _stat_sig(os.path.join(feature_dir, ".meta.json"))
+
+    brainstorms: dict[str, object] = {}
+    brainstorms_dir = os.path.join(artifacts_root, "brainstorms")
+    if os.path.isdir(brainstorms_dir):
+        for entry in os.listdir(brainstorms_dir):
+            brainstorms[entry] = _stat_sig(os.path.join(brainstorms_dir, entry))
+
+    manifest = {
+        "root": os.path.isdir(artifacts_root),
+        "features": features,
+        "brainstorms": brainstorms,
+        "backlog": _stat_sig(os.path.join(artifacts_root, "backlog.md")),
+    }
+    return _digest(manifest), features
+
+
+def _git_common_dir(project_root: str) -> str | None:
+    """Locate the shared git dir without spawning git (handles worktrees)."""
+    dot_git = os.path.join(project_root, ".git")
+    if os.path.isdir(dot_git):
+        return dot_git
+    if not os.path.isfile(dot_git):
+        return None
+    try:
+        with open(dot_git) as f:
+            line = f.read().strip()
+    except OSError:
+        return None
+    if not line.startswith("gitdir:"):
+        return None
+    git_dir = os.path.join(project_root, line[len("gitdir:"):].strip())
+    try:
+        with open(os.path.join(git_dir, "commondir")) as f:
+            return os.path.normpath(os.path.join(git_dir, f.read().strip()))
+    except OSError:
+        return git_dir
+
+
+def _git_signals(project_root: str) -> tuple[object, object]:
+    """Return (refs signature, worktree admin signature) from stat calls."""
+    git_dir = _git_common_dir(project_root)
+    if git_dir is None:
+        return None, None
+
+    refs: dict[str, object] = {
+        "HEAD": _stat_sig(os.path.join(git_dir, "HEAD")),
+        "packed-refs": _stat_sig(os.path.join(git_dir, "packed-refs")),
+    }
+    for sub in ("refs/heads", "refs/remotes"):
+        top = os.path.join(git_dir, sub)
+        for dirpath, _dirs, files in os.walk(top):
+            for name in files:
+                path = os.path.join(dirpath, name)
+                refs[os.path.relpath(path, git_dir)] = _stat_sig(path)
+
+    worktrees: dict[str, object] = {}
+    admin = os.path.join(git_dir, "worktrees")
+    if os.path.isdir(admin):
+        for entry in os.listdir(admin):
+            worktrees[entry] = _stat_sig(os.path.join(admin, entry, "gitdir"))
+    return _digest(refs), _digest(worktrees)
+
+
+def _worktree_dir_signal(project_root: str) -> object:
+    worktrees_dir = os.path.join(project_root, ".pd-worktrees")
+    if not os.path.isdir(worktrees_dir):
+        return None
+    return sorted(
+        entry for entry in os.listdir(worktrees_dir)
+        if os.path.isdir(os.path.join(worktrees_dir, entry))
+    )
+
+
+def collect_watermarks(
+    ctx: dict,
+) -> tuple[dict[str, object], dict[str, object], dict[str, str]]:
+    """Compute change signals from an open diagnostics context.
+
+    Returns (watermarks by input name, per-feature file stats,
+    per-feature entity row digests).
+    """
+    entities_sig, phase_events_sig = None, None
+    feature_rows: dict[str, str] = {}
+    entities_conn = ctx.get("entities_conn")
+    if entities_conn is not None:
+        entities_sig, phase_events_sig = _entity_signals(entities_conn)
+        feature_rows = _feature_rows(entities_conn)
+
+    artifacts_sig, feature_files = _artifact_manifest(ctx["artifacts_root"])
+
+    project_root = ctx["project_root"]
+    memory_db_path = ctx["memory_db_path"]
+    memory_sig = {
+        "db": _stat_sig(memory_db_path),
+        "wal": _stat_sig(memory_db_path + "-wal"),
+    }
+    refs_sig, worktree_admin_sig = _git_signals(project_root)
+
+    watermarks = {
+        "entities": entities_sig,
+        "phase_events": phase_events_sig,
+        "artifacts": artifacts_sig,
+        "memory": _digest(memory_sig),
+        "config": _digest({
+            "config": _stat_sig(os.path.join(project_root, ".claude", "pd.local.md")),
+            "base_branch": ctx.get("base_branch"),
+            "artifacts_root": os.path.isdir(
+                os.path.join(project_root, str(ctx["artifacts_root"]))
+            ),
+        }),
+        "security_review": _stat_sig(
+            os.path.join(project_root, ".claude", "commands", "security-review.md")
+        ),
+        "git": refs_sig,
+        "worktrees": _digest({
+            "admin": worktree_admin_sig,
+            "dirs": _worktree_dir_signal(project_root),
+        }),
+    }
+    return watermarks, feature_files, feature_rows
+
+
+# ---------------------------------------------------------------------------
+# State persistence
+# ---------------------------------------------------------------------------
+
+
+def _state_key(
+    entities_db_path: str,
+    memory_db_path: str,
+    artifacts_root: str,
+    project_root: str,
+) -> dict[str, str]:
+    return {
+        "entities_db": os.path.abspath(entities_db_path),
+        "memory_db": os.path.abspath(memory_db_path),
+        "artifacts_root": os.path.abspath(artifacts_root),
+        "project_root": os.path.abspath(project_root),
+    }
+
+
+def default_state_path(
+    entities_db_path: str,
+    memory_db_path: str,
+    artifacts_root: str,
+    project_root: str,
+) -> str:
+    """Per-project state file under ~/.claude/pd/doctor/."""
+    key = _state_key(entities_db_path, memory_db_path, artifacts_root, project_root)
+    return os.path.join(
+        os.path.expanduser(_DEFAULT_STATE_DIR), f"state-{_digest(key)}.json"
+    )
+
+
+def load_state(path: str, key: dict[str, str]) -> dict | None:
+    """Load prior state; None if missing, unreadable, stale or for other paths."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict):
+        return None
+    if state.get("version") != STATE_VERSION or state.get("key") != key:
+        return None
+    return state
+
+
+def save_state(path: str, state: dict) -> None:
+    """Atomic JSON write: NamedTemporaryFile + os.replace()."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_name = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            dir=os.path.dirname(path) or ".",
+            suffix=".tmp",
+            delete=False,
+            encoding="utf-8",
+        ) as fd:
+            tmp_name = fd.name
+            json.dump(state, fd)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+        raise
+
+
+# ---------------------------------------------------------------------------
+# Planning and merging
+# ---------------------------------------------------------------------------
+
+
+def _changed_features(prior: dict, feature_files: dict, feature_rows: dict) -> set[str]:
+    """Feature slugs whose .meta.json stat or entity rows differ from prior."""
+    changed: set[str] = set()
+    for current, previous in (
+        (feature_files, prior.get("feature_files", {})),
+        (feature_rows, prior.get("feature_rows", {})),
+    ):
+        for slug in current.keys() | previous.keys():
+            if current.get(slug) != previous.get(slug):
+                changed.add(slug)
+    return changed
+
+
+def plan_checks(
+    runnable: list[str],
+    prior: dict | None,
+    watermarks: dict,
+    feature_files: dict,
+    feature_rows: dict,
+) -> dict[str, set[str] | None]:
+    """Decide which checks to run, and with which feature scope.
+
+    Omitted checks are served from the cache. None = full run.
+    """
+    if prior is None:
+        return {name: None for name in runnable}
+
+    prior_marks = prior.get("watermarks", {})
+    changed_inputs = {
+        name for name, value in watermarks.items()
+        if prior_marks.get(name) != value
+    }
+    cached = prior.get("results", {})
+
+    # local_entity_ids switches between "all" and "only local" semantics
+    # when the feature directory set becomes (non-)empty: re-run fully.
+    prior_files = prior.get("feature_files", {})
+    emptiness_flipped = bool(prior_files) != bool(feature_files)
+    changed_slugs = _changed_features(prior, feature_files, feature_rows)
+
+    plan: dict[str, set[str] | None] = {}
+    for name in runnable:
+        inputs = _CHECK_INPUTS.get(name)
+        if inputs is None or name not in cached:
+            plan[name] = None
+            continue
+
+        if name in _FEATURE_SCOPED_CHECKS and not emptiness_flipped:
+            global_inputs = set(inputs) - _PER_FEATURE_INPUTS
+            if changed_inputs & global_inputs:
+                plan[name] = None
+            elif changed_slugs:
+                plan[name] = set(changed_slugs)
+            continue
+
+        if changed_inputs & set(inputs):
+            plan[name] = None
+    return plan
+
+
+def _slug_of(entity: str | None) -> str | None:
+    if entity is None or ":" not in entity:
+        return None
+    return entity.split(":", 1)[1]
+
+
+def merge_scoped_result(
+    cached: CheckResult, fresh: CheckResult, scope: set[str]
+) -> CheckResult:
+    """Overlay a scoped re-run onto a cached full result.
+
+    Cached issues for features outside ``scope`` are kept; everything else
+    (in-scope features and global issues) comes from the fresh run.
+    """
+    kept = [
+        issue for issue in cached.issues
+        if _slug_of(issue.entity) is not None
+        and _slug_of(issue.entity) not in scope
+    ]
+    issues = kept + list(fresh.issues)
+    passed = not any(i.severity in ("error", "warning") for i in issues)
+    return CheckResult(
+        name=fresh.name,
+        passed=passed,
+        issues=issues,
+        elapsed_ms=fresh.elapsed_ms,
+        extras={**fresh.extras, "rechecked_features": len(scope)},
+    )
+
+
+def _cacheable(result: CheckResult) -> bool:
+    """Skip and crash placeholders must never be replayed from cache."""
+    return not any(
+        issue.message.startswith(("Skipped:", "Check failed with exception"))
+        or issue.message.endswith("DB file not found")
+        for issue in result.issues
+    )
+
+
+def _strip_run_extras(result: CheckResult) -> dict:
+    data = result.to_dict()
+    data["extras"] = {
+        k: v for k, v in data["extras"].items()
+        if k not in ("cached", "rechecked_features")
+    }
+    return data
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+
+def run_incremental_diagnostics(
+    entities_db_path: str,
+    memory_db_path: str,
+    artifacts_root: str,
+    project_root: str,
+    *,
+    state_path: str | None = None,
+    full: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> DiagnosticReport:
+    """Run diagnostics, re-checking only what changed since the last clean run.
+
+    ``full=True`` ignores the cache (today's behaviour) but still records a
+    fresh baseline. Reused results carry ``extras["cached"] = True``; merged
+    feature-scoped results carry ``extras["rechecked_features"]``. State is
+    only saved when both DBs passed readiness.
+    """
+    start = time.monotonic()
+    key = _state_key(entities_db_path, memory_db_path, artifacts_root, project_root)
+    if state_path is None:
+        state_path = default_state_path(
+            entities_db_path, memory_db_path, artifacts_root, project_root,
+        )
+    prior = None if full else load_state(state_path, key)
+
+    captured: dict = {}
+
+    def _select(ctx: dict, runnable: list[str]) -> dict[str, set[str] | None]:
+        watermarks, feature_files, feature_rows = collect_watermarks(ctx)
+        captured.update(
+            watermarks=watermarks,
+            feature_files=feature_files,
+            feature_rows=feature_rows,
+            clean=bool(ctx.get("entity_db_ok")) and bool(ctx.get("memory_db_ok")),
+        )
+        usable_prior = prior if captured["clean"] else None
+        captured["plan"] = plan_checks(
+            runnable, usable_prior, watermarks, feature_files, feature_rows,
+        )
+        return captured["plan"]
+
+    results = _execute_checks(
+        entities_db_path, memory_db_path, artifacts_root, project_root,
+        max_workers=max_workers, select=_select,
+    )
+
+    plan = captured.get("plan")
+    if plan is not None and prior is not None and captured["clean"]:
+        prior_results = prior.get("results", {})
+        for name in _CHECK_INPUTS:
+            cached_data = prior_results.get(name)
+            if cached_data is None:
+                continue
+            cached = CheckResult.from_dict(cached_data)
+            if name not in plan:
+                cached.extras["cached"] = True
+                results[name] = cached
+            elif plan[name] is not None and name in results:
+                results[name] = merge_scoped_result(
+                    cached, results[name], plan[name],
+                )
+
+    if captured.get("clean"):
+        state = {
+            "version": STATE_VERSION,
+            "key": key,
+            "watermarks": captured["watermarks"],
+            "feature_files": captured["feature_files"],
+            "feature_rows": captured["feature_rows"],
+            "results": {
+                name: _strip_run_extras(result)
+                for name, result in results.items()
+                if name in _CHECK_INPUTS and _cacheable(result)
+            },
+        }
+        try:
+            save_state(state_path, state)
+        except OSError:
+            pass
+
+    return _assemble_report(results, start)
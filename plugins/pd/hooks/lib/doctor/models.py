@@ -18,6 +18,17 @@ class Issue:
         """Serialize to a plain dict (None -> JSON null)."""
         return asdict(self)
 
+    @classmethod
+    def from_dict(cls, data: dict) -> Issue:
+        """Inverse of to_dict (used by the incremental result cache)."""
+        return cls(
+            check=data["check"],
+            severity=data["severity"],
+            entity=data.get("entity"),
+            message=data["message"],
+            fix_hint=data.get("fix_hint"),
+        )
+
 
 @dataclass
 class CheckResult:
@@ -33,6 +44,17 @@ class CheckResult:
         """Serialize to a plain dict (None -> JSON null)."""
         return asdict(self)
 
+    @classmethod
+    def from_dict(cls, data: dict) -> CheckResult:
+        """Inverse of to_dict (used by the incremental result cache)."""
+        return cls(
+            name=data["name"],
+            passed=data["passed"],
+            issues=[Issue.from_dict(i) for i in data.get("issues", [])],
+            elapsed_ms=data.get("elapsed_ms", 0),
+            extras=dict(data.get("extras") or {}),
+        )
+
 
 @dataclass
 class DiagnosticReport:
@@ -0,0 +1,204 @@
+"""Shared read-only snapshot of entity DB and artifact tree for pd:doctor.
+
+Several checks each re-scanned the full entities/workflow_phases tables and
+the artifacts directory. build_snapshot() loads them once into indexed
+in-memory structures; run_diagnostics() hands the same snapshot to every
+check so they can run concurrently without touching a shared connection.
+
+Checks called directly (e.g. from tests) without a snapshot in their
+kwargs build one on demand via get_snapshot().
+"""
+from __future__ import annotations
+
+import glob
+import json
+import os
+import sqlite3
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class EntityRow:
+    """Subset of an entities row used by doctor checks."""
+
+    uuid: str
+    type_id: str
+    entity_type: str
+    entity_id: str
+    status: str | None
+    parent_type_id: str | None
+    parent_uuid: str | None
+    artifact_path: str | None
+    project_id: str | None
+
+
+@dataclass(frozen=True)
+class WorkflowRow:
+    """Subset of a workflow_phases row used by doctor checks."""
+
+    type_id: str
+    workflow_phase: str | None
+    last_completed_phase: str | None
+
+
+@dataclass
+class DoctorSnapshot:
+    """Indexed, read-only view of entity DB tables and the artifact tree.
+
+    Table load failures are recorded in ``errors`` (table name -> exception)
+    so checks can reproduce their previous per-query error handling.
+    """
+
+    entities: list[EntityRow] = field(default_factory=list)
+    workflow_phases: list[WorkflowRow] = field(default_factory=list)
+    dependencies: list[tuple[str, str]] = field(default_factory=list)
+    tags: list[tuple[str, str]] = field(default_factory=list)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    # Indexes over entities / workflow_phases
+    by_type_id: dict[str, EntityRow] = field(default_factory=dict)
+    by_uuid: dict[str, EntityRow] = field(default_factory=dict)
+    by_entity_type: dict[str, list[EntityRow]] = field(default_factory=dict)
+    workflow_by_type_id: dict[str, WorkflowRow] = field(default_factory=dict)
+    dependencies_by_entity: dict[str, list[str]] = field(default_factory=dict)
+
+    # Artifact tree ({artifacts_root}/features and /brainstorms)
+    artifacts_loaded: bool = False
+    feature_dirs: list[str] = field(default_factory=list)
+    feature_meta: dict[str, dict] = field(default_factory=dict)
+    feature_meta_errors: dict[str, Exception] = field(default_factory=dict)
+    brainstorm_entries: list[tuple[str, bool, bool]] = field(default_factory=list)
+
+    def entities_of_type(self, entity_type: str) -> list[EntityRow]:
+        """Return entities with the given entity_type (load order)."""
+        return self.by_entity_type.get(entity_type, [])
+
+    def has_meta_file(self, slug: str) -> bool:
+        """True when features/{slug}/.meta.json exists (parsed or not)."""
+        return slug in self.feature_meta or slug in self.feature_meta_errors
+
+
+_ENTITY_COLUMNS = (
+    "uuid, type_id, entity_type, entity_id, status, "
+    "parent_type_id, parent_uuid, artifact_path, project_id"
+)
+
+
+def _load_entities(snapshot: DoctorSnapshot, conn: sqlite3.Connection) -> None:
+    try:
+        rows = conn.execute(f"SELECT {_ENTITY_COLUMNS} FROM entities").fetchall()
+    except sqlite3.Error as exc:
+        snapshot.errors["entities"] = exc
+        return
+    for row in rows:
+        entity = EntityRow(*row)
+        snapshot.entities.append(entity)
+        snapshot.by_type_id[entity.type_id] = entity
+        snapshot.by_uuid[entity.uuid] = entity
+        snapshot.by_entity_type.setdefault(entity.entity_type, []).append(entity)
+
+
+def _load_workflow_phases(
+    snapshot: DoctorSnapshot, conn: sqlite3.Connection
+) -> None:
+    try:
+        rows = conn.execute(
+            "SELECT type_id, workflow_phase, last_completed_phase "
+            "FROM workflow_phases"
+        ).fetchall()
+    except sqlite3.Error as exc:
+        snapshot.errors["workflow_phases"] = exc
+        return
+    for row in rows:
+        wp = WorkflowRow(*row)
+        snapshot.workflow_phases.append(wp)
+        snapshot.workflow_by_type_id[wp.type_id] = wp
+
+
+def _load_dependencies(
+    snapshot: DoctorSnapshot, conn: sqlite3.Connection
+) -> None:
+    try:
+        rows = conn.execute(
+            "SELECT entity_uuid, blocked_by_uuid FROM entity_dependencies"
+        ).fetchall()
+    except sqlite3.Error as exc:
+        snapshot.errors["entity_dependencies"] = exc
+        return
+    for entity_uuid, blocked_by_uuid in rows:
+        snapshot.dependencies.append((entity_uuid, blocked_by_uuid))
+        snapshot.dependencies_by_entity.setdefault(entity_uuid, []).append(
+            blocked_by_uuid
+        )
+
+
+def _load_tags(snapshot: DoctorSnapshot, conn: sqlite3.Connection) -> None:
+    try:
+        rows = conn.execute("SELECT entity_uuid, tag FROM entity_tags").fetchall()
+    except sqlite3.Error as exc:
+        snapshot.errors["entity_tags"] = exc
+        return
+    snapshot.tags.extend((row[0], row[1]) for row in rows)
+
+
+def _scan_artifacts(snapshot: DoctorSnapshot, artifacts_root: str) -> None:
+    """Parse every features/*/.meta.json and list brainstorms once."""
+    snapshot.artifacts_loaded = True
+
+    features_dir = os.path.join(artifacts_root, "features")
+    if os.path.isdir(features_dir):
+        for entry in os.listdir(features_dir):
+            feature_dir = os.path.join(features_dir, entry)
+            if not os.path.isdir(feature_dir):
+                continue
+            snapshot.feature_dirs.append(entry)
+            meta_path = os.path.join(feature_dir, ".meta.json")
+            if not os.path.isfile(meta_path):
+                continue
+            try:
+                with open(meta_path) as f:
+                    snapshot.feature_meta[entry] = json.loads(f.read())
+            except (ValueError, OSError) as exc:
+                snapshot.feature_meta_errors[entry] = exc
+
+    brainstorms_dir = os.path.join(artifacts_root, "brainstorms")
+    if os.path.isdir(brainstorms_dir):
+        for entry in os.listdir(brainstorms_dir):
+            entry_path = os.path.join(brainstorms_dir, entry)
+            is_dir = os.path.isdir(entry_path)
+            has_prd = bool(
+                is_dir and glob.glob(os.path.join(entry_path, "*.prd.md"))
+            )
+            snapshot.brainstorm_entries.append((entry, is_dir, has_prd))
+
+
+def build_snapshot(
+    entities_conn: sqlite3.Connection | None = None,
+    artifacts_root: str | None = None,
+) -> DoctorSnapshot:
+    """Load entity tables and the artifact tree once.
+
+    Either source may be omitted; the corresponding fields stay empty.
+    Never raises on DB errors -- failures land in ``snapshot.errors``.
+    """
+    snapshot = DoctorSnapshot()
+    if entities_conn is not None:
+        _load_entities(snapshot, entities_conn)
+        _load_workflow_phases(snapshot, entities_conn)
+        _load_dependencies(snapshot, entities_conn)
+        _load_tags(snapshot, entities_conn)
+    if artifacts_root is not None:
+        _scan_artifacts(snapshot, artifacts_root)
+    return snapshot
+
+
+def get_snapshot(
+    kwargs: dict,
+    entities_conn: sqlite3.Connection | None = None,
+    artifacts_root: str | None = None,
+) -> DoctorSnapshot:
+    """Return the shared snapshot from check kwargs, or build a private one."""
+    snapshot = kwargs.get("snapshot")
+    if snapshot is not None:
+        return snapshot
+    return build_snapshot(entities_conn, artifacts_root)
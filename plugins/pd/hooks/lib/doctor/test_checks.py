@@ -1462,6 +1462,34 @@ class TestCheck5WrongEmbeddingDimension:
             conn.close()
 
 
+class TestCheck5QuantizedEmbeddings:
+    """Check 5: float16 and int8 embedding stores are not flagged."""
+
+    @pytest.mark.parametrize("fmt", ["float16", "int8"])
+    def test_check5_quantized_store_passes_dimension_check(self, tmp_path, fmt):
+        np = pytest.importorskip("numpy")
+        from doctor.checks import check_memory_health
+        from semantic_memory.quantize import encode_embedding
+
+        db_path = _make_memory_db(tmp_path)
+        conn = sqlite3.connect(db_path)
+        rng = np.random.default_rng(0)
+        for i in range(3):
+            conn.execute(
+                "INSERT INTO entries (id, content, embedding, created_at, updated_at) "
+                "VALUES (?, 'test', ?, datetime('now'), datetime('now'))",
+                (f"e{i}", encode_embedding(rng.standard_normal(768), fmt)),
+            )
+        conn.commit()
+        try:
+            result = check_memory_health(conn)
+            assert not [
+                i for i in result.issues if "embedding dimension" in i.message
+            ]
+        finally:
+            conn.close()
+
+
 class TestCheck5EmptyKeywordsInfo:
     """Check 5: entries with keywords='[]' reports info."""
 
@@ -2638,6 +2666,307 @@ class TestOrchestratorConnectionsClosedOnException:
         conn.close()
 
 
+class TestSnapshotSharedAcrossChecks:
+    """Snapshot: checks produce identical results with a shared snapshot."""
+
+    def test_shared_snapshot_matches_private_scan(self, tmp_path):
+        from doctor.checks import (
+            check_entity_orphans,
+            check_feature_status,
+            check_referential_integrity,
+        )
+        from doctor.snapshot import build_snapshot
+
+        db_path = _make_db(tmp_path)
+        _register_feature(db_path, "001-alpha", status="active")
+        _register_feature(db_path, "002-beta", status="completed")
+        _create_meta_json(tmp_path, "001-alpha", status="completed")
+        _create_meta_json(tmp_path, "003-gamma", status="active")
+
+        conn = _entities_conn(db_path)
+        try:
+            snapshot = build_snapshot(conn, str(tmp_path))
+            for check in (
+                check_feature_status,
+                check_entity_orphans,
+                check_referential_integrity,
+            ):
+                kwargs = {
+                    "entities_conn": conn,
+                    "artifacts_root": str(tmp_path),
+                    "project_root": str(tmp_path),
+                }
+                private = check(**kwargs)
+                shared = check(snapshot=snapshot, **kwargs)
+                assert [i.to_dict() for i in shared.issues] == [
+                    i.to_dict() for i in private.issues
+                ]
+        finally:
+            conn.close()
+
+    def test_snapshot_used_without_connection(self, tmp_path):
+        """A check given a snapshot never touches entities_conn."""
+        from doctor.checks import check_stale_dependencies
+        from doctor.snapshot import build_snapshot
+
+        db_path = _make_db(tmp_path)
+        conn = _entities_conn(db_path)
+        conn.execute(
+            "INSERT INTO entities (uuid, type_id, entity_type, entity_id, "
+            "name, status) VALUES ('u1', 'feature:001-a', 'feature', "
+            "'001-a', 'A', 'completed')"
+        )
+        conn.execute(
+            "INSERT INTO entity_dependencies VALUES ('u2', 'u1')"
+        )
+        conn.commit()
+        snapshot = build_snapshot(conn, None)
+        conn.close()
+
+        result = check_stale_dependencies(entities_conn=None, snapshot=snapshot)
+        assert len(result.issues) == 1
+        assert "feature:001-a" in result.issues[0].message
+
+    def test_snapshot_records_table_errors(self, tmp_path):
+        from doctor.checks import check_referential_integrity
+        from doctor.snapshot import build_snapshot
+
+        conn = sqlite3.connect(str(tmp_path / "empty.db"))
+        try:
+            snapshot = build_snapshot(conn, str(tmp_path))
+            assert "entities" in snapshot.errors
+            result = check_referential_integrity(conn, snapshot=snapshot)
+            assert result.passed is False
+            assert "Cannot read entities table" in result.issues[0].message
+        finally:
+            conn.close()
+
+
+class TestOrchestratorConcurrentScheduler:
+    """Orchestrator: concurrent scheduling preserves order and results."""
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        from doctor import CHECK_ORDER, run_diagnostics
+
+        db_path = _make_db(tmp_path)
+        mem_path = _make_memory_db(tmp_path)
+        docs = tmp_path / "docs"
+        docs.mkdir(exist_ok=True)
+        _register_feature(db_path, "001-alpha", status="active")
+        _create_meta_json(docs, "001-alpha", status="completed")
+
+        # check_workflow_phase migrates the DB on first open; warm it up so
+        # both runs observe the same schema.
+        run_diagnostics(db_path, mem_path, str(docs), str(tmp_path))
+
+        sequential = run_diagnostics(
+            db_path, mem_path, str(docs), str(tmp_path), max_workers=1,
+        )
+        parallel = run_diagnostics(
+            db_path, mem_path, str(docs), str(tmp_path), max_workers=8,
+        )
+
+        expected_names = [fn.__name__[len("check_"):] for fn in CHECK_ORDER]
+        assert [c.name for c in parallel.checks] == expected_names
+        assert [c.name for c in sequential.checks] == expected_names
+        for seq, par in zip(sequential.checks, parallel.checks):
+            assert [i.to_dict() for i in seq.issues] == [
+                i.to_dict() for i in par.issues
+            ]
+            assert par.elapsed_ms >= 0
+
+    def test_checks_run_on_worker_threads(self, tmp_path, monkeypatch):
+        import doctor
+
+        db_path = _make_db(tmp_path)
+        mem_path = _make_memory_db(tmp_path)
+        (tmp_path / "docs").mkdir(exist_ok=True)
+
+        seen: dict[str, str] = {}
+
+        def _recording(fn):
+            def wrapper(**ctx):
+                seen[fn.__name__] = threading.current_thread().name
+                assert ctx["snapshot"] is not None
+                return fn(**ctx)
+            wrapper.__name__ = fn.__name__
+            return wrapper
+
+        monkeypatch.setattr(
+            doctor, "CHECK_ORDER",
+            [doctor.CHECK_ORDER[0]]
+            + [_recording(fn) for fn in doctor.CHECK_ORDER[1:]],
+        )
+
+        report = doctor.run_diagnostics(
+            db_path, mem_path, str(tmp_path / "docs"), str(tmp_path),
+        )
+        assert len(report.checks) == 14
+        assert len(seen) == 13
+        assert all(name.startswith("pd-doctor") for name in seen.values())
+
+    def test_locked_entity_db_skips_before_snapshot(self, tmp_path):
+        from doctor import run_diagnostics
+
+        db_path = _make_db(tmp_path)
+        mem_path = _make_memory_db(tmp_path)
+        (tmp_path / "docs").mkdir(exist_ok=True)
+
+        blocker = sqlite3.connect(db_path)
+        blocker.execute("BEGIN IMMEDIATE")
+        try:
+            report = run_diagnostics(
+                db_path, mem_path, str(tmp_path / "docs"), str(tmp_path),
+            )
+        finally:
+            blocker.rollback()
+            blocker.close()
+
+        assert report.checks[0].name == "db_readiness"
+        ref = next(c for c in report.checks if c.name == "referential_integrity")
+        assert any("Skipped" in i.message for i in ref.issues)
+
+
+class TestIncrementalDiagnostics:
+    """Incremental runs reuse cached results for unchanged inputs."""
+
+    def _setup(self, tmp_path):
+        from doctor import run_diagnostics
+
+        db_path = _make_db(tmp_path)
+        mem_path = _make_memory_db(tmp_path)
+        docs = tmp_path / "docs"
+        docs.mkdir(exist_ok=True)
+        _register_feature(db_path, "001-alpha", status="active")
+        _create_meta_json(docs, "001-alpha", status="completed")
+        _register_feature(db_path, "002-beta", status="active")
+        _create_meta_json(docs, "002-beta", status="completed")
+        # check_workflow_phase migrates the DB on first open
+        run_diagnostics(db_path, mem_path, str(docs), str(tmp_path))
+        state = str(tmp_path / "state.json")
+        return db_path, mem_path, str(docs), state
+
+    def _run(self, tmp_path, db_path, mem_path, docs, state, **kw):
+        from doctor.incremental import run_incremental_diagnostics
+
+        return run_incremental_diagnostics(
+            db_path, mem_path, docs, str(tmp_path), state_path=state, **kw,
+        )
+
+    def test_unchanged_inputs_serve_cached_results(self, tmp_path):
+        db_path, mem_path, docs, state = self._setup(tmp_path)
+
+        first = self._run(tmp_path, db_path, mem_path, docs, state)
+        assert os.path.isfile(state)
+        assert not any(c.extras.get("cached") for c in first.checks)
+
+        second = self._run(tmp_path, db_path, mem_path, docs, state)
+        assert [c.name for c in second.checks] == [c.name for c in first.checks]
+        by_name = {c.name: c for c in second.checks}
+        assert not by_name["db_readiness"].extras.get("cached")
+        assert by_name["feature_status"].extras.get("cached") is True
+        assert by_name["referential_integrity"].extras.get("cached") is True
+        for a, b in zip(first.checks, second.checks):
+            assert [i.to_dict() for i in a.issues] == [
+                i.to_dict() for i in b.issues
+            ]
+        assert second.error_count == first.error_count
+        assert second.warning_count == first.warning_count
+
+    def test_touched_feature_is_rechecked_alone(self, tmp_path):
+        db_path, mem_path, docs, state = self._setup(tmp_path)
+        self._run(tmp_path, db_path, mem_path, docs, state)
+
+        # Fix 001-alpha only; 002-beta keeps its cached mismatch.
+        _create_meta_json(
+            tmp_path / "docs", "001-alpha", status="active",
+        )
+        report = self._run(tmp_path, db_path, mem_path, docs, state)
+
+        fs = next(c for c in report.checks if c.name == "feature_status")
+        assert fs.extras.get("rechecked_features") == 1
+        entities = {i.entity for i in fs.issues}
+        assert "feature:002-beta" in entities
+        assert "feature:001-alpha" not in entities
+
+    def test_entity_update_invalidates_dependent_checks(self, tmp_path):
+        db_path, mem_path, docs, state = self._setup(tmp_path)
+        self._run(tmp_path, db_path, mem_path, docs, state)
+
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "UPDATE entities SET status = 'completed' "
+            "WHERE type_id = 'feature:002-beta'"
+        )
+        conn.commit()
+        conn.close()
+
+        report = self._run(tmp_path, db_path, mem_path, docs, state)
+        by_name = {c.name: c for c in report.checks}
+        assert not by_name["referential_integrity"].extras.get("cached")
+        assert by_name["config_validity"].extras.get("cached") is True
+        fs = by_name["feature_status"]
+        assert fs.extras.get("rechecked_features") == 1
+        assert "feature:002-beta" not in {i.entity for i in fs.issues}
+        assert "feature:001-alpha" in {i.entity for i in fs.issues}
+
+    def test_same_second_update_invalidates_dependent_checks(self, tmp_path):
+        """An update leaving COUNT/MAX(updated_at)/MAX(rowid) unchanged is seen."""
+        db_path, mem_path, docs, state = self._setup(tmp_path)
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE entities SET updated_at = '2026-01-01T00:00:00Z'")
+        conn.commit()
+        self._run(tmp_path, db_path, mem_path, docs, state)
+
+        conn.execute(
+            "UPDATE entities SET status = 'completed' "
+            "WHERE type_id = 'feature:002-beta'"
+        )
+        conn.commit()
+        conn.close()
+
+        report = self._run(tmp_path, db_path, mem_path, docs, state)
+        by_name = {c.name: c for c in report.checks}
+        assert not by_name["referential_integrity"].extras.get("cached")
+        fs = by_name["feature_status"]
+        assert fs.extras.get("rechecked_features") == 1
+        assert "feature:002-beta" not in {i.entity for i in fs.issues}
+
+    def test_full_ignores_cache_and_refreshes_state(self, tmp_path):
+        db_path, mem_path, docs, state = self._setup(tmp_path)
+        self._run(tmp_path, db_path, mem_path, docs, state)
+        before = os.stat(state).st_mtime_ns
+
+        report = self._run(tmp_path, db_path, mem_path, docs, state, full=True)
+        assert not any(c.extras.get("cached") for c in report.checks)
+        assert os.stat(state).st_mtime_ns >= before
+
+    def test_stale_state_version_is_ignored(self, tmp_path):
+        db_path, mem_path, docs, state = self._setup(tmp_path)
+        self._run(tmp_path, db_path, mem_path, docs, state)
+        with open(state) as f:
+            data = json.load(f)
+        data["version"] = -1
+        with open(state, "w") as f:
+            json.dump(data, f)
+
+        report = self._run(tmp_path, db_path, mem_path, docs, state)
+        assert not any(c.extras.get("cached") for c in report.checks)
+
+    def test_locked_entity_db_does_not_write_state(self, tmp_path):
+        db_path, mem_path, docs, state = self._setup(tmp_path)
+
+        blocker = sqlite3.connect(db_path)
+        blocker.execute("BEGIN IMMEDIATE")
+        try:
+            self._run(tmp_path, db_path, mem_path, docs, state)
+        finally:
+            blocker.rollback()
+            blocker.close()
+
+        assert not os.path.exists(state)
+
+
 # ===========================================================================
 # Task 5.2: CLI Tests
 # ===========================================================================
@@ -2816,6 +3145,44 @@ class TestCliNoneSerializesAsJsonNull:
         assert result.returncode == 0
 
 
+class TestCliIncrementalStateFile:
+    """CLI: --incremental writes state, the next run serves cached checks."""
+
+    def test_cli_incremental_reuses_state(self, tmp_path):
+        db_path = _make_db(tmp_path)
+        mem_path = _make_memory_db(tmp_path)
+        (tmp_path / "docs").mkdir(exist_ok=True)
+        state = str(tmp_path / "doctor-state.json")
+
+        cmd = [sys.executable, "-m", "doctor",
+               "--entities-db", db_path,
+               "--memory-db", mem_path,
+               "--project-root", str(tmp_path),
+               "--artifacts-root", str(tmp_path / "docs"),
+               "--state-file", state]
+        env = {**os.environ, "PYTHONPATH": _doctor_lib_path()}
+
+        subprocess.run(cmd + ["--full"], capture_output=True, text=True, env=env)
+        assert os.path.isfile(state)
+        result = subprocess.run(
+            cmd + ["--incremental"], capture_output=True, text=True, env=env,
+        )
+        assert result.returncode == 0
+        checks = json.loads(result.stdout)["diagnostic"]["checks"]
+        assert len(checks) == 14
+        assert any(c["extras"].get("cached") for c in checks)
+
+    def test_cli_incremental_and_full_are_exclusive(self, tmp_path):
+        result = subprocess.run(
+            [sys.executable, "-m", "doctor",
+             "--entities-db", "x", "--memory-db", "y", "--project-root", ".",
+             "--incremental", "--full"],
+            capture_output=True, text=True,
+            env={**os.environ, "PYTHONPATH": _doctor_lib_path()},
+        )
+        assert result.returncode != 0
+
+
 # ---------------------------------------------------------------------------
 # Lock Holder Identification Tests (feature 063)
 # ---------------------------------------------------------------------------
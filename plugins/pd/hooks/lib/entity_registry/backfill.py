@@ -12,6 +12,7 @@ import logging
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from entity_registry.database import EntityDatabase
 from workflow_engine.kanban import derive_kanban
@@ -40,6 +41,9 @@ VALID_MODES: frozenset[str] = frozenset({"standard", "full", "light"})
 
 BACKFILL_BATCH_SIZE = 20
 
+# Threads used to read and parse artifact files on the bulk path (I/O bound).
+PARSE_WORKERS = 8
+
 
 def _chunked(iterable, size: int):
     """Yield successive chunks of *size* from *iterable*."""
@@ -107,6 +111,88 @@ def _resolve_meta_path(
     return None
 
 
+def _derive_workflow_row(
+    entity: dict, meta: dict | None, all_children_completed: bool,
+) -> dict:
+    """Derive the workflow_phases columns for a non-project entity.
+
+    Brainstorms and backlog items get fixed draft/open defaults (moved to
+    the completed column when every child feature is completed). Other
+    entities resolve status from .meta.json, then the entity row, then
+    ``planned``; features additionally derive phase and mode.
+    """
+    type_id = entity["type_id"]
+    entity_type = entity["entity_type"]
+
+    if entity_type in ("brainstorm", "backlog"):
+        if entity_type == "brainstorm":
+            row = {"workflow_phase": "draft", "kanban_column": "wip"}
+        else:
+            row = {"workflow_phase": "open", "kanban_column": "backlog"}
+        if all_children_completed:
+            row["kanban_column"] = "completed"
+        return row
+
+    # 3-tier status resolution
+    status = None
+    if meta is not None and "status" in meta:
+        status = meta["status"]
+    if status is None and entity["status"] is not None:
+        status = entity["status"]
+    if status is None:
+        status = "planned"
+
+    # Validate status
+    if status not in _VALID_STATUSES:
+        logger.warning(
+            "Unmapped status %r for entity %s, defaulting to 'planned'",
+            status, type_id,
+        )
+        status = "planned"
+
+    # Feature-specific: derive workflow_phase, last_completed_phase, mode
+    workflow_phase = None
+    last_completed_phase = None
+    mode = None
+
+    if entity_type == "feature":
+        # last_completed_phase from .meta.json
+        if meta is not None:
+            last_completed_phase = meta.get("lastCompletedPhase")
+        # Validate last_completed_phase
+        if last_completed_phase is not None and last_completed_phase not in PHASE_SEQUENCE:
+            logger.warning(
+                "Unrecognized lastCompletedPhase %r for entity %s, setting to None",
+                last_completed_phase, type_id,
+            )
+            last_completed_phase = None
+
+        # Derive workflow_phase
+        workflow_phase = _derive_next_phase(last_completed_phase)
+
+        # Special case: completed status -> workflow_phase = finish
+        if status == "completed":
+            workflow_phase = "finish"
+
+        # mode from .meta.json
+        if meta is not None:
+            mode = meta.get("mode")
+        # Validate mode
+        if mode is not None and mode not in VALID_MODES:
+            logger.warning(
+                "Invalid mode %r for entity %s, setting to None",
+                mode, type_id,
+            )
+            mode = None
+
+    return {
+        "workflow_phase": workflow_phase,
+        "kanban_column": derive_kanban(status, workflow_phase),
+        "last_completed_phase": last_completed_phase,
+        "mode": mode,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -114,7 +200,7 @@ def _resolve_meta_path(
 
 def run_backfill(
     db: EntityDatabase, artifacts_root: str, header_aware: bool = False,
-    project_id: str = "__unknown__",
+    project_id: str = "__unknown__", *, bulk: bool = True,
 ) -> None:
     """Scan artifact directories and register entities in topological order.
 
@@ -129,6 +215,12 @@ def run_backfill(
         BEFORE the backfill_complete guard check.  This ensures headers are
         stamped even on already-backfilled databases (spec R26).
         Defaults to False for backward compatibility (spec R25).
+    bulk:
+        If True (default) and the project has no entities yet, parse all
+        artifacts up front (in parallel) and ingest entities and their
+        workflow_phases rows with one ``register_entities_batch`` call.
+        Otherwise, or when the artifacts contain duplicate ids, the
+        per-entity scanners run as before.
     """
     # Step 1: Header stamping (independent of backfill_complete) — spec R26
     if header_aware:
@@ -146,17 +238,25 @@ def run_backfill(
     if db.get_metadata("backfill_complete") == "1" and current_version >= _BACKFILL_VERSION:
         return
 
-    scanners = {
-        "backlog": _scan_backlog,
-        "brainstorm": _scan_brainstorms,
-        "project": _scan_projects,
-        "feature": _scan_features,
-    }
-
-    for entity_type in ENTITY_SCAN_ORDER:
-        scanners[entity_type](db, artifacts_root, project_id=project_id)
-
-    # Fix orphaned NULL workflow_phase values (e.g. abandoned entities)
+    plan = None
+    if bulk and not db.list_entities(project_id=project_id, limit=1):
+        plan = plan_bulk_backfill(artifacts_root)
+
+    if plan is None:
+        scanners = {
+            "backlog": _scan_backlog,
+            "brainstorm": _scan_brainstorms,
+            "project": _scan_projects,
+            "feature": _scan_features,
+        }
+
+        with db.deferred_fts():
+            for entity_type in ENTITY_SCAN_ORDER:
+                scanners[entity_type](db, artifacts_root, project_id=project_id)
+
+    # Fix orphaned NULL workflow_phase values (e.g. abandoned entities).
+    # Runs before bulk ingestion so only pre-existing rows are touched,
+    # matching the per-entity path where phases are created afterwards.
     with db.transaction():
         all_phases = db.list_workflow_phases()
         for row in all_phases:
@@ -166,6 +266,9 @@ def run_backfill(
                 except ValueError:
                     pass  # TOCTOU: row deleted between list and update
 
+    if plan:
+        db.register_entities_batch(plan, project_id=project_id)
+
     # Mark backfill as complete with current version
     db.set_metadata("backfill_complete", "1")
     db.set_metadata("backfill_version", _BACKFILL_VERSION)
@@ -202,6 +305,18 @@ def backfill_workflow_phases(
     all_entities = db.list_entities()
     entities = [e for e in all_entities if e["entity_type"] != "project"]
 
+    # Index feature children once instead of rescanning every entity per
+    # brainstorm/backlog.
+    children_by_uuid: dict[str, list[dict]] = {}
+    legacy_children: dict[str, list[dict]] = {}
+    for e in all_entities:
+        if e["entity_type"] != "feature":
+            continue
+        if e.get("parent_uuid"):
+            children_by_uuid.setdefault(e["parent_uuid"], []).append(e)
+        elif e.get("parent_type_id"):
+            legacy_children.setdefault(e["parent_type_id"], []).append(e)
+
     for batch in _chunked(entities, BACKFILL_BATCH_SIZE):
         with db.transaction():
             for entity in batch:
@@ -226,18 +341,10 @@ def backfill_workflow_phases(
                         # Child-completion override (D3: prefer parent_uuid, fall back
                         # to parent_type_id for legacy entities without parent_uuid)
                         entity_uuid = entity.get("uuid")
-                        children = [
-                            e for e in all_entities
-                            if e["entity_type"] == "feature"
-                            and (
-                                (entity_uuid and e.get("parent_uuid") == entity_uuid)
-                                or (
-                                    not e.get("parent_uuid")
-                                    and e.get("parent_type_id") == type_id
-                                )
-                            )
-                        ]
-                        all_children_completed = children and all(
+                        children = legacy_children.get(type_id, [])
+                        if entity_uuid:
+                            children = children_by_uuid.get(entity_uuid, []) + children
+                        all_children_completed = bool(children) and all(
                             c.get("status") == "completed" for c in children
                         )
 
@@ -248,91 +355,20 @@ def backfill_workflow_phases(
                             skipped += 1
                             continue
 
-                        # Derive defaults
-                        if entity_type == "brainstorm":
-                            workflow_phase = "draft"
-                            kanban_column = "wip"
-                        else:  # backlog
-                            workflow_phase = "open"
-                            kanban_column = "backlog"
-
-                        # Apply child-completion override
-                        if all_children_completed:
-                            kanban_column = "completed"
+                        row = _derive_workflow_row(entity, meta, all_children_completed)
 
                         # Case 3: existing row with NULL phase -> UPDATE
                         if existing_row and existing_row["workflow_phase"] is None:
-                            db.update_workflow_phase(
-                                type_id,
-                                workflow_phase=workflow_phase,
-                                kanban_column=kanban_column,
-                            )
+                            db.update_workflow_phase(type_id, **row)
                             updated += 1
                             continue
 
                         # Case 1: no row -> INSERT (upsert for idempotency)
-                        db.upsert_workflow_phase(
-                            type_id,
-                            project_id=project_id,
-                            workflow_phase=workflow_phase,
-                            kanban_column=kanban_column,
-                        )
+                        db.upsert_workflow_phase(type_id, project_id=project_id, **row)
                         created += 1
                         continue
 
-                    # 3-tier status resolution
-                    status = None
-                    if meta is not None and "status" in meta:
-                        status = meta["status"]
-                    if status is None and entity["status"] is not None:
-                        status = entity["status"]
-                    if status is None:
-                        status = "planned"
-
-                    # Validate status
-                    if status not in _VALID_STATUSES:
-                        logger.warning(
-                            "Unmapped status %r for entity %s, defaulting to 'planned'",
-                            status, type_id,
-                        )
-                        status = "planned"
-
-                    # Feature-specific: derive workflow_phase, last_completed_phase, mode
-                    workflow_phase = None
-                    last_completed_phase = None
-                    mode = None
-
-                    if entity_type == "feature":
-                        # last_completed_phase from .meta.json
-                        if meta is not None:
-                            last_completed_phase = meta.get("lastCompletedPhase")
-                        # Validate last_completed_phase
-                        if last_completed_phase is not None and last_completed_phase not in PHASE_SEQUENCE:
-                            logger.warning(
-                                "Unrecognized lastCompletedPhase %r for entity %s, setting to None",
-                                last_completed_phase, type_id,
-                            )
-                            last_completed_phase = None
-
-                        # Derive workflow_phase
-                        workflow_phase = _derive_next_phase(last_completed_phase)
-
-                        # Special case: completed status -> workflow_phase = finish
-                        if status == "completed":
-                            workflow_phase = "finish"
-
-                        # mode from .meta.json
-                        if meta is not None:
-                            mode = meta.get("mode")
-                        # Validate mode
-                        if mode is not None and mode not in VALID_MODES:
-                            logger.warning(
-                                "Invalid mode %r for entity %s, setting to None",
-                                mode, type_id,
-                            )
-                            mode = None
-
-                    kanban_column = derive_kanban(status, workflow_phase)
+                    row = _derive_workflow_row(entity, meta, False)
 
                     # Skip if row already exists (idempotent — don't overwrite)
                     if db.get_workflow_phase(type_id) is not None:
@@ -340,14 +376,7 @@ def backfill_workflow_phases(
                         continue
 
                     # Upsert for idempotency (INSERT OR IGNORE + UPDATE)
-                    db.upsert_workflow_phase(
-                        type_id,
-                        project_id=project_id,
-                        workflow_phase=workflow_phase,
-                        kanban_column=kanban_column,
-                        last_completed_phase=last_completed_phase,
-                        mode=mode,
-                    )
+                    db.upsert_workflow_phase(type_id, project_id=project_id, **row)
                     created += 1
 
                 except Exception as exc:
@@ -370,35 +399,7 @@ def _scan_backlog(db: EntityDatabase, artifacts_root: str, project_id: str = "__
     with open(backlog_path) as f:
         content = f.read()
 
-    for line in content.splitlines():
-        line = line.strip()
-        if not line.startswith("|"):
-            continue
-        # Skip header and separator rows
-        cells = [c.strip() for c in line.split("|")]
-        # Split produces ['', cell1, cell2, ..., ''] for | delimited rows
-        cells = [c for c in cells if c]
-        if len(cells) < 3:
-            # Skip separator rows silently (all dashes), log others
-            raw_cells = [c.strip() for c in line.split("|") if c.strip()]
-            if raw_cells and not all(c.startswith("-") for c in raw_cells):
-                print(
-                    f"entity-server: backfill: skipping malformed backlog row: {line!r}",
-                    file=sys.stderr,
-                )
-            continue
-        item_id = cells[0]
-        # Skip header row and separator row
-        if item_id == "ID" or item_id.startswith("-"):
-            continue
-
-        description = cells[2]
-        if len(description) <= 80:
-            title = description
-        else:
-            truncated = description[:80].rsplit(" ", 1)[0]
-            title = (truncated if truncated != description[:80] else description[:80]) + "\u2026"
-
+    for item_id, title, description in _parse_backlog(content):
         db.register_entity(
             entity_type="backlog",
             entity_id=item_id,
@@ -418,16 +419,7 @@ def _scan_backlog(db: EntityDatabase, artifacts_root: str, project_id: str = "__
         existing = db.get_entity(f"backlog:{item_id}")
         existing_status = (existing or {}).get("status") or ""
         if existing_status not in ("promoted", "dropped"):
-            derived_status = None
-            desc_lower = description.lower()
-            if "(promoted" in desc_lower:
-                derived_status = "promoted"
-            elif any(
-                marker in desc_lower
-                for marker in ["(closed:", "(fixed:", "(already implemented"]
-            ):
-                derived_status = "dropped"
-
+            derived_status = _backlog_status(description)
             if derived_status:
                 db.update_entity(
                     type_id=f"backlog:{item_id}",
@@ -443,6 +435,52 @@ def _scan_backlog(db: EntityDatabase, artifacts_root: str, project_id: str = "__
                     )
 
 
+def _parse_backlog(content: str):
+    """Yield ``(item_id, title, description)`` for each backlog.md table row."""
+    for line in content.splitlines():
+        line = line.strip()
+        if not line.startswith("|"):
+            continue
+        # Skip header and separator rows
+        cells = [c.strip() for c in line.split("|")]
+        # Split produces ['', cell1, cell2, ..., ''] for | delimited rows
+        cells = [c for c in cells if c]
+        if len(cells) < 3:
+            # Skip separator rows silently (all dashes), log others
+            raw_cells = [c.strip() for c in line.split("|") if c.strip()]
+            if raw_cells and not all(c.startswith("-") for c in raw_cells):
+                print(
+                    f"entity-server: backfill: skipping malformed backlog row: {line!r}",
+                    file=sys.stderr,
+                )
+            continue
+        item_id = cells[0]
+        # Skip header row and separator row
+        if item_id == "ID" or item_id.startswith("-"):
+            continue
+
+        description = cells[2]
+        if len(description) <= 80:
+            title = description
+        else:
+            truncated = description[:80].rsplit(" ", 1)[0]
+            title = (truncated if truncated != description[:80] else description[:80]) + "\u2026"
+        yield item_id, title, description
+
+
+def _backlog_status(description: str) -> str | None:
+    """Derive a promoted/dropped status from backlog.md annotations."""
+    desc_lower = description.lower()
+    if "(promoted" in desc_lower:
+        return "promoted"
+    if any(
+        marker in desc_lower
+        for marker in ["(closed:", "(fixed:", "(already implemented"]
+    ):
+        return "dropped"
+    return None
+
+
 def _scan_brainstorms(db: EntityDatabase, artifacts_root: str, project_id: str = "__unknown__") -> None:
     """Glob brainstorm files and register each as a brainstorm entity.
 
@@ -452,27 +490,32 @@ def _scan_brainstorms(db: EntityDatabase, artifacts_root: str, project_id: str =
     if not os.path.isdir(bs_dir):
         return
 
+    for path, stem in _brainstorm_files(bs_dir):
+        _register_brainstorm(db, path, stem, project_id=project_id)
+
+
+def _brainstorm_files(bs_dir: str) -> list[tuple[str, str]]:
+    """Return ``(path, stem)`` per brainstorm, .prd.md winning over .md."""
+    files: list[tuple[str, str]] = []
     registered_stems: set[str] = set()
 
     # Phase 1: .prd.md files (higher priority)
-    prd_files = sorted(glob.glob(os.path.join(bs_dir, "*.prd.md")))
-    for path in prd_files:
+    for path in sorted(glob.glob(os.path.join(bs_dir, "*.prd.md"))):
         stem = _brainstorm_stem(path)
-        _register_brainstorm(db, path, stem, project_id=project_id)
+        files.append((path, stem))
         registered_stems.add(stem)
 
     # Phase 2: .md files (only unregistered stems)
-    md_files = sorted(glob.glob(os.path.join(bs_dir, "*.md")))
-    for path in md_files:
+    for path in sorted(glob.glob(os.path.join(bs_dir, "*.md"))):
         # Skip .prd.md files (already processed)
         if path.endswith(".prd.md"):
             continue
         stem = _brainstorm_stem(path)
         if stem in registered_stems:
             continue
-
-        _register_brainstorm(db, path, stem, project_id=project_id)
+        files.append((path, stem))
         registered_stems.add(stem)
+    return files
 
 
 def _scan_projects(db: EntityDatabase, artifacts_root: str, project_id: str = "__unknown__") -> None:
@@ -565,6 +608,126 @@ def _scan_features(db: EntityDatabase, artifacts_root: str, project_id: str = "_
             db.set_parent(type_id, bl_type_id)
 
 
+# ---------------------------------------------------------------------------
+# Bulk ingestion
+# ---------------------------------------------------------------------------
+
+
+def plan_bulk_backfill(
+    artifacts_root: str, max_workers: int = PARSE_WORKERS,
+) -> list[dict] | None:
+    """Build the ``register_entities_batch`` rows for a first-time backfill.
+
+    Reads every backlog row, brainstorm and .meta.json file (files are
+    parsed on ``max_workers`` threads) and reproduces what the per-entity
+    scanners would register into an empty project: names, derived backlog
+    statuses, synthetic external/orphaned parents and parent links. Each
+    non-project row also carries the workflow_phases row that
+    ``backfill_workflow_phases`` would create for it.
+
+    Returns None when two artifacts share a type_id; the scanners' update
+    and re-parenting rules decide those, so the caller falls back to them.
+    """
+    rows: dict[str, dict] = {}
+    metas: dict[str, dict] = {}
+
+    def add(entity_type, entity_id, name, **fields) -> bool:
+        type_id = f"{entity_type}:{entity_id}"
+        if type_id in rows:
+            return False
+        rows[type_id] = {
+            "entity_type": entity_type, "entity_id": entity_id,
+            "name": name, **fields,
+        }
+        return True
+
+    backlog_path = os.path.join(artifacts_root, "backlog.md")
+    bs_dir = os.path.join(artifacts_root, "brainstorms")
+    brainstorms = _brainstorm_files(bs_dir) if os.path.isdir(bs_dir) else []
+    project_metas = sorted(glob.glob(os.path.join(artifacts_root, "projects", "*", ".meta.json")))
+    feature_metas = sorted(glob.glob(os.path.join(artifacts_root, "features", "*", ".meta.json")))
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        bs_contents = pool.map(_read_file, [path for path, _ in brainstorms])
+        project_data = pool.map(_read_json, project_metas)
+        feature_data = pool.map(_read_json, feature_metas)
+        backlog_content = _read_file(backlog_path)
+
+        if backlog_content is not None:
+            for item_id, title, description in _parse_backlog(backlog_content):
+                if not add(
+                    "backlog", item_id, title, artifact_path=backlog_path,
+                    metadata={"description": description},
+                    status=_backlog_status(description),
+                ):
+                    return None
+
+        for (path, stem), content in zip(brainstorms, bs_contents):
+            parent_type_id = _derive_parent("brainstorm", {}, content)
+            add(
+                "brainstorm", stem, _extract_prd_title(content, stem),
+                artifact_path=path,
+                parent_type_id=parent_type_id if parent_type_id in rows else None,
+            )
+
+        for path, meta in zip(project_metas, project_data):
+            if meta is None:
+                continue
+            proj_entity_id = meta.get("id", "")
+            parent_type_id = _derive_parent("project", meta, None)
+            if not add(
+                "project", proj_entity_id, meta.get("name", proj_entity_id),
+                artifact_path=os.path.dirname(path),
+                parent_type_id=parent_type_id if parent_type_id in rows else None,
+            ):
+                return None
+
+        for path, meta in zip(feature_metas, feature_data):
+            if meta is None:
+                continue
+            feat_id = meta.get("id", "")
+            slug = meta.get("slug", "")
+            entity_id = f"{feat_id}-{slug}" if slug else feat_id
+            name = meta.get("name", "") or _humanize_slug(slug or entity_id)
+
+            parent_type_id = _derive_parent("feature", meta, None)
+            if not parent_type_id and meta.get("backlog_source"):
+                parent_type_id = f"backlog:{meta['backlog_source']}"
+            if parent_type_id and parent_type_id not in rows:
+                spec = _synthetic_parent_spec(parent_type_id, meta)
+                if spec is not None:
+                    add(spec[0], spec[1], spec[2], status=spec[3])
+
+            if not add(
+                "feature", entity_id, name,
+                artifact_path=os.path.dirname(path),
+                metadata=(
+                    {"depends_on_features": meta["depends_on_features"]}
+                    if "depends_on_features" in meta else None
+                ),
+                parent_type_id=parent_type_id if parent_type_id in rows else None,
+            ):
+                return None
+            metas[f"feature:{entity_id}"] = meta
+
+    completed_parents: dict[str, bool] = {}
+    for type_id, row in rows.items():
+        if row["entity_type"] == "feature" and row.get("parent_type_id"):
+            parent = row["parent_type_id"]
+            completed_parents[parent] = completed_parents.get(parent, True) and (
+                row.get("status") == "completed"
+            )
+
+    for type_id, row in rows.items():
+        if row["entity_type"] == "project":
+            continue
+        entity = {**row, "type_id": type_id, "status": row.get("status")}
+        row["workflow_phase"] = _derive_workflow_row(
+            entity, metas.get(type_id), completed_parents.get(type_id, False),
+        )
+    return list(rows.values())
+
+
 # ---------------------------------------------------------------------------
 # Parent derivation
 # ---------------------------------------------------------------------------
@@ -665,37 +828,34 @@ def _register_synthetic_for_missing_parent(
     - Brainstorm parent with external path -> status="external"
     - Backlog parent not found -> status="orphaned"
     """
+    spec = _synthetic_parent_spec(parent_type_id, meta)
+    if spec is not None:
+        _register_synthetic(db, *spec, project_id=project_id)
+
+
+def _synthetic_parent_spec(
+    parent_type_id: str, meta: dict,
+) -> tuple[str, str, str, str] | None:
+    """Return ``(entity_type, entity_id, name, status)`` for a missing parent.
+
+    None when the reference is malformed or of a type that is never
+    synthesised.
+    """
     parts = parent_type_id.split(":", 1)
     if len(parts) != 2:
-        return
+        return None
     p_type, p_id = parts
 
     if p_type == "brainstorm":
         bs_source = meta.get("brainstorm_source", "")
         if _is_external_path(bs_source):
-            _register_synthetic(
-                db, "brainstorm", p_id,
-                f"External: {bs_source}", "external",
-                project_id=project_id,
-            )
-        else:
-            _register_synthetic(
-                db, "brainstorm", p_id,
-                f"Brainstorm {p_id} (orphaned)", "orphaned",
-                project_id=project_id,
-            )
-    elif p_type == "backlog":
-        _register_synthetic(
-            db, "backlog", p_id,
-            f"Backlog #{p_id} (orphaned)", "orphaned",
-            project_id=project_id,
-        )
-    elif p_type == "project":
-        _register_synthetic(
-            db, "project", p_id,
-            f"Project {p_id} (orphaned)", "orphaned",
-            project_id=project_id,
-        )
+            return ("brainstorm", p_id, f"External: {bs_source}", "external")
+        return ("brainstorm", p_id, f"Brainstorm {p_id} (orphaned)", "orphaned")
+    if p_type == "backlog":
+        return ("backlog", p_id, f"Backlog #{p_id} (orphaned)", "orphaned")
+    if p_type == "project":
+        return ("project", p_id, f"Project {p_id} (orphaned)", "orphaned")
+    return None
 
 
 # ---------------------------------------------------------------------------
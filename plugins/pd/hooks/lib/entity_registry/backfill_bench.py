@@ -0,0 +1,173 @@
+"""Benchmark for the entity backfill on a synthetic artifact tree.
+
+Generates ``--features`` feature directories (plus projects, brainstorms and
+a backlog.md scaled from that count) covering the shapes the scanners
+handle: project and brainstorm parents, backlog markers, external and
+orphaned references. Times ``run_backfill`` + ``backfill_workflow_phases``
+on a fresh database through the bulk path and, unless ``--skip-per-entity``,
+through the per-entity scanners, and checks both produce the same rows.
+
+Usage (from plugins/pd, with hooks/lib on PYTHONPATH):
+    python -m entity_registry.backfill_bench --features 20000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from entity_registry.backfill import backfill_workflow_phases, run_backfill
+from entity_registry.database import EntityDatabase
+
+_PHASES = ("brainstorm", "specify", "design", "create-plan", "implement", "finish")
+_STATUSES = ("planned", "active", "completed", "abandoned")
+_MODES = ("standard", "full", "light")
+
+
+def build_synthetic_tree(root: str, features: int, *, seed: int = 0) -> None:
+    """Write a synthetic artifacts tree with ``features`` features under root."""
+    rng = random.Random(seed)
+    backlog_items = max(1, features // 4)
+    brainstorms = max(1, features // 5)
+    projects = max(1, features // 20)
+
+    os.makedirs(os.path.join(root, "brainstorms"), exist_ok=True)
+    lines = [
+        "# Backlog", "",
+        "| ID | Timestamp | Description |",
+        "|----|-----------|-------------|",
+    ]
+    for i in range(backlog_items):
+        note = rng.choice(["", "", " (promoted to feature)", " (closed: stale)"])
+        lines.append(f"| {i:05d} | 2026-01-01T00:00:00Z | Backlog item {i}{note} |")
+    with open(os.path.join(root, "backlog.md"), "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+    for i in range(brainstorms):
+        suffix = ".prd.md" if i % 3 else ".md"
+        marker = f"*Source: Backlog #{rng.randrange(backlog_items):05d}*\n" if i % 2 else ""
+        path = os.path.join(root, "brainstorms", f"2026{i:06d}-idea-{i}{suffix}")
+        with open(path, "w") as f:
+            f.write(f"# PRD: Idea {i}\n\n{marker}\nBody.\n")
+
+    for i in range(projects):
+        proj_dir = os.path.join(root, "projects", f"P{i:03d}-proj")
+        os.makedirs(proj_dir)
+        meta = {"id": f"P{i:03d}", "name": f"Project {i}"}
+        if i % 2:
+            meta["brainstorm_source"] = (
+                f"docs/brainstorms/2026{rng.randrange(brainstorms):06d}-idea.prd.md"
+            )
+        with open(os.path.join(proj_dir, ".meta.json"), "w") as f:
+            json.dump(meta, f)
+
+    for i in range(features):
+        slug = f"feature-{i}"
+        feat_dir = os.path.join(root, "features", f"{i:05d}-{slug}")
+        os.makedirs(feat_dir)
+        meta = {"id": f"{i:05d}", "slug": slug, "mode": rng.choice(_MODES)}
+        if i % 7:
+            meta["name"] = f"Feature {i}"
+        if i % 5 == 0:
+            meta["status"] = rng.choice(_STATUSES)
+        if i % 2:
+            meta["lastCompletedPhase"] = rng.choice(_PHASES)
+        kind = i % 6
+        if kind == 0:
+            meta["project_id"] = f"P{rng.randrange(projects + 2):03d}"
+        elif kind == 1:
+            meta["brainstorm_source"] = (
+                f"docs/brainstorms/2026{rng.randrange(brainstorms + 5):06d}-idea-"
+                f"{i}.prd.md"
+            )
+        elif kind == 2:
+            meta["brainstorm_source"] = f"~/notes/external-{i}.md"
+        elif kind == 3:
+            meta["backlog_source"] = f"{rng.randrange(backlog_items + 10):05d}"
+        if i % 11 == 0 and i:
+            meta["depends_on_features"] = [f"{i - 1:05d}-feature-{i - 1}"]
+        with open(os.path.join(feat_dir, ".meta.json"), "w") as f:
+            json.dump(meta, f)
+
+
+def _canonical_metadata(raw: str | None) -> str | None:
+    # Inserts store json.dumps output, in-SQL merges store minified JSON.
+    return json.dumps(json.loads(raw), sort_keys=True) if raw else raw
+
+
+def snapshot(db: EntityDatabase) -> tuple[list[tuple], list[tuple]]:
+    """Comparable (entities, workflow_phases) rows, without uuids and times."""
+    entities = sorted(
+        (e["type_id"], e["entity_type"], e["entity_id"], e["name"], e["status"],
+         e["parent_type_id"], e["artifact_path"],
+         _canonical_metadata(e["metadata"]))
+        for e in db.list_entities()
+    )
+    phases = sorted(
+        (p["type_id"], p["workflow_phase"], p["kanban_column"],
+         p["last_completed_phase"], p["mode"])
+        for p in db.list_workflow_phases()
+    )
+    return entities, phases
+
+
+def _timed_backfill(db_path: str, root: str, *, bulk: bool) -> tuple[float, tuple]:
+    db = EntityDatabase(db_path)
+    try:
+        start = time.perf_counter()
+        run_backfill(db, root, bulk=bulk)
+        backfill_workflow_phases(db, root)
+        elapsed = time.perf_counter() - start
+        return elapsed, snapshot(db)
+    finally:
+        db.close()
+
+
+def run_bench(root: str, workdir: str, *, per_entity: bool = True) -> dict:
+    """Backfill root into fresh databases under workdir and report timings."""
+    bulk_s, bulk_rows = _timed_backfill(
+        os.path.join(workdir, "bulk.db"), root, bulk=True,
+    )
+    report = {
+        "entities": len(bulk_rows[0]),
+        "workflow_phases": len(bulk_rows[1]),
+        "bulk_s": round(bulk_s, 3),
+    }
+    if per_entity:
+        legacy_s, legacy_rows = _timed_backfill(
+            os.path.join(workdir, "per_entity.db"), root, bulk=False,
+        )
+        report["per_entity_s"] = round(legacy_s, 3)
+        report["speedup"] = round(legacy_s / bulk_s, 1) if bulk_s else None
+        report["identical"] = legacy_rows == bulk_rows
+    return report
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(description="Entity backfill benchmark")
+    parser.add_argument("--features", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-per-entity", action="store_true",
+                        help="Only time the bulk path")
+    parsed = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory(prefix="pd-backfill-bench-") as tmp:
+        root = os.path.join(tmp, "docs")
+        start = time.perf_counter()
+        build_synthetic_tree(root, parsed.features, seed=parsed.seed)
+        print(
+            f"built tree in {time.perf_counter() - start:.1f}s at {root}",
+            file=sys.stderr,
+        )
+        report = run_bench(root, tmp, per_entity=not parsed.skip_per_entity)
+
+    print(json.dumps(report, indent=2))
+    return 0 if report.get("identical", True) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
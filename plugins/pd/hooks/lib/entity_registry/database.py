@@ -16,9 +16,9 @@ import re
 import sqlite3
 import sys
 import uuid as uuid_mod
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import contextmanager
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 _UUID_V4_RE = re.compile(
     r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$'
@@ -55,6 +55,183 @@ def flatten_metadata(metadata: dict | None) -> str:
     return " ".join(parts)
 
 
+# Metadata keys filterable and sortable in SQL; migration 13 indexes each
+# one. Queries must use ``_metadata_expr(key)`` verbatim for SQLite to match
+# the expression index. Rows whose metadata is not valid JSON read NULL.
+INDEXED_METADATA_KEYS = ("progress", "traffic_light", "slug", "branch")
+
+
+def _metadata_expr(key: str) -> str:
+    """SQL expression reading an indexed top-level metadata key."""
+    return (
+        "CASE WHEN json_valid(metadata) "
+        f"THEN json_extract(metadata, '$.{key}') END"
+    )
+
+
+def _metadata_path(key: str) -> str:
+    """JSON path for an arbitrary top-level metadata key."""
+    return f'$."{key}"'
+
+
+# Existing metadata as a JSON object; NULL, malformed or non-object
+# metadata merges as ``{}``.
+_METADATA_OBJECT_SQL = (
+    "COALESCE(CASE WHEN json_valid(metadata) THEN "
+    "CASE json_type(metadata) WHEN 'object' THEN metadata END END, '{}')"
+)
+
+# json_set takes two arguments per key; stay under SQLITE_MAX_FUNCTION_ARG
+# (127 by default).
+_METADATA_MERGE_MAX_KEYS = 60
+
+
+def _metadata_merge_params(metadata: dict) -> list | None:
+    """``json_set`` path/value parameters for a shallow merge of *metadata*.
+
+    Returns None when the merge cannot be expressed in SQL (a key that a
+    JSON path cannot quote, a value that is not strict JSON, or too many
+    keys); the caller then merges in Python.
+    """
+    if len(metadata) > _METADATA_MERGE_MAX_KEYS:
+        return None
+    params: list = []
+    for key, value in metadata.items():
+        if not isinstance(key, str) or '"' in key:
+            return None
+        try:
+            encoded = json.dumps(value, allow_nan=False)
+        except (TypeError, ValueError):
+            return None
+        params.extend((_metadata_path(key), encoded))
+    return params
+
+
+_FTS_INSERT_SQL = (
+    "INSERT INTO entities_fts(rowid, name, entity_id, entity_type, "
+    "status, metadata_text) VALUES(?, ?, ?, ?, ?, ?)"
+)
+
+
+# Upper bounds, in seconds, of the phase-duration histogram buckets kept by
+# ``phase_duration_rollups``; one more open-ended bucket follows the last.
+# Migration 15 bakes them into the rollup triggers, so changing them needs
+# a migration that recreates the triggers and rebuilds the rollups.
+PHASE_DURATION_BUCKETS = (60, 600, 3600, 4 * 3600, 86400, 7 * 86400)
+
+
+def _duration_bucket_sql(expr: str) -> str:
+    """SQL CASE mapping a duration in seconds to its histogram bucket."""
+    whens = " ".join(
+        f"WHEN {expr} < {bound} THEN {i}"
+        for i, bound in enumerate(PHASE_DURATION_BUCKETS)
+    )
+    return f"CASE {whens} ELSE {len(PHASE_DURATION_BUCKETS)} END"
+
+
+def _phase_duration_sql(completed: str) -> str:
+    """Seconds from the latest ``started`` event of the same (type_id, phase)
+    at or before the *completed* row alias; NULL when there is none."""
+    return (
+        f"(julianday({completed}.timestamp) - ("
+        "SELECT MAX(julianday(s.timestamp)) FROM phase_events s "
+        f"WHERE s.type_id = {completed}.type_id "
+        f"AND s.phase = {completed}.phase AND s.event_type = 'started' "
+        f"AND julianday(s.timestamp) <= julianday({completed}.timestamp)"
+        ")) * 86400.0"
+    )
+
+
+_PHASE_ROLLUP_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS phase_events_rollup_ai
+    AFTER INSERT ON phase_events WHEN date(NEW.timestamp) IS NOT NULL
+    BEGIN
+        INSERT INTO phase_event_rollups (
+            day, project_id, phase, event_type, event_count,
+            iterations_count, iterations_sum, iterations_max
+        ) VALUES (
+            date(NEW.timestamp), NEW.project_id, NEW.phase, NEW.event_type, 1,
+            NEW.iterations IS NOT NULL, COALESCE(NEW.iterations, 0),
+            NEW.iterations
+        )
+        ON CONFLICT(day, project_id, phase, event_type) DO UPDATE SET
+            event_count = event_count + 1,
+            iterations_count = iterations_count + excluded.iterations_count,
+            iterations_sum = iterations_sum + excluded.iterations_sum,
+            iterations_max = MAX(
+                COALESCE(iterations_max, excluded.iterations_max),
+                COALESCE(excluded.iterations_max, iterations_max)
+            );
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS phase_events_duration_ai
+    AFTER INSERT ON phase_events
+    WHEN NEW.event_type = 'completed' AND date(NEW.timestamp) IS NOT NULL
+    BEGIN
+        INSERT INTO phase_duration_rollups (
+            day, project_id, phase, bucket, duration_count, duration_sum
+        )
+        SELECT date(NEW.timestamp), NEW.project_id, NEW.phase,
+               {_duration_bucket_sql("d")}, 1, d
+        FROM (SELECT {_phase_duration_sql("NEW")} AS d)
+        WHERE d >= 0
+        ON CONFLICT(day, project_id, phase, bucket) DO UPDATE SET
+            duration_count = duration_count + 1,
+            duration_sum = duration_sum + excluded.duration_sum;
+    END
+    """,
+)
+
+
+def _rebuild_phase_rollups(conn: sqlite3.Connection) -> None:
+    """Recompute both rollup tables from the phase_events rows present.
+
+    Caller owns the transaction.
+    """
+    conn.execute("DELETE FROM phase_event_rollups")
+    conn.execute("DELETE FROM phase_duration_rollups")
+    conn.execute(
+        "INSERT INTO phase_event_rollups ("
+        "day, project_id, phase, event_type, event_count, "
+        "iterations_count, iterations_sum, iterations_max) "
+        "SELECT date(timestamp), project_id, phase, event_type, COUNT(*), "
+        "COUNT(iterations), COALESCE(SUM(iterations), 0), MAX(iterations) "
+        "FROM phase_events WHERE date(timestamp) IS NOT NULL "
+        "GROUP BY 1, 2, 3, 4"
+    )
+    conn.execute(
+        "INSERT INTO phase_duration_rollups ("
+        "day, project_id, phase, bucket, duration_count, duration_sum) "
+        f"SELECT day, project_id, phase, {_duration_bucket_sql('d')}, "
+        "COUNT(*), SUM(d) FROM ("
+        "SELECT date(c.timestamp) AS day, c.project_id, c.phase, "
+        f"{_phase_duration_sql('c')} AS d "
+        "FROM phase_events c WHERE c.event_type = 'completed'"
+        ") WHERE d >= 0 AND day IS NOT NULL GROUP BY 1, 2, 3, 4"
+    )
+
+
+def _fts_values(rows: Iterable) -> list[tuple]:
+    """Map ``(rowid, name, entity_id, entity_type, status, metadata)`` rows
+    to entities_fts insert parameters."""
+    return [
+        (row[0], row[1], row[2], row[3], row[4] or "",
+         flatten_metadata(json.loads(row[5]) if row[5] else None))
+        for row in rows
+    ]
+
+
+def _populate_fts(conn: sqlite3.Connection) -> None:
+    """Index every entity into an empty entities_fts in one executemany."""
+    rows = conn.execute(
+        "SELECT rowid, name, entity_id, entity_type, status, metadata "
+        "FROM entities"
+    ).fetchall()
+    conn.executemany(_FTS_INSERT_SQL, _fts_values(rows))
+
+
 def _create_initial_schema(conn: sqlite3.Connection) -> None:
     """Migration 1: create entities and _metadata tables, triggers, indexes."""
     conn.executescript("""
@@ -387,19 +564,7 @@ def _create_fts_index(conn: sqlite3.Connection) -> None:
             raise
 
         # Backfill existing entities into FTS index
-        rows = conn.execute(
-            "SELECT rowid, name, entity_id, entity_type, status, metadata "
-            "FROM entities"
-        ).fetchall()
-        for row in rows:
-            metadata_text = flatten_metadata(
-                json.loads(row[5]) if row[5] else None
-            )
-            conn.execute(
-                "INSERT INTO entities_fts(rowid, name, entity_id, entity_type, "
-                "status, metadata_text) VALUES(?, ?, ?, ?, ?, ?)",
-                (row[0], row[1], row[2], row[3], row[4] or "", metadata_text),
-            )
+        _populate_fts(conn)
 
         conn.execute(
             "INSERT INTO _metadata(key, value) VALUES('schema_version', '4') "
@@ -751,19 +916,7 @@ def _schema_expansion_v6(conn: sqlite3.Connection) -> None:
             raise
 
         # Backfill FTS from entities
-        rows = conn.execute(
-            "SELECT rowid, name, entity_id, entity_type, status, metadata "
-            "FROM entities"
-        ).fetchall()
-        for row in rows:
-            metadata_text = flatten_metadata(
-                json.loads(row[5]) if row[5] else None
-            )
-            conn.execute(
-                "INSERT INTO entities_fts(rowid, name, entity_id, entity_type, "
-                "status, metadata_text) VALUES(?, ?, ?, ?, ?, ?)",
-                (row[0], row[1], row[2], row[3], row[4] or "", metadata_text),
-            )
+        _populate_fts(conn)
 
         # --- Step 6: CREATE entity_tags table ---
         conn.execute("""
@@ -927,19 +1080,7 @@ def _fix_fts_content_mode(conn: sqlite3.Connection) -> None:
         if "no such module: fts5" in str(exc):
             raise RuntimeError("FTS5 extension not available") from exc
         raise
-    rows = conn.execute(
-        "SELECT rowid, name, entity_id, entity_type, status, metadata "
-        "FROM entities"
-    ).fetchall()
-    for row in rows:
-        metadata_text = flatten_metadata(
-            json.loads(row[5]) if row[5] else None
-        )
-        conn.execute(
-            "INSERT INTO entities_fts(rowid, name, entity_id, entity_type, "
-            "status, metadata_text) VALUES(?, ?, ?, ?, ?, ?)",
-            (row[0], row[1], row[2], row[3], row[4] or "", metadata_text),
-        )
+    _populate_fts(conn)
     conn.commit()
 
 
@@ -1211,19 +1352,7 @@ def _add_project_scoping(conn: sqlite3.Connection) -> None:
             if "no such module: fts5" in str(exc):
                 raise RuntimeError("FTS5 extension not available") from exc
             raise
-        rows = conn.execute(
-            "SELECT rowid, name, entity_id, entity_type, status, metadata "
-            "FROM entities"
-        ).fetchall()
-        for row in rows:
-            metadata_text = flatten_metadata(
-                json.loads(row[5]) if row[5] else None
-            )
-            conn.execute(
-                "INSERT INTO entities_fts(rowid, name, entity_id, entity_type, "
-                "status, metadata_text) VALUES(?, ?, ?, ?, ?, ?)",
-                (row[0], row[1], row[2], row[3], row[4] or "", metadata_text),
-            )
+        _populate_fts(conn)
 
         # --- Step 12: Update schema_version ---
         conn.execute(
@@ -1625,6 +1754,402 @@ def _migration_10_phase_events(conn: sqlite3.Connection) -> None:
         raise
 
 
+def _migration_11_recency_indexes(conn: sqlite3.Connection) -> None:
+    """Migration 11: keyset indexes for recency-ordered entity listing.
+
+    ``list_entities(limit=..., after=...)`` pages entities newest-first by
+    ``(updated_at, uuid)``. These indexes let SQLite walk that order
+    directly (optionally within one entity_type) instead of sorting the
+    whole table per page.
+
+    Self-managed transaction with the schema_version stamp inside it, as in
+    migration 10; re-checks the version after BEGIN IMMEDIATE so concurrent
+    openers do not double-apply.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        v_row = conn.execute(
+            "SELECT value FROM _metadata WHERE key = 'schema_version'"
+        ).fetchone()
+        if v_row is not None:
+            try:
+                current_version = int(v_row[0])
+            except (TypeError, ValueError):
+                current_version = 0
+            if current_version >= 11:
+                conn.rollback()
+                return
+
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entities_recency "
+            "ON entities(updated_at, uuid)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entities_type_recency "
+            "ON entities(entity_type, updated_at, uuid)"
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO _metadata (key, value) "
+            "VALUES ('schema_version', '11')"
+        )
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
+        raise
+
+
+def _migration_12_lookup_indexes(conn: sqlite3.Connection) -> None:
+    """Migration 12: indexes for the lookups the query-plan audit flagged.
+
+    - ``entities.type_id`` alone (``get_entity``, ``resolve_ref``, the
+      ``workflow_phases`` join) was a full scan: the only index covering it
+      is UNIQUE(project_id, type_id), which leads with project_id.
+    - ``query_phase_events`` filtered by type_id or project_id sorted every
+      match in a temp B-tree for ``ORDER BY timestamp DESC``.
+
+    Self-managed transaction with the schema_version stamp inside it, as in
+    migration 11.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        v_row = conn.execute(
+            "SELECT value FROM _metadata WHERE key = 'schema_version'"
+        ).fetchone()
+        if v_row is not None:
+            try:
+                current_version = int(v_row[0])
+            except (TypeError, ValueError):
+                current_version = 0
+            if current_version >= 12:
+                conn.rollback()
+                return
+
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entities_type_id "
+            "ON entities(type_id, project_id)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_pe_type_time "
+            "ON phase_events(type_id, timestamp)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_pe_project_time "
+            "ON phase_events(project_id, timestamp)"
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO _metadata (key, value) "
+            "VALUES ('schema_version', '12')"
+        )
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
+        raise
+
+
+def _migration_13_metadata_indexes(conn: sqlite3.Connection) -> None:
+    """Migration 13: expression indexes on frequently queried metadata keys.
+
+    One index per ``INDEXED_METADATA_KEYS`` entry over ``_metadata_expr``,
+    so ``query_by_metadata`` filters and sorts on progress, traffic_light,
+    slug and branch without reading or decoding every metadata blob. The
+    json_valid guard keeps a malformed blob from failing inserts.
+
+    Self-managed transaction with the schema_version stamp inside it, as in
+    migration 11.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        v_row = conn.execute(
+            "SELECT value FROM _metadata WHERE key = 'schema_version'"
+        ).fetchone()
+        if v_row is not None:
+            try:
+                current_version = int(v_row[0])
+            except (TypeError, ValueError):
+                current_version = 0
+            if current_version >= 13:
+                conn.rollback()
+                return
+
+        for key in INDEXED_METADATA_KEYS:
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_entities_meta_{key} "
+                f"ON entities({_metadata_expr(key)})"
+            )
+        conn.execute(
+            "INSERT OR REPLACE INTO _metadata (key, value) "
+            "VALUES ('schema_version', '13')"
+        )
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
+        raise
+
+
+def _migration_14_outbox(conn: sqlite3.Connection) -> None:
+    """Migration 14: outbox table for deferred post-commit work.
+
+    A job is written in the same transaction as the change that needs it
+    (phase completion enqueues its cascade and .meta.json projection) and
+    run later by ``workflow_engine.outbox.OutboxWorker``. ``available_at``
+    is the due time for pending rows and the lease expiry for running
+    ones. The partial UNIQUE index coalesces pending jobs that share a
+    ``dedupe_key``; running and failed rows are outside it.
+
+    Self-managed transaction with the schema_version stamp inside it, as in
+    migration 11.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        v_row = conn.execute(
+            "SELECT value FROM _metadata WHERE key = 'schema_version'"
+        ).fetchone()
+        if v_row is not None:
+            try:
+                current_version = int(v_row[0])
+            except (TypeError, ValueError):
+                current_version = 0
+            if current_version >= 14:
+                conn.rollback()
+                return
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                id           INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind         TEXT NOT NULL,
+                payload      TEXT NOT NULL,
+                dedupe_key   TEXT,
+                status       TEXT NOT NULL DEFAULT 'pending' CHECK(
+                    status IN ('pending', 'running', 'failed')
+                ),
+                attempts     INTEGER NOT NULL DEFAULT 0,
+                available_at TEXT NOT NULL,
+                last_error   TEXT,
+                created_at   TEXT NOT NULL,
+                updated_at   TEXT NOT NULL
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_outbox_due "
+            "ON outbox(status, available_at)"
+        )
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_outbox_pending_key "
+            "ON outbox(dedupe_key) "
+            "WHERE status = 'pending' AND dedupe_key IS NOT NULL"
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO _metadata (key, value) "
+            "VALUES ('schema_version', '14')"
+        )
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
+        raise
+
+
+def _migration_15_phase_rollups(conn: sqlite3.Connection) -> None:
+    """Migration 15: per-day rollups of phase_events, kept by triggers.
+
+    - ``phase_event_rollups``: event count and iteration stats per (UTC
+      day, project, phase, event_type).
+    - ``phase_duration_rollups``: histogram of phase durations per (UTC day
+      of completion, project, phase, ``PHASE_DURATION_BUCKETS`` bucket). A
+      ``completed`` event is paired with the latest ``started`` event of
+      the same feature and phase at or before it.
+
+    AFTER INSERT triggers update both on every insert path, and existing
+    rows are aggregated once here. There are no delete triggers: rollups
+    outlive the raw events they summarise. Events with unparseable
+    timestamps are not rolled up.
+
+    Self-managed transaction with the schema_version stamp inside it, as in
+    migration 11.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        v_row = conn.execute(
+            "SELECT value FROM _metadata WHERE key = 'schema_version'"
+        ).fetchone()
+        if v_row is not None:
+            try:
+                current_version = int(v_row[0])
+            except (TypeError, ValueError):
+                current_version = 0
+            if current_version >= 15:
+                conn.rollback()
+                return
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS phase_event_rollups (
+                day              TEXT NOT NULL,
+                project_id       TEXT NOT NULL,
+                phase            TEXT NOT NULL,
+                event_type       TEXT NOT NULL,
+                event_count      INTEGER NOT NULL,
+                iterations_count INTEGER NOT NULL,
+                iterations_sum   INTEGER NOT NULL,
+                iterations_max   INTEGER,
+                PRIMARY KEY (day, project_id, phase, event_type)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS phase_duration_rollups (
+                day            TEXT NOT NULL,
+                project_id     TEXT NOT NULL,
+                phase          TEXT NOT NULL,
+                bucket         INTEGER NOT NULL,
+                duration_count INTEGER NOT NULL,
+                duration_sum   REAL NOT NULL,
+                PRIMARY KEY (day, project_id, phase, bucket)
+            ) WITHOUT ROWID
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_per_project_day "
+            "ON phase_event_rollups(project_id, day)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_pdr_project_day "
+            "ON phase_duration_rollups(project_id, day)"
+        )
+        for trigger in _PHASE_ROLLUP_TRIGGERS:
+            conn.execute(trigger)
+        _rebuild_phase_rollups(conn)
+        conn.execute(
+            "INSERT OR REPLACE INTO _metadata (key, value) "
+            "VALUES ('schema_version', '15')"
+        )
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
+        raise
+
+
+def _migration_16_frontmatter_headers(conn: sqlite3.Connection) -> None:
+    """Migration 16: cache of parsed artifact frontmatter headers.
+
+    ``frontmatter_headers`` maps a file path to the ``(mtime_ns, size)``
+    it had when its header was last parsed and the header as JSON (NULL
+    when the file has no frontmatter). ``FrontmatterHeaderIndex`` reuses a
+    row while the file's stat still matches, so drift scans only re-read
+    files that changed.
+
+    Self-managed transaction with the schema_version stamp inside it, as in
+    migration 11.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        v_row = conn.execute(
+            "SELECT value FROM _metadata WHERE key = 'schema_version'"
+        ).fetchone()
+        if v_row is not None:
+            try:
+                current_version = int(v_row[0])
+            except (TypeError, ValueError):
+                current_version = 0
+            if current_version >= 16:
+                conn.rollback()
+                return
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS frontmatter_headers (
+                path     TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size     INTEGER NOT NULL,
+                header   TEXT
+            ) WITHOUT ROWID
+        """)
+        conn.execute(
+            "INSERT OR REPLACE INTO _metadata (key, value) "
+            "VALUES ('schema_version', '16')"
+        )
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
+        raise
+
+
+_DATA_GENERATION_TABLES = (
+    "entities", "workflow_phases", "entity_dependencies", "entity_tags",
+)
+
+_BUMP_DATA_GENERATION = (
+    "INSERT INTO _metadata (key, value) VALUES ('data_generation', '1') "
+    "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1;"
+)
+
+
+def _migration_17_data_generation(conn: sqlite3.Connection) -> None:
+    """Migration 17: persistent write counter for entity state.
+
+    AFTER INSERT/UPDATE/DELETE triggers on ``_DATA_GENERATION_TABLES`` bump
+    ``data_generation`` in ``_metadata``. Unlike ``PRAGMA data_version`` and
+    ``total_changes``, which restart on every connection, the counter is
+    comparable across connections, processes and restarts, and it moves on
+    every write regardless of timestamp resolution. ``change_token`` and
+    the doctor's incremental watermarks are built from it.
+
+    Self-managed transaction with the schema_version stamp inside it, as in
+    migration 11.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        v_row = conn.execute(
+            "SELECT value FROM _metadata WHERE key = 'schema_version'"
+        ).fetchone()
+        if v_row is not None:
+            try:
+                current_version = int(v_row[0])
+            except (TypeError, ValueError):
+                current_version = 0
+            if current_version >= 17:
+                conn.rollback()
+                return
+
+        for table in _DATA_GENERATION_TABLES:
+            for event, suffix in (("INSERT", "ai"), ("UPDATE", "au"), ("DELETE", "ad")):
+                conn.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_generation_{suffix}
+                    AFTER {event} ON {table}
+                    BEGIN
+                        {_BUMP_DATA_GENERATION}
+                    END
+                """)
+        conn.execute(
+            "INSERT OR IGNORE INTO _metadata (key, value) "
+            "VALUES ('data_generation', '1')"
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO _metadata (key, value) "
+            "VALUES ('schema_version', '17')"
+        )
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
+        raise
+
+
 # Ordered mapping of version -> migration function.
 MIGRATIONS: dict[int, Callable[[sqlite3.Connection], None]] = {
     1: _create_initial_schema,
@@ -1637,11 +2162,52 @@ MIGRATIONS: dict[int, Callable[[sqlite3.Connection], None]] = {
     8: _add_project_scoping,
     9: _migration_9_remove_create_tasks,
     10: _migration_10_phase_events,
+    11: _migration_11_recency_indexes,
+    12: _migration_12_lookup_indexes,
+    13: _migration_13_metadata_indexes,
+    14: _migration_14_outbox,
+    15: _migration_15_phase_rollups,
+    16: _migration_16_frontmatter_headers,
+    17: _migration_17_data_generation,
 }
 
 # Sentinel object to distinguish "not provided" from explicit ``None``.
 _UNSET = object()
 
+# Max bound parameters per ``IN (...)`` lookup; stays well under SQLite's
+# default SQLITE_MAX_VARIABLE_NUMBER on older builds (999).
+_IN_CLAUSE_CHUNK = 500
+
+# workflow_phases columns register_entities_batch accepts per entity.
+_BATCH_PHASE_COLUMNS = frozenset(
+    {"workflow_phase", "kanban_column", "last_completed_phase", "mode"}
+)
+
+
+def _parents_first(rows: list[tuple[dict, str]]) -> list[tuple[dict, str]]:
+    """Order ``(entity, type_id)`` pairs so in-batch parents precede children.
+
+    Foreign keys are checked per row, so a child cannot be inserted before
+    a parent from the same batch. Input order is kept otherwise.
+    """
+    by_type_id = {type_id: (ent, type_id) for ent, type_id in rows}
+    ordered: list[tuple[dict, str]] = []
+    placed: set[str] = set()
+    for _, type_id in rows:
+        chain = []
+        current = type_id
+        while current in by_type_id and current not in placed:
+            placed.add(current)
+            chain.append(by_type_id[current])
+            current = by_type_id[current][0].get("parent_type_id")
+        ordered.extend(reversed(chain))
+    return ordered
+
+# deferred_fts() flushes of at least this many rows end with an FTS5
+# 'merge' of up to _FTS_MERGE_PAGES pages.
+_FTS_MERGE_AFTER = 500
+_FTS_MERGE_PAGES = 500
+
 # Export format version — separate from the DB schema version.
 EXPORT_SCHEMA_VERSION = 1
 
@@ -1653,6 +2219,9 @@ PHASE_EVENTS_COLS = (
     "source, created_at"
 )
 
+# Schema name the phase_events archive is ATTACHed under.
+_ARCHIVE_SCHEMA = "pe_archive"
+
 
 class EntityDatabase:
     """SQLite-backed storage for entity registry.
@@ -1662,6 +2231,11 @@ class EntityDatabase:
     db_path:
         Path to the SQLite database file, or ``":memory:"`` for an
         in-memory database.
+    row_cache:
+        Keep an identity map of entity and workflow_phases rows read by
+        ``get_entity`` / ``get_entity_by_uuid`` / ``get_workflow_phase``,
+        revalidated with ``PRAGMA data_version`` so commits from other
+        connections are seen. Counters via ``row_cache_stats()``.
     """
 
     VALID_ENTITY_TYPES = (
@@ -1669,8 +2243,33 @@ class EntityDatabase:
         "initiative", "objective", "key_result", "task",
     )
 
-    def __init__(self, db_path: str, *, check_same_thread: bool = True) -> None:
+    # Entries kept by the row cache before it starts over.
+    ROW_CACHE_MAX = 4096
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        check_same_thread: bool = True,
+        row_cache: bool = True,
+    ) -> None:
         self._in_transaction = False
+        # rowids awaiting an entities_fts refresh; None outside deferred_fts()
+        self._fts_dirty: set[int] | None = None
+        # Identity map for entity / workflow_phases rows; see _cached_row().
+        self._row_cache_enabled = row_cache
+        self._row_cache: dict[tuple[str, str], dict | None] = {}
+        self._row_cache_stamp: tuple | None = None
+        # total_changes last seen outside a transaction
+        self._row_cache_committed: int | None = None
+        # keys written inside transaction(); see _row_cache_evict()
+        self._row_cache_pending: list | None = None
+        # data_version read inside the current transaction() block
+        self._row_cache_txn_version: int | None = None
+        self._row_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+        self._db_path = db_path
+        # True once the phase_events archive is ATTACHed as pe_archive
+        self._archive_attached = False
         self._conn = sqlite3.connect(db_path, timeout=5.0, check_same_thread=check_same_thread)
         self._conn.row_factory = sqlite3.Row
         self._set_pragmas()
@@ -1684,6 +2283,129 @@ class EntityDatabase:
         """Close the database connection."""
         self._conn.close()
 
+    def data_generation(self) -> int:
+        """Persistent count of writes to entities, workflow phases,
+        dependencies and tags (see migration 17)."""
+        row = self._conn.execute(
+            "SELECT value FROM _metadata WHERE key = 'data_generation'"
+        ).fetchone()
+        return int(row[0]) if row is not None else 0
+
+    def change_token(self) -> str:
+        """Return a cheap token that changes whenever entity state changes.
+
+        Built from ``data_generation``, which is stored in the database, so
+        tokens compare equal across connections and server restarts only
+        when no entity, workflow phase, dependency or tag was written in
+        between. Pollers can skip re-reading tables while it is stable.
+        """
+        return str(self.data_generation())
+
+    def _cached_row(
+        self, key: tuple[str, str], load: Callable[[], dict | None],
+    ) -> dict | None:
+        """Return the row for *key* from the identity map, or ``load()`` it.
+
+        The map is stamped with ``PRAGMA data_version`` (moves on commits
+        from other connections) and ``total_changes`` (moves on this
+        connection's own writes, including trigger writes); a moved stamp
+        empties it. Inside a transaction that has already written, rows
+        may be uncommitted and could be rolled back, so reads bypass the
+        map until the connection is back in autocommit. Misses (including
+        "not found") are stored too. Callers get a copy, so mutating a
+        returned dict cannot leak into later reads.
+        """
+        if not self._row_cache_enabled:
+            return load()
+        changes = self._conn.total_changes
+        if not self._conn.in_transaction:
+            self._row_cache_committed = changes
+        elif changes != self._row_cache_committed:
+            self._row_cache_stats["misses"] += 1
+            return load()
+        if self._in_transaction and self._row_cache_txn_version is not None:
+            # BEGIN IMMEDIATE holds the write lock: nobody else can commit.
+            data_version = self._row_cache_txn_version
+        else:
+            data_version = self._conn.execute(
+                "PRAGMA data_version"
+            ).fetchone()[0]
+            if self._in_transaction:
+                self._row_cache_txn_version = data_version
+        stamp = (data_version, changes)
+        if stamp != self._row_cache_stamp:
+            if self._row_cache:
+                self._row_cache_stats["invalidations"] += 1
+                self._row_cache.clear()
+            self._row_cache_stamp = stamp
+        if key in self._row_cache:
+            self._row_cache_stats["hits"] += 1
+            row = self._row_cache[key]
+        else:
+            self._row_cache_stats["misses"] += 1
+            if len(self._row_cache) >= self.ROW_CACHE_MAX:
+                self._row_cache.clear()
+            row = self._row_cache[key] = load()
+        return dict(row) if row is not None else None
+
+    def _row_cache_evict(self, changes_before: int, *keys: tuple[str, str]) -> bool:
+        """Keep the row cache across one of our own writes that touched *keys*.
+
+        *changes_before* is ``total_changes`` taken just before the write.
+        If the map was current at that point and no other connection has
+        committed since, only *keys* are dropped and the stamp is moved
+        forward; otherwise the next read empties the map as usual. Inside
+        transaction() the keys are collected and evicted on COMMIT, provided
+        every change made in the block was reported this way. Returns True
+        when the map is current afterwards, so the caller may store the
+        row it has just written.
+        """
+        if not self._row_cache_enabled:
+            return False
+        if self._in_transaction:
+            # Defer to commit; a write we cannot account for spoils it.
+            pending = self._row_cache_pending
+            if pending is not None and pending[0] == changes_before:
+                pending[0] = self._conn.total_changes
+                pending[2].extend(keys)
+            else:
+                self._row_cache_pending = None
+            return False
+        if self._conn.in_transaction:
+            return False
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if self._row_cache_stamp != (data_version, changes_before):
+            return False
+        for key in keys:
+            self._row_cache.pop(key, None)
+        changes = self._conn.total_changes
+        self._row_cache_stamp = (data_version, changes)
+        self._row_cache_committed = changes
+        return True
+
+    def row_cache_stats(self) -> dict:
+        """Hit/miss/invalidation counters and current size of the row cache."""
+        return {**self._row_cache_stats, "size": len(self._row_cache)}
+
+    def set_trace_callback(self, callback: Callable[[str], None] | None) -> None:
+        """Install (or with None, remove) a per-statement SQL trace callback.
+
+        Thin passthrough to ``sqlite3.Connection.set_trace_callback`` for
+        instrumentation such as per-request query counting.
+        """
+        self._conn.set_trace_callback(callback)
+
+    def set_progress_handler(
+        self, handler: Callable[[], int] | None, n: int,
+    ) -> None:
+        """Install (or with None, remove) a sqlite3 progress handler.
+
+        ``handler`` runs every ``n`` VM instructions; a truthy return aborts
+        the running statement with ``sqlite3.OperationalError``
+        ("interrupted"). Used by callers that enforce query deadlines.
+        """
+        self._conn.set_progress_handler(handler, n)
+
     def _commit(self):
         """Commit unless inside an explicit transaction()."""
         if not self._in_transaction:
@@ -1764,7 +2486,11 @@ class EntityDatabase:
         """Retrieve a single entity by UUID.
 
         Returns entity dict or None if not found (or input is not a valid UUID).
+        Served from the row cache while the database is unchanged.
         """
+        return self._cached_row(("uuid", uuid), lambda: self._load_entity(uuid))
+
+    def _load_entity(self, uuid: str) -> dict | None:
         row = self._conn.execute(
             "SELECT * FROM entities WHERE uuid = ?", (uuid,)
         ).fetchone()
@@ -1936,9 +2662,19 @@ class EntityDatabase:
         self._conn.commit()  # flush implicit transactions
         self._conn.execute("BEGIN IMMEDIATE")
         self._in_transaction = True
+        start = self._conn.total_changes
+        # [changes accounted for, changes at BEGIN, row-cache keys written]
+        self._row_cache_pending = [start, start, []]
+        self._row_cache_txn_version = None
         try:
             yield
+            # Checked before COMMIT: FTS5 flushes its own writes on commit.
+            pending = self._row_cache_pending
+            accounted = pending is not None and pending[0] == self._conn.total_changes
             self._conn.execute("COMMIT")
+            self._in_transaction = False
+            if accounted:
+                self._row_cache_evict(pending[1], *pending[2])
         except Exception:
             try:
                 self._conn.execute("ROLLBACK")
@@ -1947,6 +2683,88 @@ class EntityDatabase:
             raise
         finally:
             self._in_transaction = False
+            self._row_cache_pending = None
+            self._row_cache_txn_version = None
+
+    # ------------------------------------------------------------------
+    # FTS maintenance
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def deferred_fts(self):
+        """Context manager that batches entities_fts maintenance.
+
+        Inside the block, entity writes record the rowids they touch
+        instead of rewriting their FTS rows one statement at a time. On
+        exit (normal or not) the recorded rowids are re-indexed from the
+        entities table in one pass: stale FTS rows are deleted with a few
+        ``IN`` statements, current rows inserted with one
+        ``executemany``, followed by an FTS5 ``merge`` step after large
+        batches. Searches inside the block see the pre-block index.
+        Re-entrant: nested blocks are flushed by the outermost one.
+
+        Usage::
+
+            with db.deferred_fts():
+                for item in items:
+                    db.register_entity(...)
+        """
+        if self._fts_dirty is not None:
+            yield
+            return
+        self._fts_dirty = set()
+        try:
+            yield
+        finally:
+            dirty, self._fts_dirty = self._fts_dirty, None
+            if dirty:
+                self._flush_fts(dirty)
+
+    def _flush_fts(self, rowids: set[int]) -> None:
+        """Re-index *rowids* in entities_fts from the entities table."""
+        ordered = sorted(rowids)
+        with self.transaction():
+            for start in range(0, len(ordered), _IN_CLAUSE_CHUNK):
+                chunk = ordered[start:start + _IN_CLAUSE_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                self._conn.execute(
+                    f"DELETE FROM entities_fts WHERE rowid IN ({placeholders})",
+                    chunk,
+                )
+                rows = self._conn.execute(
+                    "SELECT rowid, name, entity_id, entity_type, status, "
+                    f"metadata FROM entities WHERE rowid IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                self._conn.executemany(_FTS_INSERT_SQL, _fts_values(rows))
+            if len(ordered) >= _FTS_MERGE_AFTER:
+                # Fold the segments the batch created into larger ones
+                # (bounded work) rather than leaving them for later queries.
+                self._conn.execute(
+                    "INSERT INTO entities_fts(entities_fts, rank) "
+                    "VALUES('merge', ?)",
+                    (_FTS_MERGE_PAGES,),
+                )
+            self._commit()
+
+    def _mark_fts(self, rowid: int) -> bool:
+        """Record *rowid* for the pending flush; False when not deferring."""
+        if self._fts_dirty is None:
+            return False
+        self._fts_dirty.add(rowid)
+        return True
+
+    def optimize_fts(self) -> None:
+        """Merge all entities_fts segments into one (FTS5 ``optimize``).
+
+        Maintenance command for after large imports or merges; it rewrites
+        the whole index, so it is not run automatically.
+        """
+        with self.transaction():
+            self._conn.execute(
+                "INSERT INTO entities_fts(entities_fts) VALUES('optimize')"
+            )
+            self._commit()
 
     # ------------------------------------------------------------------
     # Entity tagging (Task 1b.9a)
@@ -2159,16 +2977,15 @@ class EntityDatabase:
                     "SELECT rowid FROM entities WHERE uuid = ?",
                     (entity_uuid,),
                 ).fetchone()
-                metadata_text = flatten_metadata(
-                    json.loads(metadata_json) if metadata_json else None
-                )
-                self._conn.execute(
-                    "INSERT INTO entities_fts(rowid, name, entity_id, "
-                    "entity_type, status, metadata_text) "
-                    "VALUES(?, ?, ?, ?, ?, ?)",
-                    (row[0], name, entity_id, entity_type, status or "",
-                     metadata_text),
-                )
+                if not self._mark_fts(row[0]):
+                    metadata_text = flatten_metadata(
+                        json.loads(metadata_json) if metadata_json else None
+                    )
+                    self._conn.execute(
+                        _FTS_INSERT_SQL,
+                        (row[0], name, entity_id, entity_type, status or "",
+                         metadata_text),
+                    )
             self._commit()  # no-op inside transaction(); commit handled by context manager
         # Apply parent_type_id on duplicate if caller provided one and existing entity has none
         if cursor.rowcount == 0 and parent_type_id is not None and parent_uuid is not None:
@@ -2255,20 +3072,55 @@ class EntityDatabase:
     def get_entity(self, type_id: str) -> dict | None:
         """Retrieve a single entity by UUID or type_id.
 
-        Returns ``None`` if not found.
+        Returns ``None`` if not found. Served from the row cache while the
+        database is unchanged.
         """
+        if _UUID_V4_RE.match(type_id.lower()):
+            return self.get_entity_by_uuid(type_id.lower())
+        return self._cached_row(
+            ("type_id", type_id), lambda: self._load_entity_by_type_id(type_id),
+        )
+
+    def _load_entity_by_type_id(self, type_id: str) -> dict | None:
         try:
             uuid, _ = self._resolve_identifier(type_id)
         except ValueError:
             return None
-        row = self._conn.execute(
-            "SELECT * FROM entities WHERE uuid = ?", (uuid,)
-        ).fetchone()
-        return dict(row) if row else None
+        return self._load_entity(uuid)
+
+    def get_entities_by_type_ids(self, type_ids: Iterable[str]) -> dict[str, dict]:
+        """Retrieve many entities by type_id in chunked ``IN`` queries.
+
+        Returns ``{type_id: entity}`` with the same dicts as ``get_entity``.
+        Unknown type_ids are omitted, and so are type_ids shared by
+        entities in several projects (``get_entity`` treats those as not
+        found).
+        """
+        wanted = list(dict.fromkeys(type_ids))
+        found: dict[str, dict] = {}
+        ambiguous: set[str] = set()
+        for start in range(0, len(wanted), _IN_CLAUSE_CHUNK):
+            chunk = wanted[start:start + _IN_CLAUSE_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT * FROM entities WHERE type_id IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            for row in rows:
+                if row["type_id"] in found:
+                    ambiguous.add(row["type_id"])
+                found[row["type_id"]] = dict(row)
+        for type_id in ambiguous:
+            del found[type_id]
+        return found
 
     def list_entities(
         self, entity_type: str | None = None,
         project_id: str | None = None,
+        *,
+        status: str | None = None,
+        limit: int | None = None,
+        after: tuple[str, str] | None = None,
     ) -> list[dict]:
         """Return all entities, optionally filtered by entity_type and project.
 
@@ -2280,27 +3132,192 @@ class EntityDatabase:
         project_id:
             If provided, only return entities in this project.
             If None, return entities across all projects.
+        status:
+            If provided, only return entities with this exact status.
+        limit:
+            If provided, return at most this many entities, newest first
+            (``updated_at DESC, uuid DESC``).
+        after:
+            Keyset cursor ``(updated_at, uuid)`` of the last entity on the
+            previous page; only entities strictly after it in the newest-first
+            order are returned. Implies the same ordering as ``limit``.
 
         Returns
         -------
         list[dict]
             List of entity dicts with same keys as ``get_entity``.
+            Unordered unless ``limit`` or ``after`` is given.
         """
         conditions: list[str] = []
-        params: list[str] = []
+        params: list = []
         if entity_type is not None:
             conditions.append("entity_type = ?")
             params.append(entity_type)
         if project_id is not None:
             conditions.append("project_id = ?")
             params.append(project_id)
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+        if after is not None:
+            conditions.append("(updated_at, uuid) < (?, ?)")
+            params.extend(after)
 
         sql = "SELECT * FROM entities"
         if conditions:
             sql += " WHERE " + " AND ".join(conditions)
+        if limit is not None or after is not None:
+            sql += " ORDER BY updated_at DESC, uuid DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
         cur = self._conn.execute(sql, params)
         return [dict(row) for row in cur.fetchall()]
 
+    _METADATA_OPERATORS = frozenset({"=", "!=", "<", "<=", ">", ">="})
+
+    def query_by_metadata(
+        self,
+        filters: dict[str, object] | None = None,
+        *,
+        entity_type: str | None = None,
+        project_id: str | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Return entities filtered and/or sorted on indexed metadata keys.
+
+        Parameters
+        ----------
+        filters:
+            Maps keys from ``INDEXED_METADATA_KEYS`` to a value (equality),
+            ``None`` (key absent or null) or an ``(operator, value)`` pair
+            with operator one of ``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=``.
+        entity_type:
+            If provided, only return entities of this type.
+        project_id:
+            If provided, only return entities in this project.
+        order_by:
+            Indexed metadata key to sort on (entities lacking it sort
+            last when ``descending``, first otherwise); ties break on uuid.
+        descending:
+            Sort ``order_by`` high to low.
+        limit:
+            If provided, return at most this many entities.
+
+        Returns
+        -------
+        list[dict]
+            Entity dicts with the same keys as ``get_entity``.
+
+        Raises
+        ------
+        ValueError
+            If a key is not in ``INDEXED_METADATA_KEYS`` or an operator is
+            not supported.
+        """
+        conditions: list[str] = []
+        params: list = []
+        for key, condition in (filters or {}).items():
+            if key not in INDEXED_METADATA_KEYS:
+                raise ValueError(
+                    f"metadata key {key!r} is not indexed; "
+                    f"expected one of {INDEXED_METADATA_KEYS}"
+                )
+            expr = _metadata_expr(key)
+            if condition is None:
+                conditions.append(f"{expr} IS NULL")
+                continue
+            op, value = (
+                condition if isinstance(condition, tuple) else ("=", condition)
+            )
+            if op not in self._METADATA_OPERATORS:
+                raise ValueError(f"unsupported metadata operator: {op!r}")
+            conditions.append(f"{expr} {op} ?")
+            params.append(value)
+        if entity_type is not None:
+            conditions.append("entity_type = ?")
+            params.append(entity_type)
+        if project_id is not None:
+            conditions.append("project_id = ?")
+            params.append(project_id)
+
+        sql = "SELECT * FROM entities"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if order_by is not None:
+            if order_by not in INDEXED_METADATA_KEYS:
+                raise ValueError(
+                    f"metadata key {order_by!r} is not indexed; "
+                    f"expected one of {INDEXED_METADATA_KEYS}"
+                )
+            direction = "DESC" if descending else "ASC"
+            sql += f" ORDER BY {_metadata_expr(order_by)} {direction}, uuid {direction}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self._conn.execute(sql, params).fetchall()]
+
+    def get_metadata_fields(
+        self, uuids: Iterable[str], keys: Iterable[str],
+    ) -> dict[str, dict]:
+        """Read selected top-level metadata keys for many entities in SQL.
+
+        Only the requested values leave SQLite: scalars come back as-is and
+        only object/array values are decoded, so callers that need a few
+        keys skip parsing whole metadata blobs.
+
+        Parameters
+        ----------
+        uuids:
+            Entity UUIDs. Unknown UUIDs are omitted from the result.
+        keys:
+            Top-level metadata keys to read.
+
+        Returns
+        -------
+        dict[str, dict]
+            ``{uuid: {key: value}}`` with ``None`` for absent keys (and for
+            every key when the stored metadata is not valid JSON).
+
+        Raises
+        ------
+        ValueError
+            If a key contains a double quote (not expressible as a JSON
+            path).
+        """
+        keys = list(keys)
+        for key in keys:
+            if '"' in key:
+                raise ValueError(f"metadata key cannot contain '\"': {key!r}")
+        uuid_list = list(dict.fromkeys(uuids))
+        result: dict[str, dict] = {}
+        columns = "".join(
+            ", json_type(m, ?), json_extract(m, ?)" for _ in keys
+        )
+        path_params = [p for k in keys for p in (_metadata_path(k),) * 2]
+        for start in range(0, len(uuid_list), _IN_CLAUSE_CHUNK):
+            chunk = uuid_list[start:start + _IN_CLAUSE_CHUNK]
+            rows = self._conn.execute(
+                f"SELECT uuid{columns} FROM ("
+                "SELECT uuid, CASE WHEN json_valid(metadata) "
+                "THEN metadata END AS m FROM entities "
+                f"WHERE uuid IN ({','.join('?' * len(chunk))}))",
+                path_params + chunk,
+            ).fetchall()
+            for row in rows:
+                fields: dict = {}
+                for i, key in enumerate(keys):
+                    kind, value = row[1 + 2 * i], row[2 + 2 * i]
+                    if kind in ("object", "array"):
+                        value = json.loads(value)
+                    elif kind in ("true", "false"):
+                        value = kind == "true"
+                    fields[key] = value
+                result[row["uuid"]] = fields
+        return result
+
     def get_lineage(
         self,
         type_id: str,
@@ -2415,7 +3432,10 @@ class EntityDatabase:
         """
         # Resolve identifier directly (accepts both UUID and type_id).
         # Lets ValueError propagate naturally if entity not found.
-        entity_uuid, _ = self._resolve_identifier(type_id, project_id=project_id)
+        entity_uuid, entity_type_id = self._resolve_identifier(
+            type_id, project_id=project_id,
+        )
+        changes_before = self._conn.total_changes
 
         # FTS sync: capture old values before UPDATE
         old_row = self._conn.execute(
@@ -2445,28 +3465,35 @@ class EntityDatabase:
                 set_parts.append("metadata = ?")
                 params.append(None)
             else:
-                # Shallow merge with existing (old_row already has metadata)
-                # Use try/except to handle corrupted JSON gracefully
-                try:
-                    existing_meta = (
-                        json.loads(old_row["metadata"])
-                        if old_row["metadata"] else {}
+                # Shallow merge with existing: top-level keys replace the
+                # stored values (nested objects are not merged). Done in
+                # SQL with json_set so the stored blob is never decoded
+                # here; corrupted or non-object metadata merges as {}.
+                merge_params = _metadata_merge_params(metadata)
+                if merge_params is not None:
+                    pairs = ", ?, json(?)" * len(metadata)
+                    set_parts.append(
+                        f"metadata = json_set({_METADATA_OBJECT_SQL}{pairs})"
                     )
-                except (json.JSONDecodeError, ValueError):
-                    existing_meta = {}
-                existing_meta.update(metadata)
-                set_parts.append("metadata = ?")
-                params.append(json.dumps(existing_meta))
-
-                # Validate merged metadata
-                entity_row = self._conn.execute(
-                    "SELECT entity_type FROM entities WHERE uuid = ?",
-                    (entity_uuid,),
-                ).fetchone()
-                if entity_row:
-                    from entity_registry.metadata import validate_metadata
-                    for w in validate_metadata(entity_row["entity_type"], existing_meta):
-                        print(f"metadata warning: {w}", file=sys.stderr)
+                    params.extend(merge_params)
+                else:
+                    try:
+                        existing_meta = (
+                            json.loads(old_row["metadata"])
+                            if old_row["metadata"] else {}
+                        )
+                    except (json.JSONDecodeError, ValueError):
+                        existing_meta = {}
+                    if not isinstance(existing_meta, dict):
+                        existing_meta = {}
+                    existing_meta.update(metadata)
+                    set_parts.append("metadata = ?")
+                    params.append(json.dumps(existing_meta))
+
+                # Validate the keys being written
+                from entity_registry.metadata import validate_metadata
+                for w in validate_metadata(old_row["entity_type"], metadata):
+                    print(f"metadata warning: {w}", file=sys.stderr)
 
         # Audit 062: 3 write SQL statements — wrapped in transaction() for BEGIN IMMEDIATE
         params.append(entity_uuid)
@@ -2474,32 +3501,35 @@ class EntityDatabase:
         with self.transaction():
             self._conn.execute(sql, params)
 
-            # Re-read post-UPDATE values from DB rather than deriving them in
-            # Python. This avoids replicating the metadata-merge logic (None/keep,
-            # {}/clear, dict/shallow-merge) and uses the DB as single source of
-            # truth. If new FTS-indexed fields are added, update both the
-            # old-value SELECT and the FTS insert columns.
-            new_row = self._conn.execute(
-                "SELECT name, entity_id, entity_type, status, metadata "
-                "FROM entities WHERE uuid = ?",
-                (entity_uuid,),
-            ).fetchone()
-            new_meta_text = flatten_metadata(
-                json.loads(new_row["metadata"]) if new_row["metadata"] else None
-            )
-            # Standalone FTS: use DELETE FROM (not external-content VALUES('delete',...))
-            # INVARIANT: rowid must match entities table rowid
-            self._conn.execute(
-                "DELETE FROM entities_fts WHERE rowid = ?", (old_row["rowid"],)
-            )
-            self._conn.execute(
-                "INSERT INTO entities_fts(rowid, name, entity_id, entity_type, "
-                "status, metadata_text) VALUES(?, ?, ?, ?, ?, ?)",
-                (old_row["rowid"], new_row["name"], new_row["entity_id"],
-                 new_row["entity_type"], new_row["status"] or "",
-                 new_meta_text),
-            )
+            if not self._mark_fts(old_row["rowid"]):
+                # Re-read post-UPDATE values from DB rather than deriving them in
+                # Python. This avoids replicating the metadata-merge logic (None/keep,
+                # {}/clear, dict/shallow-merge) and uses the DB as single source of
+                # truth. If new FTS-indexed fields are added, update both the
+                # old-value SELECT and the FTS insert columns.
+                new_row = self._conn.execute(
+                    "SELECT name, entity_id, entity_type, status, metadata "
+                    "FROM entities WHERE uuid = ?",
+                    (entity_uuid,),
+                ).fetchone()
+                new_meta_text = flatten_metadata(
+                    json.loads(new_row["metadata"]) if new_row["metadata"] else None
+                )
+                # Standalone FTS: use DELETE FROM (not external-content VALUES('delete',...))
+                # INVARIANT: rowid must match entities table rowid
+                self._conn.execute(
+                    "DELETE FROM entities_fts WHERE rowid = ?", (old_row["rowid"],)
+                )
+                self._conn.execute(
+                    _FTS_INSERT_SQL,
+                    (old_row["rowid"], new_row["name"], new_row["entity_id"],
+                     new_row["entity_type"], new_row["status"] or "",
+                     new_meta_text),
+                )
             self._commit()  # no-op inside transaction(); commit handled by context manager
+        self._row_cache_evict(
+            changes_before, ("uuid", entity_uuid), ("type_id", entity_type_id),
+        )
 
         # Cascade unblock: when an entity is completed, remove it from all
         # blocked_by lists and promote fully-unblocked dependents.
@@ -2718,9 +3748,10 @@ class EntityDatabase:
             )
 
             # 4. Delete FTS entry
-            self._conn.execute(
-                "DELETE FROM entities_fts WHERE rowid = ?", (row["rowid"],)
-            )
+            if not self._mark_fts(row["rowid"]):
+                self._conn.execute(
+                    "DELETE FROM entities_fts WHERE rowid = ?", (row["rowid"],)
+                )
 
             # 5. Delete workflow_phases
             self._conn.execute(
@@ -3102,8 +4133,17 @@ class EntityDatabase:
         phase: str | None = None,
         event_type: str | None = None,
         limit: int = 50,
+        since: str | None = None,
+        until: str | None = None,
+        include_archive: bool = False,
     ) -> list[dict]:
-        """Query phase events with optional filters. All filters optional."""
+        """Query phase events with optional filters. All filters optional.
+
+        *since* (inclusive) and *until* (exclusive) bound ``timestamp`` as
+        ISO-8601 text, e.g. ``"2026-03-01"``; the range is served by the
+        timestamp indexes. *include_archive* also searches events moved out
+        by ``archive_phase_events``.
+        """
         conditions: list[str] = []
         params: list = []
         if type_id:
@@ -3118,17 +4158,25 @@ class EntityDatabase:
         if event_type:
             conditions.append("event_type = ?")
             params.append(event_type)
+        if since:
+            conditions.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            conditions.append("timestamp < ?")
+            params.append(until)
 
         where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
         # Clamp: limit < 0 is treated as 0 (0 rows, not SQLite LIMIT -1 =
         # unlimited); limit > 500 is capped at 500. ``limit=0`` honors
         # caller intent ("return 0 rows") rather than being coerced up to 1.
-        params.append(max(0, min(limit, 500)))
+        limit_param = max(0, min(limit, 500))
 
+        source, params = self._phase_events_select(
+            PHASE_EVENTS_COLS, where, params, include_archive,
+        )
         rows = self._conn.execute(
-            f"SELECT {PHASE_EVENTS_COLS} FROM phase_events{where} "
-            "ORDER BY timestamp DESC LIMIT ?",
-            params,
+            f"{source} ORDER BY timestamp DESC LIMIT ?",
+            [*params, limit_param],
         ).fetchall()
         return [dict(r) for r in rows]
 
@@ -3210,6 +4258,524 @@ class EntityDatabase:
             results.extend(dict(r) for r in rows)
         return results
 
+    def iter_phase_events(
+        self,
+        *,
+        project_id: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        batch_size: int = 1000,
+        include_archive: bool = False,
+    ) -> Iterator[tuple]:
+        """Yield ``(type_id, project_id, phase, event_type, timestamp,
+        iterations, backward_target, source)`` tuples in timestamp order.
+
+        Rows are fetched *batch_size* at a time and never turned into
+        dicts, for bulk consumers such as the columnar export in
+        ``entity_registry.phase_analytics``. *since*, *until* and
+        *include_archive* are as in ``query_phase_events``.
+        """
+        conditions: list[str] = []
+        params: list = []
+        if project_id:
+            conditions.append("project_id = ?")
+            params.append(project_id)
+        if since:
+            conditions.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            conditions.append("timestamp < ?")
+            params.append(until)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        source, params = self._phase_events_select(
+            "id, type_id, project_id, phase, event_type, timestamp, "
+            "iterations, backward_target, source",
+            where, params, include_archive,
+        )
+        cur = self._conn.execute(f"{source} ORDER BY timestamp, id", params)
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield tuple(row)[1:]
+
+    # ------------------------------------------------------------------
+    # Phase events archive (retention, see archive_phase_events)
+    # ------------------------------------------------------------------
+
+    @property
+    def phase_events_archive_path(self) -> str | None:
+        """SQLite file holding archived phase_events, next to this database.
+
+        None for in-memory databases, which cannot archive.
+        """
+        if not self._db_path or self._db_path == ":memory:" or self._db_path.startswith("file:"):
+            return None
+        return os.path.splitext(self._db_path)[0] + "-phase-archive.db"
+
+    def _attach_phase_archive(self, *, create: bool) -> bool:
+        """ATTACH the archive as ``pe_archive``; True when it is available.
+
+        Without *create*, a missing archive file is left alone and False
+        returned. Must be called outside a transaction.
+        """
+        if self._archive_attached:
+            return True
+        path = self.phase_events_archive_path
+        if path is None or (not create and not os.path.exists(path)):
+            return False
+        self._conn.execute(f"ATTACH DATABASE ? AS {_ARCHIVE_SCHEMA}", (path,))
+        try:
+            self._conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {_ARCHIVE_SCHEMA}.phase_events (
+                    id              INTEGER PRIMARY KEY,
+                    type_id         TEXT NOT NULL,
+                    project_id      TEXT NOT NULL,
+                    phase           TEXT NOT NULL,
+                    event_type      TEXT NOT NULL,
+                    timestamp       TEXT NOT NULL,
+                    iterations      INTEGER,
+                    reviewer_notes  TEXT,
+                    backward_reason TEXT,
+                    backward_target TEXT,
+                    source          TEXT NOT NULL,
+                    created_at      TEXT NOT NULL,
+                    archived_at     TEXT NOT NULL
+                )
+            """)
+            for name, columns in (
+                ("idx_pea_timestamp", "timestamp"),
+                ("idx_pea_type_time", "type_id, timestamp"),
+                ("idx_pea_project_time", "project_id, timestamp"),
+            ):
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {_ARCHIVE_SCHEMA}.{name} "
+                    f"ON phase_events({columns})"
+                )
+            self._conn.commit()
+        except sqlite3.Error:
+            self._conn.execute(f"DETACH DATABASE {_ARCHIVE_SCHEMA}")
+            raise
+        self._archive_attached = True
+        return True
+
+    def _phase_events_select(
+        self, columns: str, where: str, params: list, include_archive: bool,
+    ) -> tuple[str, list]:
+        """SELECT of *columns* over live phase_events, plus the archive when
+        *include_archive* and one exists. Returns ``(sql, params)``.
+
+        UNION (not UNION ALL) drops a row present in both, which an archive
+        batch interrupted between its two commits can leave behind.
+        """
+        live = f"SELECT {columns} FROM main.phase_events{where}"
+        if not include_archive or not self._attach_phase_archive(create=False):
+            return live, list(params)
+        archived = f"SELECT {columns} FROM {_ARCHIVE_SCHEMA}.phase_events{where}"
+        return f"{live} UNION {archived}", [*params, *params]
+
+    def archive_phase_events(self, *, before: str, batch_size: int = 1000) -> int:
+        """Move phase_events older than *before* into the archive database.
+
+        Events of features whose entity is ``active`` stay live: reconcile
+        drift detection compares active features' metadata against live
+        events. Rows move in batches of *batch_size*, oldest first, each
+        batch in its own transaction; they keep their ids, so a batch
+        repeated after a crash is harmless. The per-day rollups are not
+        touched and keep covering archived events. Returns the number of
+        rows moved.
+
+        Raises ValueError for an in-memory database.
+        """
+        if not self._attach_phase_archive(create=True):
+            raise ValueError("phase_events archive requires a file-backed database")
+        archived_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        moved = 0
+        while True:
+            with self.transaction():
+                ids = [row[0] for row in self._conn.execute(
+                    "SELECT id FROM main.phase_events WHERE timestamp < ? "
+                    "AND type_id NOT IN ("
+                    "SELECT type_id FROM main.entities WHERE status = 'active'"
+                    ") ORDER BY timestamp LIMIT ?",
+                    (before, batch_size),
+                )]
+                if not ids:
+                    return moved
+                placeholders = ",".join("?" * len(ids))
+                self._conn.execute(
+                    f"INSERT OR IGNORE INTO {_ARCHIVE_SCHEMA}.phase_events "
+                    f"({PHASE_EVENTS_COLS}, archived_at) "
+                    f"SELECT {PHASE_EVENTS_COLS}, ? FROM main.phase_events "
+                    f"WHERE id IN ({placeholders})",
+                    [archived_at, *ids],
+                )
+                self._conn.execute(
+                    f"DELETE FROM main.phase_events WHERE id IN ({placeholders})",
+                    ids,
+                )
+            moved += len(ids)
+
+    def count_phase_events(self) -> dict[str, int]:
+        """Row counts of the live phase_events table and of the archive."""
+        live = self._conn.execute(
+            "SELECT COUNT(*) FROM main.phase_events"
+        ).fetchone()[0]
+        archived = 0
+        if self._attach_phase_archive(create=False):
+            archived = self._conn.execute(
+                f"SELECT COUNT(*) FROM {_ARCHIVE_SCHEMA}.phase_events"
+            ).fetchone()[0]
+        return {"live": live, "archived": archived}
+
+    # ------------------------------------------------------------------
+    # Phase rollups (maintained by triggers, see migration 15)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _rollup_filters(
+        project_id: str | None, phase: str | None,
+        since: str | None, until: str | None,
+    ) -> tuple[list[str], list]:
+        conditions: list[str] = []
+        params: list = []
+        if project_id:
+            conditions.append("project_id = ?")
+            params.append(project_id)
+        if phase:
+            conditions.append("phase = ?")
+            params.append(phase)
+        if since:
+            conditions.append("day >= ?")
+            params.append(since[:10])
+        if until:
+            conditions.append("day < ?")
+            params.append(until[:10])
+        return conditions, params
+
+    def query_phase_rollups(
+        self,
+        *,
+        project_id: str | None = None,
+        phase: str | None = None,
+        event_type: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[dict]:
+        """Per-day phase event counts and iteration stats.
+
+        One row per (day, project_id, phase, event_type) with
+        ``event_count``, ``iterations_count`` (events that recorded
+        iterations), ``iterations_sum``, ``iterations_max`` and
+        ``iterations_avg``. Days are UTC ``YYYY-MM-DD``; *since* is
+        inclusive and *until* exclusive, and only their date part is used.
+        Sorted by day, then project, phase and event type.
+        """
+        conditions, params = self._rollup_filters(project_id, phase, since, until)
+        if event_type:
+            conditions.append("event_type = ?")
+            params.append(event_type)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self._conn.execute(
+            "SELECT day, project_id, phase, event_type, event_count, "
+            "iterations_count, iterations_sum, iterations_max "
+            f"FROM phase_event_rollups{where} "
+            "ORDER BY day, project_id, phase, event_type",
+            params,
+        ).fetchall()
+        results = []
+        for row in rows:
+            item = dict(row)
+            item["iterations_avg"] = (
+                item["iterations_sum"] / item["iterations_count"]
+                if item["iterations_count"] else None
+            )
+            results.append(item)
+        return results
+
+    def query_phase_duration_histogram(
+        self,
+        *,
+        project_id: str | None = None,
+        phase: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[dict]:
+        """Phase duration histograms summed over the selected days.
+
+        One row per phase with ``count``, ``mean_seconds`` and ``buckets``:
+        counts per ``PHASE_DURATION_BUCKETS`` bucket, the last entry being
+        the open-ended bucket. Days and bounds are as in
+        ``query_phase_rollups`` (day of completion). Sorted by phase.
+        """
+        conditions, params = self._rollup_filters(project_id, phase, since, until)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self._conn.execute(
+            "SELECT phase, bucket, SUM(duration_count), SUM(duration_sum) "
+            f"FROM phase_duration_rollups{where} "
+            "GROUP BY phase, bucket ORDER BY phase, bucket",
+            params,
+        ).fetchall()
+        by_phase: dict[str, dict] = {}
+        for phase_name, bucket, count, total in rows:
+            entry = by_phase.setdefault(phase_name, {
+                "phase": phase_name,
+                "count": 0,
+                "total_seconds": 0.0,
+                "buckets": [0] * (len(PHASE_DURATION_BUCKETS) + 1),
+            })
+            entry["buckets"][bucket] = count
+            entry["count"] += count
+            entry["total_seconds"] += total
+        results = []
+        for entry in by_phase.values():
+            total = entry.pop("total_seconds")
+            entry["mean_seconds"] = total / entry["count"] if entry["count"] else None
+            results.append(entry)
+        return results
+
+    def rebuild_phase_rollups(self) -> None:
+        """Recompute the rollup tables from the phase_events rows present.
+
+        The insert triggers keep rollups current, so this is only needed to
+        repair them, or to pair ``completed`` events with ``started``
+        events inserted after them (e.g. an out-of-order backfill). Rollups
+        of days whose raw events were deleted are lost.
+        """
+        with self.transaction():
+            _rebuild_phase_rollups(self._conn)
+
+    # ------------------------------------------------------------------
+    # Outbox (deferred post-commit work, see workflow_engine.outbox)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _outbox_time(offset_seconds: float = 0.0) -> str:
+        """Fixed-width UTC timestamp, so ``available_at`` compares as text."""
+        moment = datetime.now(timezone.utc) + timedelta(seconds=offset_seconds)
+        return moment.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+    def enqueue_outbox(
+        self,
+        kind: str,
+        payload: dict,
+        *,
+        dedupe_key: str | None = None,
+        delay_seconds: float = 0.0,
+    ) -> bool:
+        """Queue a job of *kind* for the outbox worker.
+
+        Call inside the transaction whose commit the job depends on, so
+        the job is durable exactly when that change is. A pending job with
+        the same *dedupe_key* absorbs this one.
+
+        Returns
+        -------
+        bool
+            True if a row was added, False if it was coalesced.
+        """
+        now = self._outbox_time()
+        changes_before = self._conn.total_changes
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO outbox "
+            "(kind, payload, dedupe_key, status, available_at, created_at, updated_at) "
+            "VALUES (?, ?, ?, 'pending', ?, ?, ?)",
+            (kind, json.dumps(payload), dedupe_key,
+             self._outbox_time(delay_seconds), now, now),
+        )
+        self._commit()
+        # No cached row lives in outbox: keep the row cache.
+        self._row_cache_evict(changes_before)
+        return cursor.rowcount == 1
+
+    def claim_outbox(
+        self, *, limit: int = 20, lease_seconds: float = 300.0,
+    ) -> list[dict]:
+        """Lease up to *limit* due pending jobs, oldest first.
+
+        Claimed rows become ``running`` with ``attempts`` incremented and
+        ``available_at`` set to the lease expiry; ``recover_outbox`` hands
+        them back if the worker dies before finishing them. ``payload`` is
+        returned decoded.
+        """
+        with self.transaction():
+            rows = self._conn.execute(
+                "SELECT * FROM outbox WHERE status = 'pending' "
+                "AND available_at <= ? ORDER BY id LIMIT ?",
+                (self._outbox_time(), max(limit, 0)),
+            ).fetchall()
+            if not rows:
+                return []
+            ids = [row["id"] for row in rows]
+            placeholders = ",".join("?" * len(ids))
+            self._conn.execute(
+                f"UPDATE outbox SET status = 'running', "
+                f"attempts = attempts + 1, available_at = ?, updated_at = ? "
+                f"WHERE id IN ({placeholders})",
+                [self._outbox_time(lease_seconds), self._outbox_time(), *ids],
+            )
+        jobs = []
+        for row in rows:
+            job = dict(row)
+            job["payload"] = json.loads(job["payload"])
+            job["attempts"] += 1
+            job["status"] = "running"
+            jobs.append(job)
+        return jobs
+
+    def finish_outbox(self, job_id: int) -> None:
+        """Remove a job that ran successfully."""
+        self._conn.execute("DELETE FROM outbox WHERE id = ?", (job_id,))
+        self._commit()
+
+    def retry_outbox(
+        self, job_id: int, error: str, *, delay_seconds: float,
+    ) -> None:
+        """Return a running job to the queue, due after *delay_seconds*.
+
+        If a newer pending job with the same dedupe_key exists it already
+        covers this one, and this one is dropped.
+        """
+        with self.transaction():
+            self._conn.execute(
+                "UPDATE OR IGNORE outbox SET status = 'pending', "
+                "available_at = ?, last_error = ?, updated_at = ? "
+                "WHERE id = ? AND status = 'running'",
+                (self._outbox_time(delay_seconds), error[:2000],
+                 self._outbox_time(), job_id),
+            )
+            self._conn.execute(
+                "DELETE FROM outbox WHERE id = ? AND status = 'running'",
+                (job_id,),
+            )
+
+    def fail_outbox(self, job_id: int, error: str) -> None:
+        """Park a job as ``failed`` after its last attempt."""
+        self._conn.execute(
+            "UPDATE outbox SET status = 'failed', last_error = ?, updated_at = ? "
+            "WHERE id = ?",
+            (error[:2000], self._outbox_time(), job_id),
+        )
+        self._commit()
+
+    def recover_outbox(self, *, include_failed: bool = False) -> int:
+        """Requeue running jobs whose lease has expired.
+
+        A lease outlives its worker only if that worker crashed or was
+        killed mid-job. With *include_failed*, parked jobs are also given a
+        fresh set of attempts. Jobs superseded by a pending job with the
+        same dedupe_key are dropped. Returns the number of jobs requeued.
+        """
+        now = self._outbox_time()
+        condition = "(status = 'running' AND available_at <= ?)"
+        params: list = [now]
+        if include_failed:
+            condition += " OR status = 'failed'"
+        with self.transaction():
+            requeued = self._conn.execute(
+                f"UPDATE OR IGNORE outbox SET status = 'pending', "
+                f"available_at = ?, attempts = CASE WHEN status = 'failed' "
+                f"THEN 0 ELSE attempts END, updated_at = ? WHERE {condition}",
+                [now, now, *params],
+            ).rowcount
+            self._conn.execute(f"DELETE FROM outbox WHERE {condition}", params)
+        return requeued
+
+    def next_outbox_due(self) -> float | None:
+        """Seconds until the earliest pending job is due (0 if overdue).
+
+        ``None`` when nothing is pending.
+        """
+        row = self._conn.execute(
+            "SELECT MIN(available_at) FROM outbox WHERE status = 'pending'"
+        ).fetchone()
+        if row[0] is None:
+            return None
+        due = datetime.strptime(row[0], "%Y-%m-%dT%H:%M:%S.%fZ").replace(
+            tzinfo=timezone.utc,
+        )
+        return max((due - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    def outbox_counts(self) -> dict[str, int]:
+        """Number of outbox jobs per status."""
+        counts = {"pending": 0, "running": 0, "failed": 0}
+        for row in self._conn.execute(
+            "SELECT status, COUNT(*) AS n FROM outbox GROUP BY status"
+        ):
+            counts[row["status"]] = row["n"]
+        return counts
+
+    def list_outbox(
+        self, status: str | None = None, *, limit: int = 100,
+    ) -> list[dict]:
+        """Outbox jobs (payload decoded), oldest first, optionally by status."""
+        if status is not None:
+            rows = self._conn.execute(
+                "SELECT * FROM outbox WHERE status = ? ORDER BY id LIMIT ?",
+                (status, limit),
+            ).fetchall()
+        else:
+            rows = self._conn.execute(
+                "SELECT * FROM outbox ORDER BY id LIMIT ?", (limit,),
+            ).fetchall()
+        jobs = []
+        for row in rows:
+            job = dict(row)
+            job["payload"] = json.loads(job["payload"])
+            jobs.append(job)
+        return jobs
+
+    # ------------------------------------------------------------------
+    # Frontmatter header cache (see entity_registry.frontmatter_index)
+    # ------------------------------------------------------------------
+
+    def get_frontmatter_headers(
+        self, paths: Iterable[str],
+    ) -> dict[str, tuple[int, int, str | None]]:
+        """Cached ``{path: (mtime_ns, size, header_json)}`` for *paths*.
+
+        Paths without a cache row are omitted.
+        """
+        wanted = list(dict.fromkeys(paths))
+        found: dict[str, tuple[int, int, str | None]] = {}
+        for start in range(0, len(wanted), _IN_CLAUSE_CHUNK):
+            chunk = wanted[start:start + _IN_CLAUSE_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            for row in self._conn.execute(
+                f"SELECT path, mtime_ns, size, header FROM frontmatter_headers "
+                f"WHERE path IN ({placeholders})",
+                chunk,
+            ):
+                found[row["path"]] = (row["mtime_ns"], row["size"], row["header"])
+        return found
+
+    def put_frontmatter_headers(
+        self, entries: Iterable[tuple[str, int, int, str | None]],
+    ) -> None:
+        """Insert or replace ``(path, mtime_ns, size, header_json)`` rows."""
+        with self.transaction():
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO frontmatter_headers "
+                "(path, mtime_ns, size, header) VALUES (?, ?, ?, ?)",
+                list(entries),
+            )
+
+    def delete_frontmatter_headers(self, paths: Iterable[str]) -> int:
+        """Drop cache rows for *paths*; return how many were removed."""
+        wanted = list(dict.fromkeys(paths))
+        removed = 0
+        with self.transaction():
+            for start in range(0, len(wanted), _IN_CLAUSE_CHUNK):
+                chunk = wanted[start:start + _IN_CLAUSE_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                removed += self._conn.execute(
+                    f"DELETE FROM frontmatter_headers "
+                    f"WHERE path IN ({placeholders})",
+                    chunk,
+                ).rowcount
+        return removed
+
     # ------------------------------------------------------------------
     # Workflow Phase CRUD
     # ------------------------------------------------------------------
@@ -3289,8 +4855,14 @@ class EntityDatabase:
     def get_workflow_phase(self, type_id: str) -> dict | None:
         """Retrieve a workflow_phases row by type_id.
 
-        Returns ``None`` if not found.
+        Returns ``None`` if not found. Served from the row cache while the
+        database is unchanged.
         """
+        return self._cached_row(
+            ("workflow_phase", type_id), lambda: self._load_workflow_phase(type_id),
+        )
+
+    def _load_workflow_phase(self, type_id: str) -> dict | None:
         row = self._conn.execute(
             "SELECT * FROM workflow_phases WHERE type_id = ?", (type_id,)
         ).fetchone()
@@ -3345,6 +4917,7 @@ class EntityDatabase:
         if row is None:
             raise ValueError(f"Workflow phase not found: {type_id}")
 
+        changes_before = self._conn.total_changes
         set_parts: list[str] = ["updated_at = ?"]
         params: list = [self._now_iso()]
 
@@ -3377,10 +4950,14 @@ class EntityDatabase:
             if "CHECK constraint" in msg:
                 raise ValueError(f"Invalid value: {e}") from e
             raise ValueError(msg) from e
+        key = ("workflow_phase", type_id)
+        cache_current = self._row_cache_evict(changes_before, key)
 
         result = self._conn.execute(
             "SELECT * FROM workflow_phases WHERE type_id = ?", (type_id,)
         ).fetchone()
+        if cache_current:
+            self._row_cache[key] = dict(result)
         return dict(result)
 
     def upsert_workflow_phase(
@@ -3485,6 +5062,7 @@ class EntityDatabase:
         *,
         kanban_column: str | None = None,
         workflow_phase: str | None = None,
+        type_ids: Iterable[str] | None = None,
     ) -> list[dict]:
         """List workflow_phases rows with optional filters.
 
@@ -3494,11 +5072,15 @@ class EntityDatabase:
             If provided, filter by kanban_column.
         workflow_phase:
             If provided, filter by workflow_phase.
+        type_ids:
+            If provided, only return rows for these type_ids (looked up by
+            primary key in chunks, so a page of entities costs a handful of
+            index probes instead of a full-table read).
 
         Returns
         -------
         list[dict]
-            Matching rows as plain dicts. Both filters use AND logic.
+            Matching rows as plain dicts. All filters use AND logic.
         """
         clauses: list[str] = []
         params: list = []
@@ -3516,11 +5098,24 @@ class EntityDatabase:
             " FROM workflow_phases wp"
             " LEFT JOIN entities e ON wp.type_id = e.type_id"
         )
-        if clauses:
-            sql += " WHERE " + " AND ".join(clauses)
 
-        rows = self._conn.execute(sql, params).fetchall()
-        return [dict(row) for row in rows]
+        if type_ids is None:
+            if clauses:
+                sql += " WHERE " + " AND ".join(clauses)
+            rows = self._conn.execute(sql, params).fetchall()
+            return [dict(row) for row in rows]
+
+        wanted = list(dict.fromkeys(type_ids))
+        results: list[dict] = []
+        for start in range(0, len(wanted), _IN_CLAUSE_CHUNK):
+            chunk = wanted[start:start + _IN_CLAUSE_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            chunk_sql = sql + " WHERE " + " AND ".join(
+                clauses + [f"wp.type_id IN ({placeholders})"]
+            )
+            rows = self._conn.execute(chunk_sql, params + chunk).fetchall()
+            results.extend(dict(row) for row in rows)
+        return results
 
     # ------------------------------------------------------------------
     # Metadata helpers
@@ -3786,111 +5381,183 @@ class EntityDatabase:
         ----------
         entities:
             List of dicts, each with keys: entity_type, entity_id, name,
-            and optional: artifact_path, status, parent_type_id, metadata.
+            and optional: artifact_path, status, parent_type_id, metadata,
+            tags (list of tag strings) and workflow_phase (dict of
+            workflow_phases columns: workflow_phase, kanban_column,
+            last_completed_phase, mode).
         project_id:
             Project scope applied to all entities in the batch.
 
         Returns
         -------
         list[str]
-            UUIDs of all successfully registered entities.
+            UUID of each entity in input order (existing UUID for
+            duplicates).
 
         Notes
         -----
-        Single-level parent references within batch are supported: a parent
-        must either exist in DB already or appear earlier in the batch list.
-        Multi-level chains within a single batch are NOT supported.
-        Invalid entity_type causes the entire batch to fail (none inserted).
-        Duplicate type_id entries are skipped via INSERT OR IGNORE.
+        UUIDs are allocated before anything is written, so a parent may
+        exist in DB already or appear anywhere in the batch (any order,
+        any depth). Entities, tags and workflow_phases rows are written
+        with one ``executemany`` each and the FTS index is filled once
+        after all entity rows are in.
+        Invalid entity_type, tag or workflow_phases column causes the
+        entire batch to fail (none inserted).
+        Duplicate type_id entries are skipped via INSERT OR IGNORE; their
+        tags are still added and an existing workflow_phases row is kept.
+        Sequences that already exist are advanced past any numeric
+        entity_id prefix in the batch so later allocations cannot collide.
         """
         if not entities:
             return []
 
-        # Validate all entity_types upfront
+        # Validate everything upfront
         for ent in entities:
             self._validate_entity_type(ent["entity_type"])
+            for tag in ent.get("tags") or ():
+                self._validate_tag(tag)
+            invalid = set(ent.get("workflow_phase") or {}) - _BATCH_PHASE_COLUMNS
+            if invalid:
+                raise ValueError(f"Invalid workflow_phases columns: {invalid}")
+
+        type_ids = [f"{e['entity_type']}:{e['entity_id']}" for e in entities]
+        parent_refs = {
+            e["parent_type_id"] for e in entities if e.get("parent_type_id")
+        }
 
         self._conn.execute("BEGIN IMMEDIATE")
         try:
             now = self._now_iso()
-            uuids: list[str] = []
-            # Track batch-local type_id -> uuid for intra-batch parent refs
-            batch_uuids: dict[str, str] = {}
-
-            for ent in entities:
-                entity_type = ent["entity_type"]
-                entity_id = ent["entity_id"]
-                name = ent["name"]
-                type_id = f"{entity_type}:{entity_id}"
-                status = ent.get("status")
-                artifact_path = ent.get("artifact_path")
+            known = self._uuids_for_type_ids(
+                list(dict.fromkeys([*type_ids, *parent_refs])), project_id,
+            )
+            # Allocate UUIDs for every new entity before resolving parents
+            new: list[tuple[dict, str]] = []
+            for ent, type_id in zip(entities, type_ids):
+                if type_id not in known:
+                    known[type_id] = str(uuid_mod.uuid4())
+                    new.append((ent, type_id))
+            new = _parents_first(new)
+
+            max_rowid = self._conn.execute(
+                "SELECT COALESCE(MAX(rowid), 0) FROM entities"
+            ).fetchone()[0]
+            rows = []
+            fts_values: dict[str, tuple] = {}
+            for ent, type_id in new:
+                entity_uuid = known[type_id]
                 parent_type_id = ent.get("parent_type_id")
                 metadata = ent.get("metadata")
-                metadata_json = json.dumps(metadata) if metadata is not None else None
-
-                # Resolve parent_uuid
-                parent_uuid = None
-                if parent_type_id is not None:
-                    # Check batch-local first, then DB
-                    if parent_type_id in batch_uuids:
-                        parent_uuid = batch_uuids[parent_type_id]
-                    else:
-                        parent_row = self._conn.execute(
-                            "SELECT uuid FROM entities "
-                            "WHERE type_id = ? AND project_id = ?",
-                            (parent_type_id, project_id),
-                        ).fetchone()
-                        if parent_row is not None:
-                            parent_uuid = parent_row["uuid"]
-
-                entity_uuid = str(uuid_mod.uuid4())
-                cursor = self._conn.execute(
-                    "INSERT OR IGNORE INTO entities "
-                    "(uuid, type_id, project_id, entity_type, entity_id, "
-                    "name, status, parent_type_id, parent_uuid, "
-                    "artifact_path, created_at, updated_at, metadata) "
-                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                    (entity_uuid, type_id, project_id, entity_type,
-                     entity_id, name, status, parent_type_id, parent_uuid,
-                     artifact_path, now, now, metadata_json),
+                status = ent.get("status")
+                rows.append((
+                    entity_uuid, type_id, project_id, ent["entity_type"],
+                    ent["entity_id"], ent["name"], status, parent_type_id,
+                    known.get(parent_type_id) if parent_type_id else None,
+                    ent.get("artifact_path"), now, now,
+                    json.dumps(metadata) if metadata is not None else None,
+                ))
+                fts_values[entity_uuid] = (
+                    ent["name"], ent["entity_id"], ent["entity_type"],
+                    status or "", flatten_metadata(metadata),
                 )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO entities "
+                "(uuid, type_id, project_id, entity_type, entity_id, "
+                "name, status, parent_type_id, parent_uuid, "
+                "artifact_path, created_at, updated_at, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
 
-                if cursor.rowcount == 1:
-                    # FTS update
-                    row = self._conn.execute(
-                        "SELECT rowid FROM entities WHERE uuid = ?",
-                        (entity_uuid,),
-                    ).fetchone()
-                    metadata_text = flatten_metadata(
-                        json.loads(metadata_json) if metadata_json else None
+            # Deferred FTS update: one pass over the rows this batch added
+            # (we hold the write lock, so rowids above max_rowid are ours).
+            if fts_values:
+                inserted = self._conn.execute(
+                    "SELECT rowid, uuid FROM entities WHERE rowid > ?",
+                    (max_rowid,),
+                ).fetchall()
+                if self._fts_dirty is not None:
+                    self._fts_dirty.update(rowid for rowid, _ in inserted)
+                else:
+                    self._conn.executemany(
+                        _FTS_INSERT_SQL,
+                        [
+                            (rowid, *fts_values[uid])
+                            for rowid, uid in inserted if uid in fts_values
+                        ],
                     )
-                    self._conn.execute(
-                        "INSERT INTO entities_fts(rowid, name, entity_id, "
-                        "entity_type, status, metadata_text) "
-                        "VALUES(?, ?, ?, ?, ?, ?)",
-                        (row[0], name, entity_id, entity_type, status or "",
-                         metadata_text),
+
+            tag_rows = [
+                (known[type_id], tag)
+                for ent, type_id in zip(entities, type_ids)
+                for tag in ent.get("tags") or ()
+            ]
+            if tag_rows:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO entity_tags (entity_uuid, tag) "
+                    "VALUES (?, ?)",
+                    tag_rows,
+                )
+
+            phase_rows = []
+            for ent, type_id in zip(entities, type_ids):
+                phase = ent.get("workflow_phase")
+                if phase is None:
+                    continue
+                phase_rows.append((
+                    type_id, phase.get("workflow_phase"),
+                    phase.get("kanban_column", "backlog"),
+                    phase.get("last_completed_phase"), phase.get("mode"),
+                    now, known[type_id],
+                ))
+            if phase_rows:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO workflow_phases "
+                    "(type_id, workflow_phase, kanban_column, "
+                    "last_completed_phase, mode, updated_at, uuid) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    phase_rows,
+                )
+
+            # Keep existing sequences ahead of imported numeric prefixes
+            highest: dict[str, int] = {}
+            for ent, _ in new:
+                match = re.match(r"^(\d+)", str(ent["entity_id"]))
+                if match:
+                    entity_type = ent["entity_type"]
+                    highest[entity_type] = max(
+                        highest.get(entity_type, 0), int(match.group(1)),
                     )
-                    batch_uuids[type_id] = entity_uuid
-                    uuids.append(entity_uuid)
-                else:
-                    # Already existed — fetch existing UUID
-                    existing = self._conn.execute(
-                        "SELECT uuid FROM entities "
-                        "WHERE type_id = ? AND project_id = ?",
-                        (type_id, project_id),
-                    ).fetchone()
-                    if existing:
-                        batch_uuids[type_id] = existing["uuid"]
-                        uuids.append(existing["uuid"])
+            if highest:
+                self._conn.executemany(
+                    "UPDATE sequences SET next_val = MAX(next_val, ?) "
+                    "WHERE project_id = ? AND entity_type = ?",
+                    [(top + 1, project_id, t) for t, top in highest.items()],
+                )
 
             self._commit()
-            return uuids
+            return [known[type_id] for type_id in type_ids]
 
         except Exception:
             self._conn.rollback()
             raise
 
+    def _uuids_for_type_ids(
+        self, type_ids: list[str], project_id: str,
+    ) -> dict[str, str]:
+        """Map the given type_ids that exist in *project_id* to their UUIDs."""
+        found: dict[str, str] = {}
+        for start in range(0, len(type_ids), _IN_CLAUSE_CHUNK):
+            chunk = type_ids[start:start + _IN_CLAUSE_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in self._conn.execute(
+                "SELECT type_id, uuid FROM entities "
+                f"WHERE project_id = ? AND type_id IN ({placeholders})",
+                [project_id, *chunk],
+            ):
+                found[row["type_id"]] = row["uuid"]
+        return found
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -1,6 +1,7 @@
 """Read, write, validate, and build YAML frontmatter headers for markdown files."""
 from __future__ import annotations
 
+import codecs
 import logging
 import os
 import re
@@ -53,6 +54,9 @@ _FIELD_ORDER_SET = frozenset(FIELD_ORDER)
 # Allowed artifact types (R3)
 ALLOWED_ARTIFACT_TYPES = frozenset({"spec", "design", "plan", "tasks", "retro", "prd"})
 
+# read_frontmatter's first read; a NUL byte in it marks the file as binary
+_BINARY_SNIFF_BYTES = 8192
+
 # UUID v4 regex (lowercase; callers must .lower() before matching per R11)
 _UUID_V4_RE = re.compile(
     r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
@@ -178,37 +182,54 @@ def read_frontmatter(filepath: str) -> dict | None:
 
     Returns a dict of header fields, or ``None`` if no valid frontmatter
     block is found. Never raises exceptions -- errors are logged as warnings.
+
+    Reads only as far as the closing ``---``: the body after the header is
+    neither read nor decoded.
     """
-    # Single read: binary guard + text parsing from one open call
     try:
-        with open(filepath, "rb") as f:
-            raw = f.read()
+        f = open(filepath, "rb")
     except FileNotFoundError:
         logger.warning("File not found: %s", filepath)
         return None
 
-    if b"\x00" in raw[:8192]:
-        logger.warning("Binary content detected, skipping: %s", filepath)
-        return None
-
-    lines = raw.decode("utf-8").splitlines(keepends=True)
+    with f:
+        chunk = f.read(_BINARY_SNIFF_BYTES)
+        if b"\x00" in chunk:
+            logger.warning("Binary content detected, skipping: %s", filepath)
+            return None
+
+        # The first chunk may hold part of the body; surrogateescape keeps
+        # invalid bytes there from raising. The header is checked strictly
+        # once the closing delimiter is found.
+        decoder = codecs.getincrementaldecoder("utf-8")("surrogateescape")
+        text = ""
+        chunk_size = _BINARY_SNIFF_BYTES
+        while True:
+            at_eof = len(chunk) < chunk_size
+            text += decoder.decode(chunk, final=at_eof)
+            lines = text.splitlines(keepends=True)
+            # The last line may continue in the next chunk.
+            complete = lines if at_eof else lines[:-1]
+
+            if complete and complete[0].rstrip("\n") != "---":
+                return None
+            for index, line in enumerate(complete[1:], start=1):
+                if line.rstrip("\n") == "---":
+                    # Found closing delimiter -- parse what we have
+                    header = "".join(complete[1:index])
+                    header.encode("utf-8", "surrogateescape").decode("utf-8")
+                    return _parse_block(
+                        [block.rstrip("\n") for block in complete[1:index]]
+                    )
+
+            if at_eof:
+                break
+            chunk_size *= 2  # keeps re-splitting a long header linear
+            chunk = f.read(chunk_size)
 
-    if not lines:
+    if not text:
         # Empty file
         return None
-
-    if lines[0].rstrip("\n") != "---":
-        return None
-
-    # Accumulate lines between opening and closing ---
-    block_lines: list[str] = []
-    for line in lines[1:]:
-        stripped = line.rstrip("\n")
-        if stripped == "---":
-            # Found closing delimiter -- parse what we have
-            return _parse_block(block_lines)
-        block_lines.append(stripped)
-
     # EOF without closing delimiter -- malformed
     logger.warning("Malformed frontmatter (no closing ---): %s", filepath)
     return None
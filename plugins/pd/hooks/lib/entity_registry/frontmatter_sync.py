@@ -19,6 +19,7 @@ from entity_registry.frontmatter import (
     validate_header,
     write_frontmatter,
 )
+from entity_registry.frontmatter_index import FrontmatterHeaderIndex
 from entity_registry.frontmatter_inject import (
     ARTIFACT_BASENAME_MAP,
     ARTIFACT_PHASE_MAP,
@@ -174,6 +175,86 @@ def _derive_feature_directory(entity: dict, artifacts_root: str) -> str | None:
     return None
 
 
+def _drift_report(
+    filepath: str,
+    type_id: str | None,
+    header: dict | None,
+    entity: dict | None,
+) -> DriftReport:
+    """Classify *header* (from the file) against *entity* (from the DB).
+
+    Shared by :func:`detect_drift` and :func:`detect_drift_bulk`. Raises
+    AssertionError when neither exists; callers report that as ``"error"``.
+    """
+    # Step 4-6: Branch on header/entity presence
+    if header is not None and entity is None:
+        return DriftReport(
+            filepath=filepath,
+            type_id=type_id,
+            status="file_only",
+            file_fields=dict(header),
+            db_fields=None,
+            mismatches=[],
+        )
+
+    if header is None and entity is not None:
+        return DriftReport(
+            filepath=filepath,
+            type_id=entity["type_id"],
+            status="db_only",
+            file_fields=None,
+            db_fields=dict(entity),
+            mismatches=[],
+        )
+
+    # Step 7: Both exist -- compare COMPARABLE_FIELD_MAP fields
+    assert header is not None and entity is not None
+    mismatches: list[FieldMismatch] = []
+    for file_field, db_column in COMPARABLE_FIELD_MAP.items():
+        file_val = header.get(file_field)
+        db_val = entity.get(db_column)
+
+        if file_field == "entity_uuid":
+            # UUID comparison is case-insensitive
+            if (file_val or "").lower() != (db_val or "").lower():
+                mismatches.append(FieldMismatch(
+                    field=file_field,
+                    file_value=file_val,
+                    db_value=db_val,
+                ))
+        else:
+            # type_id comparison is case-sensitive
+            if file_val != db_val:
+                mismatches.append(FieldMismatch(
+                    field=file_field,
+                    file_value=file_val,
+                    db_value=db_val,
+                ))
+
+    # Step 8-9: Diverged or in_sync
+    status = "diverged" if mismatches else "in_sync"
+    return DriftReport(
+        filepath=filepath,
+        type_id=entity["type_id"],
+        status=status,
+        file_fields=dict(header),
+        db_fields=dict(entity),
+        mismatches=mismatches,
+    )
+
+
+def _error_report(filepath: str, type_id: str | None, exc: Exception) -> DriftReport:
+    logger.warning("detect_drift error for %s: %s", filepath, exc)
+    return DriftReport(
+        filepath=filepath,
+        type_id=type_id,
+        status="error",
+        file_fields=None,
+        db_fields=None,
+        mismatches=[],
+    )
+
+
 # ---------------------------------------------------------------------------
 # Public API: Core sync functions
 # ---------------------------------------------------------------------------
@@ -237,73 +318,10 @@ def detect_drift(
 
         # Step 3: Look up entity in DB
         entity = db.get_entity(lookup_key)
-
-        # Step 4-6: Branch on header/entity presence
-        if header is not None and entity is None:
-            return DriftReport(
-                filepath=filepath,
-                type_id=type_id,
-                status="file_only",
-                file_fields=dict(header),
-                db_fields=None,
-                mismatches=[],
-            )
-
-        if header is None and entity is not None:
-            return DriftReport(
-                filepath=filepath,
-                type_id=entity["type_id"],
-                status="db_only",
-                file_fields=None,
-                db_fields=dict(entity),
-                mismatches=[],
-            )
-
-        # Step 7: Both exist -- compare COMPARABLE_FIELD_MAP fields
-        assert header is not None and entity is not None
-        mismatches: list[FieldMismatch] = []
-        for file_field, db_column in COMPARABLE_FIELD_MAP.items():
-            file_val = header.get(file_field)
-            db_val = entity.get(db_column)
-
-            if file_field == "entity_uuid":
-                # UUID comparison is case-insensitive
-                if (file_val or "").lower() != (db_val or "").lower():
-                    mismatches.append(FieldMismatch(
-                        field=file_field,
-                        file_value=file_val,
-                        db_value=db_val,
-                    ))
-            else:
-                # type_id comparison is case-sensitive
-                if file_val != db_val:
-                    mismatches.append(FieldMismatch(
-                        field=file_field,
-                        file_value=file_val,
-                        db_value=db_val,
-                    ))
-
-        # Step 8-9: Diverged or in_sync
-        status = "diverged" if mismatches else "in_sync"
-        return DriftReport(
-            filepath=filepath,
-            type_id=entity["type_id"],
-            status=status,
-            file_fields=dict(header),
-            db_fields=dict(entity),
-            mismatches=mismatches,
-        )
+        return _drift_report(filepath, type_id, header, entity)
 
     except Exception as exc:
-        logger.warning("detect_drift error for %s: %s", filepath, exc)
-        return DriftReport(
-            filepath=filepath,
-            type_id=type_id,
-            status="error",
-            file_fields=None,
-            db_fields=None,
-            mismatches=[],
-        )
+        return _error_report(filepath, type_id, exc)
 
 
 def stamp_header(
@@ -490,6 +508,45 @@ def ingest_header(
 # ---------------------------------------------------------------------------
 
 
+def detect_drift_bulk(
+    db: EntityDatabase,
+    targets: list[tuple[str, str]],
+    *,
+    header_index: FrontmatterHeaderIndex | None = None,
+) -> list[DriftReport]:
+    """:func:`detect_drift` for many ``(filepath, type_id)`` pairs at once.
+
+    Returns one report per target, in order, equal to what
+    ``detect_drift(db, filepath, type_id)`` would return. Entities are
+    fetched with one chunked query (``get_entities_by_type_ids``) and, with
+    a *header_index*, headers of unchanged files come from its cache
+    instead of being re-read. Never raises.
+    """
+    try:
+        entities = db.get_entities_by_type_ids(t for _, t in targets)
+        if header_index is not None:
+            headers = header_index.headers(p for p, _ in targets)
+        else:
+            headers = {}
+    except Exception as exc:
+        return [_error_report(p, t, exc) for p, t in targets]
+
+    reports: list[DriftReport] = []
+    for filepath, type_id in targets:
+        if filepath not in headers:
+            # Not indexed (no index, vanished or unreadable): the single-file
+            # path reads it and reports any failure the usual way.
+            reports.append(detect_drift(db, filepath, type_id=type_id))
+            continue
+        try:
+            reports.append(_drift_report(
+                filepath, type_id, headers[filepath], entities.get(type_id),
+            ))
+        except Exception as exc:
+            reports.append(_error_report(filepath, type_id, exc))
+    return reports
+
+
 def backfill_headers(
     db: EntityDatabase,
     artifacts_root: str,
@@ -544,10 +601,12 @@ def scan_all(
 ) -> list[DriftReport]:
     """Drift-scan all registered feature entities' artifact files.
 
-    Mirrors :func:`backfill_headers` structure but calls :func:`detect_drift`
-    instead of :func:`stamp_header`. Since ``type_id`` is always passed to
-    ``detect_drift``, files without frontmatter return ``status="db_only"``
-    (not ``"no_header"``).
+    Mirrors :func:`backfill_headers` structure but checks drift instead of
+    stamping. Since ``type_id`` is always passed, files without frontmatter
+    return ``status="db_only"`` (not ``"no_header"``). Reports match
+    :func:`detect_drift` per file; they are computed with
+    :func:`detect_drift_bulk` and a :class:`FrontmatterHeaderIndex`, so
+    entities are read in one query and unchanged files are not re-read.
 
     Never raises: individual file failures are caught and returned as
     ``status="error"`` reports.
@@ -564,7 +623,7 @@ def scan_all(
     list[DriftReport]
         One report per file examined. Callers can filter by ``status``.
     """
-    reports: list[DriftReport] = []
+    targets: list[tuple[str, str]] = []
     features = db.list_entities(entity_type="feature")
 
     for entity in features:
@@ -576,7 +635,8 @@ def scan_all(
             filepath = os.path.join(feat_dir, basename)
             if not os.path.isfile(filepath):
                 continue
-            report = detect_drift(db, filepath, type_id=entity["type_id"])
-            reports.append(report)
+            targets.append((filepath, entity["type_id"]))
 
-    return reports
+    return detect_drift_bulk(
+        db, targets, header_index=FrontmatterHeaderIndex(db),
+    )
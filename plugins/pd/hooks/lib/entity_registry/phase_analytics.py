@@ -0,0 +1,160 @@
+"""Columnar export of phase_events for offline analysis.
+
+``export_phase_events_npz`` streams phase_events rows (see
+``EntityDatabase.iter_phase_events``) into a compressed NumPy ``.npz``
+file, one array per column, without building a dict per row:
+
+- String columns (``type_id``, ``project_id``, ``phase``, ``event_type``,
+  ``backward_target``, ``source``) are dictionary-encoded as
+  ``<name>_codes`` (int32 indexes, -1 for NULL) plus ``<name>_values``
+  (the distinct strings).
+- ``timestamp`` is float64 seconds since the epoch, NaN when unparseable;
+  naive timestamps are read as UTC.
+- ``iterations`` is int32, -1 when NULL.
+- ``format_version`` and ``duration_buckets`` (``PHASE_DURATION_BUCKETS``)
+  describe the file.
+
+``load_phase_events_npz`` reads a file back with string columns decoded.
+numpy is optional for the rest of the package; both functions raise
+RuntimeError without it.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+from array import array
+from datetime import datetime, timezone
+
+from entity_registry.database import PHASE_DURATION_BUCKETS, EntityDatabase
+
+try:
+    import numpy as np
+    _numpy_available = True
+except ImportError:  # pragma: no cover
+    _numpy_available = False
+
+# Bump when the set or meaning of arrays in the file changes.
+NPZ_FORMAT_VERSION = 1
+
+_STRING_COLUMNS = (
+    "type_id", "project_id", "phase", "event_type", "backward_target", "source",
+)
+
+
+class _DictionaryColumn:
+    """Accumulates a dictionary-encoded string column."""
+
+    def __init__(self) -> None:
+        self.codes = array("i")
+        self._index: dict[str, int] = {}
+
+    def append(self, value: str | None) -> None:
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self._index)
+        self.codes.append(code)
+
+    @property
+    def values(self) -> list[str]:
+        return list(self._index)
+
+
+def _epoch_seconds(timestamp: str) -> float:
+    try:
+        moment = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return float("nan")
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def _require_numpy() -> None:
+    if not _numpy_available:  # pragma: no cover
+        raise RuntimeError("numpy is required for the phase_events columnar export")
+
+
+def export_phase_events_npz(
+    db: EntityDatabase,
+    path: str,
+    *,
+    project_id: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    include_archive: bool = False,
+) -> int:
+    """Write phase_events to *path* as a compressed ``.npz``; return the row count.
+
+    *project_id* None exports every project. *since*, *until* and
+    *include_archive* are as in ``EntityDatabase.query_phase_events``. The
+    file is written to a temporary name and renamed into place.
+    """
+    _require_numpy()
+    strings = {name: _DictionaryColumn() for name in _STRING_COLUMNS}
+    timestamps = array("d")
+    iterations = array("i")
+    for (type_id, row_project, phase, event_type, timestamp, iters,
+         backward_target, source) in db.iter_phase_events(
+            project_id=project_id, since=since, until=until,
+            include_archive=include_archive):
+        strings["type_id"].append(type_id)
+        strings["project_id"].append(row_project)
+        strings["phase"].append(phase)
+        strings["event_type"].append(event_type)
+        strings["backward_target"].append(backward_target)
+        strings["source"].append(source)
+        timestamps.append(_epoch_seconds(timestamp))
+        iterations.append(-1 if iters is None else iters)
+
+    arrays = {
+        "format_version": np.array(NPZ_FORMAT_VERSION, dtype=np.int32),
+        "duration_buckets": np.array(PHASE_DURATION_BUCKETS, dtype=np.int64),
+        "timestamp": np.frombuffer(timestamps, dtype=np.float64),
+        "iterations": np.frombuffer(iterations, dtype=np.int32),
+    }
+    for name, column in strings.items():
+        arrays[f"{name}_codes"] = np.frombuffer(column.codes, dtype=np.int32)
+        arrays[f"{name}_values"] = np.array(column.values, dtype=str)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".npz.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return len(timestamps)
+
+
+def load_phase_events_npz(path: str) -> dict:
+    """Read an export back as ``{column: ndarray}``.
+
+    String columns are decoded to str arrays, with NULL as ``""``; the
+    numeric columns and ``duration_buckets`` are returned as stored.
+    """
+    _require_numpy()
+    with np.load(path) as data:
+        version = int(data["format_version"])
+        if version != NPZ_FORMAT_VERSION:
+            raise ValueError(
+                f"unsupported phase_events export format {version} "
+                f"(expected {NPZ_FORMAT_VERSION})"
+            )
+        columns = {
+            "timestamp": data["timestamp"],
+            "iterations": data["iterations"],
+            "duration_buckets": data["duration_buckets"],
+        }
+        for name in _STRING_COLUMNS:
+            codes = data[f"{name}_codes"]
+            values = np.append(data[f"{name}_values"], "")
+            columns[name] = values[codes]  # -1 picks the trailing ""
+    return columns
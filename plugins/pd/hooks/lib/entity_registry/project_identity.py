@@ -4,15 +4,25 @@ Provides:
 - detect_project_id(): 12-char hex project identifier
 - collect_git_info(): full git metadata as GitProjectInfo dataclass
 - normalize_remote_url(): canonical host/owner/repo URL form
+
+Both detectors consult an on-disk identity cache shared by every hook and
+MCP process (``~/.claude/pd/project-identity.json``, override with
+``PD_PROJECT_IDENTITY_CACHE``). Entries are keyed by the repo's git dir and
+validated against stat signatures of the files that can change the
+answer (``HEAD``, ``shallow``, ``packed-refs``, ``config``, the origin HEAD
+symref), so a warm lookup costs a few ``stat`` calls instead of
+``git rev-list`` walking the whole history.
 """
 from __future__ import annotations
 
 import dataclasses
 import functools
 import hashlib
+import json
 import os
 import re
 import subprocess
+import tempfile
 
 
 @dataclasses.dataclass(frozen=True)
@@ -91,6 +101,174 @@ def _run_git(args: list[str], working_dir: str) -> subprocess.CompletedProcess:
     )
 
 
+# ---------------------------------------------------------------------------
+# Persistent identity cache
+# ---------------------------------------------------------------------------
+
+_IDENTITY_CACHE_ENV = "PD_PROJECT_IDENTITY_CACHE"
+_DEFAULT_IDENTITY_CACHE = "~/.claude/pd/project-identity.json"
+_IDENTITY_CACHE_VERSION = 1
+_IDENTITY_CACHE_MAX_ENTRIES = 64
+
+
+def _identity_cache_path() -> str:
+    return os.path.expanduser(
+        os.environ.get(_IDENTITY_CACHE_ENV) or _DEFAULT_IDENTITY_CACHE
+    )
+
+
+def _stat_sig(path: str) -> list[int] | None:
+    """Return [mtime_ns, size] for path, or None when it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _locate_git_dirs(start: str) -> tuple[str, str] | None:
+    """Find (git_dir, common_dir) above ``start`` without spawning git.
+
+    Handles linked worktrees and submodules (``.git`` file with
+    ``gitdir:``). Returns None outside a repository, or when ``GIT_DIR``
+    redirects git somewhere the walk cannot see.
+    """
+    if os.environ.get("GIT_DIR"):
+        return None
+    path = os.path.abspath(start)
+    while True:
+        dot_git = os.path.join(path, ".git")
+        if os.path.isdir(dot_git):
+            git_dir = dot_git
+            break
+        if os.path.isfile(dot_git):
+            try:
+                with open(dot_git) as f:
+                    line = f.read().strip()
+            except OSError:
+                return None
+            if not line.startswith("gitdir:"):
+                return None
+            git_dir = os.path.join(path, line[len("gitdir:"):].strip())
+            break
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+    git_dir = os.path.realpath(git_dir)
+    common_dir = git_dir
+    try:
+        with open(os.path.join(git_dir, "commondir")) as f:
+            common_dir = os.path.realpath(
+                os.path.join(git_dir, f.read().strip())
+            )
+    except OSError:
+        pass
+    return git_dir, common_dir
+
+
+def _identity_signature(git_dir: str, common_dir: str) -> dict:
+    """Stat signals that move whenever a cached identity could be stale."""
+    sig: dict[str, object] = {
+        name: _stat_sig(os.path.join(common_dir, name))
+        for name in ("shallow", "packed-refs", "config", "refs/remotes/origin/HEAD")
+    }
+    sig["HEAD"] = _stat_sig(os.path.join(git_dir, "HEAD"))
+    if sig["shallow"] is not None:
+        # Shallow clones are identified by HEAD's SHA, which moves with
+        # every commit on the checked-out branch.
+        try:
+            with open(os.path.join(git_dir, "HEAD")) as f:
+                head = f.read().strip()
+        except OSError:
+            head = ""
+        if head.startswith("ref: "):
+            sig["head_ref"] = _stat_sig(os.path.join(common_dir, head[5:]))
+    return sig
+
+
+def _load_identity_cache(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(cache, dict)
+        or cache.get("version") != _IDENTITY_CACHE_VERSION
+        or not isinstance(cache.get("entries"), dict)
+    ):
+        return {}
+    return cache["entries"]
+
+
+def _save_identity_cache(path: str, entries: dict) -> None:
+    """Atomic JSON write: NamedTemporaryFile + os.replace(). Best effort."""
+    tmp_name = None
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            dir=os.path.dirname(path) or ".",
+            suffix=".tmp",
+            delete=False,
+            encoding="utf-8",
+        ) as fd:
+            tmp_name = fd.name
+            json.dump(
+                {"version": _IDENTITY_CACHE_VERSION, "entries": entries}, fd
+            )
+        os.replace(tmp_name, path)
+    except OSError:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def _cached_identity(cwd: str) -> GitProjectInfo | None:
+    """Return the repo's GitProjectInfo from the shared cache, filling it on a miss.
+
+    Returns None (caller falls back to uncached detection) outside a git
+    repository, or when git cannot resolve a commit-based identity — the
+    path-hash fallback depends on ``cwd`` so it is not shared per repo.
+    """
+    located = _locate_git_dirs(cwd)
+    if located is None:
+        return None
+    git_dir, common_dir = located
+    signature = _identity_signature(git_dir, common_dir)
+    path = _identity_cache_path()
+    entries = _load_identity_cache(path)
+
+    entry = entries.get(git_dir)
+    if isinstance(entry, dict) and entry.get("signature") == signature:
+        try:
+            return GitProjectInfo(**entry["info"])
+        except (KeyError, TypeError):
+            pass
+
+    project_id = _detect_project_id_uncached(cwd)
+    info = _collect_git_info_uncached(cwd, project_id)
+    if not info.is_git_repo or project_id == _path_hash(cwd):
+        return None
+    entries.pop(git_dir, None)
+    entries[git_dir] = {
+        "signature": signature,
+        "info": dataclasses.asdict(info),
+    }
+    while len(entries) > _IDENTITY_CACHE_MAX_ENTRIES:
+        entries.pop(next(iter(entries)))
+    _save_identity_cache(path, entries)
+    return info
+
+
+def _path_hash(cwd: str) -> str:
+    return hashlib.sha256(os.path.abspath(cwd).encode()).hexdigest()[:12]
+
+
 @functools.lru_cache(maxsize=1)
 def detect_project_id(working_dir: str | None = None) -> str:
     """Detect a 12-char hex project identifier.
@@ -101,7 +279,8 @@ def detect_project_id(working_dir: str | None = None) -> str:
     3. HEAD SHA truncated to 12 chars
     4. SHA-256 of absolute path truncated to 12 chars
 
-    Cached per-process via ``lru_cache(maxsize=1)``.
+    Cached per-process via ``lru_cache(maxsize=1)`` and across processes
+    via the on-disk identity cache.
     """
     # Env var override
     env_id = os.environ.get("ENTITY_PROJECT_ID")
@@ -109,7 +288,14 @@ def detect_project_id(working_dir: str | None = None) -> str:
         return env_id
 
     cwd = working_dir or os.getcwd()
+    cached = _cached_identity(cwd)
+    if cached is not None:
+        return cached.project_id
+    return _detect_project_id_uncached(cwd)
 
+
+def _detect_project_id_uncached(cwd: str) -> str:
+    """Run the git fallback chain of ``detect_project_id`` (no env, no cache)."""
     try:
         # Check for shallow clone
         shallow_result = _run_git(
@@ -141,7 +327,7 @@ def detect_project_id(working_dir: str | None = None) -> str:
         pass
 
     # Final fallback: path hash
-    return hashlib.sha256(os.path.abspath(cwd).encode()).hexdigest()[:12]
+    return _path_hash(cwd)
 
 
 def collect_git_info(working_dir: str | None = None) -> GitProjectInfo:
@@ -152,10 +338,23 @@ def collect_git_info(working_dir: str | None = None) -> GitProjectInfo:
     git fields.
     """
     cwd = working_dir or os.getcwd()
-    abs_cwd = os.path.abspath(cwd)
+
+    # ENTITY_PROJECT_ID overrides the cached id just as it does for
+    # detect_project_id.
+    cached = _cached_identity(cwd)
+    if cached is not None:
+        project_id = detect_project_id(cwd)
+        if project_id != cached.project_id:
+            cached = dataclasses.replace(cached, project_id=project_id)
+        return cached
 
     # Detect project_id (uses its own fallback chain)
-    project_id = detect_project_id(cwd)
+    return _collect_git_info_uncached(cwd, detect_project_id(cwd))
+
+
+def _collect_git_info_uncached(cwd: str, project_id: str) -> GitProjectInfo:
+    """Query git for every GitProjectInfo field except ``project_id``."""
+    abs_cwd = os.path.abspath(cwd)
 
     # Check if git repo and get project root
     is_git_repo = False
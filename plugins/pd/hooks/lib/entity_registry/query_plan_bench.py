@@ -0,0 +1,154 @@
+"""Before/after benchmark for the migration 12 lookup indexes.
+
+Builds one database with ``--entities`` features (each with a workflow
+phase row and ``--events`` phase events), copies it, drops the migration
+12 indexes from the copy, and times the hot lookups against both: exact
+type_id reads (``get_entity`` / ``resolve_ref``), the per-entity and
+per-project event feeds, and the ``list_workflow_phases`` join.
+
+Usage (from plugins/pd, with hooks/lib on PYTHONPATH):
+    python -m entity_registry.query_plan_bench --entities 100000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from entity_registry.database import EntityDatabase
+
+_MIGRATION_12_INDEXES = ("idx_entities_type_id", "idx_pe_type_time", "idx_pe_project_time")
+_PROJECTS = 8
+
+
+def _tid(i: int) -> str:
+    return f"feature:{i:06d}-f{i}"
+
+
+def build_db(db_path: str, entities: int, events: int) -> None:
+    """Fill ``db_path`` with synthetic features, phases and events."""
+    db = EntityDatabase(db_path)
+    try:
+        for p in range(_PROJECTS):
+            batch = [
+                {"entity_type": "feature", "entity_id": f"{i:06d}-f{i}",
+                 "name": f"Feature {i}", "status": "active",
+                 "workflow_phase": {"workflow_phase": "design"}}
+                for i in range(p, entities, _PROJECTS)
+            ]
+            db.register_entities_batch(batch, f"proj-{p}")
+        rows = [
+            (_tid(i), f"proj-{i % _PROJECTS}", "design", "started",
+             f"2026-{n % 12 + 1:02d}-{i % 28 + 1:02d}T00:00:00Z", "backfill",
+             "2026-01-01T00:00:00Z")
+            for i in range(entities) for n in range(events)
+        ]
+        with db.transaction():
+            db._conn.executemany(
+                "INSERT INTO phase_events (type_id, project_id, phase, "
+                "event_type, timestamp, source, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+    finally:
+        db.close()
+
+
+def _time(call, repeat: int) -> float:
+    """Median milliseconds per call over ``repeat`` runs."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def time_lookups(db_path: str, entities: int, *, lookups: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    picks = [_tid(rng.randrange(entities)) for _ in range(lookups)]
+    db = EntityDatabase(db_path)
+    try:
+        def get_entities():
+            for type_id in picks:
+                db.get_entity(type_id)
+
+        def resolve_refs():
+            for type_id in picks:
+                db.resolve_ref(type_id)
+
+        def entity_feeds():
+            for type_id in picks:
+                db.query_phase_events(type_id=type_id)
+
+        return {
+            f"get_entity_x{lookups}_ms": _time(get_entities, 3),
+            f"resolve_ref_x{lookups}_ms": _time(resolve_refs, 3),
+            f"query_phase_events_type_id_x{lookups}_ms": _time(entity_feeds, 3),
+            "query_phase_events_project_id_ms": _time(
+                lambda: db.query_phase_events(project_id="proj-3", limit=50), 5,
+            ),
+            "list_workflow_phases_ms": _time(db.list_workflow_phases, 3),
+        }
+    finally:
+        db.close()
+
+
+def run_bench(workdir: str, *, entities: int, events: int, lookups: int,
+              seed: int = 0) -> dict:
+    """Time the hot lookups with and without the migration 12 indexes."""
+    after_path = os.path.join(workdir, "after.db")
+    before_path = os.path.join(workdir, "before.db")
+    build_db(after_path, entities, events)
+    shutil.copyfile(after_path, before_path)
+    db = EntityDatabase(before_path)
+    try:
+        for name in _MIGRATION_12_INDEXES:
+            db._conn.execute(f"DROP INDEX {name}")
+        db._conn.commit()
+    finally:
+        db.close()
+
+    before = time_lookups(before_path, entities, lookups=lookups, seed=seed)
+    after = time_lookups(after_path, entities, lookups=lookups, seed=seed)
+    return {
+        "entities": entities,
+        "phase_events": entities * events,
+        "before": before,
+        "after": after,
+        "speedup": {
+            key: round(before[key] / after[key], 1) if after[key] else None
+            for key in before
+        },
+    }
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(description="Lookup index benchmark")
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--events", type=int, default=2,
+                        help="phase_events rows per entity")
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parsed = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory(prefix="pd-query-plan-bench-") as tmp:
+        start = time.perf_counter()
+        report = run_bench(
+            tmp, entities=parsed.entities, events=parsed.events,
+            lookups=parsed.lookups, seed=parsed.seed,
+        )
+        print(f"bench ran in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2131,3 +2131,97 @@ class TestWorkflowPhaseBackfill:
             f"Expected 2 top-level batched transactions for 25 entities, "
             f"got {top_level_count}"
         )
+
+
+# ---------------------------------------------------------------------------
+# Bulk ingestion path
+# ---------------------------------------------------------------------------
+
+
+class TestBulkBackfill:
+    """run_backfill's bulk path must register exactly what the scanners do."""
+
+    def _backfill(self, root, db_path, *, bulk):
+        from entity_registry.backfill import backfill_workflow_phases, run_backfill
+        from entity_registry.backfill_bench import snapshot
+
+        db = EntityDatabase(str(db_path))
+        try:
+            run_backfill(db, str(root), bulk=bulk)
+            backfill_workflow_phases(db, str(root))
+            return snapshot(db)
+        finally:
+            db.close()
+
+    def test_matches_per_entity_scanners(self, tmp_path):
+        from entity_registry.backfill_bench import build_synthetic_tree
+
+        root = tmp_path / "docs"
+        build_synthetic_tree(str(root), 240, seed=3)
+        bulk = self._backfill(root, tmp_path / "bulk.db", bulk=True)
+        legacy = self._backfill(root, tmp_path / "legacy.db", bulk=False)
+        assert bulk == legacy
+        statuses = {row[4] for row in bulk[0]}
+        assert {"promoted", "dropped", "external", "orphaned"} <= statuses
+
+    def test_fixture_tree_matches(self, artifacts, tmp_path):
+        root, _ = artifacts
+        assert (
+            self._backfill(root, tmp_path / "a.db", bulk=True)
+            == self._backfill(root, tmp_path / "b.db", bulk=False)
+        )
+
+    def test_single_batch_registers_entities_and_phases(self, artifacts):
+        from unittest.mock import patch
+
+        from entity_registry.backfill import backfill_workflow_phases, run_backfill
+
+        root, db = artifacts
+        with patch.object(
+            db, "register_entity", side_effect=AssertionError("per-entity call"),
+        ):
+            run_backfill(db, str(root))
+        feature = db.get_entity("feature:029-entity-lineage-tracking")
+        assert feature["parent_type_id"] == "brainstorm:20260227-lineage"
+        assert db.get_workflow_phase("backlog:00019")["workflow_phase"] == "open"
+        # Nothing left for the follow-up phase backfill to create
+        result = backfill_workflow_phases(db, str(root))
+        assert result["created"] == 0 and result["errors"] == []
+
+    def test_existing_project_uses_scanners(self, artifacts):
+        from unittest.mock import patch
+
+        from entity_registry.backfill import run_backfill
+
+        root, db = artifacts
+        db.register_entity("backlog", "00019", "Old title", project_id="__unknown__")
+        with patch.object(
+            db, "register_entities_batch",
+            side_effect=AssertionError("bulk path on a populated project"),
+        ):
+            run_backfill(db, str(root))
+        # Scanner semantics: the existing row is refreshed in place
+        assert db.get_entity("backlog:00019")["name"] == "Entity lineage tracking"
+
+    def test_duplicate_ids_fall_back_to_scanners(self, tmp_path):
+        from entity_registry.backfill import plan_bulk_backfill
+
+        for dirname, name in (("a", "First"), ("b", "Second")):
+            feat_dir = tmp_path / "features" / dirname
+            feat_dir.mkdir(parents=True)
+            (feat_dir / ".meta.json").write_text(
+                json.dumps({"id": "001", "slug": "dup", "name": name})
+            )
+        assert plan_bulk_backfill(str(tmp_path)) is None
+        assert (
+            self._backfill(tmp_path, tmp_path / "a.db", bulk=True)
+            == self._backfill(tmp_path, tmp_path / "b.db", bulk=False)
+        )
+
+    def test_bench_smoke(self, capsys):
+        from entity_registry import backfill_bench
+
+        assert backfill_bench.main(["--features", "60"]) == 0
+        report = json.loads(capsys.readouterr().out)
+        assert report["identical"] is True
+        assert report["entities"] > 60
@@ -327,7 +327,7 @@ class TestMigration2:
 
         # Now open it with EntityDatabase — runs pending migrations (3+)
         db = EntityDatabase(db_path)
-        assert db.get_metadata("schema_version") == "10"
+        assert db.get_metadata("schema_version") == "17"
 
         # Schema should be intact
         cur = db._conn.execute("PRAGMA table_info(entities)")
@@ -497,6 +497,20 @@ class TestTriggers:
             "enforce_no_self_parent_update",
             "enforce_no_self_parent_uuid_insert",
             "enforce_no_self_parent_uuid_update",
+            "entities_generation_ad",
+            "entities_generation_ai",
+            "entities_generation_au",
+            "entity_dependencies_generation_ad",
+            "entity_dependencies_generation_ai",
+            "entity_dependencies_generation_au",
+            "entity_tags_generation_ad",
+            "entity_tags_generation_ai",
+            "entity_tags_generation_au",
+            "phase_events_duration_ai",
+            "phase_events_rollup_ai",
+            "workflow_phases_generation_ad",
+            "workflow_phases_generation_ai",
+            "workflow_phases_generation_au",
         ]
         assert trigger_names == expected
 
@@ -512,16 +526,29 @@ class TestIndexes:
         expected = [
             "idx_ed_blocked_by_uuid",
             "idx_ed_entity_uuid",
+            "idx_entities_meta_branch",
+            "idx_entities_meta_progress",
+            "idx_entities_meta_slug",
+            "idx_entities_meta_traffic_light",
+            "idx_entities_recency",
+            "idx_entities_type_id",
+            "idx_entities_type_recency",
             "idx_entity_type",
             "idx_eoa_entity_uuid",
             "idx_eoa_key_result_uuid",
             "idx_et_entity_uuid",
             "idx_et_tag",
+            "idx_outbox_due",
+            "idx_outbox_pending_key",
             "idx_parent_type_id",
             "idx_parent_uuid",
+            "idx_pdr_project_day",
             "idx_pe_lookup",
             "idx_pe_project",
+            "idx_pe_project_time",
             "idx_pe_timestamp",
+            "idx_pe_type_time",
+            "idx_per_project_day",
             "idx_project_entity_type",
             "idx_project_id",
             "idx_status",
@@ -566,8 +593,60 @@ class TestMetadata:
         db.set_metadata("foo", "baz")
         assert db.get_metadata("foo") == "baz"
 
-    def test_schema_version_is_10(self, db: EntityDatabase):
-        assert db.get_metadata("schema_version") == "10"
+    def test_schema_version_is_11(self, db: EntityDatabase):
+        assert db.get_metadata("schema_version") == "17"
+
+
+class TestChangeToken:
+    def test_stable_while_idle(self, db: EntityDatabase):
+        assert db.change_token() == db.change_token()
+
+    def test_changes_on_own_write(self, db: EntityDatabase):
+        before = db.change_token()
+        db.register_entity("feature", "tok-own", "Token Own", project_id="__unknown__")
+        assert db.change_token() != before
+
+    def test_changes_on_other_connection_write(self, tmp_path):
+        db_path = str(tmp_path / "entities.db")
+        reader = EntityDatabase(db_path)
+        writer = EntityDatabase(db_path)
+        try:
+            before = reader.change_token()
+            writer.register_entity("feature", "tok-other", "Token Other", project_id="__unknown__")
+            assert reader.change_token() != before
+        finally:
+            writer.close()
+            reader.close()
+
+    def test_survives_reopen(self, tmp_path):
+        """A reopened, written-to DB never reuses a fresh DB's token."""
+        fresh = EntityDatabase(str(tmp_path / "fresh.db"))
+        fresh_token = fresh.change_token()
+        fresh.close()
+
+        db_path = str(tmp_path / "entities.db")
+        writer = EntityDatabase(db_path)
+        writer.register_entity("feature", "tok-a", "A", project_id="__unknown__")
+        writer.update_entity("feature:tok-a", status="active")
+        written_token = writer.change_token()
+        writer.close()
+
+        reopened = EntityDatabase(db_path)
+        try:
+            assert reopened.change_token() == written_token
+            assert reopened.change_token() != fresh_token
+        finally:
+            reopened.close()
+
+    def test_changes_on_workflow_phase_writes(self, db: EntityDatabase):
+        db.register_entity("feature", "tok-b", "B", project_id="__unknown__")
+        db.register_entity("feature", "tok-c", "C", project_id="__unknown__")
+        before = db.change_token()
+        db.create_workflow_phase("feature:tok-b", workflow_phase="design")
+        after_phase = db.change_token()
+        assert after_phase != before
+        db.update_workflow_phase("feature:tok-b", workflow_phase="create-plan")
+        assert db.change_token() != after_phase
 
 
 # ---------------------------------------------------------------------------
@@ -1016,6 +1095,25 @@ class TestGetEntity:
         result = db.get_entity("feature:f1")
         assert result["parent_type_id"] == "project:p1"
 
+    def test_bulk_lookup_matches_get_entity(self, db: EntityDatabase):
+        """get_entities_by_type_ids returns get_entity's dicts, skipping misses."""
+        for i in range(3):
+            db.register_entity("feature", f"f{i}", f"F{i}", project_id="__unknown__")
+        result = db.get_entities_by_type_ids(
+            ["feature:f0", "feature:f2", "feature:nope", "feature:f0"],
+        )
+        assert result == {
+            "feature:f0": db.get_entity("feature:f0"),
+            "feature:f2": db.get_entity("feature:f2"),
+        }
+
+    def test_bulk_lookup_omits_ambiguous_type_id(self, db: EntityDatabase):
+        """A type_id registered in two projects is not found, as in get_entity."""
+        db.register_entity("feature", "dup", "A", project_id="proj-a")
+        db.register_entity("feature", "dup", "B", project_id="proj-b")
+        assert db.get_entity("feature:dup") is None
+        assert db.get_entities_by_type_ids(["feature:dup"]) == {}
+
     def test_null_optional_fields(self, db: EntityDatabase):
         """Optional fields should be None when not set."""
         db.register_entity("feature", "f1", "Feature", project_id="__unknown__")
@@ -1209,6 +1307,134 @@ class TestUpdateEntity:
         result = db.get_entity("feature:f1")
         assert json.loads(result["metadata"]) == {"key": "value"}
 
+    def test_metadata_merge_replaces_nested_objects(self, db: EntityDatabase):
+        """Top-level keys are replaced wholesale; nested dicts do not merge."""
+        db.register_entity(
+            "feature", "f1", "Feature",
+            metadata={"phase_timing": {"design": {"started": "t0"}}, "keep": 1},
+            project_id="__unknown__",
+        )
+        db.update_entity(
+            "feature:f1",
+            metadata={"phase_timing": {"specify": {"started": "t1"}}, "gone": None},
+        )
+        merged = json.loads(db.get_entity("feature:f1")["metadata"])
+        assert merged == {
+            "phase_timing": {"specify": {"started": "t1"}},
+            "keep": 1,
+            "gone": None,
+        }
+
+    def test_metadata_merge_over_corrupted_json(self, db: EntityDatabase):
+        """Corrupted stored metadata is treated as empty, as before."""
+        db.register_entity("feature", "f1", "Feature", project_id="__unknown__")
+        db._conn.execute(
+            "UPDATE entities SET metadata = '{not json' WHERE type_id = 'feature:f1'"
+        )
+        db._conn.commit()
+        db.update_entity("feature:f1", metadata={"key": "value", "n": 2.5})
+        merged = json.loads(db.get_entity("feature:f1")["metadata"])
+        assert merged == {"key": "value", "n": 2.5}
+
+    def test_metadata_merge_python_fallback(self, db: EntityDatabase):
+        """Keys a JSON path cannot quote still merge (in Python)."""
+        db.register_entity(
+            "feature", "f1", "Feature", metadata={"a": 1}, project_id="__unknown__",
+        )
+        db.update_entity("feature:f1", metadata={'odd"key': True})
+        merged = json.loads(db.get_entity("feature:f1")["metadata"])
+        assert merged == {"a": 1, 'odd"key': True}
+
+    def test_metadata_merge_keeps_fts_in_sync(self, db: EntityDatabase):
+        db.register_entity("feature", "f1", "Feature", project_id="__unknown__")
+        db.update_entity("feature:f1", metadata={"branch": "feature/zebra-stripes"})
+        assert [r["type_id"] for r in db.search_entities("zebra")] == ["feature:f1"]
+
+
+class TestMetadataQueries:
+    @pytest.fixture
+    def populated(self, db: EntityDatabase):
+        for i, (progress, light) in enumerate(
+            [(10, "RED"), (55, "YELLOW"), (90, "GREEN"), (None, None)]
+        ):
+            meta = {"slug": f"f{i}", "branch": f"feature/00{i}-f{i}"}
+            if progress is not None:
+                meta.update(progress=progress, traffic_light=light)
+            db.register_entity(
+                "feature", f"00{i}-f{i}", f"Feature {i}",
+                metadata=meta, project_id="__unknown__",
+            )
+        db.register_entity(
+            "project", "p1", "Project", metadata={"progress": 55},
+            project_id="__unknown__",
+        )
+        return db
+
+    def test_equality_filter(self, populated):
+        rows = populated.query_by_metadata({"traffic_light": "GREEN"})
+        assert [r["type_id"] for r in rows] == ["feature:002-f2"]
+
+    def test_range_filter_with_type_and_sort(self, populated):
+        rows = populated.query_by_metadata(
+            {"progress": (">=", 50)}, entity_type="feature",
+            order_by="progress", descending=True,
+        )
+        assert [r["type_id"] for r in rows] == ["feature:002-f2", "feature:001-f1"]
+
+    def test_none_matches_absent_key(self, populated):
+        rows = populated.query_by_metadata({"progress": None}, entity_type="feature")
+        assert [r["type_id"] for r in rows] == ["feature:003-f3"]
+
+    def test_sort_and_limit_without_filters(self, populated):
+        rows = populated.query_by_metadata(
+            entity_type="feature", order_by="slug", limit=2,
+        )
+        assert [r["type_id"] for r in rows] == ["feature:000-f0", "feature:001-f1"]
+
+    def test_unindexed_key_rejected(self, populated):
+        with pytest.raises(ValueError, match="not indexed"):
+            populated.query_by_metadata({"phase_timing": {}})
+        with pytest.raises(ValueError, match="not indexed"):
+            populated.query_by_metadata(order_by="mode")
+
+    def test_bad_operator_rejected(self, populated):
+        with pytest.raises(ValueError, match="operator"):
+            populated.query_by_metadata({"progress": ("LIKE", 5)})
+
+    def test_filter_tracks_metadata_updates(self, populated):
+        populated.update_entity("feature:000-f0", metadata={"traffic_light": "GREEN"})
+        rows = populated.query_by_metadata(
+            {"traffic_light": "GREEN"}, order_by="slug",
+        )
+        assert [r["type_id"] for r in rows] == ["feature:000-f0", "feature:002-f2"]
+
+    def test_corrupted_metadata_reads_null(self, populated):
+        populated._conn.execute(
+            "UPDATE entities SET metadata = 'oops' WHERE type_id = 'feature:000-f0'"
+        )
+        populated._conn.commit()
+        rows = populated.query_by_metadata({"slug": None}, entity_type="feature")
+        assert [r["type_id"] for r in rows] == ["feature:000-f0"]
+
+    def test_get_metadata_fields(self, populated):
+        populated.update_entity(
+            "feature:001-f1",
+            metadata={"phase_timing": {"design": {"started": "t"}}, "done": True},
+        )
+        uuid0 = populated.get_entity("feature:000-f0")["uuid"]
+        uuid1 = populated.get_entity("feature:001-f1")["uuid"]
+        fields = populated.get_metadata_fields(
+            [uuid0, uuid1, "missing"], ["progress", "phase_timing", "done"],
+        )
+        assert fields == {
+            uuid0: {"progress": 10, "phase_timing": None, "done": None},
+            uuid1: {
+                "progress": 55,
+                "phase_timing": {"design": {"started": "t"}},
+                "done": True,
+            },
+        }
+
 
 # ---------------------------------------------------------------------------
 # Task 1.16: export_lineage_markdown tests
@@ -2496,7 +2722,7 @@ class TestMigrationIdempotency:
         entity = db2.get_entity("project:p1")
         assert entity is not None
         assert entity["uuid"] == p1_uuid
-        assert db2.get_metadata("schema_version") == "10"
+        assert db2.get_metadata("schema_version") == "17"
         db2.close()
 
 
@@ -2596,6 +2822,67 @@ class TestListEntities:
         assert result == []
 
 
+class TestListEntitiesKeyset:
+    """Keyset pagination via list_entities(limit=..., after=...)."""
+
+    def _seed(self, db: EntityDatabase, count: int) -> None:
+        for i in range(count):
+            db.register_entity(
+                "feature", f"k{i}", f"Keyset {i}", status="active",
+                project_id="__unknown__",
+            )
+        # Distinct, known recency order: k{count-1} is newest
+        for i in range(count):
+            db._conn.execute(
+                "UPDATE entities SET updated_at = ? WHERE type_id = ?",
+                (f"2026-01-01T00:00:{i:02d}+00:00", f"feature:k{i}"),
+            )
+        db._conn.commit()
+
+    def test_pages_cover_all_rows_newest_first(self, db: EntityDatabase):
+        self._seed(db, 7)
+        seen: list[str] = []
+        after = None
+        while True:
+            page = db.list_entities(limit=3, after=after)
+            seen.extend(e["entity_id"] for e in page)
+            if len(page) < 3:
+                break
+            after = (page[-1]["updated_at"], page[-1]["uuid"])
+        assert seen == [f"k{i}" for i in range(6, -1, -1)]
+
+    def test_ties_on_updated_at_break_by_uuid(self, db: EntityDatabase):
+        for i in range(4):
+            db.register_entity("feature", f"t{i}", f"Tie {i}", project_id="__unknown__")
+        db._conn.execute("UPDATE entities SET updated_at = '2026-01-01T00:00:00+00:00'")
+        db._conn.commit()
+
+        first = db.list_entities(limit=2)
+        second = db.list_entities(
+            limit=2, after=(first[-1]["updated_at"], first[-1]["uuid"]),
+        )
+        ids = [e["uuid"] for e in first + second]
+        assert len(set(ids)) == 4
+        assert ids == sorted(ids, reverse=True)
+
+    def test_status_filter_in_sql(self, db: EntityDatabase):
+        self._seed(db, 3)
+        db.update_entity("feature:k1", status="completed")
+        result = db.list_entities(status="completed", limit=10)
+        assert [e["entity_id"] for e in result] == ["k1"]
+
+    def test_keyset_query_uses_recency_index(self, db: EntityDatabase):
+        plan = db._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM entities "
+            "WHERE entity_type = ? AND (updated_at, uuid) < (?, ?) "
+            "ORDER BY updated_at DESC, uuid DESC LIMIT 50",
+            ("feature", "2026", "x"),
+        ).fetchall()
+        detail = " ".join(row[-1] for row in plan)
+        assert "idx_entities_type_recency" in detail
+        assert "TEMP B-TREE" not in detail
+
+
 # ---------------------------------------------------------------------------
 # Migration 3: workflow_phases table tests (Tasks 1.1 - 1.5)
 # ---------------------------------------------------------------------------
@@ -2690,9 +2977,9 @@ class TestMigration3:
         fk_columns = [fk[3] for fk in fk_rows]
         assert "type_id" not in fk_columns
 
-    def test_schema_version_is_10(self, db: EntityDatabase):
+    def test_schema_version_is_11(self, db: EntityDatabase):
         """After all migrations, schema_version should be 10."""
-        assert db.get_metadata("schema_version") == "10"
+        assert db.get_metadata("schema_version") == "17"
 
     # -- Task 1.2: Migration creates indexes and trigger (AC-2) ------------
 
@@ -2877,10 +3164,10 @@ class TestMigration3:
     # -- Task 1.4: Fresh DB migration safety (AC-3) ------------------------
 
     def test_fresh_db_has_all_migrations(self, tmp_path):
-        """A brand-new EntityDatabase should run all 10 migrations."""
+        """A brand-new EntityDatabase should run all 11 migrations."""
         fresh_db = EntityDatabase(str(tmp_path / "fresh.db"))
         try:
-            assert fresh_db.get_metadata("schema_version") == "10"
+            assert fresh_db.get_metadata("schema_version") == "17"
         finally:
             fresh_db.close()
 
@@ -3254,6 +3541,35 @@ class TestWorkflowPhaseCRUD:
         assert len(result) == 3
         assert all(isinstance(r, dict) for r in result)
 
+    def test_list_workflow_phases_filter_by_type_ids(self, db: EntityDatabase):
+        """list_workflow_phases(type_ids=...) returns only those rows."""
+        for slug in ("f1", "f2", "f3"):
+            db.register_entity("feature", slug, slug, project_id="__unknown__")
+            db.create_workflow_phase(f"feature:{slug}", kanban_column="wip")
+
+        result = db.list_workflow_phases(
+            type_ids=["feature:f1", "feature:f3", "feature:missing"],
+        )
+        assert {r["type_id"] for r in result} == {"feature:f1", "feature:f3"}
+        assert db.list_workflow_phases(type_ids=[]) == []
+
+    def test_list_workflow_phases_type_ids_chunked(
+        self, db: EntityDatabase, monkeypatch
+    ):
+        """type_ids lookups beyond one IN-clause chunk return every row."""
+        import entity_registry.database as database_mod
+
+        monkeypatch.setattr(database_mod, "_IN_CLAUSE_CHUNK", 2)
+        for slug in ("f1", "f2", "f3", "f4", "f5"):
+            db.register_entity("feature", slug, slug, project_id="__unknown__")
+            db.create_workflow_phase(f"feature:{slug}", kanban_column="wip")
+
+        result = db.list_workflow_phases(
+            kanban_column="wip",
+            type_ids=[f"feature:f{i}" for i in range(1, 6)],
+        )
+        assert len(result) == 5
+
     def test_list_workflow_phases_filter_by_kanban_column(
         self, db: EntityDatabase
     ):
@@ -4307,7 +4623,7 @@ class TestMigration5:
         new phase values are accepted."""
         db = EntityDatabase(str(tmp_path / "m5-idem.db"))
         try:
-            assert db.get_schema_version() == 10
+            assert db.get_schema_version() == 17
 
             # Verify all new phase values are accepted
             new_phases = [
@@ -5065,6 +5381,81 @@ class TestBatchRegistration:
         results = db.search_entities("UniqueSearchTerm")
         assert len(results) >= 1
 
+    def test_batch_parents_any_order_and_depth(self, db):
+        entities = [
+            {"entity_type": "feature", "entity_id": "f1", "name": "Feature",
+             "parent_type_id": "project:p1"},
+            {"entity_type": "project", "entity_id": "p1", "name": "Project",
+             "parent_type_id": "brainstorm:b1"},
+            {"entity_type": "brainstorm", "entity_id": "b1", "name": "Brainstorm"},
+        ]
+        uuids = db.register_entities_batch(entities, project_id="__unknown__")
+        feature = db.get_entity("feature:f1")
+        project = db.get_entity("project:p1")
+        assert feature["parent_uuid"] == uuids[1]
+        assert project["parent_uuid"] == uuids[2]
+
+    def test_batch_returns_uuid_per_input(self, db):
+        existing = db.register_entity("feature", "dup", "Dup", project_id="__unknown__")
+        entities = [
+            {"entity_type": "feature", "entity_id": "dup", "name": "Ignored"},
+            {"entity_type": "feature", "entity_id": "once", "name": "Once"},
+            {"entity_type": "feature", "entity_id": "once", "name": "Twice"},
+        ]
+        uuids = db.register_entities_batch(entities, project_id="__unknown__")
+        assert uuids[0] == existing
+        assert uuids[1] == uuids[2]
+        assert db.get_entity("feature:dup")["name"] == "Dup"
+        assert db.get_entity("feature:once")["name"] == "Once"
+        assert len(db.search_entities("Once")) == 1
+
+    def test_batch_tags_and_workflow_phases(self, db):
+        db.register_entity("feature", "old", "Old", project_id="__unknown__")
+        db.upsert_workflow_phase("feature:old", workflow_phase="design")
+        entities = [
+            {"entity_type": "feature", "entity_id": "new", "name": "New",
+             "tags": ["bulk", "import"],
+             "workflow_phase": {"workflow_phase": "specify", "mode": "standard"}},
+            {"entity_type": "feature", "entity_id": "old", "name": "Old",
+             "tags": ["bulk"],
+             "workflow_phase": {"workflow_phase": "finish"}},
+        ]
+        new_uuid, old_uuid = db.register_entities_batch(
+            entities, project_id="__unknown__",
+        )
+        assert db.get_tags(new_uuid) == ["bulk", "import"]
+        assert db.get_tags(old_uuid) == ["bulk"]
+        row = db.get_workflow_phase("feature:new")
+        assert (row["workflow_phase"], row["kanban_column"], row["mode"]) == (
+            "specify", "backlog", "standard",
+        )
+        assert row["uuid"] == new_uuid
+        # Existing phase rows are kept
+        assert db.get_workflow_phase("feature:old")["workflow_phase"] == "design"
+
+    def test_batch_invalid_tag_or_phase_column_fails_all(self, db):
+        with pytest.raises(ValueError, match="Invalid tag"):
+            db.register_entities_batch(
+                [{"entity_type": "feature", "entity_id": "t", "name": "T",
+                  "tags": ["Not Valid"]}],
+                project_id="__unknown__",
+            )
+        with pytest.raises(ValueError, match="Invalid workflow_phases columns"):
+            db.register_entities_batch(
+                [{"entity_type": "feature", "entity_id": "t", "name": "T",
+                  "workflow_phase": {"type_id": "feature:other"}}],
+                project_id="__unknown__",
+            )
+        assert db.get_entity("feature:t") is None
+
+    def test_batch_advances_existing_sequence(self, db):
+        assert db.next_sequence_value("__unknown__", "feature") == 1
+        db.register_entities_batch(
+            [{"entity_type": "feature", "entity_id": "041-imported", "name": "I"}],
+            project_id="__unknown__",
+        )
+        assert db.next_sequence_value("__unknown__", "feature") == 42
+
 
 # ---------------------------------------------------------------------------
 # _commit() and transaction() tests (Task 1.5)
@@ -5167,6 +5558,217 @@ class TestTransactionContextManager:
         assert row["name"] == "Updated"
 
 
+# ---------------------------------------------------------------------------
+# Row cache (identity map for entity / workflow_phases rows)
+# ---------------------------------------------------------------------------
+
+
+class TestRowCache:
+    """Tests for the EntityDatabase row cache and its invalidation."""
+
+    @pytest.fixture
+    def feature(self, db):
+        uid = db.register_entity(
+            "feature", "rc-1", "Cached", project_id="__unknown__",
+        )
+        db.create_workflow_phase("feature:rc-1", workflow_phase="design")
+        return uid
+
+    def _selects(self, db, call):
+        statements = []
+        db.set_trace_callback(statements.append)
+        try:
+            call()
+        finally:
+            db.set_trace_callback(None)
+        return [s for s in statements if s.startswith("SELECT")]
+
+    def test_repeat_reads_hit_without_sql(self, db, feature):
+        db.get_entity_by_uuid(feature)
+        db.get_workflow_phase("feature:rc-1")
+        selects = self._selects(db, lambda: (
+            db.get_entity_by_uuid(feature),
+            db.get_entity(feature.upper()),
+            db.get_workflow_phase("feature:rc-1"),
+        ))
+        assert selects == []
+        assert db.row_cache_stats()["hits"] == 3
+
+    def test_type_id_and_missing_rows_are_cached(self, db, feature):
+        assert db.get_entity("feature:rc-1")["uuid"] == feature
+        assert db.get_entity("feature:nope") is None
+        assert self._selects(db, lambda: (
+            db.get_entity("feature:rc-1"), db.get_entity("feature:nope"),
+        )) == []
+
+    def test_returned_dicts_are_copies(self, db, feature):
+        db.get_entity_by_uuid(feature)["name"] = "mutated"
+        assert db.get_entity_by_uuid(feature)["name"] == "Cached"
+
+    def test_own_update_is_visible(self, db, feature):
+        db.get_entity("feature:rc-1")
+        db.get_workflow_phase("feature:rc-1")
+        db.update_entity("feature:rc-1", status="active", metadata={"slug": "x"})
+        db.update_workflow_phase("feature:rc-1", workflow_phase="implement")
+        assert db.get_entity_by_uuid(feature)["status"] == "active"
+        assert json.loads(db.get_entity("feature:rc-1")["metadata"]) == {"slug": "x"}
+        assert db.get_workflow_phase("feature:rc-1")["workflow_phase"] == "implement"
+
+    def test_own_update_keeps_unrelated_rows(self, db, feature):
+        other = db.register_entity("feature", "rc-2", "Other", project_id="__unknown__")
+        db.get_entity_by_uuid(other)
+        db.update_entity("feature:rc-1", name="Renamed")
+        assert self._selects(db, lambda: db.get_entity_by_uuid(other)) == []
+        assert db.get_entity_by_uuid(feature)["name"] == "Renamed"
+
+    def test_update_inside_transaction_evicted_on_commit(self, db, feature):
+        other = db.register_entity("feature", "rc-2", "Other", project_id="__unknown__")
+        db.get_entity_by_uuid(other)
+        with db.transaction():
+            db.get_entity_by_uuid(feature)
+            db.update_entity("feature:rc-1", name="InTxn")
+            assert db.get_entity_by_uuid(feature)["name"] == "InTxn"
+        assert db.get_entity_by_uuid(feature)["name"] == "InTxn"
+        assert db.row_cache_stats()["invalidations"] == 0
+
+    def test_raw_sql_write_invalidates(self, db, feature):
+        db.get_entity_by_uuid(feature)
+        db._conn.execute(
+            "UPDATE entities SET name = 'raw' WHERE uuid = ?", (feature,),
+        )
+        db._conn.commit()
+        assert db.get_entity_by_uuid(feature)["name"] == "raw"
+        assert db.row_cache_stats()["invalidations"] == 1
+
+    def test_rollback_discards_uncommitted_rows(self, db, feature):
+        db.get_entity_by_uuid(feature)
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.update_entity("feature:rc-1", name="Doomed")
+                assert db.get_entity_by_uuid(feature)["name"] == "Doomed"
+                raise RuntimeError("rollback")
+        assert db.get_entity_by_uuid(feature)["name"] == "Cached"
+
+    def test_commit_from_other_connection_invalidates(self, db, feature):
+        db.get_entity_by_uuid(feature)
+        db_path = db._conn.execute("PRAGMA database_list").fetchone()[2]
+        other = EntityDatabase(db_path)
+        try:
+            other.update_entity("feature:rc-1", name="Elsewhere")
+            other.update_workflow_phase("feature:rc-1", workflow_phase="finish")
+        finally:
+            other.close()
+        assert db.get_entity_by_uuid(feature)["name"] == "Elsewhere"
+        assert db.get_workflow_phase("feature:rc-1")["workflow_phase"] == "finish"
+
+    def test_disabled_cache_always_reads(self, tmp_path):
+        database = EntityDatabase(str(tmp_path / "nocache.db"), row_cache=False)
+        try:
+            uid = database.register_entity(
+                "feature", "rc-1", "Cached", project_id="__unknown__",
+            )
+            database.get_entity_by_uuid(uid)
+            assert len(self._selects(
+                database, lambda: database.get_entity_by_uuid(uid),
+            )) == 1
+            assert database.row_cache_stats() == {
+                "hits": 0, "misses": 0, "invalidations": 0, "size": 0,
+            }
+        finally:
+            database.close()
+
+
+# ---------------------------------------------------------------------------
+# Outbox (deferred post-commit work)
+# ---------------------------------------------------------------------------
+
+
+class TestOutbox:
+    """Tests for the outbox table and its EntityDatabase methods."""
+
+    def test_enqueue_and_claim_oldest_first(self, db):
+        assert db.enqueue_outbox("cascade", {"n": 1}) is True
+        db.enqueue_outbox("cascade", {"n": 2})
+        jobs = db.claim_outbox(limit=1)
+        assert [j["payload"] for j in jobs] == [{"n": 1}]
+        assert jobs[0]["attempts"] == 1 and jobs[0]["status"] == "running"
+        assert db.outbox_counts() == {"pending": 1, "running": 1, "failed": 0}
+
+    def test_pending_jobs_coalesce_on_dedupe_key(self, db):
+        assert db.enqueue_outbox("meta", {"n": 1}, dedupe_key="meta:f1") is True
+        assert db.enqueue_outbox("meta", {"n": 2}, dedupe_key="meta:f1") is False
+        # Once claimed, a new job with the key queues behind it.
+        db.claim_outbox()
+        assert db.enqueue_outbox("meta", {"n": 3}, dedupe_key="meta:f1") is True
+        assert db.outbox_counts() == {"pending": 1, "running": 1, "failed": 0}
+
+    def test_delayed_job_is_not_claimed_early(self, db):
+        db.enqueue_outbox("cascade", {}, delay_seconds=60)
+        assert db.claim_outbox() == []
+
+    def test_finish_deletes_job(self, db):
+        db.enqueue_outbox("cascade", {})
+        job = db.claim_outbox()[0]
+        db.finish_outbox(job["id"])
+        assert db.list_outbox() == []
+
+    def test_retry_requeues_with_error(self, db):
+        db.enqueue_outbox("cascade", {})
+        job = db.claim_outbox()[0]
+        db.retry_outbox(job["id"], "boom", delay_seconds=0)
+        (row,) = db.list_outbox()
+        assert row["status"] == "pending" and row["last_error"] == "boom"
+        assert db.claim_outbox()[0]["attempts"] == 2
+
+    def test_retry_superseded_by_newer_pending_job(self, db):
+        db.enqueue_outbox("meta", {"n": 1}, dedupe_key="k")
+        job = db.claim_outbox()[0]
+        db.enqueue_outbox("meta", {"n": 2}, dedupe_key="k")
+        db.retry_outbox(job["id"], "boom", delay_seconds=0)
+        assert [r["payload"] for r in db.list_outbox()] == [{"n": 2}]
+
+    def test_fail_parks_job_until_recovered(self, db):
+        db.enqueue_outbox("cascade", {})
+        job = db.claim_outbox()[0]
+        db.fail_outbox(job["id"], "gave up")
+        assert db.recover_outbox() == 0
+        assert db.list_outbox("failed")[0]["last_error"] == "gave up"
+        assert db.recover_outbox(include_failed=True) == 1
+        assert db.claim_outbox()[0]["attempts"] == 1
+
+    def test_recover_reclaims_expired_lease_only(self, db):
+        db.enqueue_outbox("cascade", {"n": 1})
+        db.enqueue_outbox("cascade", {"n": 2})
+        db.claim_outbox(limit=1, lease_seconds=-1)  # lease already expired
+        db.claim_outbox(limit=1, lease_seconds=300)
+        assert db.recover_outbox() == 1
+        assert [j["payload"] for j in db.claim_outbox()] == [{"n": 1}]
+
+    def test_enqueue_rolls_back_with_transaction(self, db):
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.enqueue_outbox("cascade", {})
+                raise RuntimeError("abort")
+        assert db.outbox_counts()["pending"] == 0
+
+    def test_next_due_reports_earliest_pending_job(self, db):
+        assert db.next_outbox_due() is None
+        db.enqueue_outbox("meta", {}, delay_seconds=30)
+        assert 0 < db.next_outbox_due() <= 30
+        db.enqueue_outbox("cascade", {})
+        assert db.next_outbox_due() == 0
+        db.claim_outbox()  # running jobs are not due
+        assert 0 < db.next_outbox_due() <= 30
+
+    def test_enqueue_keeps_row_cache(self, db):
+        uid = db.register_entity("feature", "ob-1", "F", project_id="__unknown__")
+        db.get_entity_by_uuid(uid)
+        with db.transaction():
+            db.enqueue_outbox("cascade", {})
+        db.get_entity_by_uuid(uid)
+        assert db.row_cache_stats()["invalidations"] == 0
+
+
 # ---------------------------------------------------------------------------
 # begin_immediate() bug fix tests (058)
 # ---------------------------------------------------------------------------
@@ -5593,7 +6195,7 @@ class TestMigration8Data:
             db2 = EntityDatabase(db_path)
             v2 = db2.get_schema_version()
             db2.close()
-            assert v1 == v2 == 10
+            assert v1 == v2 == 17
 
     def test_migration_8_schema_version_set_to_8(self):
         """Schema version is 8 after migration."""
@@ -1386,6 +1386,74 @@ class TestReadFrontmatterAdversarial:
         assert "extra_key" not in result
 
 
+class TestReadFrontmatterHeaderOnly:
+    """read_frontmatter reads only up to the closing delimiter."""
+
+    def test_body_is_not_decoded(self, tmp_path):
+        """Invalid UTF-8 after the header does not affect the result."""
+        fpath = tmp_path / "spec.md"
+        fpath.write_bytes(
+            f"---\nentity_uuid: {VALID_UUID}\n---\n".encode()
+            + b"\xff\xfe not utf-8" * 1000
+        )
+        assert read_frontmatter(str(fpath)) == {"entity_uuid": VALID_UUID}
+
+    def test_body_is_not_read(self, tmp_path, monkeypatch):
+        """Only the first chunk of a large file is read."""
+        import builtins
+
+        fpath = tmp_path / "spec.md"
+        fpath.write_text(
+            f"---\nentity_uuid: {VALID_UUID}\n---\n" + "body line\n" * 100_000
+        )
+        sizes = []
+        real_open = builtins.open
+
+        class _Counting:
+            def __init__(self, f):
+                self._f = f
+
+            def read(self, n=-1):
+                data = self._f.read(n)
+                sizes.append(len(data))
+                return data
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self._f.close()
+
+        monkeypatch.setattr(
+            builtins, "open", lambda *a, **kw: _Counting(real_open(*a, **kw)),
+        )
+        assert read_frontmatter(str(fpath)) == {"entity_uuid": VALID_UUID}
+        assert sum(sizes) <= 8192
+
+    def test_header_spanning_several_chunks(self, tmp_path):
+        """A header longer than one read, split mid multi-byte character."""
+        fpath = tmp_path / "spec.md"
+        padding = "\u00e9" * 6000  # 2 bytes each: crosses the 8192 boundary
+        fpath.write_text(
+            f"---\nentity_uuid: {VALID_UUID}\nphase: {padding}\n---\n# Body\n",
+            encoding="utf-8",
+        )
+        assert read_frontmatter(str(fpath)) == {
+            "entity_uuid": VALID_UUID, "phase": padding,
+        }
+
+    def test_closing_delimiter_at_eof_without_newline(self, tmp_path):
+        fpath = str(tmp_path / "spec.md")
+        _write_file(fpath, f"---\nentity_uuid: {VALID_UUID}\n---")
+        assert read_frontmatter(fpath) == {"entity_uuid": VALID_UUID}
+
+    def test_crlf_delimiters_are_not_frontmatter(self, tmp_path):
+        """As before the chunked reader: '---\\r' is not a delimiter."""
+        fpath = tmp_path / "spec.md"
+        fpath.write_bytes(b"---\r\nentity_uuid: x\r\n---\r\n")
+        assert read_frontmatter(str(fpath)) is None
+
+
 class TestWriteFrontmatterMutationMindset:
     """Mutation mindset tests for write_frontmatter (dimension: mutation_mindset)."""
 
@@ -0,0 +1,92 @@
+"""Tests for entity_registry.frontmatter_index."""
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+import entity_registry.frontmatter_index as fi
+from entity_registry.database import EntityDatabase
+from entity_registry.frontmatter_index import FrontmatterHeaderIndex
+
+_HEADER = "---\nentity_uuid: abc\nentity_type_id: feature:001-x\n---\n# Body\n"
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = EntityDatabase(str(tmp_path / "entities.db"))
+    yield database
+    database.close()
+
+
+def _write(path, content, *, age_s=60):
+    """Write *content* with an mtime *age_s* seconds in the past."""
+    path.write_text(content)
+    ns = time.time_ns() - age_s * 1_000_000_000
+    os.utime(path, ns=(ns, ns))
+    return str(path)
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    calls = []
+    real = fi.read_frontmatter
+
+    def counting(path):
+        calls.append(path)
+        return real(path)
+
+    monkeypatch.setattr(fi, "read_frontmatter", counting)
+    return calls
+
+
+class TestFrontmatterHeaderIndex:
+    def test_unchanged_files_are_served_from_cache(self, db, tmp_path, reads):
+        spec = _write(tmp_path / "spec.md", _HEADER)
+        plain = _write(tmp_path / "plan.md", "# No frontmatter\n")
+        expected = {
+            spec: {"entity_uuid": "abc", "entity_type_id": "feature:001-x"},
+            plain: None,
+        }
+
+        assert FrontmatterHeaderIndex(db).headers([spec, plain]) == expected
+        assert len(reads) == 2
+
+        index = FrontmatterHeaderIndex(db)
+        assert index.headers([spec, plain]) == expected
+        assert len(reads) == 2
+        assert (index.hits, index.misses) == (2, 0)
+
+    def test_changed_file_is_reread(self, db, tmp_path, reads):
+        spec = _write(tmp_path / "spec.md", _HEADER)
+        FrontmatterHeaderIndex(db).headers([spec])
+        _write(tmp_path / "spec.md", _HEADER.replace("abc", "abd"), age_s=30)
+
+        headers = FrontmatterHeaderIndex(db).headers([spec])
+        assert headers[spec]["entity_uuid"] == "abd"
+        assert len(reads) == 2
+        assert db.get_frontmatter_headers([spec])[spec][2] is not None
+
+    def test_recently_modified_file_is_not_cached(self, db, tmp_path, reads):
+        spec = _write(tmp_path / "spec.md", _HEADER, age_s=0)
+        FrontmatterHeaderIndex(db).headers([spec])
+        FrontmatterHeaderIndex(db).headers([spec])
+        assert len(reads) == 2
+        assert db.get_frontmatter_headers([spec]) == {}
+
+    def test_removed_file_is_dropped(self, db, tmp_path):
+        spec = _write(tmp_path / "spec.md", _HEADER)
+        FrontmatterHeaderIndex(db).headers([spec])
+        os.unlink(spec)
+
+        assert FrontmatterHeaderIndex(db).headers([spec]) == {}
+        assert db.get_frontmatter_headers([spec]) == {}
+
+    def test_unreadable_header_is_omitted_and_not_cached(self, db, tmp_path):
+        path = tmp_path / "spec.md"
+        path.write_bytes(b"---\nentity_uuid: \xff\n---\n")
+        os.utime(path, ns=(0, 0))
+
+        assert FrontmatterHeaderIndex(db).headers([str(path)]) == {}
+        assert db.get_frontmatter_headers([str(path)]) == {}
@@ -819,6 +819,65 @@ class TestScanAll:
         reports = scan_all(db, artifacts_root)
         assert reports == []
 
+    def test_scan_matches_detect_drift_per_file(self, tmp_path):
+        """Bulk scan returns exactly what detect_drift returns per file."""
+        from entity_registry.database import EntityDatabase
+        from entity_registry.frontmatter_sync import (
+            detect_drift, scan_all, stamp_header,
+        )
+
+        db = EntityDatabase(":memory:")
+        for i, body in enumerate(["stamp", "plain", "foreign", "bad"]):
+            slug = f"00{i}-{body}"
+            db.register_entity("feature", slug, slug, project_id="__unknown__")
+            feat_dir = tmp_path / "features" / slug
+            feat_dir.mkdir(parents=True)
+            (feat_dir / "spec.md").write_text("# Spec\n")
+            (feat_dir / "design.md").write_text("# Design\n")
+            if body == "stamp":
+                stamp_header(db, str(feat_dir / "spec.md"), f"feature:{slug}", "spec")
+            elif body == "foreign":
+                (feat_dir / "spec.md").write_text(_make_frontmatter(
+                    "11111111-1111-4111-8111-111111111111", "feature:999-other",
+                ))
+            elif body == "bad":
+                (feat_dir / "spec.md").write_bytes(b"---\nentity_uuid: \xff\n---\n")
+
+        expected = [
+            detect_drift(db, r.filepath, type_id=r.type_id)
+            for r in scan_all(db, str(tmp_path))
+        ]
+        assert scan_all(db, str(tmp_path)) == expected
+        assert [r.status for r in expected].count("db_only") == 5
+        assert {"in_sync", "diverged", "error"} <= {r.status for r in expected}
+
+    def test_scan_reads_entities_in_one_query(self, tmp_path):
+        """Entity rows for all scanned files come from a single SELECT."""
+        from entity_registry.database import EntityDatabase
+        from entity_registry.frontmatter_sync import scan_all
+
+        db = EntityDatabase(":memory:")
+        for i in range(10):
+            slug = f"{i:03d}-bulk"
+            db.register_entity("feature", slug, slug, project_id="__unknown__")
+            feat_dir = tmp_path / "features" / slug
+            feat_dir.mkdir(parents=True)
+            (feat_dir / "spec.md").write_text("# Spec\n")
+
+        statements = []
+        db._conn.set_trace_callback(statements.append)
+        try:
+            reports = scan_all(db, str(tmp_path))
+        finally:
+            db._conn.set_trace_callback(None)
+        assert len(reports) == 10
+        entity_selects = [
+            s for s in statements
+            if s.lstrip().upper().startswith("SELECT") and "FROM entities" in s
+        ]
+        # list_entities plus the bulk lookup.
+        assert len(entity_selects) == 2
+
 
 # ---------------------------------------------------------------------------
 # Phase 5: Integration tests (tasks 5.1a, 5.2a, 5.3)
@@ -0,0 +1,95 @@
+"""Tests for entity_registry.phase_analytics (columnar phase_events export)."""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from entity_registry.database import PHASE_DURATION_BUCKETS, EntityDatabase
+from entity_registry.phase_analytics import (
+    NPZ_FORMAT_VERSION,
+    export_phase_events_npz,
+    load_phase_events_npz,
+)
+
+
+@pytest.fixture
+def db():
+    database = EntityDatabase(":memory:")
+    database.insert_phase_event(
+        type_id="feature:a-001", project_id="P001", phase="design",
+        event_type="started", timestamp="2026-03-01T09:00:00Z",
+    )
+    database.insert_phase_event(
+        type_id="feature:a-001", project_id="P001", phase="design",
+        event_type="completed", timestamp="2026-03-01T10:00:00+00:00",
+        iterations=3,
+    )
+    database.insert_phase_event(
+        type_id="feature:b-002", project_id="P002", phase="design",
+        event_type="backward", timestamp="2026-03-02T09:00:00",
+        backward_reason="gap", backward_target="specify",
+    )
+    yield database
+    database.close()
+
+
+def test_export_round_trips_columns(db, tmp_path):
+    path = str(tmp_path / "events.npz")
+    assert export_phase_events_npz(db, path) == 3
+
+    columns = load_phase_events_npz(path)
+    assert list(columns["type_id"]) == [
+        "feature:a-001", "feature:a-001", "feature:b-002",
+    ]
+    assert list(columns["event_type"]) == ["started", "completed", "backward"]
+    assert list(columns["backward_target"]) == ["", "", "specify"]
+    assert list(columns["iterations"]) == [-1, 3, -1]
+    assert columns["timestamp"][1] - columns["timestamp"][0] == 3600.0
+    # Naive timestamps are read as UTC.
+    assert columns["timestamp"][2] == 1772442000.0
+    assert list(columns["duration_buckets"]) == list(PHASE_DURATION_BUCKETS)
+
+
+def test_export_dictionary_encodes_strings(db, tmp_path):
+    path = str(tmp_path / "events.npz")
+    export_phase_events_npz(db, path)
+    with np.load(path) as data:
+        assert int(data["format_version"]) == NPZ_FORMAT_VERSION
+        assert list(data["phase_values"]) == ["design"]
+        assert list(data["phase_codes"]) == [0, 0, 0]
+        assert data["project_id_codes"].dtype == np.int32
+        assert list(data["backward_target_codes"]) == [-1, -1, 0]
+
+
+def test_export_filters_project_and_range(db, tmp_path):
+    path = str(tmp_path / "events.npz")
+    assert export_phase_events_npz(
+        db, path, project_id="P001", since="2026-03-01T09:30:00",
+    ) == 1
+    assert list(load_phase_events_npz(path)["event_type"]) == ["completed"]
+
+
+def test_export_empty_selection(db, tmp_path):
+    path = str(tmp_path / "events.npz")
+    assert export_phase_events_npz(db, path, project_id="nope") == 0
+    columns = load_phase_events_npz(path)
+    assert len(columns["timestamp"]) == 0 and len(columns["type_id"]) == 0
+
+
+def test_unparseable_timestamp_exports_as_nan(db, tmp_path):
+    db.insert_phase_event(
+        type_id="feature:c-003", project_id="P001", phase="design",
+        event_type="started", timestamp="sometime",
+    )
+    path = str(tmp_path / "events.npz")
+    export_phase_events_npz(db, path, project_id="P001")
+    assert math.isnan(load_phase_events_npz(path)["timestamp"][-1])
+
+
+def test_load_rejects_other_format_version(tmp_path):
+    path = str(tmp_path / "events.npz")
+    np.savez(path, format_version=np.array(NPZ_FORMAT_VERSION + 1))
+    with pytest.raises(ValueError, match="unsupported"):
+        load_phase_events_npz(path)
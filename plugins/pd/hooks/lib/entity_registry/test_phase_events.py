@@ -1169,3 +1169,227 @@ class TestFeature089BundleE:
             f"duplicate (type_id, phase, event_type, timestamp, source) "
             f"tuples found after concurrent run: {rows!r}"
         )
+
+
+# ---------------------------------------------------------------------------
+# Time-range queries and per-day rollups (migration 15)
+# ---------------------------------------------------------------------------
+
+
+def _event(db, phase, event_type, timestamp, *, type_id="feature:r-001",
+           project_id="proj-A", iterations=None):
+    db.insert_phase_event(
+        type_id=type_id, project_id=project_id, phase=phase,
+        event_type=event_type, timestamp=timestamp, iterations=iterations,
+    )
+
+
+def _rollup_tables(db):
+    return (
+        [tuple(r) for r in db._conn.execute(
+            "SELECT * FROM phase_event_rollups ORDER BY 1, 2, 3, 4")],
+        [tuple(r) for r in db._conn.execute(
+            "SELECT * FROM phase_duration_rollups ORDER BY 1, 2, 3, 4")],
+    )
+
+
+class TestPhaseEventTimeRange:
+    @pytest.fixture(autouse=True)
+    def seed_events(self, db):
+        for day in ("01", "02", "03"):
+            _event(db, "design", "started", f"2026-03-{day}T09:00:00Z")
+
+    def test_since_inclusive_until_exclusive(self, db):
+        results = db.query_phase_events(
+            since="2026-03-02T09:00:00Z", until="2026-03-03",
+        )
+        assert [r["timestamp"] for r in results] == ["2026-03-02T09:00:00Z"]
+
+    def test_range_combines_with_type_filter(self, db):
+        results = db.query_phase_events(
+            type_id="feature:r-001", since="2026-03-02",
+        )
+        assert len(results) == 2
+
+    def test_iter_phase_events_yields_tuples_in_time_order(self, db):
+        rows = list(db.iter_phase_events(until="2026-03-03", batch_size=1))
+        assert rows == [
+            ("feature:r-001", "proj-A", "design", "started",
+             f"2026-03-{day}T09:00:00Z", None, None, "live")
+            for day in ("01", "02")
+        ]
+
+
+class TestPhaseRollups:
+    def test_insert_updates_daily_counts_and_iteration_stats(self, db):
+        _event(db, "design", "completed", "2026-03-01T10:00:00Z", iterations=2)
+        _event(db, "design", "completed", "2026-03-01T18:00:00Z", iterations=5,
+               type_id="feature:r-002")
+        _event(db, "design", "completed", "2026-03-01T19:00:00Z",
+               type_id="feature:r-003")
+        _event(db, "design", "completed", "2026-03-02T10:00:00Z", iterations=1)
+
+        rows = db.query_phase_rollups(project_id="proj-A", phase="design")
+        assert [(r["day"], r["event_count"], r["iterations_count"],
+                 r["iterations_sum"], r["iterations_max"]) for r in rows] == [
+            ("2026-03-01", 3, 2, 7, 5),
+            ("2026-03-02", 1, 1, 1, 1),
+        ]
+        assert rows[0]["iterations_avg"] == 3.5
+
+    def test_day_is_utc_date(self, db):
+        _event(db, "design", "started", "2026-03-01T22:00:00-05:00")
+        (row,) = db.query_phase_rollups()
+        assert row["day"] == "2026-03-02"
+
+    def test_duration_pairs_latest_started_at_or_before_completion(self, db):
+        _event(db, "design", "started", "2026-03-01T08:00:00Z")
+        _event(db, "design", "started", "2026-03-01T09:00:00Z")
+        _event(db, "design", "completed", "2026-03-01T09:30:00Z")
+        _event(db, "design", "started", "2026-03-02T09:00:00Z")  # after
+        (entry,) = db.query_phase_duration_histogram()
+        assert entry["phase"] == "design"
+        assert entry["count"] == 1
+        assert entry["mean_seconds"] == pytest.approx(1800, abs=0.01)
+        assert entry["buckets"] == [0, 0, 1, 0, 0, 0, 0]
+
+    def test_completed_without_started_has_no_duration(self, db):
+        _event(db, "design", "completed", "2026-03-01T09:30:00Z")
+        assert db.query_phase_duration_histogram() == []
+        assert db.query_phase_rollups()[0]["event_count"] == 1
+
+    def test_histogram_sums_days_and_filters_range(self, db):
+        _event(db, "design", "started", "2026-03-01T00:00:00Z")
+        _event(db, "design", "completed", "2026-03-01T00:00:30Z")
+        _event(db, "design", "started", "2026-03-05T00:00:00Z")
+        _event(db, "design", "completed", "2026-03-13T00:00:00Z")
+        (entry,) = db.query_phase_duration_histogram(project_id="proj-A")
+        assert entry["buckets"] == [1, 0, 0, 0, 0, 0, 1]
+        (entry,) = db.query_phase_duration_histogram(since="2026-03-02")
+        assert entry["buckets"] == [0, 0, 0, 0, 0, 0, 1]
+
+    def test_unparseable_timestamp_is_not_rolled_up(self, db):
+        _event(db, "design", "started", "not-a-time")
+        assert db.query_phase_events()[0]["timestamp"] == "not-a-time"
+        assert db.query_phase_rollups() == []
+
+    def test_rollups_outlive_deleted_events(self, db):
+        _event(db, "design", "started", "2026-03-01T09:00:00Z")
+        db._conn.execute("DELETE FROM phase_events")
+        db._conn.commit()
+        assert db.query_phase_rollups()[0]["event_count"] == 1
+
+    def test_rebuild_matches_incremental_rollups(self, db):
+        _event(db, "design", "started", "2026-03-01T09:00:00Z")
+        _event(db, "design", "completed", "2026-03-01T12:00:00Z", iterations=3)
+        _event(db, "implement", "started", "2026-03-02T09:00:00Z",
+               project_id="proj-B", type_id="feature:r-009")
+        incremental = _rollup_tables(db)
+        db.rebuild_phase_rollups()
+        assert _rollup_tables(db) == incremental
+
+    def test_rebuild_pairs_started_inserted_after_completed(self, db):
+        _event(db, "design", "completed", "2026-03-01T12:00:00Z")
+        _event(db, "design", "started", "2026-03-01T11:00:00Z")
+        assert db.query_phase_duration_histogram() == []
+        db.rebuild_phase_rollups()
+        (entry,) = db.query_phase_duration_histogram()
+        assert entry["mean_seconds"] == pytest.approx(3600, abs=0.01)
+
+    def test_migration_15_backfills_existing_events(self, db):
+        from entity_registry.database import _migration_15_phase_rollups
+
+        _event(db, "design", "started", "2026-03-01T09:00:00Z")
+        _event(db, "design", "completed", "2026-03-01T10:00:00Z", iterations=2)
+        expected = _rollup_tables(db)
+        db._conn.execute("DROP TABLE phase_event_rollups")
+        db._conn.execute("DROP TABLE phase_duration_rollups")
+        db._conn.execute(
+            "UPDATE _metadata SET value = '14' WHERE key = 'schema_version'"
+        )
+        db._conn.commit()
+
+        _migration_15_phase_rollups(db._conn)
+        assert _rollup_tables(db) == expected
+        assert db.get_schema_version() == 15
+
+
+# ---------------------------------------------------------------------------
+# Retention archive
+# ---------------------------------------------------------------------------
+
+
+class TestPhaseEventsArchive:
+    @pytest.fixture
+    def file_db(self, tmp_path):
+        database = EntityDatabase(str(tmp_path / "entities.db"))
+        for day in ("01", "02", "03"):
+            _event(database, "design", "started", f"2026-03-{day}T09:00:00Z")
+        yield database
+        database.close()
+
+    def test_archive_path_sits_next_to_database(self, file_db, tmp_path):
+        assert file_db.phase_events_archive_path == str(
+            tmp_path / "entities-phase-archive.db"
+        )
+
+    def test_moves_old_events_keeping_rows_intact(self, file_db):
+        before = file_db.query_phase_events(limit=500)
+        assert file_db.archive_phase_events(before="2026-03-03", batch_size=1) == 2
+        assert file_db.count_phase_events() == {"live": 1, "archived": 2}
+        assert [r["timestamp"] for r in file_db.query_phase_events()] == [
+            "2026-03-03T09:00:00Z",
+        ]
+        assert file_db.query_phase_events(include_archive=True) == before
+
+    def test_archive_is_idempotent(self, file_db):
+        file_db.archive_phase_events(before="2026-03-03")
+        assert file_db.archive_phase_events(before="2026-03-03") == 0
+        assert file_db.count_phase_events() == {"live": 1, "archived": 2}
+
+    def test_events_of_active_features_stay_live(self, file_db):
+        file_db.register_entity(
+            "feature", "r-001", "Active", status="active",
+            project_id="proj-A",
+        )
+        _event(file_db, "design", "started", "2026-03-01T10:00:00Z",
+               type_id="feature:r-002")
+        assert file_db.archive_phase_events(before="2026-04-01") == 1
+        assert {r["type_id"] for r in file_db.query_phase_events()} == {
+            "feature:r-001",
+        }
+
+    def test_rollups_keep_archived_events(self, file_db):
+        rollups = file_db.query_phase_rollups()
+        file_db.archive_phase_events(before="2026-04-01")
+        assert file_db.query_phase_rollups() == rollups
+
+    def test_spanning_query_drops_rows_duplicated_by_interrupted_batch(self, file_db):
+        file_db.archive_phase_events(before="2026-03-02")
+        # Simulate a crash after the archive commit but before the live
+        # delete: the row exists in both databases.
+        file_db._conn.execute(
+            "INSERT INTO phase_events SELECT id, type_id, project_id, phase, "
+            "event_type, timestamp, iterations, reviewer_notes, backward_reason, "
+            "backward_target, source, created_at FROM pe_archive.phase_events"
+        )
+        file_db._conn.commit()
+        assert len(file_db.query_phase_events(include_archive=True)) == 3
+        assert len(list(file_db.iter_phase_events(include_archive=True))) == 3
+
+    def test_include_archive_without_archive_reads_live_only(self, file_db, tmp_path):
+        assert len(file_db.query_phase_events(include_archive=True)) == 3
+        assert not (tmp_path / "entities-phase-archive.db").exists()
+
+    def test_iter_spans_archive_in_time_order(self, file_db):
+        file_db.archive_phase_events(before="2026-03-02")
+        rows = list(file_db.iter_phase_events(include_archive=True))
+        assert [r[4] for r in rows] == [
+            f"2026-03-{day}T09:00:00Z" for day in ("01", "02", "03")
+        ]
+        assert len(list(file_db.iter_phase_events())) == 2
+
+    def test_in_memory_database_cannot_archive(self, db):
+        assert db.phase_events_archive_path is None
+        with pytest.raises(ValueError, match="file-backed"):
+            db.archive_phase_events(before="2026-01-01")
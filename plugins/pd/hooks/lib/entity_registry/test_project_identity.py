@@ -8,6 +8,15 @@ import subprocess
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def identity_cache(tmp_path, monkeypatch):
+    """Keep the on-disk identity cache out of the real home directory."""
+    path = tmp_path / "identity-cache" / "project-identity.json"
+    monkeypatch.setenv("PD_PROJECT_IDENTITY_CACHE", str(path))
+    monkeypatch.delenv("ENTITY_PROJECT_ID", raising=False)
+    return path
+
+
 # ---------------------------------------------------------------------------
 # T1.1: normalize_remote_url tests
 # ---------------------------------------------------------------------------
@@ -279,3 +288,120 @@ class TestCollectGitInfo:
         assert info.root_commit_sha == ""
         assert info.remote_url == ""
         assert info.name == tmp_path.name  # falls back to dir basename
+
+
+# ---------------------------------------------------------------------------
+# Persistent identity cache
+# ---------------------------------------------------------------------------
+
+
+def _git(repo, *args):
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / "repo"
+    (path / "sub").mkdir(parents=True)
+    _git(path, "init", "-q")
+    (path / "sub" / "f.txt").write_text("x")
+    _git(path, "add", ".")
+    _git(path, "commit", "-q", "-m", "root")
+    return path
+
+
+class TestIdentityCache:
+    def setup_method(self):
+        from entity_registry.project_identity import detect_project_id
+
+        detect_project_id.cache_clear()
+
+    def _forbid_git(self, monkeypatch):
+        def no_git(cmd, **kwargs):
+            raise AssertionError(f"unexpected subprocess: {cmd}")
+
+        monkeypatch.setattr(subprocess, "run", no_git)
+
+    def test_warm_lookup_spawns_no_git(self, repo, monkeypatch, identity_cache):
+        from entity_registry.project_identity import (
+            collect_git_info,
+            detect_project_id,
+        )
+
+        root_sha = _git(repo, "rev-list", "--max-parents=0", "HEAD")
+        first = collect_git_info(str(repo))
+        assert first.project_id == root_sha[:12]
+        assert identity_cache.exists()
+
+        detect_project_id.cache_clear()
+        self._forbid_git(monkeypatch)
+        # Any directory inside the repo shares the entry.
+        assert detect_project_id(str(repo / "sub")) == root_sha[:12]
+        assert collect_git_info(str(repo / "sub")) == first
+
+    def test_config_change_invalidates_entry(self, repo):
+        from entity_registry.project_identity import collect_git_info
+
+        assert collect_git_info(str(repo)).remote_url == ""
+        _git(repo, "remote", "add", "origin", "git@github.com:Owner/Proj.git")
+        info = collect_git_info(str(repo))
+        assert info.remote_url == "git@github.com:Owner/Proj.git"
+        assert info.name == "Proj"
+
+    def test_shallow_entry_tracks_branch_ref(self, repo):
+        from entity_registry.project_identity import (
+            _identity_signature,
+            _locate_git_dirs,
+        )
+
+        git_dir, common_dir = _locate_git_dirs(str(repo))
+        assert "head_ref" not in _identity_signature(git_dir, common_dir)
+        (repo / ".git" / "shallow").write_text("")
+        before = _identity_signature(git_dir, common_dir)
+        assert before["head_ref"] is not None
+        (repo / "sub" / "g.txt").write_text("y")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-q", "-m", "second")
+        assert _identity_signature(git_dir, common_dir) != before
+
+    def test_env_override_applies_to_cached_info(self, repo, monkeypatch):
+        from entity_registry.project_identity import (
+            collect_git_info,
+            detect_project_id,
+        )
+
+        collect_git_info(str(repo))
+        detect_project_id.cache_clear()
+        monkeypatch.setenv("ENTITY_PROJECT_ID", "override-id")
+        assert collect_git_info(str(repo)).project_id == "override-id"
+
+    def test_repo_without_commits_is_not_cached(self, tmp_path, identity_cache):
+        from entity_registry.project_identity import detect_project_id
+
+        empty = tmp_path / "empty"
+        empty.mkdir()
+        _git(empty, "init", "-q")
+        expected = hashlib.sha256(str(empty).encode()).hexdigest()[:12]
+        assert detect_project_id(str(empty)) == expected
+        assert not identity_cache.exists()
+
+    def test_corrupt_cache_is_rebuilt(self, repo, identity_cache):
+        from entity_registry.project_identity import detect_project_id
+
+        identity_cache.parent.mkdir(parents=True)
+        identity_cache.write_text("{not json")
+        assert len(detect_project_id(str(repo))) == 12
+        assert "entries" in identity_cache.read_text()
+
+    def test_locates_linked_worktree_git_dir(self, repo, tmp_path):
+        from entity_registry.project_identity import _locate_git_dirs
+
+        worktree = tmp_path / "wt"
+        _git(repo, "worktree", "add", "-q", str(worktree))
+        git_dir, common_dir = _locate_git_dirs(str(worktree))
+        assert common_dir == os.path.realpath(repo / ".git")
+        assert git_dir != common_dir
+        assert _locate_git_dirs(str(tmp_path)) is None
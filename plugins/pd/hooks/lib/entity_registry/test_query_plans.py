@@ -0,0 +1,175 @@
+"""Query-plan audit of EntityDatabase's public lookups.
+
+Every public method that looks up a bounded set of rows runs under a
+QueryRecorder; each statement it issues is replayed under EXPLAIN QUERY
+PLAN and must not fully scan a hot table. Whole-table listings are
+audited separately and are allowed to scan only the table they list.
+"""
+from __future__ import annotations
+
+import pytest
+
+from entity_registry.database import EntityDatabase
+from query_plan_audit import QueryRecorder, audit, explain
+
+PROJECT = "proj-a"
+
+HOT_TABLES = frozenset({
+    "entities", "workflow_phases", "phase_events", "entity_tags",
+    "entity_dependencies", "entity_okr_alignment",
+})
+
+
+def _tid(i: int) -> str:
+    return f"feature:{i:03d}-f{i}"
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = EntityDatabase(str(tmp_path / "plans.db"))
+    database.register_entity("project", "P001", "Project", project_id=PROJECT)
+    database.register_entities_batch(
+        [
+            {"entity_type": "feature", "entity_id": f"{i:03d}-f{i}",
+             "name": f"Feature {i}", "status": "active"}
+            for i in range(60)
+        ],
+        PROJECT,
+    )
+    for i in range(60):
+        database.create_workflow_phase(_tid(i), workflow_phase="design")
+        database.insert_phase_event(
+            type_id=_tid(i), project_id=PROJECT, phase="design",
+            event_type="started", timestamp=f"2026-01-{i % 28 + 1:02d}T00:00:00Z",
+        )
+    database.set_parent(_tid(1), "project:P001")
+    a = database.get_entity(_tid(0))["uuid"]
+    b = database.get_entity(_tid(1))["uuid"]
+    database.add_tag(a, "perf")
+    database.add_dependency(a, b)
+    database.add_okr_alignment(a, b)
+    yield database
+    database.close()
+
+
+def _findings(db, call, *, flag_sorts=False):
+    with QueryRecorder(db) as recorder:
+        call(db)
+    assert recorder.statements, "call issued no SQL"
+    return audit(
+        db._conn, recorder.statements, hot_tables=HOT_TABLES,
+        flag_sorts=flag_sorts,
+    )
+
+
+def _uuid(db, i):
+    return db.get_entity(_tid(i))["uuid"]
+
+
+# (name, call) pairs for lookups whose cost must not grow with the table.
+LOOKUPS = [
+    ("get_entity", lambda db: db.get_entity(_tid(3))),
+    ("get_entity_by_uuid", lambda db: db.get_entity_by_uuid(_uuid(db, 3))),
+    ("get_entities_by_type_ids",
+     lambda db: db.get_entities_by_type_ids([_tid(3), _tid(4)])),
+    ("resolve_ref", lambda db: db.resolve_ref(_tid(3))),
+    ("resolve_ref_project", lambda db: db.resolve_ref(_tid(3), PROJECT)),
+    ("resolve_ref_prefix_project", lambda db: db.resolve_ref("feature:012", PROJECT)),
+    ("get_children_by_uuid", lambda db: db.get_children_by_uuid(_uuid(db, 0))),
+    ("search_by_type_id_prefix_project",
+     lambda db: db.search_by_type_id_prefix("feature:01", PROJECT)),
+    ("get_tags", lambda db: db.get_tags(_uuid(db, 0))),
+    ("query_by_tag", lambda db: db.query_by_tag("perf")),
+    ("get_okr_alignments", lambda db: db.get_okr_alignments(_uuid(db, 0))),
+    ("set_parent", lambda db: db.set_parent(_tid(2), "project:P001")),
+    ("list_entities_by_type",
+     lambda db: db.list_entities(entity_type="feature", project_id=PROJECT)),
+    ("list_entities_page", lambda db: db.list_entities(limit=10)),
+    ("get_lineage_up", lambda db: db.get_lineage(_tid(1))),
+    ("get_lineage_down", lambda db: db.get_lineage("project:P001", direction="down")),
+    ("update_entity", lambda db: db.update_entity(_tid(4), status="completed")),
+    ("search_entities", lambda db: db.search_entities("Feature", limit=5)),
+    ("export_lineage_markdown", lambda db: db.export_lineage_markdown("project:P001")),
+    ("query_phase_events_by_type",
+     lambda db: db.query_phase_events(type_id=_tid(5))),
+    ("query_phase_events_by_project",
+     lambda db: db.query_phase_events(project_id=PROJECT)),
+    ("query_phase_events_bulk",
+     lambda db: db.query_phase_events_bulk([_tid(5), _tid(6)], ["started"])),
+    ("query_phase_events_since",
+     lambda db: db.query_phase_events(since="2026-01-01")),
+    ("query_phase_events_by_type_since",
+     lambda db: db.query_phase_events(type_id=_tid(5), since="2026-01-01")),
+    ("query_phase_rollups_by_project",
+     lambda db: db.query_phase_rollups(project_id=PROJECT, since="2026-01-01")),
+    ("query_phase_duration_histogram_by_project",
+     lambda db: db.query_phase_duration_histogram(project_id=PROJECT)),
+    ("get_workflow_phase", lambda db: db.get_workflow_phase(_tid(7))),
+    ("update_workflow_phase",
+     lambda db: db.update_workflow_phase(_tid(7), kanban_column="wip")),
+    ("list_workflow_phases_by_ids",
+     lambda db: db.list_workflow_phases(type_ids=[_tid(7), _tid(8)])),
+    ("query_dependencies", lambda db: db.query_dependencies(entity_uuid=_uuid(db, 0))),
+    ("query_dependencies_blocker",
+     lambda db: db.query_dependencies(blocked_by_uuid=_uuid(db, 1))),
+    ("check_dependency_cycle",
+     lambda db: db.check_dependency_cycle(_uuid(db, 1), _uuid(db, 0))),
+    ("scan_entity_ids", lambda db: db.scan_entity_ids("feature", PROJECT)),
+    ("next_sequence_value", lambda db: db.next_sequence_value(PROJECT, "feature")),
+    ("delete_entity", lambda db: db.delete_entity(_tid(59))),
+    ("query_by_metadata",
+     lambda db: db.query_by_metadata({"slug": "f3"}, entity_type="feature")),
+    ("query_by_metadata_sorted",
+     lambda db: db.query_by_metadata(
+         {"progress": (">=", 50)}, order_by="progress", descending=True)),
+    ("get_metadata_fields",
+     lambda db: db.get_metadata_fields([_uuid(db, 3)], ["slug", "phase_timing"])),
+]
+
+# Whole-table reads: scanning the listed table is the point, anything else
+# (an automatic index, a scan of a joined table) is not.
+LISTINGS = [
+    ("list_entities", lambda db: db.list_entities(), {"entities"}),
+    ("export_entities_json", lambda db: db.export_entities_json(), {"entities"}),
+    ("list_workflow_phases", lambda db: db.list_workflow_phases(), {"workflow_phases"}),
+    # LIKE is case-insensitive, so an unscoped prefix search cannot use the
+    # BINARY type_id index; resolve_ref only reaches it on an exact miss.
+    ("search_by_type_id_prefix",
+     lambda db: db.search_by_type_id_prefix("feature:01"), {"entities"}),
+]
+
+
+@pytest.mark.parametrize("name,call", LOOKUPS, ids=[n for n, _ in LOOKUPS])
+def test_lookup_has_no_full_scan(db, name, call):
+    findings = _findings(db, call)
+    assert not findings, "\n".join(
+        f"{f.kind} {f.table}: {f.detail}\n    {f.sql}" for f in findings
+    )
+
+
+@pytest.mark.parametrize(
+    "name,call,allowed", LISTINGS, ids=[n for n, _, _ in LISTINGS],
+)
+def test_listing_scans_only_its_table(db, name, call, allowed):
+    findings = _findings(db, call)
+    unexpected = [
+        f for f in findings if f.kind != "scan" or f.table not in allowed
+    ]
+    assert not unexpected, "\n".join(
+        f"{f.kind} {f.table}: {f.detail}\n    {f.sql}" for f in unexpected
+    )
+
+
+@pytest.mark.parametrize("column", ["type_id", "project_id"])
+def test_phase_events_by_column_reads_in_timestamp_order(db, column):
+    """The timestamp-ordered event feed walks an index, no temp sort."""
+    value = _tid(5) if column == "type_id" else PROJECT
+    findings = _findings(
+        db, lambda d: d.query_phase_events(**{column: value}), flag_sorts=True,
+    )
+    assert not findings, [f.detail for f in findings]
+
+
+def test_type_id_lookup_uses_type_id_index(db):
+    plan = explain(db._conn, "SELECT uuid FROM entities WHERE type_id = ?", ("x",))
+    assert any("idx_entities_type_id" in step for step in plan), plan
@@ -881,6 +881,85 @@ class TestSearchMutationMindset:
 # ---------------------------------------------------------------------------
 
 
+class TestDeferredFts:
+    """deferred_fts() batches FTS maintenance into one flush on exit."""
+
+    def _fts(self, db, term):
+        return db._conn.execute(
+            "SELECT rowid FROM entities_fts WHERE entities_fts MATCH ?", (term,)
+        ).fetchall()
+
+    def _assert_in_sync(self, db):
+        expected = {
+            (r["rowid"], r["name"]) for r in db._conn.execute(
+                "SELECT rowid, name FROM entities"
+            )
+        }
+        actual = {
+            (r[0], r[1]) for r in db._conn.execute(
+                "SELECT rowid, name FROM entities_fts"
+            )
+        }
+        assert actual == expected
+
+    def test_writes_indexed_on_exit_only(self, db):
+        db.register_entity("feature", "keep", "Keep Old", project_id="__unknown__")
+        db.register_entity("feature", "gone", "Gone Soon", project_id="__unknown__")
+        with db.deferred_fts():
+            db.register_entity("feature", "new", "Fresh Arrival", project_id="__unknown__")
+            db.update_entity("feature:keep", name="Kept Renamed")
+            db.delete_entity("feature:gone")
+            db.register_entities_batch(
+                [{"entity_type": "feature", "entity_id": "b1", "name": "Batched One"}],
+                project_id="__unknown__",
+            )
+            # Index untouched until the block ends
+            assert self._fts(db, "Fresh") == []
+            assert len(self._fts(db, "Old")) == 1
+        assert len(self._fts(db, "Fresh")) == 1
+        assert len(self._fts(db, "Batched")) == 1
+        assert self._fts(db, "Old") == []
+        assert self._fts(db, "Gone") == []
+        self._assert_in_sync(db)
+        assert [e["type_id"] for e in db.search_entities("Renamed")] == ["feature:keep"]
+
+    def test_nested_blocks_flush_once_at_outermost(self, db):
+        with db.deferred_fts():
+            with db.deferred_fts():
+                db.register_entity("feature", "inner", "Inner Item", project_id="__unknown__")
+            assert self._fts(db, "Inner") == []
+        assert len(self._fts(db, "Inner")) == 1
+
+    def test_flushes_when_block_raises(self, db):
+        with pytest.raises(RuntimeError):
+            with db.deferred_fts():
+                db.register_entity("feature", "boom", "Boom Item", project_id="__unknown__")
+                raise RuntimeError("stop")
+        assert len(self._fts(db, "Boom")) == 1
+
+    def test_rolled_back_write_leaves_index_consistent(self, db):
+        db.register_entity("feature", "stay", "Stay Put", project_id="__unknown__")
+        with db.deferred_fts():
+            with pytest.raises(RuntimeError):
+                with db.transaction():
+                    db.update_entity("feature:stay", name="Never Seen")
+                    raise RuntimeError("rollback")
+        assert self._fts(db, "Never") == []
+        self._assert_in_sync(db)
+
+    def test_large_flush_and_optimize(self, db):
+        with db.deferred_fts():
+            for i in range(600):
+                db.register_entity(
+                    "feature", f"bulk-{i:03d}", f"Bulk Item {i}",
+                    metadata={"module": f"mod{i}"}, project_id="__unknown__",
+                )
+        assert len(self._fts(db, "mod599")) == 1
+        db.optimize_fts()
+        self._assert_in_sync(db)
+        assert len(self._fts(db, "Bulk")) == 600
+
+
 def test_fts_rebuild_succeeds_on_production_schema(tmp_path):
     """AC-7: Verify FTS rebuild works on standalone content-bearing table."""
     db = EntityDatabase(str(tmp_path / "test.db"))
@@ -261,7 +261,8 @@ def _cmd_classify(args: argparse.Namespace) -> int:
     """Classify every entry in entries.json and emit classifications.json.
 
     Per user spec: reads `--entries` (or sandbox/entries.json fallback),
-    calls `classify_keywords` + `decide_target` per entry, writes a list of
+    scores every entry in one `classify_all` batch (`--workers` processes),
+    applies `decide_target` per entry, writes a list of
     `{entry_name, scores, winner, tied}` records.
     """
     sandbox = Path(args.sandbox)
@@ -276,19 +277,20 @@ def _cmd_classify(args: argparse.Namespace) -> int:
         return 1
 
     try:
-        from pattern_promotion.classifier import classify_keywords, decide_target
+        from pattern_promotion.classifier import classify_all, decide_target
     except ImportError as exc:
         _emit_status("error", error=f"classifier unavailable: {exc}")
         return 1
 
+    kb_entries = [_reconstitute_entry(entry_dict) for entry_dict in entries]
+    try:
+        all_scores = classify_all(kb_entries, workers=args.workers)
+    except Exception as exc:
+        _emit_status("error", error=f"classify_keywords failed: {exc}")
+        return 1
+
     classifications: list[dict] = []
-    for entry_dict in entries:
-        kb_entry = _reconstitute_entry(entry_dict)
-        try:
-            scores = classify_keywords(kb_entry)
-        except Exception as exc:
-            _emit_status("error", error=f"classify_keywords failed: {exc}")
-            return 1
+    for kb_entry, scores in zip(kb_entries, all_scores):
         winner = decide_target(scores)
         max_score = max(scores.values()) if scores else 0
         tied = (
@@ -664,6 +666,12 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Path to entries.json (default: <sandbox>/entries.json)",
     )
+    p_classify.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for large batches (0 = one per CPU; default: 1)",
+    )
 
     p_gen = sub.add_parser(
         "generate", help="Generate a DiffPlan for a target type"
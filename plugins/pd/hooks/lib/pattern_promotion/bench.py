@@ -0,0 +1,143 @@
+"""Benchmark for KB enumeration and keyword classification.
+
+Writes a synthetic knowledge bank of ``--entries`` entries spread over
+patterns.md, heuristics.md and anti-patterns.md, then times:
+
+- ``enumerate_qualifying_entries`` with a cold and a warm parse cache;
+- per-row keyword scoring (one ``search`` per pattern, the previous
+  implementation) against ``classify_all`` in-process and with
+  ``--workers`` processes.
+
+Reports JSON timings and checks that every method produced the same scores.
+
+Usage (from plugins/pd, with hooks/lib on PYTHONPATH):
+    python -m pattern_promotion.bench --entries 5000 --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pattern_promotion import kb_parser
+from pattern_promotion.classifier import KEYWORD_PATTERNS, classify_all
+
+_FILES = ("patterns.md", "heuristics.md", "anti-patterns.md")
+
+_PHRASES = (
+    "PreToolUse on Edit should block the tool call",
+    "the reviewer catches in review any missing tests",
+    "when implementing a workflow, follow the procedure steps",
+    "invokes /pd:finish after the slash command",
+    "validate cron expressions with a regex check before it runs",
+    "assess the design phase with an audit",
+    "keep the plan small and commit often",
+    "brainstorming and researching happen before designing",
+)
+
+# Text no keyword row matches, so most entries hit only some targets.
+_FILLER = (
+    "Prefer small, well-named functions over long ones",
+    "Record the decision and its rationale next to the code",
+    "Schema changes need a migration and a version bump",
+    "Keep fixtures close to the tests that use them",
+    "Flaky timing assertions hide real regressions",
+)
+
+
+def write_kb(kb_dir: Path, entries: int, *, seed: int = 0) -> None:
+    """Write ``entries`` synthetic entries into *kb_dir*, all qualifying."""
+    rng = random.Random(seed)
+    kb_dir.mkdir(parents=True, exist_ok=True)
+    blocks: dict[str, list[str]] = {name: [] for name in _FILES}
+    for i in range(entries):
+        name = _FILES[i % len(_FILES)]
+        description = ". ".join(
+            rng.sample(_PHRASES, 1 + i % 2) + rng.sample(_FILLER, 2)
+        )
+        blocks[name].append(
+            f"### Entry {i}\n{description}.\n"
+            f"- Observation count: {3 + i % 5}\n"
+            "- Confidence: high\n"
+        )
+    for name, parts in blocks.items():
+        (kb_dir / name).write_text(
+            f"# {name}\n\n" + "\n".join(parts), encoding="utf-8",
+        )
+    # Age the files past the parse cache's racy window.
+    ns = time.time_ns() - 60 * 1_000_000_000
+    for name in _FILES:
+        os.utime(kb_dir / name, ns=(ns, ns))
+
+
+def _per_row_scores(entries) -> list[dict[str, int]]:
+    return [
+        {
+            target: sum(1 for pat in patterns
+                        if pat.search(f"{e.name} {e.description}"))
+            for target, patterns in KEYWORD_PATTERNS.items()
+        }
+        for e in entries
+    ]
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, round((time.perf_counter() - start) * 1000, 2)
+
+
+def run_bench(kb_dir: Path, *, workers: int) -> dict:
+    """Run the benchmark against an existing *kb_dir* and return the report."""
+    kb_parser.clear_parse_cache()
+    entries, cold_ms = _timed(lambda: kb_parser.enumerate_qualifying_entries(kb_dir))
+    warm, warm_ms = _timed(lambda: kb_parser.enumerate_qualifying_entries(kb_dir))
+
+    reference, per_row_ms = _timed(lambda: _per_row_scores(entries))
+    serial, serial_ms = _timed(lambda: classify_all(entries))
+    pooled, pooled_ms = _timed(lambda: classify_all(entries, workers=workers))
+
+    return {
+        "entries": len(entries),
+        "workers": workers,
+        "enumerate_cold_ms": cold_ms,
+        "enumerate_warm_ms": warm_ms,
+        "classify_per_row_ms": per_row_ms,
+        "classify_all_ms": serial_ms,
+        "classify_all_pool_ms": pooled_ms,
+        "consistent": warm == entries and serial == reference and pooled == reference,
+    }
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(description="KB enumerate/classify benchmark")
+    parser.add_argument("--kb-dir", help="Existing knowledge bank (default: synthetic)")
+    parser.add_argument("--entries", type=int, default=5000,
+                        help="Synthetic entries to generate")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Worker processes for the pooled classify run")
+    parsed = parser.parse_args(args)
+
+    tmpdir = None
+    kb_dir = Path(parsed.kb_dir) if parsed.kb_dir else None
+    if kb_dir is None:
+        tmpdir = tempfile.TemporaryDirectory(prefix="pd-kb-bench-")
+        kb_dir = Path(tmpdir.name)
+        write_kb(kb_dir, parsed.entries)
+    try:
+        report = run_bench(kb_dir, workers=parsed.workers)
+    finally:
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+    print(json.dumps(report, indent=2))
+    return 0 if report["consistent"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
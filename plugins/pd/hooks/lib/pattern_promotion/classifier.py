@@ -7,10 +7,20 @@ module import with `re.IGNORECASE`. A target's score is the number of
 
 FR-2b tie-break: strictly-highest winner returned, or None (caller escalates
 to LLM fallback per FR-2c).
+
+Each target's rows are also joined into one alternation of named groups (the
+shared leading ``\\b`` factored out), so an entry is scanned once per target
+instead of once per row. The scan resumes one character after each match
+start, so overlapping matches are still found; rows that also match at a
+reported start are checked with an anchored ``match``. Scores equal a
+per-row ``search``. ``classify_all`` scores a whole batch, optionally across
+worker processes.
 """
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
 from pattern_promotion.kb_parser import KBEntry
@@ -93,16 +103,89 @@ KEYWORD_PATTERNS: dict[str, list[re.Pattern[str]]] = {
 }
 
 
-def classify_keywords(entry: KBEntry) -> dict[str, int]:
-    """Return per-target counts of DISTINCT matched patterns."""
-    text = f"{entry.name} {entry.description}"
+def _combine(patterns: list[str]) -> tuple[re.Pattern[str], list[int]]:
+    """One alternation over *patterns*; row ``i`` is captured as group ``p<i>``.
+
+    Returns the compiled pattern and the row indexes in alternative order.
+    """
+    bounded = [i for i, p in enumerate(patterns) if p.startswith(r"\b")]
+    other = [i for i, p in enumerate(patterns) if not p.startswith(r"\b")]
+    alternatives = []
+    if bounded:
+        alternatives.append(
+            r"\b(?:"
+            + "|".join(f"(?P<p{i}>{patterns[i][2:]})" for i in bounded)
+            + ")"
+        )
+    alternatives.extend(f"(?P<p{i}>{patterns[i]})" for i in other)
+    return re.compile("|".join(alternatives), re.IGNORECASE), bounded + other
+
+
+_COMBINED_PATTERNS: dict[str, tuple[re.Pattern[str], list[int]]] = {
+    "hook": _combine(_HOOK_PATTERNS),
+    "agent": _combine(_AGENT_PATTERNS),
+    "skill": _combine(_SKILL_PATTERNS),
+    "command": _combine(_COMMAND_PATTERNS),
+}
+
+# Batches smaller than this are scored in-process even when workers > 1;
+# pickling and process start-up cost more than the scan.
+PARALLEL_MIN_ENTRIES = 2000
+
+
+def _score_text(text: str) -> dict[str, int]:
     scores: dict[str, int] = {}
-    for target, patterns in KEYWORD_PATTERNS.items():
-        matched = sum(1 for pat in patterns if pat.search(text))
-        scores[target] = matched
+    for target, (combined, order) in _COMBINED_PATTERNS.items():
+        patterns = KEYWORD_PATTERNS[target]
+        matched: set[int] = set()
+        m = combined.search(text)
+        while m is not None:
+            row = int(m.lastgroup[1:])
+            matched.add(row)
+            # Alternatives before the reported one failed at this position;
+            # later ones may match here too.
+            start = m.start()
+            for later in order[order.index(row) + 1:]:
+                if later not in matched and patterns[later].match(text, start):
+                    matched.add(later)
+            if len(matched) == len(patterns):
+                break
+            m = combined.search(text, start + 1)
+        scores[target] = len(matched)
     return scores
 
 
+def _score_texts(texts: list[str]) -> list[dict[str, int]]:
+    return [_score_text(text) for text in texts]
+
+
+def classify_keywords(entry: KBEntry) -> dict[str, int]:
+    """Return per-target counts of DISTINCT matched patterns."""
+    return _score_text(f"{entry.name} {entry.description}")
+
+
+def classify_all(
+    entries: list[KBEntry], *, workers: int = 1,
+) -> list[dict[str, int]]:
+    """``classify_keywords`` for every entry, in input order.
+
+    With *workers* > 1 and at least ``PARALLEL_MIN_ENTRIES`` entries, the
+    batch is split into one chunk per worker and scored in a process pool
+    (regex matching holds the GIL, so threads would not help). ``workers=0``
+    uses one worker per CPU.
+    """
+    texts = [f"{e.name} {e.description}" for e in entries]
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(texts) < PARALLEL_MIN_ENTRIES:
+        return _score_texts(texts)
+    size = -(-len(texts) // workers)
+    chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        return [scores for chunk in pool.map(_score_texts, chunks)
+                for scores in chunk]
+
+
 def decide_target(scores: dict[str, int]) -> Optional[str]:
     """FR-2b: strictly-highest winner, else None (escalate to LLM fallback)."""
     if not scores:
@@ -16,10 +16,16 @@ FR-1 rules:
 - Files without the field (patterns.md) are eligible on observation count alone.
 - Entries containing `- Promoted: ` are skipped (idempotent re-runs).
 - constitution.md is excluded wholesale.
+
+Parsed files are cached per process, keyed by path and validated against
+`(st_mtime_ns, st_size)`, so repeated enumerations only re-parse files that
+changed. `mark_entry` drops the cache row of the file it rewrites.
 """
 from __future__ import annotations
 
+import os
 import re
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -69,6 +75,39 @@ def _strip_heading_prefix(heading: str) -> str:
     return heading
 
 
+# absolute path -> ((st_mtime_ns, st_size), entries, promoted_names)
+_PARSE_CACHE: dict[str, tuple[tuple[int, int], tuple[KBEntry, ...], frozenset[str]]] = {}
+
+# Files modified this recently are parsed but not cached: a same-size write
+# within one timestamp tick would otherwise go unnoticed.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _parse_file_cached(path: Path) -> tuple[list[KBEntry], set[str]]:
+    """`_parse_file` through the per-process stat-validated cache.
+
+    Cached KBEntry objects are shared between calls; callers must not
+    mutate them.
+    """
+    cache_key = os.path.abspath(path)
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _PARSE_CACHE.get(cache_key)
+    if hit is not None and hit[0] == key:
+        return list(hit[1]), set(hit[2])
+    entries, promoted_names = _parse_file(path)
+    if time.time_ns() - st.st_mtime_ns >= _RACY_WINDOW_NS:
+        _PARSE_CACHE[cache_key] = (key, tuple(entries), frozenset(promoted_names))
+    else:
+        _PARSE_CACHE.pop(cache_key, None)
+    return entries, promoted_names
+
+
+def clear_parse_cache() -> None:
+    """Forget every cached KB file parse."""
+    _PARSE_CACHE.clear()
+
+
 def _parse_file(path: Path) -> tuple[list[KBEntry], set[str]]:
     """Parse a single KB markdown file into KBEntry objects.
 
@@ -178,7 +217,7 @@ def enumerate_qualifying_entries(
             continue
         if path.name in EXCLUDED_FILES:
             continue
-        file_entries, promoted_names = _parse_file(path)
+        file_entries, promoted_names = _parse_file_cached(path)
         for e in file_entries:
             if e.name in promoted_names:
                 continue
@@ -260,3 +299,4 @@ def mark_entry(
     if had_trailing_newline and not out.endswith("\n"):
         out += "\n"
     path.write_text(out, encoding="utf-8")
+    _PARSE_CACHE.pop(os.path.abspath(path), None)
@@ -12,6 +12,7 @@ import pytest
 
 from pattern_promotion.classifier import (
     KEYWORD_PATTERNS,
+    classify_all,
     classify_keywords,
     decide_target,
 )
@@ -162,3 +163,65 @@ class TestDistinctPatternCount:
         scores = classify_keywords(entry)
         # Only the `reviewer` pattern matched (repeatedly). score == 1.
         assert scores["agent"] == 1
+
+
+def _per_row(entry: KBEntry) -> dict[str, int]:
+    """Reference scoring: one search per row."""
+    text = f"{entry.name} {entry.description}"
+    return {
+        target: sum(1 for pat in patterns if pat.search(text))
+        for target, patterns in KEYWORD_PATTERNS.items()
+    }
+
+
+class TestCombinedScan:
+    """The single-alternation scan scores exactly like per-row search."""
+
+    @pytest.mark.parametrize("description", [
+        # `block .* tool` spans `tool input`; both rows count.
+        "Block the tool input before it runs.",
+        # `on Edit` starts inside the `prevent .* call` match.
+        "Prevent on Edit the call; on Write too.",
+        # Same start for `review .* phase` and `reviewer`.
+        "reviewer in the review phase, reviewing",
+        "/foo-bar command invokes /pd:finish via slash command",
+        "IMPLEMENTING workflow STEPS, then debugging",
+        "",
+    ])
+    def test_matches_per_row_search(self, description):
+        entry = _entry("Name", description)
+        assert classify_keywords(entry) == _per_row(entry)
+
+    def test_overlapping_rows_both_counted(self):
+        scores = classify_keywords(_entry("x", "block the tool input"))
+        assert scores["hook"] == 2
+
+
+class TestClassifyAll:
+    def test_preserves_order_and_scores(self):
+        entries = [
+            _entry("Hook", "PreToolUse on Edit"),
+            _entry("Agent", "reviewer audit"),
+            _entry("Nothing", "plain text"),
+        ]
+        assert classify_all(entries) == [classify_keywords(e) for e in entries]
+        assert classify_all([]) == []
+
+    def test_worker_pool_matches_serial(self, monkeypatch):
+        import pattern_promotion.classifier as classifier
+
+        monkeypatch.setattr(classifier, "PARALLEL_MIN_ENTRIES", 1)
+        entries = [
+            _entry(f"Entry {i}", ["PreToolUse", "reviewer", "steps", ""][i % 4])
+            for i in range(12)
+        ]
+        assert classify_all(entries, workers=3) == classify_all(entries)
+
+
+def test_bench_smoke(capsys):
+    from pattern_promotion import bench
+
+    assert bench.main(["--entries", "60", "--workers", "1"]) == 0
+    out = capsys.readouterr().out
+    assert '"consistent": true' in out
+    assert '"entries": 60' in out
@@ -287,3 +287,71 @@ class TestMarkEntry:
         )
         b_start = next(i for i, ln in enumerate(lines) if ln.startswith("### Entry B"))
         assert a_promoted < b_start
+
+
+# ---------------------------------------------------------------------------
+# Parse cache
+# ---------------------------------------------------------------------------
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    import os
+    import time
+
+    ns = time.time_ns() - seconds * 1_000_000_000
+    os.utime(path, ns=(ns, ns))
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    import pattern_promotion.kb_parser as kb
+
+    kb.clear_parse_cache()
+    calls: list[str] = []
+    real = kb._parse_file
+
+    def counting(path):
+        calls.append(path.name)
+        return real(path)
+
+    monkeypatch.setattr(kb, "_parse_file", counting)
+    yield calls
+    kb.clear_parse_cache()
+
+
+class TestParseCache:
+    def test_unchanged_files_are_not_reparsed(self, kb_dir: Path, parses):
+        for path in kb_dir.iterdir():
+            _age(path)
+        first = enumerate_qualifying_entries(kb_dir)
+        assert len(parses) == 3
+        assert enumerate_qualifying_entries(kb_dir) == first
+        assert len(parses) == 3
+
+    def test_changed_file_is_reparsed(self, kb_dir: Path, parses):
+        for path in kb_dir.iterdir():
+            _age(path)
+        enumerate_qualifying_entries(kb_dir)
+        path = kb_dir / "patterns.md"
+        path.write_text(PATTERNS_MD.replace("Feature #", "Feature #9"))
+        _age(path, 30)
+        enumerate_qualifying_entries(kb_dir)
+        assert parses[3:] == ["patterns.md"]
+
+    def test_recently_modified_file_is_not_cached(self, kb_dir: Path, parses):
+        enumerate_qualifying_entries(kb_dir)
+        enumerate_qualifying_entries(kb_dir)
+        assert len(parses) == 6
+
+    def test_mark_entry_invalidates(self, kb_dir: Path, parses):
+        path = kb_dir / "heuristics.md"
+        for p in kb_dir.iterdir():
+            _age(p)
+        names = [e.name for e in enumerate_qualifying_entries(kb_dir)]
+        assert "High-Confidence Qualifying Heuristic" in names
+        mark_entry(
+            path, "High-Confidence Qualifying Heuristic", "skill", "x/SKILL.md",
+        )
+        _age(path)  # same mtime tick as the cached parse must not matter
+        names = [e.name for e in enumerate_qualifying_entries(kb_dir)]
+        assert "High-Confidence Qualifying Heuristic" not in names
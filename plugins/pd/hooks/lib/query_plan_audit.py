@@ -0,0 +1,144 @@
+"""EXPLAIN QUERY PLAN audit for SQLite access paths.
+
+Records the statements a block of code runs on a connection (through the
+connection's trace callback), replays each one under EXPLAIN QUERY PLAN
+and reports the plan steps that read a whole table: a bare ``SCAN``, or an
+``AUTOMATIC`` index SQLite builds from a full scan on every execution.
+Optionally, temp B-tree sorts are reported too.
+
+Used by the entity registry and semantic memory query-plan tests so a new
+query, or a schema change, cannot quietly put a hot path back on a full
+table scan.
+
+Typical use::
+
+    with QueryRecorder(db) as recorder:
+        db.get_entity("feature:001-x")
+    findings = audit(conn, recorder.statements, hot_tables={"entities"})
+"""
+from __future__ import annotations
+
+import re
+import sqlite3
+from dataclasses import dataclass
+
+# Statement kinds EXPLAIN QUERY PLAN says something useful about.
+_PLANNED_PREFIXES = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+
+# ``FROM entities e`` / ``JOIN phase_events AS pe`` -> alias to table.
+_TABLE_REF_RE = re.compile(
+    r"\b(?:FROM|JOIN|UPDATE|INTO)\s+([A-Za-z_]\w*)"
+    r"(?:\s+(?:AS\s+)?(?!ON\b|WHERE\b|USING\b|SET\b|JOIN\b|LEFT\b|INNER\b"
+    r"|CROSS\b|ORDER\b|GROUP\b|LIMIT\b|VALUES\b|SELECT\b|NATURAL\b"
+    r"|UNION\b|EXCEPT\b|INTERSECT\b|HAVING\b|RETURNING\b|INDEXED\b)"
+    r"([A-Za-z_]\w*))?",
+    re.IGNORECASE,
+)
+_SCAN_RE = re.compile(r"^SCAN (\w+)$")
+_AUTO_INDEX_RE = re.compile(r"^(?:SEARCH|SCAN) (\w+) USING AUTOMATIC")
+
+
+@dataclass(frozen=True)
+class PlanFinding:
+    """One problematic plan step.
+
+    ``kind`` is ``"scan"`` (full table scan), ``"auto-index"`` (transient
+    index built from a full scan) or ``"sort"`` (temp B-tree for ORDER BY
+    or GROUP BY; ``table`` is None).
+    """
+
+    kind: str
+    table: str | None
+    detail: str
+    sql: str
+
+
+class QueryRecorder:
+    """Context manager that collects the SQL statements run on a connection.
+
+    *target* is anything with ``set_trace_callback`` (a
+    ``sqlite3.Connection`` or a database wrapper exposing the passthrough).
+    Trigger sub-programs are traced either as ``-- TRIGGER ...`` comments,
+    which are skipped, or as repeats of the outer statement, which
+    :func:`audit` collapses.
+    """
+
+    def __init__(self, target) -> None:
+        self._target = target
+        self.statements: list[str] = []
+
+    def _record(self, sql: str) -> None:
+        if not sql.lstrip().startswith("--"):
+            self.statements.append(sql)
+
+    def __enter__(self) -> QueryRecorder:
+        self._target.set_trace_callback(self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._target.set_trace_callback(None)
+
+
+def explain(conn: sqlite3.Connection, sql: str, params=()) -> list[str]:
+    """Return the EXPLAIN QUERY PLAN detail strings for *sql*, in order."""
+    return [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+
+def _aliases(sql: str) -> dict[str, str]:
+    mapping: dict[str, str] = {}
+    for table, alias in _TABLE_REF_RE.findall(sql):
+        mapping.setdefault(table.lower(), table.lower())
+        if alias:
+            mapping[alias.lower()] = table.lower()
+    return mapping
+
+
+def plan_findings(
+    conn: sqlite3.Connection,
+    sql: str,
+    *,
+    hot_tables: set[str] | frozenset[str],
+    flag_sorts: bool = False,
+) -> list[PlanFinding]:
+    """Explain one statement and return its findings on *hot_tables*.
+
+    Statements that are not DML/queries, or that no longer compile (a temp
+    table that has since been dropped), produce no findings.
+    """
+    if not sql.lstrip().upper().startswith(_PLANNED_PREFIXES):
+        return []
+    try:
+        details = explain(conn, sql)
+    except sqlite3.Error:
+        return []
+    aliases = _aliases(sql)
+    hot = {t.lower() for t in hot_tables}
+    findings: list[PlanFinding] = []
+    for detail in details:
+        for kind, pattern in (("scan", _SCAN_RE), ("auto-index", _AUTO_INDEX_RE)):
+            match = pattern.match(detail)
+            if match:
+                table = aliases.get(match.group(1).lower(), match.group(1).lower())
+                if table in hot:
+                    findings.append(PlanFinding(kind, table, detail, sql))
+                break
+        else:
+            if flag_sorts and detail.startswith("USE TEMP B-TREE"):
+                findings.append(PlanFinding("sort", None, detail, sql))
+    return findings
+
+
+def audit(
+    conn: sqlite3.Connection,
+    statements: list[str],
+    *,
+    hot_tables: set[str] | frozenset[str],
+    flag_sorts: bool = False,
+) -> list[PlanFinding]:
+    """Return the findings for every distinct statement in *statements*."""
+    findings: list[PlanFinding] = []
+    for sql in dict.fromkeys(statements):
+        findings.extend(
+            plan_findings(conn, sql, hot_tables=hot_tables, flag_sorts=flag_sorts)
+        )
+    return findings
@@ -4,6 +4,8 @@ Runs all session-start reconciliation tasks in sequence:
   1. entity_status.sync_entity_statuses   — .meta.json → entity DB status sync
   2. kb_import.sync_knowledge_bank         — MarkdownImporter KB sync
   3. workflow_engine.reconciliation        — .meta.json → DB workflow state sync
+  4. dependency_freshness                  — stale blocked_by edge cleanup
+  5. phase_events_retention                — archive old phase_events rows
 
 Design principles:
   - Fail-open: any task error is captured in `errors` list; exit code is always 0.
@@ -11,7 +13,8 @@ Design principles:
   - DB connections closed in finally block (even on task errors).
 
 Output (stdout): single JSON line with keys:
-  entity_sync, kb_import, workflow_reconcile, dependency_cleanup, elapsed_ms, errors
+  entity_sync, kb_import, workflow_reconcile, dependency_cleanup,
+  phase_events_retention, elapsed_ms, errors
 """
 import argparse
 import json
@@ -75,6 +78,7 @@ def run(args):
         "kb_import": None,
         "workflow_reconcile": None,
         "dependency_cleanup": None,
+        "phase_events_retention": None,
         "elapsed_ms": 0,
         "errors": [],
     }
@@ -131,6 +135,20 @@ def run(args):
             results["errors"].append(f"dependency_freshness: {exc}")
             results["dependency_cleanup"] = 0
 
+        # Task 5: phase_events retention (off unless phase_events_retention_days > 0)
+        try:
+            from reconciliation_orchestrator import phase_events_retention
+            from semantic_memory.config import read_config
+
+            config = read_config(args.project_root)
+            results["phase_events_retention"] = (
+                phase_events_retention.archive_old_phase_events(
+                    entity_db, config.get("phase_events_retention_days"),
+                )
+            )
+        except Exception as exc:
+            results["errors"].append(f"phase_events_retention: {exc}")
+
     except Exception as exc:
         # DB connection failure or other setup error
         results["errors"].append(f"setup: {exc}")
@@ -113,15 +113,17 @@ def sync_entity_statuses(db, full_artifacts_path, project_id="__unknown__",
         ("backlogs", lambda: _sync_backlog_entities(db, full_artifacts_path, artifacts_root, project_id)),
     ]
 
-    for name, helper in helpers:
-        try:
-            hr = helper()
-        except Exception as exc:
-            results["warnings"].append(f"{name}: {exc}")
-            continue
-        for key in ("updated", "skipped", "archived", "registered", "deleted"):
-            results[key] += hr.get(key, 0)
-        results["warnings"].extend(hr.get("warnings", []))
+    # One batched FTS refresh for every entity the helpers touch.
+    with db.deferred_fts():
+        for name, helper in helpers:
+            try:
+                hr = helper()
+            except Exception as exc:
+                results["warnings"].append(f"{name}: {exc}")
+                continue
+            for key in ("updated", "skipped", "archived", "registered", "deleted"):
+                results[key] += hr.get(key, 0)
+            results["warnings"].extend(hr.get("warnings", []))
 
     return results
 
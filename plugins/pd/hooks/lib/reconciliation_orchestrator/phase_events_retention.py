@@ -0,0 +1,28 @@
+"""phase_events retention for the reconciliation orchestrator.
+
+Moves phase_events rows older than ``phase_events_retention_days`` into the
+archive database beside entities.db (see
+``EntityDatabase.archive_phase_events``). The per-day rollups stay in the
+live database, and ``query_phase_analytics(include_archive=True)`` still
+reaches the archived rows.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+
+def archive_old_phase_events(db, retention_days, now=None) -> dict | None:
+    """Archive events older than *retention_days* days before *now*.
+
+    Returns None when retention is disabled (``retention_days`` 0, or not a
+    non-negative int), else ``{"archived": n, "before": cutoff}``.
+    """
+    if (
+        not isinstance(retention_days, int)
+        or isinstance(retention_days, bool)
+        or retention_days <= 0
+    ):
+        return None
+    now = now or datetime.now(timezone.utc)
+    cutoff = (now - timedelta(days=retention_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return {"archived": db.archive_phase_events(before=cutoff), "before": cutoff}
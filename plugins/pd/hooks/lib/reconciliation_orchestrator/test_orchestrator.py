@@ -94,7 +94,8 @@ class TestFullRunOutputsValidJson:
         data = json.loads(output)
 
         expected_keys = {"entity_sync", "kb_import", "workflow_reconcile",
-                         "dependency_cleanup", "elapsed_ms", "errors"}
+                         "dependency_cleanup", "phase_events_retention",
+                         "elapsed_ms", "errors"}
         assert set(data.keys()) == expected_keys, (
             f"Expected keys {expected_keys}, got {set(data.keys())}"
         )
@@ -641,3 +642,44 @@ class TestWorkflowReconcileImportDiagnostic:
         assert data["workflow_reconcile"] is None
         # Diagnostic error captured
         assert any("import skipped" in e for e in data["errors"])
+
+
+class TestPhaseEventsRetention:
+    """Task 5 archives old phase_events when phase_events_retention_days > 0."""
+
+    def _seed(self, tmp_path):
+        entity_db_path = str(tmp_path / "entities.db")
+        memory_db_path = str(tmp_path / "memory.db")
+        db = EntityDatabase(entity_db_path)
+        db.insert_phase_event(
+            type_id="feature:001-old", project_id="__unknown__",
+            phase="design", event_type="completed",
+            timestamp="2020-01-01T00:00:00Z",
+        )
+        db.close()
+        _make_memory_db(memory_db_path)
+        return entity_db_path, memory_db_path
+
+    def test_disabled_by_default(self, tmp_path):
+        entity_db_path, memory_db_path = self._seed(tmp_path)
+        result = _run_cli(str(tmp_path), "docs", entity_db_path, memory_db_path)
+        data = json.loads(result.stdout.strip())
+        assert data["phase_events_retention"] is None
+        assert not os.path.exists(str(tmp_path / "entities-phase-archive.db"))
+
+    def test_archives_events_past_horizon(self, tmp_path):
+        entity_db_path, memory_db_path = self._seed(tmp_path)
+        (tmp_path / ".claude").mkdir()
+        (tmp_path / ".claude" / "pd.local.md").write_text(
+            "phase_events_retention_days: 30\n"
+        )
+        result = _run_cli(str(tmp_path), "docs", entity_db_path, memory_db_path)
+        data = json.loads(result.stdout.strip())
+        assert data["phase_events_retention"]["archived"] == 1
+        assert data["errors"] == []
+
+        db = EntityDatabase(entity_db_path)
+        try:
+            assert db.count_phase_events() == {"live": 0, "archived": 1}
+        finally:
+            db.close()
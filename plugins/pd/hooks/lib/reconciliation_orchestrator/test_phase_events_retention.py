@@ -0,0 +1,35 @@
+"""Tests for reconciliation_orchestrator.phase_events_retention module."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from entity_registry.database import EntityDatabase
+from reconciliation_orchestrator.phase_events_retention import archive_old_phase_events
+
+NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = EntityDatabase(str(tmp_path / "entities.db"))
+    for timestamp in ("2026-01-01T00:00:00Z", "2026-05-25T00:00:00Z"):
+        database.insert_phase_event(
+            type_id="feature:001-done", project_id="__unknown__",
+            phase="design", event_type="started", timestamp=timestamp,
+        )
+    yield database
+    database.close()
+
+
+class TestArchiveOldPhaseEvents:
+    def test_archives_events_older_than_horizon(self, db):
+        result = archive_old_phase_events(db, 30, now=NOW)
+        assert result == {"archived": 1, "before": "2026-05-02T00:00:00Z"}
+        assert db.count_phase_events() == {"live": 1, "archived": 1}
+
+    @pytest.mark.parametrize("days", [0, -5, None, "30", True])
+    def test_disabled_or_invalid_horizon_is_a_no_op(self, db, days):
+        assert archive_old_phase_events(db, days, now=NOW) is None
+        assert db.count_phase_events() == {"live": 2, "archived": 0}
@@ -25,6 +25,7 @@ DEFAULTS: dict[str, bool | int | float | str] = {
     "memory_prominence_weight": 0.3,
     "memory_embedding_provider": "gemini",
     "memory_embedding_model": "gemini-embedding-001",
+    "memory_embedding_storage": "float32",
     "memory_model_capture_mode": "ask-first",
     "memory_silent_capture_budget": 5,
     "memory_injection_limit": 15,
@@ -33,6 +34,7 @@ DEFAULTS: dict[str, bool | int | float | str] = {
     "memory_auto_promote": False,
     "memory_promote_low_threshold": 3,
     "memory_promote_medium_threshold": 5,
+    "memory_refresh_prefetch": True,
     # Feature 088 Bundle G (FR-10.1, #00102) — memory decay keys.
     # Registering defaults allows session-start to detect typos like
     # ``memory_decay_enabaled`` via ``_warn_unknown_keys``.
@@ -42,6 +44,7 @@ DEFAULTS: dict[str, bool | int | float | str] = {
     "memory_decay_grace_period_days": 14,
     "memory_decay_dry_run": False,
     "memory_decay_scan_limit": 100000,
+    "phase_events_retention_days": 0,
 }
 
 # Precompiled regexes for type coercion (applied after space stripping).
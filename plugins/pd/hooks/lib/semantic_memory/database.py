@@ -11,6 +11,14 @@ from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import Callable
 
+from semantic_memory.quantize import (
+    DEFAULT_EMBEDDING_FORMAT,
+    EMBEDDING_FORMATS,
+    blob_format,
+    decode_embedding,
+    encode_embedding,
+)
+
 # Feature 093 FR-1 (#00219, #00220): Z-suffix ISO-8601 format matching production
 # `_config_utils._iso_utc` output (strftime("%Y-%m-%dT%H:%M:%SZ")).
 # Used symmetrically by `MemoryDatabase.scan_decay_candidates` (read path, log-and-skip)
@@ -26,6 +34,12 @@ _ISO8601_Z_PATTERN = re.compile(
 )
 
 
+def _name_like_pattern(name: str) -> str:
+    """``%name%`` LIKE pattern with SQL wildcards escaped (ESCAPE '\\')."""
+    escaped = name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
 def _assert_testing_context() -> None:
     """Refuse ``*_for_testing`` invocations outside an active pytest test.
 
@@ -90,8 +104,10 @@ def _sanitize_fts5_query(raw: str) -> str:
     # Step 5-6: join with OR or return empty
     return " OR ".join(quoted)
 
+
 try:
     import numpy as np
+    from semantic_memory.vector_index import VectorIndex
     _numpy_available = True
 except ImportError:  # pragma: no cover
     _numpy_available = False
@@ -334,12 +350,133 @@ def _rebuild_fts5_index(
     conn.execute("INSERT INTO entries_fts(entries_fts) VALUES('rebuild')")
 
 
+def _add_decay_scan_indexes(
+    conn: sqlite3.Connection,
+    **_kwargs: object,
+) -> None:
+    """Migration 6: index the confidence-decay scan and track decay inputs.
+
+    Two partial indexes split ``entries`` by ``last_recalled_at`` so the
+    keyset-paginated decay scan walks each branch in staleness order
+    without a full table scan.  The triggers bump the ``decay_generation``
+    counter in ``_metadata`` whenever a row is inserted or a column that
+    feeds decay eligibility changes; the maintenance job only trusts its
+    "next eligible at" watermark while the generation is unchanged.
+    Recalls that move ``last_recalled_at`` forward only postpone decay,
+    so they do not bump the counter.
+    """
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_entries_decay_recalled "
+        "ON entries(last_recalled_at, id) WHERE last_recalled_at IS NOT NULL"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_entries_decay_never_recalled "
+        "ON entries(created_at, id) WHERE last_recalled_at IS NULL"
+    )
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS entries_decay_ai AFTER INSERT ON entries
+        BEGIN
+            {_BUMP_DECAY_GENERATION}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS entries_decay_au AFTER UPDATE ON entries
+        WHEN new.confidence IS NOT old.confidence
+          OR new.source IS NOT old.source
+          OR new.created_at IS NOT old.created_at
+          OR (new.last_recalled_at IS NOT old.last_recalled_at
+              AND (old.last_recalled_at IS NULL
+                   OR new.last_recalled_at IS NULL
+                   OR new.last_recalled_at < old.last_recalled_at))
+        BEGIN
+            {_BUMP_DECAY_GENERATION}
+        END
+    """)
+
+
+def _add_lookup_indexes(
+    conn: sqlite3.Connection,
+    **_kwargs: object,
+) -> None:
+    """Migration 7: index the lookups the query-plan audit flagged.
+
+    ``find_entry_by_name`` / ``find_entries_by_names`` match on
+    ``LOWER(name)``, which no plain index can serve; the expression index
+    turns that full scan into a seek.  The embedding backfill polls
+    ``embedding IS NULL``; the partial index holds only the pending rows,
+    so the poll stays cheap once nearly every entry has an embedding.
+    """
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_entries_name_lower "
+        "ON entries(LOWER(name))"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_entries_missing_embedding "
+        "ON entries(id) WHERE embedding IS NULL"
+    )
+
+
+def _add_content_generation(
+    conn: sqlite3.Connection,
+    **_kwargs: object,
+) -> None:
+    """Migration 8: count every change to ``entries``.
+
+    The triggers bump ``content_generation`` in ``_metadata`` on any
+    insert, update or delete, so a process can tell whether results it
+    derived from the store (the memory-refresh digest cache) are still
+    current, including after writes from another process.
+    """
+    for event, name in (
+        ("INSERT", "entries_content_ai"),
+        ("UPDATE", "entries_content_au"),
+        ("DELETE", "entries_content_ad"),
+    ):
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON entries
+            BEGIN
+                {_BUMP_CONTENT_GENERATION}
+            END
+        """)
+
+
+def _add_source_hash_index(
+    conn: sqlite3.Connection,
+    **_kwargs: object,
+) -> None:
+    """Migration 9: index ``source_hash``.
+
+    Merging one store into another skips every source row whose
+    ``source_hash`` already exists in the destination; without an index
+    that anti-join rescans ``entries`` once per source row.
+    """
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_entries_source_hash "
+        "ON entries(source_hash)"
+    )
+
+
+_BUMP_DECAY_GENERATION = (
+    "INSERT INTO _metadata (key, value) VALUES ('decay_generation', '1') "
+    "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1;"
+)
+
+_BUMP_CONTENT_GENERATION = (
+    "INSERT INTO _metadata (key, value) VALUES ('content_generation', '1') "
+    "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1;"
+)
+
+
 MIGRATIONS: dict[int, Callable[[sqlite3.Connection], None]] = {
     1: _create_initial_schema,
     2: _add_source_hash_and_created_timestamp,
     3: _enforce_not_null_columns,
     4: _add_influence_tracking,
     5: _rebuild_fts5_index,
+    6: _add_decay_scan_indexes,
+    7: _add_lookup_indexes,
+    8: _add_content_generation,
+    9: _add_source_hash_index,
 }
 
 # All 19 column names in insertion order.
@@ -374,6 +511,10 @@ class MemoryDatabase:
         not surfaced in config.
         """
         self._busy_timeout_ms = int(busy_timeout_ms)
+        # Cached embedding matrix (see get_all_embeddings) and the
+        # PRAGMA data_version it was loaded at.
+        self._vector_index: VectorIndex | None = None
+        self._vector_index_version: int | None = None
         self._conn = sqlite3.connect(db_path, timeout=5.0)
         self._conn.row_factory = sqlite3.Row
         self._set_pragmas()
@@ -437,6 +578,8 @@ class MemoryDatabase:
         except Exception:
             self._conn.rollback()
             raise
+        if "embedding" in entry:
+            self._invalidate_vector_index()
 
     def _insert_new(self, entry: dict) -> None:
         """Insert a brand-new entry row.
@@ -522,6 +665,8 @@ class MemoryDatabase:
         except Exception:
             self._conn.rollback()
             raise
+        if self._vector_index is not None:
+            self._vector_index.remove(entry_id)
 
     def merge_duplicate(
         self,
@@ -616,10 +761,9 @@ class MemoryDatabase:
             return dict(row)
 
         # Fallback: LIKE with escaped wildcards
-        escaped = name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-        pattern = f"%{escaped}%"
         cur = self._conn.execute(
-            "SELECT * FROM entries WHERE name LIKE ? ESCAPE '\\'", (pattern,)
+            "SELECT * FROM entries WHERE name LIKE ? ESCAPE '\\'",
+            (_name_like_pattern(name),),
         )
         row = cur.fetchone()
         if row is not None:
@@ -627,6 +771,87 @@ class MemoryDatabase:
 
         return None
 
+    # Names resolved per query in find_entries_by_names (2 params each).
+    _NAME_LOOKUP_CHUNK = 250
+
+    def find_entries_by_names(
+        self, names: list[str], columns: tuple[str, ...] | None = None,
+    ) -> list[dict | None]:
+        """Batched :meth:`find_entry_by_name`, aligned with *names*.
+
+        Same resolution rules (case-insensitive exact match first, then
+        escaped LIKE; the first row in table order wins) in at most two
+        queries per 250 names. *columns* limits the returned fields.
+        """
+        select = "e.*" if columns is None else ", ".join(f"e.{c}" for c in columns)
+        results: list[dict | None] = [None] * len(names)
+        for start in range(0, len(names), self._NAME_LOOKUP_CHUNK):
+            chunk = list(enumerate(names[start:start + self._NAME_LOOKUP_CHUNK], start))
+            self._resolve_names(
+                chunk, "LOWER(e.name) = LOWER(w.term)", select, results,
+            )
+            unresolved = [
+                (pos, _name_like_pattern(name))
+                for pos, name in chunk if results[pos] is None
+            ]
+            if unresolved:
+                self._resolve_names(
+                    unresolved, "e.name LIKE w.term ESCAPE '\\'", select, results,
+                )
+        return results
+
+    def _resolve_names(
+        self,
+        terms: list[tuple[int, str]],
+        condition: str,
+        select: str,
+        results: list[dict | None],
+    ) -> None:
+        """Fill ``results[pos]`` with the first entry matching each term."""
+        values = ", ".join(["(?, ?)"] * len(terms))
+        params = [value for pair in terms for value in pair]
+        cur = self._conn.execute(
+            f"WITH w(pos, term) AS (VALUES {values}) "
+            f"SELECT w.pos AS lookup_pos, {select} "
+            f"FROM w JOIN entries e ON {condition} "
+            f"ORDER BY w.pos, e.rowid",
+            params,
+        )
+        for row in cur.fetchall():
+            found = dict(row)
+            pos = found.pop("lookup_pos")
+            if results[pos] is None:
+                results[pos] = found
+
+    def record_influences(
+        self,
+        entry_ids: list[str],
+        agent_role: str,
+        feature_type_id: str | None,
+    ) -> None:
+        """Batched :meth:`record_influence`: every id in one transaction.
+
+        Repeated ids are counted once per occurrence.
+        """
+        if not entry_ids:
+            return
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(
+                "UPDATE entries SET influence_count = influence_count + 1 WHERE id = ?",
+                [(entry_id,) for entry_id in entry_ids],
+            )
+            self._conn.executemany(
+                "INSERT INTO influence_log (entry_id, agent_role, feature_type_id, timestamp) "
+                "VALUES (?, ?, ?, ?)",
+                [(entry_id, agent_role, feature_type_id, now) for entry_id in entry_ids],
+            )
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
+
     def record_influence(
         self,
         entry_id: str,
@@ -724,13 +949,29 @@ class MemoryDatabase:
     ) -> tuple[list[str], object] | None:
         """Return all valid embeddings as ``(ids, matrix)`` or ``None``.
 
-        *matrix* is a ``numpy.ndarray`` of shape ``(n, expected_dims)``
-        with dtype ``float32``.  Entries whose BLOB length does not
-        equal ``expected_dims * 4`` are silently skipped (with a
-        warning on stderr).
+        *matrix* is a read-only ``numpy.ndarray`` of shape
+        ``(n, expected_dims)`` with dtype ``float32``; float16 and int8
+        BLOBs (see ``semantic_memory.quantize``) are dequantised on load.
+        Entries whose BLOB length fits no storage format for
+        ``expected_dims`` are silently skipped (with a warning on stderr).
+
+        Served from an in-process VectorIndex. Writes through this
+        connection update it in place; a commit from any other connection
+        (``PRAGMA data_version`` moved) triggers a full reload.
 
         Returns ``None`` when there are no valid embeddings.
         """
+        index = self.get_vector_index(expected_dims)
+        if index is None:
+            return None
+        return index.snapshot()
+
+    def get_vector_index(self, expected_dims: int = 768) -> VectorIndex | None:
+        """Return the shared embedding index, reloading it if stale.
+
+        ``None`` when numpy is unavailable. Callers must treat the index as
+        read-only; it is only valid until the next write on this database.
+        """
         if not _numpy_available:  # pragma: no cover
             print(
                 "semantic_memory: numpy not available, cannot load embeddings",
@@ -738,45 +979,160 @@ class MemoryDatabase:
             )
             return None
 
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        index = self._vector_index
+        if (
+            index is None
+            or index.dims != expected_dims
+            or self._vector_index_version != version
+        ):
+            index = self._load_vector_index(expected_dims)
+            self._vector_index = index
+            self._vector_index_version = version
+        return index
+
+    def _load_vector_index(self, expected_dims: int) -> VectorIndex:
+        # Rows are decoded straight into the index's preallocated matrix
+        # while the cursor streams, so peak memory stays close to the
+        # final matrix instead of holding every BLOB and vector at once.
+        count = self._conn.execute(
+            "SELECT COUNT(*) FROM entries WHERE embedding IS NOT NULL"
+        ).fetchone()[0]
+        index = VectorIndex(expected_dims, capacity=count + count // 4)
+        storage = self.embedding_storage
+
         cur = self._conn.execute(
             "SELECT id, embedding FROM entries WHERE embedding IS NOT NULL"
         )
-
-        ids: list[str] = []
-        vectors: list[object] = []
-        expected_bytes = expected_dims * 4
-
-        for row in cur.fetchall():
-            blob = row[1]
-            if len(blob) != expected_bytes:
+        for entry_id, blob in cur:
+            vector = decode_embedding(blob, expected_dims, storage)
+            if vector is None:
                 print(
-                    f"semantic_memory: skipping entry {row[0]!r} — "
+                    f"semantic_memory: skipping entry {entry_id!r} — "
                     f"embedding BLOB is {len(blob)} bytes, "
-                    f"expected {expected_bytes}",
+                    f"expected {expected_dims * 4} for {expected_dims} dims",
                     file=sys.stderr,
                 )
                 continue
-            ids.append(row[0])
-            vectors.append(np.frombuffer(blob, dtype=np.float32))
+            index.upsert(entry_id, vector)
 
-        if not ids:
-            return None
+        return index
 
-        matrix = np.stack(vectors)
-        return ids, matrix
+    def _invalidate_vector_index(self) -> None:
+        self._vector_index = None
 
     def update_embedding(self, entry_id: str, embedding: bytes) -> None:
-        """Set the embedding BLOB for a single entry."""
+        """Set the embedding for a single entry from float32 bytes.
+
+        The vector is stored in the store's ``embedding_storage`` format.
+        """
+        storage = self.embedding_storage
+        if storage != "float32":
+            embedding = encode_embedding(
+                np.frombuffer(embedding, dtype=np.float32), storage
+            )
         self._conn.execute(
             "UPDATE entries SET embedding = ? WHERE id = ?",
             (embedding, entry_id),
         )
         self._conn.commit()
+        index = self._vector_index
+        if index is not None:
+            vector = decode_embedding(embedding, index.dims, storage)
+            if vector is not None:
+                index.upsert(entry_id, vector)
+            else:
+                index.remove(entry_id)
+
+    @property
+    def embedding_storage(self) -> str:
+        """Format new embeddings are stored in (``_metadata.embedding_storage``)."""
+        value = self.get_metadata("embedding_storage")
+        if value in EMBEDDING_FORMATS:
+            return value
+        return DEFAULT_EMBEDDING_FORMAT
+
+    def set_embedding_storage(self, fmt: str) -> None:
+        """Store future embeddings as *fmt* (float32, float16 or int8).
+
+        Existing BLOBs are left as they are and stay readable; use
+        ``convert_embeddings`` to rewrite them.
+        """
+        if fmt not in EMBEDDING_FORMATS:
+            raise ValueError(f"unknown embedding format: {fmt!r}")
+        if self.get_metadata("embedding_storage") != fmt:
+            self.set_metadata("embedding_storage", fmt)
+
+    def convert_embeddings(
+        self,
+        fmt: str,
+        expected_dims: int,
+        *,
+        batch_size: int = 500,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> dict:
+        """Rewrite every embedding BLOB in *fmt* and make it the store format.
+
+        Rows are re-encoded in rowid order, *batch_size* per transaction,
+        so the write lock is only held briefly; an interrupted conversion
+        picks up where it stopped when run again (BLOBs already in *fmt*
+        are left alone). BLOBs that fit no format for *expected_dims* are
+        counted as skipped. *progress* is called with ``(done, total)``
+        after each batch.
+        """
+        if fmt not in EMBEDDING_FORMATS:
+            raise ValueError(f"unknown embedding format: {fmt!r}")
+        source = self.embedding_storage
+        self.set_embedding_storage(fmt)
+        total = self._conn.execute(
+            "SELECT COUNT(*) FROM entries WHERE embedding IS NOT NULL"
+        ).fetchone()[0]
+        stats = {"converted": 0, "unchanged": 0, "skipped": 0}
+        done = 0
+        last_rowid = 0
+        while True:
+            rows = self._conn.execute(
+                "SELECT rowid, embedding FROM entries "
+                "WHERE rowid > ? AND embedding IS NOT NULL "
+                "ORDER BY rowid LIMIT ?",
+                (last_rowid, batch_size),
+            ).fetchall()
+            if not rows:
+                break
+            updates = []
+            for rowid, blob in rows:
+                current = blob_format(blob, expected_dims, source)
+                if current is None:
+                    stats["skipped"] += 1
+                elif current == fmt:
+                    stats["unchanged"] += 1
+                else:
+                    vector = decode_embedding(blob, expected_dims, current)
+                    updates.append((encode_embedding(vector, fmt), rowid))
+            if updates:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.executemany(
+                        "UPDATE entries SET embedding = ? WHERE rowid = ?",
+                        updates,
+                    )
+                    self._conn.commit()
+                except Exception:
+                    self._conn.rollback()
+                    raise
+                stats["converted"] += len(updates)
+            done += len(rows)
+            last_rowid = rows[-1][0]
+            if progress is not None:
+                progress(done, total)
+        self._invalidate_vector_index()
+        return stats
 
     def clear_all_embeddings(self) -> None:
         """Set the embedding column to NULL for every entry."""
         self._conn.execute("UPDATE entries SET embedding = NULL")
         self._conn.commit()
+        self._invalidate_vector_index()
 
     def get_entries_without_embedding(
         self, limit: int = 50
@@ -949,6 +1305,7 @@ class MemoryDatabase:
         commit, rollback then re-raise so the connection is not left mid-txn.
         """
         _assert_testing_context()
+        self._invalidate_vector_index()
         try:
             self._conn.execute(sql, params)
             self._conn.commit()
@@ -1018,6 +1375,64 @@ class MemoryDatabase:
         for row in cursor:
             yield row
 
+    def scan_decay_batch(
+        self,
+        *,
+        recalled: bool,
+        not_null_cutoff: str,
+        after: tuple[str, str] | None = None,
+        limit: int,
+    ) -> list[sqlite3.Row]:
+        """Return the next keyset page of decay candidates from one branch.
+
+        ``recalled=True`` walks rows with ``last_recalled_at < not_null_cutoff``
+        in ``(last_recalled_at, id)`` order; ``recalled=False`` walks
+        never-recalled rows in ``(created_at, id)`` order.  Both are served
+        by the partial indexes from migration 6.  ``after`` is the key of
+        the last row of the previous page.  Rows have the same shape as
+        ``scan_decay_candidates``.
+        """
+        if not _ISO8601_Z_PATTERN.fullmatch(not_null_cutoff):
+            raise ValueError(
+                f"not_null_cutoff must be Z-suffix ISO-8601, got {not_null_cutoff!r:.80}"
+            )
+        if limit <= 0:
+            return []
+        if recalled:
+            key = "last_recalled_at"
+            where = "last_recalled_at IS NOT NULL AND last_recalled_at < ?"
+            params: list = [not_null_cutoff]
+        else:
+            key = "created_at"
+            where = "last_recalled_at IS NULL"
+            params = []
+        if after is not None:
+            where += f" AND ({key}, id) > (?, ?)"
+            params.extend(after)
+        params.append(limit)
+        return self._conn.execute(
+            "SELECT id, confidence, source, last_recalled_at, created_at "
+            f"FROM entries WHERE {where} ORDER BY {key}, id LIMIT ?",
+            params,
+        ).fetchall()
+
+    def earliest_recall_since(self, cutoff: str) -> str | None:
+        """Return the smallest ``last_recalled_at`` that is ``>= cutoff``."""
+        row = self._conn.execute(
+            "SELECT MIN(last_recalled_at) FROM entries "
+            "WHERE last_recalled_at IS NOT NULL AND last_recalled_at >= ?",
+            (cutoff,),
+        ).fetchone()
+        return row[0]
+
+    def decay_generation(self) -> int:
+        """Counter bumped by triggers whenever decay inputs change."""
+        return int(self.get_metadata("decay_generation") or 0)
+
+    def content_generation(self) -> int:
+        """Counter bumped by triggers on every change to ``entries``."""
+        return int(self.get_metadata("content_generation") or 0)
+
     def batch_demote(
         self,
         ids: list[str],
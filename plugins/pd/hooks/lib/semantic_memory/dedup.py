@@ -2,7 +2,8 @@
 
 Compares a new entry's embedding vector against all existing entries
 using cosine similarity (matmul on pre-normalized vectors). Returns a
-DedupResult indicating whether the entry is a near-duplicate.
+DedupResult indicating whether the entry is a near-duplicate, or the raw
+top-k matches so one pass can serve several thresholds.
 """
 from __future__ import annotations
 
@@ -29,42 +30,69 @@ class DedupResult:
     similarity: float
 
 
-def check_duplicate(
+def nearest_entries(
     embedding_vec: "np.ndarray",
     db: "MemoryDatabase",
-    threshold: float = 0.90,
-) -> DedupResult:
-    """Check if a new entry (by its pre-computed embedding) is a near-duplicate.
+    k: int = 1,
+) -> list[tuple[str, float]]:
+    """Return the *k* most similar existing entries as ``(id, similarity)``.
 
-    Compares embedding_vec against all existing entries via matmul on
-    normalized vectors. Uses db.get_all_embeddings() which returns
-    (ids: list[str], matrix: np.ndarray). Match lookup: ids[np.argmax(scores)].
-
-    Self-matching is not possible -- the new entry hasn't been inserted yet.
+    One matmul over the database's cached embedding matrix
+    (``db.get_all_embeddings``), so callers applying several thresholds
+    (near-duplicate rejection, dedup merge) share a single pass.
 
-    Graceful degradation: returns DedupResult(is_duplicate=False, None, 0.0)
-    if numpy is unavailable, no entries exist, or any error occurs.
+    Graceful degradation: returns ``[]`` if numpy is unavailable, no
+    entries exist, or any error occurs.
     """
     try:
         if not _numpy_available:  # pragma: no cover
-            return DedupResult(False, None, 0.0)
+            return []
 
-        result = db.get_all_embeddings()
+        result = db.get_all_embeddings(expected_dims=len(embedding_vec))
         if result is None:
-            return DedupResult(False, None, 0.0)
+            return []
 
         ids, matrix = result
 
-        if len(ids) == 0:
-            return DedupResult(False, None, 0.0)
+        if len(ids) == 0 or k <= 0:
+            return []
 
         scores = matrix @ embedding_vec
-        best_idx = np.argmax(scores)
-
-        if scores[best_idx] > threshold:
-            return DedupResult(True, ids[best_idx], float(scores[best_idx]))
-        else:
-            return DedupResult(False, None, float(scores[best_idx]))
+        if k == 1:
+            best_idx = int(np.argmax(scores))
+            return [(ids[best_idx], float(scores[best_idx]))]
+        order = np.argsort(-scores)[:k]
+        return [(ids[i], float(scores[i])) for i in order]
 
     except Exception:
+        return []
+
+
+def dedup_result(
+    matches: list[tuple[str, float]], threshold: float,
+) -> DedupResult:
+    """Apply *threshold* to the best of *matches* (from nearest_entries)."""
+    if not matches:
         return DedupResult(False, None, 0.0)
+    best_id, best_score = matches[0]
+    if best_score > threshold:
+        return DedupResult(True, best_id, best_score)
+    return DedupResult(False, None, best_score)
+
+
+def check_duplicate(
+    embedding_vec: "np.ndarray",
+    db: "MemoryDatabase",
+    threshold: float = 0.90,
+) -> DedupResult:
+    """Check if a new entry (by its pre-computed embedding) is a near-duplicate.
+
+    Compares embedding_vec against all existing entries via matmul on
+    normalized vectors (see nearest_entries).
+
+    Self-matching is not possible -- the new entry hasn't been inserted yet.
+
+    Graceful degradation: returns DedupResult(is_duplicate=False, None, 0.0)
+    if numpy is unavailable, no entries exist, or any error occurs.
+    """
+    return dedup_result(nearest_entries(embedding_vec, db, k=1), threshold)
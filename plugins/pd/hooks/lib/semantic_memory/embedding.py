@@ -4,7 +4,9 @@ Defines the EmbeddingProvider protocol and concrete implementations.
 """
 from __future__ import annotations
 
+import hashlib
 import os
+import re
 import sys
 from typing import Protocol, runtime_checkable
 
@@ -283,6 +285,178 @@ class GeminiProvider:
             raise EmbeddingError(f"Gemini batch embedding failed: {e}") from e
 
 
+class LocalProvider:
+    """Offline embedding provider using feature hashing in numpy.
+
+    Each text becomes a bag of lower-cased word unigrams, word bigrams and
+    character trigrams of each word; every feature is hashed (blake2b, so
+    stable across processes) to a signed bucket of a ``dimensions``-wide
+    vector and counts are log-damped. There is no model to download and no
+    network call, so embedding throughput is bounded by CPU. Similarity is
+    lexical/morphological rather than semantic; the vectors are not
+    comparable with any other provider's.
+
+    Parameters
+    ----------
+    model:
+        Model identifier reported by :attr:`model_name`.
+    dimensions:
+        Output dimensionality of embedding vectors.
+    """
+
+    DEFAULT_MODEL = "hash-ngram-v1"
+    TASK_TYPES = ("document", "query")
+
+    _TOKEN_RE = re.compile(r"[a-z0-9]+")
+    _UNIGRAM_WEIGHT = 1.0
+    _BIGRAM_WEIGHT = 0.5
+    _TRIGRAM_WEIGHT = 0.25
+    # Bound on cached per-word / per-bigram features; the cache is simply
+    # cleared when it fills up.
+    _CACHE_LIMIT = 100_000
+
+    def __init__(self, model: str = DEFAULT_MODEL, dimensions: int = 768) -> None:
+        if np is None:
+            raise RuntimeError("numpy is required for LocalProvider")
+        self._model = model
+        self._dimensions = dimensions
+        self._cache: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+    @property
+    def dimensions(self) -> int:
+        """Number of dimensions in the embedding vectors."""
+        return self._dimensions
+
+    @property
+    def provider_name(self) -> str:
+        """Short identifier for the provider."""
+        return "local"
+
+    @property
+    def model_name(self) -> str:
+        """Name of the embedding model being used."""
+        return self._model
+
+    def _bucket(self, feature: str) -> tuple[int, float]:
+        digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        return value % self._dimensions, 1.0 if value >> 63 else -1.0
+
+    def _hashed(self, key: str, features: list[tuple[str, float]]) -> tuple[np.ndarray, np.ndarray]:
+        """Return cached ``(columns, signed weights)`` for *key*'s features."""
+        cached = self._cache.get(key)
+        if cached is None:
+            cols = np.empty(len(features), dtype=np.intp)
+            vals = np.empty(len(features), dtype=np.float32)
+            for i, (feature, weight) in enumerate(features):
+                col, sign = self._bucket(feature)
+                cols[i] = col
+                vals[i] = sign * weight
+            if len(self._cache) >= self._CACHE_LIMIT:
+                self._cache.clear()
+            cached = self._cache[key] = (cols, vals)
+        return cached
+
+    def _word_features(self, word: str) -> tuple[np.ndarray, np.ndarray]:
+        key = "w:" + word
+        if key in self._cache:
+            return self._cache[key]
+        padded = f"#{word}#"
+        features = [(key, self._UNIGRAM_WEIGHT)] + [
+            ("c:" + padded[i:i + 3], self._TRIGRAM_WEIGHT)
+            for i in range(len(padded) - 2)
+        ]
+        return self._hashed(key, features)
+
+    def _bigram_features(self, first: str, second: str) -> tuple[np.ndarray, np.ndarray]:
+        key = f"b:{first} {second}"
+        return self._hashed(key, [(key, self._BIGRAM_WEIGHT)])
+
+    def _check_task_type(self, task_type: str) -> None:
+        if task_type not in self.TASK_TYPES:
+            raise EmbeddingError(
+                f"Unknown task_type {task_type!r}. "
+                f"Valid types: {list(self.TASK_TYPES)}"
+            )
+
+    def embed(self, text: str, task_type: str = "query") -> np.ndarray:
+        """Generate an embedding vector for a single text.
+
+        Parameters
+        ----------
+        text:
+            The text to embed.
+        task_type:
+            Either ``"query"`` or ``"document"`` (both embed identically).
+
+        Returns
+        -------
+        numpy.ndarray
+            A float32 vector of length :attr:`dimensions`.
+
+        Raises
+        ------
+        EmbeddingError
+            If the task_type is invalid.
+        """
+        return self.embed_batch([text], task_type)[0]
+
+    def embed_batch(
+        self, texts: list[str], task_type: str = "document"
+    ) -> list[np.ndarray]:
+        """Generate embedding vectors for multiple texts.
+
+        Features for the whole batch are summed into one
+        ``(len(texts), dimensions)`` matrix with a single ``np.bincount``.
+
+        Parameters
+        ----------
+        texts:
+            List of texts to embed.
+        task_type:
+            Either ``"query"`` or ``"document"`` (both embed identically).
+
+        Returns
+        -------
+        list[numpy.ndarray]
+            A list of float32 vectors, one per input text. A text with no
+            alphanumeric tokens yields a zero vector.
+
+        Raises
+        ------
+        EmbeddingError
+            If the task_type is invalid.
+        """
+        self._check_task_type(task_type)
+        counts = np.zeros(len(texts), dtype=np.intp)
+        cols: list[np.ndarray] = []
+        vals: list[np.ndarray] = []
+        for row, text in enumerate(texts):
+            words = self._TOKEN_RE.findall(text.lower())
+            parts = [self._word_features(w) for w in words]
+            parts.extend(
+                self._bigram_features(a, b) for a, b in zip(words, words[1:])
+            )
+            for part_cols, part_vals in parts:
+                cols.append(part_cols)
+                vals.append(part_vals)
+                counts[row] += len(part_cols)
+
+        size = len(texts) * self._dimensions
+        if vals:
+            flat = (
+                np.repeat(np.arange(len(texts), dtype=np.intp), counts)
+                * self._dimensions
+                + np.concatenate(cols)
+            )
+            sums = np.bincount(flat, weights=np.concatenate(vals), minlength=size)
+            matrix = sums.astype(np.float32).reshape(len(texts), self._dimensions)
+            np.copysign(np.log1p(np.abs(matrix)), matrix, out=matrix)
+        else:
+            matrix = np.zeros((len(texts), self._dimensions), dtype=np.float32)
+        return list(matrix)
+
+
 class NormalizingWrapper:
     """Wrapper that L2-normalizes vectors from any EmbeddingProvider.
 
@@ -378,10 +552,13 @@ class NormalizingWrapper:
 
 
 def create_provider(config: dict) -> EmbeddingProvider | None:
-    """Create a Gemini embedding provider from configuration.
+    """Create an embedding provider from configuration.
 
-    Returns None if: numpy unavailable, provider not 'gemini',
-    GEMINI_API_KEY not set, or construction fails.
+    ``memory_embedding_provider`` selects ``gemini`` (needs
+    GEMINI_API_KEY) or ``local`` (offline :class:`LocalProvider`;
+    ``memory_embedding_model`` is ignored). Returns None if: numpy
+    unavailable, provider unknown, GEMINI_API_KEY not set for gemini, or
+    construction fails.
 
     Parameters
     ----------
@@ -396,8 +573,10 @@ def create_provider(config: dict) -> EmbeddingProvider | None:
     """
     if np is None:
         return None
-    _load_dotenv_once()
     provider_name = config.get("memory_embedding_provider", "")
+    if provider_name == "local":
+        return NormalizingWrapper(LocalProvider())
+    _load_dotenv_once()
     if provider_name != "gemini":
         return None
     api_key = os.environ.get("GEMINI_API_KEY")
@@ -4,8 +4,9 @@ Implements the ``decay_confidence`` public function plus private helpers for
 per-tier demotion of stale memory entries per spec FR-1 / FR-2 / FR-5.
 
 Entry points:
-- ``decay_confidence(db, config, *, now=None)`` — programmatic API used by
-  session-start (via ``_main``) and by tests directly.
+- ``decay_confidence(db, config, *, now=None, incremental=False)`` —
+  programmatic API used by session-start (via ``_main``, incrementally)
+  and by tests directly.
 - ``_main()`` — CLI entry exposed as ``python -m semantic_memory.maintenance``.
 
 Module-level state is per-process (matches refresh.py / memory_server.py
@@ -334,6 +335,267 @@ def _partition_candidates(
     }
 
 
+# Keys in ``_metadata`` owned by the incremental decay pass.  The
+# ``decay_generation`` counter they are checked against is maintained by
+# the entries triggers from memory schema migration 6.
+_DECAY_STATE_KEY = "decay_scan_state"
+_DECAY_WATERMARK_KEY = "decay_watermark"
+
+# Rows fetched (and demoted) per keyset page; bounds memory and the length
+# of each demotion transaction independently of ``scan_limit``.
+_DECAY_BATCH_SIZE = 1000
+
+
+def _parse_ts(value: str | None) -> datetime | None:
+    """Parse a stored ISO-8601 timestamp as aware UTC; None when unparseable."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _eligible_at(
+    row,
+    confidence: str,
+    *,
+    high_days: int,
+    med_days: int,
+    grace_days: int,
+    now: datetime,
+) -> datetime | None:
+    """Earliest time ``row`` at tier ``confidence`` can next be demoted.
+
+    None means never (floor tier or import source) until the row itself
+    changes, which bumps the decay generation.  Unparseable timestamps
+    report ``now`` so they can never postpone a sweep.
+    """
+    if row["source"] == "import" or confidence == "low":
+        return None
+    tier_days = high_days if confidence == "high" else med_days
+    if row["last_recalled_at"] is not None:
+        base = _parse_ts(row["last_recalled_at"])
+        wait = tier_days
+    else:
+        base = _parse_ts(row["created_at"])
+        wait = max(tier_days, grace_days)
+    if base is None:
+        return now
+    try:
+        return base + timedelta(days=wait)
+    except OverflowError:
+        return None
+
+
+def _min_ts(a: datetime | None, b: datetime | None) -> datetime | None:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a, b)
+
+
+def _load_json_metadata(db: MemoryDatabase, key: str) -> dict | None:
+    raw = db.get_metadata(key)
+    if raw is None:
+        return None
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def _watermark_holds(
+    db: MemoryDatabase, thresholds: list[int], now: datetime,
+) -> bool:
+    """True when the last complete pass proved nothing can decay before now."""
+    mark = _load_json_metadata(db, _DECAY_WATERMARK_KEY)
+    if (
+        mark is None
+        or mark.get("thresholds") != thresholds
+        or mark.get("generation") != db.decay_generation()
+    ):
+        return False
+    if mark.get("at") is None:
+        return True
+    at = _parse_ts(mark["at"])
+    return at is not None and now < at
+
+
+def _iter_decay_batches(
+    db: MemoryDatabase,
+    state: dict,
+    not_null_cutoff: str,
+    scan_limit: int,
+):
+    """Yield keyset pages of candidates, advancing ``state`` in place.
+
+    Walks the recalled branch, then the never-recalled branch, resuming at
+    ``state["branch"]`` / ``state["after"]``.  Sets ``state["complete"]``
+    once both branches are exhausted within ``scan_limit`` rows.
+    """
+    remaining = scan_limit
+    while remaining > 0:
+        recalled = state["branch"] == "recalled"
+        after = tuple(state["after"]) if state["after"] else None
+        want = min(_DECAY_BATCH_SIZE, remaining)
+        rows = db.scan_decay_batch(
+            recalled=recalled,
+            not_null_cutoff=not_null_cutoff,
+            after=after,
+            limit=want,
+        )
+        remaining -= len(rows)
+        if rows:
+            last = rows[-1]
+            key = last["last_recalled_at"] if recalled else last["created_at"]
+            state["after"] = [key, last["id"]]
+            yield rows
+        if len(rows) < want:
+            if not recalled:
+                state["complete"] = True
+                return
+            state["branch"] = "never"
+            state["after"] = None
+
+
+def _decay_incremental(
+    db: MemoryDatabase,
+    *,
+    now: datetime,
+    high_days: int,
+    med_days: int,
+    grace_days: int,
+    high_cutoff: str,
+    med_cutoff: str,
+    grace_cutoff: str,
+    now_iso: str,
+    scan_limit: int,
+    dry_run: bool,
+) -> dict:
+    """Resume the keyset decay pass for up to ``scan_limit`` rows.
+
+    Progress (cursor plus the earliest future eligibility seen so far) is
+    kept in ``_metadata[decay_scan_state]``.  When a pass covers the whole
+    table without the decay generation moving underneath it, the earliest
+    eligibility becomes ``_metadata[decay_watermark]`` and later runs
+    before that instant skip the scan entirely.  Dry runs read the same
+    cursor but never persist progress.
+    """
+    thresholds = [high_days, med_days, grace_days]
+    diag = {
+        **_zero_diag(dry_run=dry_run),
+        "sweep_skipped": False,
+        "pass_complete": False,
+    }
+    if _watermark_holds(db, thresholds, now):
+        diag["sweep_skipped"] = True
+        return diag
+
+    generation = db.decay_generation()
+    state = _load_json_metadata(db, _DECAY_STATE_KEY)
+    if state is None or state.get("thresholds") != thresholds:
+        state = {
+            "thresholds": thresholds,
+            "branch": "recalled",
+            "after": None,
+            "next_at": None,
+            "generation": generation,
+            "stale": False,
+        }
+    elif state.get("generation") != generation:
+        # Rows changed since the previous batch; keep scanning forward but
+        # do not trust this pass's eligibility floor for a watermark.
+        state["stale"] = True
+    state["complete"] = False
+
+    next_at = _parse_ts(state.get("next_at"))
+    not_null_cutoff = max(high_cutoff, med_cutoff)
+    eligible = functools.partial(
+        _eligible_at,
+        high_days=high_days, med_days=med_days, grace_days=grace_days, now=now,
+    )
+
+    for rows in _iter_decay_batches(db, state, not_null_cutoff, scan_limit):
+        candidates = _partition_candidates(
+            rows,
+            high_cutoff=high_cutoff,
+            med_cutoff=med_cutoff,
+            grace_cutoff=grace_cutoff,
+        )
+        diag["scanned"] += candidates["scanned_total"]
+        diag["skipped_floor"] += candidates["floor_count"]
+        diag["skipped_import"] += candidates["import_count"]
+        diag["skipped_grace"] += candidates["grace_count"]
+
+        if dry_run:
+            diag["demoted_high_to_medium"] += len(candidates["high_ids"])
+            diag["demoted_medium_to_low"] += len(candidates["medium_ids"])
+            continue
+
+        before = db.decay_generation()
+        to_medium = db.batch_demote(candidates["high_ids"], "medium", now_iso)
+        to_low = db.batch_demote(candidates["medium_ids"], "low", now_iso)
+        diag["demoted_high_to_medium"] += to_medium
+        diag["demoted_medium_to_low"] += to_low
+        after = db.decay_generation()
+        # Our own demotions bump the generation once per row.  Anything
+        # else (a concurrent writer, rows skipped by the updated_at guard)
+        # means the eligibility computed below may be wrong.
+        if (
+            to_medium != len(candidates["high_ids"])
+            or to_low != len(candidates["medium_ids"])
+            or after != before + to_medium + to_low
+        ):
+            state["stale"] = True
+        state["generation"] = after
+
+        new_tier = {entry_id: "medium" for entry_id in candidates["high_ids"]}
+        new_tier.update(
+            {entry_id: "low" for entry_id in candidates["medium_ids"]}
+        )
+        for row in rows:
+            tier = new_tier.get(row["id"], row["confidence"])
+            next_at = _min_ts(next_at, eligible(row, tier))
+
+    if dry_run:
+        return diag
+
+    if state["complete"]:
+        # Recalled rows newer than the cutoff were never fetched; the
+        # earliest of them bounds when any of them can become stale.
+        fresh = _parse_ts(db.earliest_recall_since(not_null_cutoff))
+        if fresh is not None:
+            next_at = _min_ts(
+                next_at, fresh + timedelta(days=min(high_days, med_days))
+            )
+        if not state["stale"]:
+            db.set_metadata(_DECAY_WATERMARK_KEY, json.dumps({
+                "at": _iso_utc(next_at) if next_at is not None else None,
+                "generation": state["generation"],
+                "thresholds": thresholds,
+            }))
+        state = {
+            "thresholds": thresholds,
+            "branch": "recalled",
+            "after": None,
+            "next_at": None,
+            "generation": state["generation"],
+            "stale": False,
+        }
+        diag["pass_complete"] = True
+    else:
+        state["next_at"] = _iso_utc(next_at) if next_at is not None else None
+        state.pop("complete", None)
+    db.set_metadata(_DECAY_STATE_KEY, json.dumps(state))
+    return diag
+
+
 def _zero_diag(*, dry_run: bool) -> dict:
     """Build a zero-valued diagnostic dict for the disabled / no-op paths.
 
@@ -358,6 +620,7 @@ def decay_confidence(
     config: dict,
     *,
     now: datetime | None = None,
+    incremental: bool = False,
 ) -> dict:
     """Demote confidence one tier for entries unobserved past thresholds.
 
@@ -366,6 +629,12 @@ def decay_confidence(
     DB / IO errors — returns a diagnostic dict with ``"error"`` key appended
     on sqlite3.Error.  TypeError on non-datetime ``now`` IS propagated
     (caller bug per spec FR-8).
+
+    ``incremental=True`` (the session-start CLI default) resumes the
+    index-backed keyset pass instead of sweeping from the start, and skips
+    the scan while the ``_metadata`` "next eligible at" watermark holds;
+    see ``_decay_incremental``.  The diag then also carries
+    ``sweep_skipped`` and ``pass_complete``.
     """
     t0 = time.perf_counter()
 
@@ -462,6 +731,25 @@ def decay_confidence(
     )
 
     try:
+        if incremental:
+            diag = _decay_incremental(
+                db,
+                now=now,
+                high_days=high_days,
+                med_days=med_days,
+                grace_days=grace_days,
+                high_cutoff=high_cutoff,
+                med_cutoff=med_cutoff,
+                grace_cutoff=grace_cutoff,
+                now_iso=now_iso,
+                scan_limit=scan_limit,
+                dry_run=dry_run,
+            )
+            diag["elapsed_ms"] = int((time.perf_counter() - t0) * 1000)
+            if config.get("memory_influence_debug", False):
+                _emit_decay_diagnostic(diag)
+            return diag
+
         rows = list(_select_candidates(
             db, high_cutoff, med_cutoff, grace_cutoff, scan_limit=scan_limit,
         ))
@@ -551,6 +839,11 @@ def _main() -> None:
         action="store_true",
         help="Force dry-run (overrides memory_decay_dry_run config)",
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Sweep every entry now, ignoring the incremental cursor/watermark",
+    )
     args = parser.parse_args()
 
     if not args.decay:
@@ -604,7 +897,7 @@ def _main() -> None:
     db = MemoryDatabase(db_path)
 
     try:
-        diag = decay_confidence(db, config)
+        diag = decay_confidence(db, config, incremental=not args.full)
         summary = _build_summary_line(diag)
         if summary:
             print(summary)
@@ -0,0 +1,99 @@
+"""Storage formats for embedding BLOBs.
+
+Embeddings arrive from providers as float32 vectors. A memory store can
+keep them as raw float32 (4 bytes per dimension), float16 (2 bytes), or
+int8 with a per-vector float32 scale (1 byte + 4 bytes per vector). The
+store-wide format lives in ``_metadata.embedding_storage`` and applies to
+new writes; readers recognise every format by BLOB length, so a store
+that is part-way through a conversion stays readable.
+
+Decoded vectors are always float32, so the in-process VectorIndex and
+everything downstream of ``get_all_embeddings`` is unchanged.
+"""
+from __future__ import annotations
+
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+EMBEDDING_FORMATS = ("float32", "float16", "int8")
+DEFAULT_EMBEDDING_FORMAT = "float32"
+
+_INT8_MAX = 127
+
+
+def embedding_nbytes(dims: int, fmt: str) -> int:
+    """BLOB size of a *dims*-dimensional embedding stored as *fmt*."""
+    if fmt == "float32":
+        return dims * 4
+    if fmt == "float16":
+        return dims * 2
+    if fmt == "int8":
+        return dims + 4
+    raise ValueError(f"unknown embedding format: {fmt!r}")
+
+
+def encode_embedding(vector: np.ndarray, fmt: str) -> bytes:
+    """Serialise a float vector as an embedding BLOB in *fmt*."""
+    vec = np.asarray(vector, dtype=np.float32).ravel()
+    if fmt == "float32":
+        return vec.tobytes()
+    if fmt == "float16":
+        return vec.astype(np.float16).tobytes()
+    if fmt == "int8":
+        peak = float(np.max(np.abs(vec))) if vec.size else 0.0
+        scale = peak / _INT8_MAX if peak > 0 else 0.0
+        if scale:
+            quantised = np.clip(np.rint(vec / scale), -_INT8_MAX, _INT8_MAX)
+        else:
+            quantised = np.zeros_like(vec)
+        return (
+            np.float32(scale).tobytes() + quantised.astype(np.int8).tobytes()
+        )
+    raise ValueError(f"unknown embedding format: {fmt!r}")
+
+
+def blob_format(blob: bytes, dims: int, preferred: str = DEFAULT_EMBEDDING_FORMAT) -> str | None:
+    """Return the format a BLOB of this length holds, or None if none fits.
+
+    Lengths are distinct for every *dims* except 4 (float16 and int8 are
+    both 8 bytes); *preferred*, normally the store's format, wins ties.
+    """
+    size = len(blob)
+    if size == embedding_nbytes(dims, preferred):
+        return preferred
+    for fmt in EMBEDDING_FORMATS:
+        if size == embedding_nbytes(dims, fmt):
+            return fmt
+    return None
+
+
+def decode_embedding(
+    blob: bytes, dims: int, preferred: str = DEFAULT_EMBEDDING_FORMAT
+) -> np.ndarray | None:
+    """Return the float32 vector stored in *blob*, or None on a size mismatch."""
+    fmt = blob_format(blob, dims, preferred)
+    if fmt == "float32":
+        return np.frombuffer(blob, dtype=np.float32)
+    if fmt == "float16":
+        return np.frombuffer(blob, dtype=np.float16).astype(np.float32)
+    if fmt == "int8":
+        scale = np.frombuffer(blob, dtype=np.float32, count=1)[0]
+        return np.frombuffer(blob, dtype=np.int8, offset=4).astype(np.float32) * scale
+    return None
+
+
+def resolve_storage_format(config: dict, *, prefix: str = "[memory]") -> str:
+    """Read ``memory_embedding_storage`` from config, defaulting bad values."""
+    value = config.get("memory_embedding_storage", DEFAULT_EMBEDDING_FORMAT)
+    if value in EMBEDDING_FORMATS:
+        return value
+    print(
+        f"{prefix} memory_embedding_storage={value!r} is not one of "
+        f"{', '.join(EMBEDDING_FORMATS)}; using {DEFAULT_EMBEDDING_FORMAT}",
+        file=sys.stderr,
+    )
+    return DEFAULT_EMBEDDING_FORMAT
@@ -0,0 +1,150 @@
+"""Benchmark for embedding storage formats.
+
+Fills one memory database per format with the same ``--entries`` synthetic
+embeddings (clustered, unit-normalised, ``--dims`` wide) and, per format,
+reports the BLOB bytes on disk, the time and peak Python memory of loading
+the vector index from a fresh connection, query latency, and recall@k of
+the top-``--k`` results against exact float32 search.
+
+Usage (from plugins/pd, with hooks/lib on PYTHONPATH):
+    python -m semantic_memory.quantize_bench --entries 20000 --dims 768
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from semantic_memory.database import MemoryDatabase
+from semantic_memory.quantize import EMBEDDING_FORMATS, encode_embedding
+
+
+def synthetic_embeddings(
+    entries: int, dims: int, *, clusters: int = 64, seed: int = 0
+) -> np.ndarray:
+    """Unit vectors scattered around ``clusters`` random centres."""
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, dims)).astype(np.float32)
+    assignment = rng.integers(0, clusters, size=entries)
+    vectors = centres[assignment] + 0.6 * rng.standard_normal(
+        (entries, dims)
+    ).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def _fill(db_path: str, vectors: np.ndarray, fmt: str) -> None:
+    db = MemoryDatabase(db_path)
+    try:
+        db.set_embedding_storage(fmt)
+        rows = [
+            (
+                f"e{i:07d}", f"entry {i}", f"description {i}", "patterns",
+                "[]", "manual", "bench", f"{i:016x}",
+                "2026-01-01T00:00:00Z", "2026-01-01T00:00:00Z",
+                encode_embedding(vec, fmt),
+            )
+            for i, vec in enumerate(vectors)
+        ]
+        db._conn.executemany(
+            "INSERT INTO entries (id, name, description, category, keywords, "
+            "source, source_project, source_hash, created_at, updated_at, "
+            "embedding) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        db._conn.commit()
+    finally:
+        db.close()
+
+
+def _recall(expected: list[list[int]], actual: list[list[int]]) -> float:
+    hits = sum(len(set(e) & set(a)) for e, a in zip(expected, actual))
+    return hits / sum(len(e) for e in expected)
+
+
+def run_bench(
+    workdir: str, *, entries: int, dims: int, queries: int = 200, k: int = 10
+) -> dict:
+    """Benchmark every storage format on one synthetic corpus."""
+    vectors = synthetic_embeddings(entries, dims)
+    rng = np.random.default_rng(1)
+    picks = rng.integers(0, entries, size=queries)
+    query_matrix = vectors[picks] + 0.3 * rng.standard_normal(
+        (queries, dims)
+    ).astype(np.float32)
+    query_matrix /= np.linalg.norm(query_matrix, axis=1, keepdims=True)
+
+    ids = [f"e{i:07d}" for i in range(entries)]
+    exact = [
+        [ids[j] for j in np.argsort(-(vectors @ q))[:k]] for q in query_matrix
+    ]
+
+    report: dict = {"entries": entries, "dims": dims, "queries": queries, "k": k}
+    for fmt in EMBEDDING_FORMATS:
+        db_path = os.path.join(workdir, f"{fmt}.db")
+        _fill(db_path, vectors, fmt)
+
+        db = MemoryDatabase(db_path)
+        try:
+            blob_bytes = db._conn.execute(
+                "SELECT SUM(length(embedding)) FROM entries"
+            ).fetchone()[0]
+            tracemalloc.start()
+            start = time.perf_counter()
+            index = db.get_vector_index(dims)
+            load_s = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            latencies = []
+            results = []
+            for q in query_matrix:
+                start = time.perf_counter()
+                top = index.top_k(q, k)
+                latencies.append((time.perf_counter() - start) * 1000)
+                results.append([entry_id for entry_id, _ in top])
+            matrix_bytes = index.snapshot()[1].nbytes
+        finally:
+            db.close()
+
+        report[fmt] = {
+            "blob_bytes": blob_bytes,
+            "db_file_bytes": os.path.getsize(db_path),
+            "load_s": round(load_s, 3),
+            "load_peak_bytes": peak,
+            "index_matrix_bytes": matrix_bytes,
+            "query_p50_ms": round(statistics.median(latencies), 3),
+            f"recall_at_{k}": round(_recall(exact, results), 4),
+        }
+    return report
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(description="Embedding storage format benchmark")
+    parser.add_argument("--entries", type=int, default=20_000)
+    parser.add_argument("--dims", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parsed = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory(prefix="pd-quantize-bench-") as tmp:
+        start = time.perf_counter()
+        report = run_bench(
+            tmp, entries=parsed.entries, dims=parsed.dims,
+            queries=parsed.queries, k=parsed.k,
+        )
+        print(f"bench ran in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
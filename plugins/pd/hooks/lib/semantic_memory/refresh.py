@@ -25,6 +25,12 @@ Phase 1 internals:
 
 Phase 3 will add ``refresh_memory_digest`` as the public entry that combines
 the helpers here.
+
+Prefetch (keeps ``complete_phase`` off the retrieval path):
+- ``RefreshDigestCache`` — digests keyed by query + limit, valid while the
+  memory store's ``content_generation`` is unchanged.
+- ``prefetch_refresh_digest`` — compute one digest into the cache.
+- ``RefreshPrefetcher`` — daemon thread that keeps wanted digests warm.
 """
 from __future__ import annotations
 
@@ -33,7 +39,10 @@ import json
 import os
 import re
 import sys
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -96,6 +105,9 @@ _slow_refresh_warned: bool = False
 # One-shot flag: warn once per process if diagnostic log write fails.
 _refresh_error_warned: bool = False
 
+# One-shot flag: warn once per process if a background prefetch fails.
+_prefetch_error_warned: bool = False
+
 
 def reset_warning_state() -> None:
     """Clear all module-level dedup flags (Feature 089 FR-3.6 / AC-16 — #00155).
@@ -108,10 +120,11 @@ def reset_warning_state() -> None:
 
     Side-effect-only; returns ``None``.  Safe to call repeatedly.
     """
-    global _slow_refresh_warned, _refresh_error_warned
+    global _slow_refresh_warned, _refresh_error_warned, _prefetch_error_warned
     _refresh_warned_fields.clear()
     _slow_refresh_warned = False
     _refresh_error_warned = False
+    _prefetch_error_warned = False
 
 
 # ---------------------------------------------------------------------------
@@ -362,19 +375,8 @@ def refresh_memory_digest(
             _refresh_error_warned = True
         return None
 
-    # Post-filter: medium/high confidence only (spec FR-3 step 2).
-    filtered = [
-        e for e in ranked
-        if e.get("confidence") in ("medium", "high")
-    ]
-
-    # Truncate to requested limit (spec FR-3 step 4).
-    truncated = filtered[:limit]
-
-    # Serialize to {name, category, description} with byte cap.
-    entries = _serialize_entries(truncated)
-
-    if not entries:
+    digest = _digest_from_ranked(ranked, query, limit)
+    if digest is None:
         return None
 
     # Latency observation (spec FR-7) — observability-only, not pre-emption.
@@ -395,10 +397,31 @@ def refresh_memory_digest(
             feature_type_id=feature_type_id or "",
             completed_phase=completed_phase or "",
             query=query,
-            entry_count=len(entries),
+            entry_count=digest["count"],
             elapsed_ms=elapsed_ms,
         )
 
+    return digest
+
+
+def _digest_from_ranked(
+    ranked: list[dict], query: str, limit: int
+) -> dict | None:
+    """Filter, truncate and serialize ranked entries into a digest dict."""
+    # Post-filter: medium/high confidence only (spec FR-3 step 2).
+    filtered = [
+        e for e in ranked
+        if e.get("confidence") in ("medium", "high")
+    ]
+
+    # Truncate to requested limit (spec FR-3 step 4).
+    truncated = filtered[:limit]
+
+    # Serialize to {name, category, description} with byte cap.
+    entries = _serialize_entries(truncated)
+
+    if not entries:
+        return None
     return {"query": query, "count": len(entries), "entries": entries}
 
 
@@ -444,3 +467,249 @@ def hybrid_retrieve(
     entries_by_id = {e["id"]: e for e in all_entries}
     ranker = RankingEngine(config)
     return ranker.rank(result, entries_by_id, limit)
+
+
+# ---------------------------------------------------------------------------
+# Digest cache + background prefetch
+# ---------------------------------------------------------------------------
+
+# Cached digests older than this are recomputed even if the store is
+# unchanged: ranking decays recency and recall against the wall clock.
+PREFETCH_MAX_AGE_SECONDS: float = 1800.0
+
+# Bound on cached digests and on queries kept warm, per process.
+PREFETCH_MAX_KEYS: int = 64
+
+
+class RefreshDigestCache:
+    """Refresh digests keyed by ``(query, limit)`` and store generation.
+
+    An entry is served only while ``MemoryDatabase.content_generation()``
+    equals the generation it was computed at and it is younger than
+    ``max_age_seconds``.  A cached ``None`` (no qualifying entries) is a
+    hit like any other digest.  Thread-safe: ``RefreshPrefetcher`` fills
+    it while the request thread reads it.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_age_seconds: float = PREFETCH_MAX_AGE_SECONDS,
+        max_entries: int = PREFETCH_MAX_KEYS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._entries: OrderedDict[
+            tuple[str, int], tuple[int, float, dict | None]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_age = max_age_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._stats = {"hits": 0, "misses": 0, "stores": 0}
+
+    def lookup(
+        self, query: str, limit: int, generation: int
+    ) -> tuple[bool, dict | None]:
+        """Return ``(True, digest)`` on a fresh hit, else ``(False, None)``."""
+        with self._lock:
+            cached = self._entries.get((query, limit))
+            if cached is not None and self._fresh(cached, generation):
+                self._stats["hits"] += 1
+                return True, cached[2]
+            self._stats["misses"] += 1
+            return False, None
+
+    def is_fresh(self, query: str, limit: int, generation: int) -> bool:
+        """Whether ``lookup`` would hit, without counting it."""
+        with self._lock:
+            cached = self._entries.get((query, limit))
+            return cached is not None and self._fresh(cached, generation)
+
+    def store(
+        self, query: str, limit: int, generation: int, digest: dict | None
+    ) -> None:
+        """Cache *digest*, computed while the store was at *generation*."""
+        with self._lock:
+            key = (query, limit)
+            self._entries[key] = (generation, self._clock(), digest)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self._stats["stores"] += 1
+
+    def stats(self) -> dict:
+        """Hit/miss/store counters and the current entry count."""
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
+
+    def _fresh(self, cached: tuple[int, float, dict | None], generation: int) -> bool:
+        return (
+            cached[0] == generation
+            and self._clock() - cached[1] < self._max_age
+        )
+
+
+def prefetch_refresh_digest(
+    db: MemoryDatabase,
+    provider: EmbeddingProvider | None,
+    cache: RefreshDigestCache,
+    query: str,
+    limit: int,
+    *,
+    config: dict,
+) -> bool:
+    """Compute the digest for *query* and store it in *cache*.
+
+    Same retrieval, filter and byte cap as ``refresh_memory_digest``.  The
+    generation is read before retrieval, so a write landing mid-way keys
+    the stored digest to the older generation: a later miss, never a
+    stale hit.  Returns ``False`` (nothing stored) when there is no
+    provider or retrieval fails.
+    """
+    global _prefetch_error_warned
+
+    if provider is None:
+        return False
+    generation = db.content_generation()
+    try:
+        ranked = hybrid_retrieve(
+            db, provider, config, query, limit * REFRESH_OVERSAMPLE_FACTOR
+        )
+    except Exception as exc:
+        if not _prefetch_error_warned:
+            sys.stderr.write(
+                f"[refresh] memory_refresh prefetch failed: {exc}\n"
+            )
+            _prefetch_error_warned = True
+        return False
+    cache.store(query, limit, generation, _digest_from_ranked(ranked, query, limit))
+    return True
+
+
+class RefreshPrefetcher:
+    """Daemon thread that keeps the digests for wanted queries warm.
+
+    ``want(query, limit)`` registers a query the caller expects to issue
+    (``complete_phase`` for a feature's current phase) and wakes the
+    thread; ``forget`` drops it once served.  Each pass recomputes every
+    wanted digest the cache would not serve.  Between passes the thread
+    sleeps ``poll_interval`` seconds, so digests invalidated by memory
+    writes are rewarmed while the server is otherwise idle.
+
+    Parameters
+    ----------
+    open_db:
+        Opens the thread's own ``MemoryDatabase`` (called on the thread;
+        sqlite connections are bound to the thread that opened them).
+    provider, config:
+        As for ``refresh_memory_digest``.
+    cache:
+        Shared with the request thread.
+    """
+
+    def __init__(
+        self,
+        open_db: Callable[[], MemoryDatabase],
+        provider: EmbeddingProvider | None,
+        config: dict,
+        cache: RefreshDigestCache,
+        *,
+        poll_interval: float = 60.0,
+        max_wanted: int = PREFETCH_MAX_KEYS,
+    ) -> None:
+        self._open_db = open_db
+        self._provider = provider
+        self._config = config
+        self._cache = cache
+        self._poll_interval = poll_interval
+        self._max_wanted = max_wanted
+        self._wanted: OrderedDict[tuple[str, int], None] = OrderedDict()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._idle = threading.Condition()
+        self._busy = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the thread (no-op if already running)."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="memory-refresh-prefetch", daemon=True,
+        )
+        self._thread.start()
+
+    def want(self, query: str, limit: int) -> None:
+        """Keep the digest for *query* warm and compute it soon."""
+        with self._idle:
+            key = (query, limit)
+            self._wanted[key] = None
+            self._wanted.move_to_end(key)
+            while len(self._wanted) > self._max_wanted:
+                self._wanted.popitem(last=False)
+            self._busy = True
+            self._wake.set()
+
+    def forget(self, query: str, limit: int) -> None:
+        """Stop rewarming *query*; its cached digest stays until stale."""
+        with self._idle:
+            self._wanted.pop((query, limit), None)
+
+    def wanted(self) -> list[tuple[str, int]]:
+        """Queries currently kept warm, oldest first."""
+        with self._idle:
+            return list(self._wanted)
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until every wanted digest has been attempted. True if idle."""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._busy, timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the thread and close its database."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        try:
+            db = self._open_db()
+        except Exception as exc:
+            sys.stderr.write(f"[refresh] prefetch could not open memory db: {exc}\n")
+            with self._idle:
+                self._busy = False
+                self._idle.notify_all()
+            return
+        try:
+            while not self._stop.is_set():
+                with self._idle:
+                    self._wake.clear()
+                    wanted = list(self._wanted)
+                try:
+                    self._warm(db, wanted)
+                except Exception as exc:
+                    sys.stderr.write(f"[refresh] prefetch pass failed: {exc}\n")
+                with self._idle:
+                    if not self._wake.is_set():
+                        self._busy = False
+                        self._idle.notify_all()
+                self._wake.wait(self._poll_interval)
+        finally:
+            with self._idle:
+                self._busy = False
+                self._idle.notify_all()
+            db.close()
+
+    def _warm(self, db: MemoryDatabase, wanted: list[tuple[str, int]]) -> None:
+        for query, limit in wanted:
+            if self._stop.is_set():
+                return
+            if self._cache.is_fresh(query, limit, db.content_generation()):
+                continue
+            prefetch_refresh_digest(
+                db, self._provider, self._cache, query, limit,
+                config=self._config,
+            )
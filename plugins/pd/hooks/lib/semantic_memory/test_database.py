@@ -77,7 +77,7 @@ class TestSchemaCreation:
         assert cur.fetchone() is not None
 
     def test_schema_version_is_4(self, db: MemoryDatabase):
-        assert db.get_schema_version() == 5
+        assert db.get_schema_version() == 9
 
     def test_entries_has_19_columns(self, db: MemoryDatabase):
         cur = db._conn.execute("PRAGMA table_info(entries)")
@@ -100,20 +100,20 @@ class TestSchemaCreation:
 class TestMigrationIdempotency:
     def test_opening_twice_does_not_error(self):
         """Opening two MemoryDatabase instances on same in-memory DB should
-        still result in schema_version == 5 (migrations are idempotent)."""
+        still result in schema_version == 6 (migrations are idempotent)."""
         db1 = MemoryDatabase(":memory:")
-        assert db1.get_schema_version() == 5
+        assert db1.get_schema_version() == 9
         db1.close()
 
     def test_schema_version_persists(self, tmp_path):
         """Schema version survives close and reopen."""
         db_path = str(tmp_path / "test.db")
         db1 = MemoryDatabase(db_path)
-        assert db1.get_schema_version() == 5
+        assert db1.get_schema_version() == 9
         db1.close()
 
         db2 = MemoryDatabase(db_path)
-        assert db2.get_schema_version() == 5
+        assert db2.get_schema_version() == 9
         db2.close()
 
 
@@ -177,7 +177,7 @@ class TestMigrationV2Backfill:
 
         # Reopen with MemoryDatabase to trigger migrations v2-v4
         db = MemoryDatabase(db_path)
-        assert db.get_schema_version() == 5
+        assert db.get_schema_version() == 9
 
         entry = db.get_entry("test1")
         assert entry is not None
@@ -902,6 +902,61 @@ class TestGetAllEmbeddings:
         assert matrix.shape == (1, 384)
 
 
+class TestEmbeddingIndexCache:
+    def _vec(self, value: float) -> bytes:
+        return np.array([value] * 768, dtype=np.float32).tobytes()
+
+    def test_repeated_reads_share_one_load(self, db: MemoryDatabase):
+        db.upsert_entry(_make_entry(embedding=self._vec(0.1)))
+        db.get_all_embeddings()
+        first = db.get_vector_index()
+        db.get_all_embeddings()
+        assert db.get_vector_index() is first
+
+    def test_matrix_is_read_only(self, db: MemoryDatabase):
+        db.upsert_entry(_make_entry(embedding=self._vec(0.1)))
+        _, matrix = db.get_all_embeddings()
+        with pytest.raises(ValueError):
+            matrix[0, 0] = 1.0
+
+    def test_update_embedding_applied_in_place(self, db: MemoryDatabase):
+        db.upsert_entry(_make_entry(id="a", embedding=self._vec(0.1)))
+        db.upsert_entry(_make_entry(id="b"))
+        index = db.get_vector_index()
+
+        db.update_embedding("b", self._vec(0.7))
+        db.update_embedding("a", self._vec(0.3))
+
+        assert db.get_vector_index() is index
+        ids, matrix = db.get_all_embeddings()
+        rows = dict(zip(ids, matrix[:, 0].tolist()))
+        assert rows == pytest.approx({"a": 0.3, "b": 0.7})
+
+    def test_delete_and_clear_drop_rows(self, db: MemoryDatabase):
+        db.upsert_entry(_make_entry(id="a", embedding=self._vec(0.1)))
+        db.upsert_entry(_make_entry(id="b", embedding=self._vec(0.2)))
+        db.get_all_embeddings()
+
+        db.delete_entry("a")
+        assert db.get_all_embeddings()[0] == ["b"]
+        db.clear_all_embeddings()
+        assert db.get_all_embeddings() is None
+
+    def test_write_from_other_connection_triggers_reload(self, tmp_path):
+        path = str(tmp_path / "memory.db")
+        reader = MemoryDatabase(path)
+        writer = MemoryDatabase(path)
+        try:
+            reader.upsert_entry(_make_entry(id="a", embedding=self._vec(0.1)))
+            assert reader.get_all_embeddings()[0] == ["a"]
+
+            writer.upsert_entry(_make_entry(id="b", embedding=self._vec(0.2)))
+            assert sorted(reader.get_all_embeddings()[0]) == ["a", "b"]
+        finally:
+            reader.close()
+            writer.close()
+
+
 class TestUpdateEmbedding:
     def test_update_embedding(self, db: MemoryDatabase):
         db.upsert_entry(_make_entry())
@@ -919,6 +974,59 @@ class TestUpdateEmbedding:
         assert result["embedding"] == emb2
 
 
+class TestEmbeddingStorage:
+    def _vec(self, dims: int = 768, seed: int = 0) -> np.ndarray:
+        vec = np.random.default_rng(seed).standard_normal(dims).astype(np.float32)
+        return vec / np.linalg.norm(vec)
+
+    def test_default_is_float32(self, db: MemoryDatabase):
+        assert db.embedding_storage == "float32"
+        with pytest.raises(ValueError):
+            db.set_embedding_storage("int4")
+
+    def test_update_embedding_stores_configured_format(self, db: MemoryDatabase):
+        db.set_embedding_storage("int8")
+        db.upsert_entry(_make_entry())
+        vec = self._vec()
+        db.update_embedding("abc123", vec.tobytes())
+        assert len(db.get_entry("abc123")["embedding"]) == 768 + 4
+        ids, matrix = db.get_all_embeddings()
+        assert ids == ["abc123"]
+        assert float(matrix[0] @ vec) > 0.999
+
+    def test_mixed_formats_load_together(self, db: MemoryDatabase):
+        db.upsert_entry(_make_entry(id="a", embedding=self._vec(seed=1).tobytes()))
+        db.set_embedding_storage("float16")
+        db.upsert_entry(_make_entry(id="b"))
+        db.update_embedding("b", self._vec(seed=2).tobytes())
+        db._invalidate_vector_index()
+        ids, matrix = db.get_all_embeddings()
+        assert sorted(ids) == ["a", "b"]
+        assert matrix.dtype == np.float32
+
+    def test_convert_embeddings_in_batches(self, db: MemoryDatabase):
+        for i in range(5):
+            db.upsert_entry(
+                _make_entry(id=f"e{i}", embedding=self._vec(seed=i).tobytes())
+            )
+        db.upsert_entry(_make_entry(id="bad", embedding=b"\x00" * 10))
+        calls = []
+        stats = db.convert_embeddings(
+            "float16", 768, batch_size=2,
+            progress=lambda done, total: calls.append((done, total)),
+        )
+        assert stats == {"converted": 5, "unchanged": 0, "skipped": 1}
+        assert calls == [(2, 6), (4, 6), (6, 6)]
+        assert db.embedding_storage == "float16"
+        assert len(db.get_entry("e0")["embedding"]) == 768 * 2
+        ids, matrix = db.get_all_embeddings()
+        assert len(ids) == 5
+        assert float(matrix[ids.index("e3")] @ self._vec(seed=3)) > 0.999
+
+        again = db.convert_embeddings("float16", 768)
+        assert again == {"converted": 0, "unchanged": 5, "skipped": 1}
+
+
 class TestClearAllEmbeddings:
     def test_clears_all_embeddings(self, db: MemoryDatabase):
         emb = np.array([0.1] * 768, dtype=np.float32).tobytes()
@@ -1246,7 +1354,7 @@ class TestMigration4:
         conn.close()
 
         db = MemoryDatabase(db_path)
-        assert db.get_schema_version() == 5
+        assert db.get_schema_version() == 9
 
         # Verify influence_count column exists and defaults to 0
         entry = db.get_entry("e1")
@@ -1286,11 +1394,11 @@ class TestMigration4:
         conn.close()
 
         db1 = MemoryDatabase(db_path)
-        assert db1.get_schema_version() == 5
+        assert db1.get_schema_version() == 9
         db1.close()
 
         db2 = MemoryDatabase(db_path)
-        assert db2.get_schema_version() == 5
+        assert db2.get_schema_version() == 9
         db2.close()
 
     def test_migration_influence_count_default_zero_on_new_entry(self, db: MemoryDatabase):
@@ -1534,6 +1642,68 @@ class TestFindEntryByName:
         assert result["id"] in ("e1", "e2")
 
 
+class TestFindEntriesByNames:
+    def test_matches_single_lookup_semantics(self, db: MemoryDatabase):
+        db.upsert_entry(_make_entry(id="e1", name="Hook Stderr Pattern"))
+        db.upsert_entry(_make_entry(id="e2", name="Always validate hook inputs first"))
+        db.upsert_entry(_make_entry(id="e3", name="Pattern with 100% accuracy"))
+        db.upsert_entry(_make_entry(id="e4", name="Use _embed_text_for_entry helper"))
+        names = [
+            "hook stderr pattern", "validate hook inputs", "100%",
+            "_embed_text_for_entry", "missing entirely", "hook stderr pattern",
+        ]
+
+        batched = db.find_entries_by_names(names)
+
+        assert [e["id"] if e else None for e in batched] == [
+            (db.find_entry_by_name(n) or {}).get("id") for n in names
+        ]
+        assert [e["id"] if e else None for e in batched] == [
+            "e1", "e2", "e3", "e4", None, "e1",
+        ]
+
+    def test_exact_match_preferred_over_like(self, db: MemoryDatabase):
+        db.upsert_entry(_make_entry(id="long", name="Hooks pattern extended"))
+        db.upsert_entry(_make_entry(id="exact", name="hooks pattern"))
+        assert db.find_entries_by_names(["Hooks Pattern"])[0]["id"] == "exact"
+
+    def test_column_subset_and_empty_input(self, db: MemoryDatabase):
+        db.upsert_entry(_make_entry(id="e1", name="Named"))
+        assert db.find_entries_by_names(["named"], columns=("id", "name")) == [
+            {"id": "e1", "name": "Named"}
+        ]
+        assert db.find_entries_by_names([]) == []
+
+    def test_lookups_are_chunked(self, db: MemoryDatabase, monkeypatch):
+        monkeypatch.setattr(MemoryDatabase, "_NAME_LOOKUP_CHUNK", 2)
+        for i in range(5):
+            db.upsert_entry(_make_entry(id=f"e{i}", name=f"Entry {i}"))
+        found = db.find_entries_by_names([f"entry {i}" for i in range(5)])
+        assert [e["id"] for e in found] == [f"e{i}" for i in range(5)]
+
+
+class TestRecordInfluences:
+    def test_batch_counts_each_occurrence(self, db: MemoryDatabase):
+        db.upsert_entry(_make_entry(id="e1"))
+        db.upsert_entry(_make_entry(id="e2", name="Other"))
+
+        db.record_influences(["e1", "e2", "e1"], "implementer", "feature:057")
+
+        assert db.get_entry("e1")["influence_count"] == 2
+        assert db.get_entry("e2")["influence_count"] == 1
+        rows = db.fetch_row_for_testing(
+            "SELECT COUNT(*) AS n, COUNT(DISTINCT timestamp) AS stamps "
+            "FROM influence_log WHERE agent_role = 'implementer'"
+        )
+        assert rows == {"n": 3, "stamps": 1}
+
+    def test_empty_batch_is_noop(self, db: MemoryDatabase):
+        db.record_influences([], "implementer", None)
+        assert db.fetch_row_for_testing(
+            "SELECT COUNT(*) AS n FROM influence_log"
+        ) == {"n": 0}
+
+
 # ---------------------------------------------------------------------------
 # Test: record_influence (Task 2.2.2 — combined atomic method)
 # ---------------------------------------------------------------------------
@@ -2084,6 +2254,126 @@ class TestScanDecayCandidates:
         assert "format violation" in captured.err
 
 
+class TestDecayScanBatch:
+    """Keyset-paginated, index-backed decay scan (migration 6)."""
+
+    def _seed(self, db, entry_id, *, recalled=None, created="2026-01-01T00:00:00Z"):
+        db.insert_test_entry_for_testing(
+            entry_id=entry_id,
+            description=f"entry {entry_id}",
+            confidence="high",
+            source="session-capture",
+            last_recalled_at=recalled,
+            created_at=created,
+        )
+
+    def test_pages_recalled_branch_in_staleness_order(self, db: MemoryDatabase):
+        for i, day in enumerate([5, 3, 3, 1, 9]):
+            self._seed(db, f"r{i}", recalled=f"2026-03-0{day}T00:00:00Z")
+        self._seed(db, "never")
+
+        cutoff = "2026-03-06T00:00:00Z"
+        first = db.scan_decay_batch(recalled=True, not_null_cutoff=cutoff, limit=2)
+        assert [r["id"] for r in first] == ["r3", "r1"]
+        last = first[-1]
+        rest = db.scan_decay_batch(
+            recalled=True, not_null_cutoff=cutoff,
+            after=(last["last_recalled_at"], last["id"]), limit=10,
+        )
+        # r4 (03-09) is newer than the cutoff; "never" is the other branch.
+        assert [r["id"] for r in rest] == ["r2", "r0"]
+
+    def test_pages_never_recalled_branch_by_created_at(self, db: MemoryDatabase):
+        self._seed(db, "b", created="2026-01-02T00:00:00Z")
+        self._seed(db, "a", created="2026-01-02T00:00:00Z")
+        self._seed(db, "c", created="2026-01-01T00:00:00Z")
+        self._seed(db, "recalled", recalled="2026-01-01T00:00:00Z")
+        rows = db.scan_decay_batch(
+            recalled=False, not_null_cutoff="2026-12-01T00:00:00Z", limit=10,
+        )
+        assert [r["id"] for r in rows] == ["c", "a", "b"]
+        rows = db.scan_decay_batch(
+            recalled=False, not_null_cutoff="2026-12-01T00:00:00Z",
+            after=("2026-01-02T00:00:00Z", "a"), limit=10,
+        )
+        assert [r["id"] for r in rows] == ["b"]
+
+    @pytest.mark.parametrize("recalled, index", [
+        (True, "idx_entries_decay_recalled"),
+        (False, "idx_entries_decay_never_recalled"),
+    ])
+    def test_branches_use_partial_indexes(self, db: MemoryDatabase, recalled, index):
+        traced: list[str] = []
+        db._conn.set_trace_callback(traced.append)
+        db.scan_decay_batch(
+            recalled=recalled, not_null_cutoff="2026-03-06T00:00:00Z",
+            after=("2026-01-01T00:00:00Z", "x"), limit=5,
+        )
+        db._conn.set_trace_callback(None)
+        sql = next(s for s in traced if "FROM entries" in s)
+        plan = " ".join(
+            row[3] for row in db._conn.execute(f"EXPLAIN QUERY PLAN {sql}")
+        )
+        assert index in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_earliest_recall_since(self, db: MemoryDatabase):
+        assert db.earliest_recall_since("2026-01-01T00:00:00Z") is None
+        self._seed(db, "old", recalled="2025-12-01T00:00:00Z")
+        self._seed(db, "new", recalled="2026-02-01T00:00:00Z")
+        self._seed(db, "newer", recalled="2026-03-01T00:00:00Z")
+        assert db.earliest_recall_since("2026-01-01T00:00:00Z") == "2026-02-01T00:00:00Z"
+
+    def test_generation_tracks_decay_inputs_only(self, db: MemoryDatabase):
+        assert db.decay_generation() == 0
+        self._seed(db, "e1")
+        assert db.decay_generation() == 1
+
+        # First recall of a never-recalled row can make it decay sooner.
+        db.update_recall(["e1"], "2026-02-01T00:00:00Z")
+        assert db.decay_generation() == 2
+        # Later recalls only postpone decay.
+        db.update_recall(["e1"], "2026-02-05T00:00:00Z")
+        db.execute_test_sql_for_testing(
+            "UPDATE entries SET observation_count = 3 WHERE id = 'e1'"
+        )
+        assert db.decay_generation() == 2
+
+        db.batch_demote(["e1"], "medium", "2099-01-01T00:00:00Z")
+        assert db.decay_generation() == 3
+
+
+
+class TestContentGeneration:
+    """Migration 8: ``content_generation`` counts every entries change."""
+
+    def _seed(self, db, entry_id):
+        db.insert_test_entry_for_testing(
+            entry_id=entry_id, created_at="2026-01-01T00:00:00Z",
+        )
+
+    def test_bumped_by_insert_update_and_delete(self, db: MemoryDatabase):
+        assert db.content_generation() == 0
+        self._seed(db, "e1")
+        assert db.content_generation() == 1
+        # Recalls feed ranking, so they count too.
+        db.update_recall(["e1"], "2026-02-01T00:00:00Z")
+        assert db.content_generation() == 2
+        db.delete_entry("e1")
+        assert db.content_generation() >= 3
+
+    def test_visible_to_other_connections(self, tmp_path):
+        path = str(tmp_path / "memory.db")
+        reader = MemoryDatabase(path)
+        writer = MemoryDatabase(path)
+        try:
+            before = reader.content_generation()
+            self._seed(writer, "e1")
+            assert reader.content_generation() == before + 1
+        finally:
+            reader.close()
+            writer.close()
+
 class TestBatchDemote:
     """Task 2.3 / 2.4 — design I-7 (BEGIN IMMEDIATE, 500-ids chunking,
     `updated_at < ?` guard for intra-tick idempotency).
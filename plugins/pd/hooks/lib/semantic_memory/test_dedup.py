@@ -293,3 +293,45 @@ class TestDedupResult:
         assert r.is_duplicate is False
         assert r.existing_entry_id is None
         assert r.similarity == 0.3
+
+
+# ---------------------------------------------------------------------------
+# Test: single top-k pass shared across thresholds
+# ---------------------------------------------------------------------------
+
+class TestNearestEntries:
+    def test_one_load_serves_several_thresholds(self):
+        from semantic_memory.dedup import dedup_result, nearest_entries
+
+        base = _normalized(np.array([1.0, 0.0, 0.0], dtype=np.float32))
+        query = _normalized(np.array([1.0, 0.4, 0.0], dtype=np.float32))
+        db = _make_db(["entry-1"], base.reshape(1, -1))
+
+        matches = nearest_entries(query, db)
+
+        assert db.get_all_embeddings.call_count == 1
+        assert dedup_result(matches, 0.95).is_duplicate is False
+        merge = dedup_result(matches, 0.90)
+        assert merge.is_duplicate is True
+        assert merge.existing_entry_id == "entry-1"
+
+    def test_top_k_sorted_best_first(self):
+        from semantic_memory.dedup import nearest_entries
+
+        rows = np.stack([
+            _normalized(np.array([0.0, 1.0, 0.0], dtype=np.float32)),
+            _normalized(np.array([1.0, 0.0, 0.0], dtype=np.float32)),
+            _normalized(np.array([1.0, 1.0, 0.0], dtype=np.float32)),
+        ])
+        db = _make_db(["y", "x", "xy"], rows)
+        query = _normalized(np.array([1.0, 0.1, 0.0], dtype=np.float32))
+
+        assert [i for i, _ in nearest_entries(query, db, k=2)] == ["x", "xy"]
+
+    def test_no_embeddings_returns_empty(self):
+        from semantic_memory.dedup import dedup_result, nearest_entries
+
+        db = _make_db(None, None)
+        query = _normalized(np.array([1.0, 0.0, 0.0], dtype=np.float32))
+        assert nearest_entries(query, db) == []
+        assert dedup_result([], 0.9) == DedupResult(False, None, 0.0)
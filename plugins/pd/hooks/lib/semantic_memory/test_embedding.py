@@ -11,6 +11,7 @@ import pytest
 from semantic_memory.embedding import (
     EmbeddingProvider,
     GeminiProvider,
+    LocalProvider,
     NormalizingWrapper,
     create_provider,
 )
@@ -526,6 +527,21 @@ class TestCreateProvider:
             result = create_provider(config)
             assert result is None, f"Expected None for provider {provider_name!r}"
 
+    @patch("semantic_memory.embedding._load_dotenv_once")
+    def test_returns_local_provider_without_api_key(self, mock_dotenv):
+        """create_provider builds the offline provider without touching .env."""
+        config = {
+            "memory_embedding_provider": "local",
+            "memory_embedding_model": "gemini-embedding-001",
+        }
+        env = {k: v for k, v in os.environ.items() if k != "GEMINI_API_KEY"}
+        with patch.dict(os.environ, env, clear=True):
+            result = create_provider(config)
+        assert isinstance(result, NormalizingWrapper)
+        assert result.provider_name == "local"
+        assert result.model_name == LocalProvider.DEFAULT_MODEL
+        mock_dotenv.assert_not_called()
+
     @patch("semantic_memory.embedding.np", None)
     def test_returns_none_when_numpy_unavailable(self):
         """create_provider should return None when numpy is not installed."""
@@ -663,3 +679,44 @@ class TestLoadDotenvOnce:
         assert str(git_env) in loaded_paths, (
             f"git .env not loaded. Loaded: {loaded_paths}"
         )
+
+
+# ---------------------------------------------------------------------------
+# LocalProvider tests
+# ---------------------------------------------------------------------------
+
+
+class TestLocalProvider:
+    def test_protocol_and_properties(self):
+        provider = LocalProvider(dimensions=256)
+        assert isinstance(provider, EmbeddingProvider)
+        assert provider.provider_name == "local"
+        assert provider.model_name == "hash-ngram-v1"
+        assert provider.dimensions == 256
+
+    def test_deterministic_across_instances(self):
+        a = LocalProvider().embed("Use WAL mode for SQLite")
+        b = LocalProvider().embed("Use WAL mode for SQLite")
+        assert a.dtype == np.float32
+        assert a.shape == (768,)
+        np.testing.assert_array_equal(a, b)
+
+    def test_batch_matches_single(self):
+        provider = LocalProvider(dimensions=128)
+        texts = ["retry on busy database", "", "retry on busy database", "react hooks"]
+        batch = provider.embed_batch(texts)
+        assert len(batch) == 4
+        for text, vec in zip(texts, batch):
+            np.testing.assert_allclose(vec, provider.embed(text), rtol=1e-6)
+        assert not batch[1].any()
+
+    def test_shared_terms_score_higher(self):
+        provider = NormalizingWrapper(LocalProvider())
+        query = provider.embed("sqlite busy timeout")
+        related = provider.embed("raise the SQLite busy_timeout on contention")
+        unrelated = provider.embed("render react components with hooks")
+        assert float(query @ related) > float(query @ unrelated) + 0.2
+
+    def test_unknown_task_type(self):
+        with pytest.raises(EmbeddingError, match="Unknown task_type"):
+            LocalProvider().embed("text", task_type="classification")
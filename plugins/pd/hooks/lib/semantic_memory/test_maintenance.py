@@ -1853,6 +1853,145 @@ class TestDecayScanLimit:
         assert result["demoted_high_to_medium"] == 5
 
 
+class TestDecayIncremental:
+    """Keyset-paginated decay pass with the ``_metadata`` watermark."""
+
+    @pytest.fixture
+    def raw_scan_limit(self, monkeypatch):
+        """Let tests pass scan limits below the production clamp."""
+        original = maintenance._resolve_int_config
+
+        def _pass_through(config, key, default, *, clamp=None, warned):
+            if key == "memory_decay_scan_limit":
+                return int(config.get(key, default))
+            return original(config, key, default, clamp=clamp, warned=warned)
+
+        monkeypatch.setattr(maintenance, "_resolve_int_config", _pass_through)
+
+    def _run(self, db, now=NOW, **overrides):
+        return maintenance.decay_confidence(
+            db, _enabled_config(**overrides), now=now, incremental=True,
+        )
+
+    def test_first_run_matches_full_sweep(self, fresh_db):
+        _seed_entry(fresh_db, entry_id="h", confidence="high",
+                    last_recalled_at=_days_ago(31), created_at=_days_ago(90))
+        _seed_entry(fresh_db, entry_id="m", confidence="medium",
+                    last_recalled_at=None, created_at=_days_ago(61))
+        _seed_entry(fresh_db, entry_id="g", confidence="high",
+                    last_recalled_at=None, created_at=_days_ago(3))
+        _seed_entry(fresh_db, entry_id="i", confidence="high", source="import",
+                    last_recalled_at=None, created_at=_days_ago(400))
+
+        result = self._run(fresh_db)
+
+        assert result["sweep_skipped"] is False
+        assert result["pass_complete"] is True
+        assert result["demoted_high_to_medium"] == 1
+        assert result["demoted_medium_to_low"] == 1
+        assert result["skipped_grace"] == 1
+        assert result["skipped_import"] == 1
+        assert _get_row(fresh_db, "h")["confidence"] == "medium"
+        assert _get_row(fresh_db, "m")["confidence"] == "low"
+
+    def test_watermark_skips_until_next_eligible(self, fresh_db):
+        # Recalled 10 days ago: high decays 20 days from NOW.
+        _seed_entry(fresh_db, entry_id="h", confidence="high",
+                    last_recalled_at=_days_ago(10), created_at=_days_ago(90))
+        first = self._run(fresh_db)
+        assert first["scanned"] == 0 and first["pass_complete"] is True
+        mark = json.loads(fresh_db.get_metadata("decay_watermark"))
+        assert mark["at"] == _days_ago(-20)
+
+        again = self._run(fresh_db, now=NOW + timedelta(days=19))
+        assert again["sweep_skipped"] is True
+        assert again["scanned"] == 0
+
+        due = self._run(fresh_db, now=NOW + timedelta(days=21))
+        assert due["sweep_skipped"] is False
+        assert due["demoted_high_to_medium"] == 1
+
+    def test_demotion_moves_watermark_to_next_tier(self, fresh_db):
+        _seed_entry(fresh_db, entry_id="h", confidence="high",
+                    last_recalled_at=_days_ago(31), created_at=_days_ago(90))
+        self._run(fresh_db)
+        mark = json.loads(fresh_db.get_metadata("decay_watermark"))
+        # Now medium; stale since 31 days ago → eligible 29 days from NOW.
+        assert mark["at"] == _days_ago(-29)
+        assert self._run(fresh_db)["sweep_skipped"] is True
+
+    def test_nothing_decayable_skips_until_rows_change(self, fresh_db):
+        _seed_entry(fresh_db, entry_id="low", confidence="low",
+                    last_recalled_at=None, created_at=_days_ago(400))
+        self._run(fresh_db)
+        assert json.loads(fresh_db.get_metadata("decay_watermark"))["at"] is None
+        later = NOW + timedelta(days=3650)
+        assert self._run(fresh_db, now=later)["sweep_skipped"] is True
+
+        _seed_entry(fresh_db, entry_id="new", confidence="medium",
+                    last_recalled_at=None, created_at=_days_ago(100))
+        result = self._run(fresh_db, now=later)
+        assert result["sweep_skipped"] is False
+        assert result["demoted_medium_to_low"] == 1
+
+    def test_threshold_change_invalidates_watermark(self, fresh_db):
+        _seed_entry(fresh_db, entry_id="h", confidence="high",
+                    last_recalled_at=_days_ago(10), created_at=_days_ago(90))
+        self._run(fresh_db)
+        result = self._run(fresh_db, memory_decay_high_threshold_days=7)
+        assert result["sweep_skipped"] is False
+        assert result["demoted_high_to_medium"] == 1
+
+    def test_pass_spans_runs_in_bounded_batches(
+        self, fresh_db, monkeypatch, raw_scan_limit,
+    ):
+        monkeypatch.setattr(maintenance, "_DECAY_BATCH_SIZE", 2)
+        for i in range(4):
+            _seed_entry(fresh_db, entry_id=f"r{i}", confidence="high",
+                        last_recalled_at=_days_ago(40 + i), created_at=_days_ago(90))
+        for i in range(3):
+            _seed_entry(fresh_db, entry_id=f"n{i}", confidence="medium",
+                        last_recalled_at=None, created_at=_days_ago(70 + i))
+
+        runs = []
+        while not runs or not runs[-1]["pass_complete"]:
+            runs.append(self._run(fresh_db, memory_decay_scan_limit=3))
+            assert len(runs) < 10
+        assert [r["scanned"] for r in runs] == [3, 3, 1]
+        assert sum(r["demoted_high_to_medium"] for r in runs) == 4
+        assert sum(r["demoted_medium_to_low"] for r in runs) == 3
+        assert fresh_db.get_metadata("decay_watermark") is not None
+
+    def test_concurrent_change_mid_pass_withholds_watermark(
+        self, fresh_db, raw_scan_limit,
+    ):
+        for i in range(3):
+            _seed_entry(fresh_db, entry_id=f"r{i}", confidence="low",
+                        last_recalled_at=_days_ago(40 + i), created_at=_days_ago(90))
+        first = self._run(fresh_db, memory_decay_scan_limit=2)
+        assert first["pass_complete"] is False
+        # A row behind the cursor is promoted by another writer.
+        fresh_db.execute_test_sql_for_testing(
+            "UPDATE entries SET confidence = 'high' WHERE id = 'r2'"
+        )
+        second = self._run(fresh_db, memory_decay_scan_limit=2)
+        assert second["pass_complete"] is True
+        assert fresh_db.get_metadata("decay_watermark") is None
+        # The following pass is clean and records the watermark.
+        self._run(fresh_db, memory_decay_scan_limit=10)
+        assert fresh_db.get_metadata("decay_watermark") is not None
+
+    def test_dry_run_does_not_persist_progress(self, fresh_db):
+        _seed_entry(fresh_db, entry_id="h", confidence="high",
+                    last_recalled_at=_days_ago(31), created_at=_days_ago(90))
+        for _ in range(2):
+            result = self._run(fresh_db, memory_decay_dry_run=True)
+            assert result["demoted_high_to_medium"] == 1
+        assert fresh_db.get_metadata("decay_scan_state") is None
+        assert fresh_db.get_metadata("decay_watermark") is None
+        assert _get_row(fresh_db, "h")["confidence"] == "high"
+
+
 # ---------------------------------------------------------------------------
 # Feature 088 Bundle G — FR-10.1 (strict config coercion + unknown-key warn)
 #                         FR-10.2 (CLI uid check)
@@ -0,0 +1,65 @@
+"""Tests for embedding storage formats."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from semantic_memory.quantize import (
+    blob_format,
+    decode_embedding,
+    embedding_nbytes,
+    encode_embedding,
+    resolve_storage_format,
+)
+
+
+def _unit(dims: int, seed: int = 0) -> np.ndarray:
+    vec = np.random.default_rng(seed).standard_normal(dims).astype(np.float32)
+    return vec / np.linalg.norm(vec)
+
+
+class TestEncodeDecode:
+    @pytest.mark.parametrize("fmt", ["float32", "float16", "int8"])
+    def test_round_trip(self, fmt):
+        vec = _unit(768)
+        blob = encode_embedding(vec, fmt)
+        assert len(blob) == embedding_nbytes(768, fmt)
+        decoded = decode_embedding(blob, 768)
+        assert decoded.dtype == np.float32
+        assert float(decoded @ vec) > 0.999
+
+    def test_float32_is_raw_bytes(self):
+        vec = _unit(8)
+        assert encode_embedding(vec, "float32") == vec.tobytes()
+        np.testing.assert_array_equal(decode_embedding(vec.tobytes(), 8), vec)
+
+    def test_int8_zero_vector(self):
+        blob = encode_embedding(np.zeros(16, dtype=np.float32), "int8")
+        np.testing.assert_array_equal(decode_embedding(blob, 16), np.zeros(16))
+
+    def test_size_mismatch_returns_none(self):
+        assert decode_embedding(b"\x00" * 10, 768) is None
+        assert blob_format(b"\x00" * 10, 768) is None
+
+    def test_preferred_format_breaks_length_tie(self):
+        # At 4 dims float16 and int8 BLOBs are both 8 bytes.
+        blob = encode_embedding(_unit(4), "int8")
+        assert blob_format(blob, 4, "int8") == "int8"
+        assert blob_format(blob, 4, "float16") == "float16"
+
+    def test_unknown_format_raises(self):
+        with pytest.raises(ValueError):
+            encode_embedding(_unit(4), "bfloat16")
+
+
+class TestResolveStorageFormat:
+    def test_default_and_valid(self):
+        assert resolve_storage_format({}) == "float32"
+        assert resolve_storage_format({"memory_embedding_storage": "int8"}) == "int8"
+
+    def test_invalid_value_warns_and_defaults(self, capsys):
+        fmt = resolve_storage_format(
+            {"memory_embedding_storage": "int4"}, prefix="[test]",
+        )
+        assert fmt == "float32"
+        assert "[test] memory_embedding_storage='int4'" in capsys.readouterr().err
@@ -0,0 +1,137 @@
+"""Query-plan audit of MemoryDatabase's public lookups.
+
+Each bounded lookup runs under a QueryRecorder; every statement it issues
+is replayed under EXPLAIN QUERY PLAN and must not fully scan ``entries``
+or ``influence_log``. Whole-store reads, and the substring fallback of a
+name lookup, are allowed to scan ``entries``.
+"""
+from __future__ import annotations
+
+import json
+import struct
+
+import pytest
+
+from query_plan_audit import QueryRecorder, audit, explain
+from semantic_memory.database import MemoryDatabase
+
+HOT_TABLES = frozenset({"entries", "influence_log"})
+
+
+def _entry(i: int) -> dict:
+    return {
+        "id": f"e{i:04d}",
+        "name": f"Pattern {i}",
+        "description": f"Description of pattern {i}",
+        "category": "patterns",
+        "source": "manual",
+        "keywords": json.dumps(["test", f"k{i}"]),
+        "source_project": "/tmp/project",
+        "source_hash": f"{i:016x}",
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+    }
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = MemoryDatabase(str(tmp_path / "plans.db"))
+    for i in range(60):
+        database.upsert_entry(_entry(i))
+    for i in range(0, 60, 2):
+        database.update_embedding(f"e{i:04d}", struct.pack("4f", 0.1, 0.2, 0.3, 0.4))
+    database.update_recall(["e0001", "e0002"], "2026-02-01T00:00:00Z")
+    yield database
+    database.close()
+
+
+def _findings(db, call):
+    with QueryRecorder(db._conn) as recorder:
+        call(db)
+    assert recorder.statements, "call issued no SQL"
+    return audit(db._conn, recorder.statements, hot_tables=HOT_TABLES)
+
+
+LOOKUPS = [
+    ("get_entry", lambda db: db.get_entry("e0003")),
+    ("get_source_hash", lambda db: db.get_source_hash("e0003")),
+    ("find_entry_by_name", lambda db: db.find_entry_by_name("pattern 3")),
+    ("find_entries_by_names",
+     lambda db: db.find_entries_by_names(["PATTERN 3", "Pattern 4"])),
+    ("upsert_entry", lambda db: db.upsert_entry(_entry(5))),
+    ("merge_duplicate", lambda db: db.merge_duplicate("e0005", ["extra"])),
+    ("delete_entry", lambda db: db.delete_entry("e0059")),
+    ("record_influence", lambda db: db.record_influence("e0006", "reviewer", None)),
+    ("record_influences",
+     lambda db: db.record_influences(["e0006", "e0007"], "reviewer", None)),
+    ("update_embedding",
+     lambda db: db.update_embedding("e0007", struct.pack("4f", 1, 0, 0, 0))),
+    ("get_entries_without_embedding",
+     lambda db: db.get_entries_without_embedding(limit=10)),
+    ("count_entries_without_embedding",
+     lambda db: db.count_entries_without_embedding()),
+    ("update_keywords", lambda db: db.update_keywords("e0008", '["a"]')),
+    ("update_recall",
+     lambda db: db.update_recall(["e0008", "e0009"], "2026-03-01T00:00:00Z")),
+    ("fts5_search", lambda db: db.fts5_search("pattern", limit=5)),
+    ("scan_decay_batch_recalled",
+     lambda db: db.scan_decay_batch(
+         recalled=True, not_null_cutoff="2026-06-01T00:00:00Z", limit=10)),
+    ("scan_decay_batch_never_recalled",
+     lambda db: db.scan_decay_batch(
+         recalled=False, not_null_cutoff="2026-06-01T00:00:00Z", limit=10)),
+    ("earliest_recall_since",
+     lambda db: db.earliest_recall_since("2026-01-15T00:00:00Z")),
+    ("batch_demote",
+     lambda db: db.batch_demote(["e0010"], "low", "2026-06-01T00:00:00Z")),
+]
+
+LISTINGS = [
+    ("get_all_entries", lambda db: db.get_all_entries()),
+    ("get_all_embeddings", lambda db: db.get_all_embeddings(expected_dims=4)),
+    ("count_entries", lambda db: db.count_entries()),
+    # A name with no exact match falls back to a substring LIKE, which no
+    # index can serve; exact hits (the common case) never get here.
+    ("find_entry_by_name_substring", lambda db: db.find_entry_by_name("ttern 3")),
+]
+
+
+@pytest.mark.parametrize("name,call", LOOKUPS, ids=[n for n, _ in LOOKUPS])
+def test_lookup_has_no_full_scan(db, name, call):
+    if name == "fts5_search" and not db.fts5_available:
+        pytest.skip("FTS5 not available")
+    findings = _findings(db, call)
+    assert not findings, "\n".join(
+        f"{f.kind} {f.table}: {f.detail}\n    {f.sql}" for f in findings
+    )
+
+
+@pytest.mark.parametrize("name,call", LISTINGS, ids=[n for n, _ in LISTINGS])
+def test_listing_scans_only_entries(db, name, call):
+    findings = _findings(db, call)
+    unexpected = [f for f in findings if f.kind != "scan" or f.table != "entries"]
+    assert not unexpected, [f.detail for f in unexpected]
+
+
+def test_name_lookup_keeps_first_row_in_table_order(db):
+    """The LOWER(name) index must not change which duplicate wins."""
+    db.upsert_entry({**_entry(100), "name": "Shared"})
+    db.upsert_entry({**_entry(101), "name": "shared"})
+    assert db.find_entry_by_name("SHARED")["id"] == "e0100"
+    assert db.find_entries_by_names(["sHaReD"])[0]["id"] == "e0100"
+
+
+def test_missing_embedding_poll_uses_partial_index(db):
+    plan = explain(
+        db._conn, "SELECT COUNT(*) FROM entries WHERE embedding IS NULL",
+    )
+    assert any("idx_entries_missing_embedding" in step for step in plan), plan
+
+
+def test_source_hash_anti_join_uses_index(db):
+    plan = explain(
+        db._conn,
+        "SELECT 1 FROM entries WHERE source_hash = ?",
+        ("0000000000000001",),
+    )
+    assert any("idx_entries_source_hash" in step for step in plan), plan
@@ -20,6 +20,7 @@ from __future__ import annotations
 import json
 import re
 import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -669,3 +670,123 @@ class TestRefreshMemoryDigest:
             assert len(matches) == 1
         finally:
             db.close()
+
+
+# ---------------------------------------------------------------------------
+# Prefetch — RefreshDigestCache / prefetch_refresh_digest / RefreshPrefetcher
+# ---------------------------------------------------------------------------
+
+
+class TestRefreshDigestCache:
+    DIGEST = {"query": "q", "count": 0, "entries": []}
+
+    def test_hit_requires_same_generation(self):
+        cache = refresh.RefreshDigestCache()
+        cache.store("q", 5, 3, self.DIGEST)
+        assert cache.lookup("q", 5, 3) == (True, self.DIGEST)
+        assert cache.lookup("q", 5, 4) == (False, None)
+        assert cache.lookup("q", 6, 3) == (False, None)
+        assert cache.stats() == {"hits": 1, "misses": 2, "stores": 1, "entries": 1}
+
+    def test_cached_none_is_a_hit(self):
+        cache = refresh.RefreshDigestCache()
+        cache.store("q", 5, 1, None)
+        assert cache.lookup("q", 5, 1) == (True, None)
+
+    def test_entries_expire_after_max_age(self):
+        now = [100.0]
+        cache = refresh.RefreshDigestCache(max_age_seconds=10, clock=lambda: now[0])
+        cache.store("q", 5, 1, self.DIGEST)
+        now[0] += 9
+        assert cache.is_fresh("q", 5, 1)
+        now[0] += 1
+        assert not cache.is_fresh("q", 5, 1)
+
+    def test_oldest_entry_evicted_past_capacity(self):
+        cache = refresh.RefreshDigestCache(max_entries=2)
+        for query in ("a", "b", "c"):
+            cache.store(query, 5, 1, None)
+        assert not cache.is_fresh("a", 5, 1)
+        assert cache.is_fresh("b", 5, 1) and cache.is_fresh("c", 5, 1)
+
+
+class TestPrefetchRefreshDigest:
+    def test_stores_same_digest_as_inline_path(self):
+        from test_memory_server import _FixedSimilarityProvider  # type: ignore
+
+        db = MemoryDatabase(":memory:")
+        try:
+            provider = _FixedSimilarityProvider(similarity=0.8)
+            _seed_refresh_entry(db, "p-0", "Alpha", "patterns", "high")
+            cache = refresh.RefreshDigestCache()
+
+            assert refresh.prefetch_refresh_digest(
+                db, provider, cache, "workflow", 5, config={},
+            )
+            hit, digest = cache.lookup("workflow", 5, db.content_generation())
+            assert hit
+            assert digest == refresh.refresh_memory_digest(
+                db, provider, "workflow", 5, config={},
+            )
+        finally:
+            db.close()
+
+    def test_failed_retrieval_stores_nothing(self, monkeypatch, capsys):
+        db = MemoryDatabase(":memory:")
+        try:
+            def boom(*a, **kw):
+                raise RuntimeError("embed down")
+
+            monkeypatch.setattr(refresh, "hybrid_retrieve", boom)
+            cache = refresh.RefreshDigestCache()
+            assert not refresh.prefetch_refresh_digest(
+                db, object(), cache, "workflow", 5, config={},
+            )
+            assert cache.stats()["entries"] == 0
+            assert "prefetch failed: embed down" in capsys.readouterr().err
+        finally:
+            db.close()
+
+
+class TestRefreshPrefetcher:
+    def test_warms_wanted_queries_and_rewarms_after_writes(self, tmp_path):
+        from test_memory_server import _FixedSimilarityProvider  # type: ignore
+
+        path = str(tmp_path / "memory.db")
+        db = MemoryDatabase(path)
+        cache = refresh.RefreshDigestCache()
+        prefetcher = refresh.RefreshPrefetcher(
+            lambda: MemoryDatabase(path),
+            _FixedSimilarityProvider(similarity=0.8), {}, cache,
+            poll_interval=0.05,
+        )
+        prefetcher.start()
+        try:
+            _seed_refresh_entry(db, "w-0", "Alpha", "patterns", "high")
+            prefetcher.want("workflow", 5)
+            assert prefetcher.wait_idle(5)
+            hit, digest = cache.lookup("workflow", 5, db.content_generation())
+            assert hit and digest["count"] == 1
+
+            # A write from another connection invalidates the digest; the
+            # idle pass recomputes it without a new want().
+            _seed_refresh_entry(db, "w-1", "Beta", "patterns", "high")
+            generation = db.content_generation()
+            deadline = time.monotonic() + 5
+            while not cache.is_fresh("workflow", 5, generation):
+                assert time.monotonic() < deadline, "digest was not rewarmed"
+                time.sleep(0.02)
+            assert cache.lookup("workflow", 5, generation)[1]["count"] == 2
+        finally:
+            prefetcher.stop()
+            db.close()
+
+    def test_forget_stops_rewarming(self):
+        prefetcher = refresh.RefreshPrefetcher(
+            lambda: MemoryDatabase(":memory:"), None, {},
+            refresh.RefreshDigestCache(),
+        )
+        prefetcher.want("a", 5)
+        prefetcher.want("b", 5)
+        prefetcher.forget("a", 5)
+        assert prefetcher.wanted() == [("b", 5)]
@@ -0,0 +1,55 @@
+"""Tests for the in-process embedding index."""
+from __future__ import annotations
+
+import numpy as np
+
+from semantic_memory.vector_index import VectorIndex
+
+
+def _unit(*values: float) -> np.ndarray:
+    vec = np.array(values, dtype=np.float32)
+    return vec / np.linalg.norm(vec)
+
+
+class TestVectorIndex:
+    def test_empty_index(self):
+        index = VectorIndex(dims=3)
+        assert len(index) == 0
+        assert index.snapshot() is None
+        assert index.top_k(_unit(1, 0, 0)) == []
+
+    def test_upsert_grows_past_initial_capacity(self):
+        index = VectorIndex(dims=2, capacity=1)
+        for i in range(200):
+            index.upsert(f"e{i}", _unit(1, i))
+        assert len(index) == 200
+        ids, matrix = index.snapshot()
+        assert ids[199] == "e199"
+        assert matrix.shape == (200, 2)
+        np.testing.assert_allclose(matrix[199], _unit(1, 199))
+
+    def test_upsert_replaces_existing_row(self):
+        index = VectorIndex.from_arrays(["a"], [_unit(1, 0)], dims=2)
+        index.upsert("a", _unit(0, 1))
+        assert len(index) == 1
+        np.testing.assert_allclose(index.snapshot()[1][0], _unit(0, 1))
+
+    def test_remove_swaps_last_row_in(self):
+        index = VectorIndex.from_arrays(
+            ["a", "b", "c"], [_unit(1, 0), _unit(0, 1), _unit(1, 1)], dims=2,
+        )
+        index.remove("a")
+        index.remove("missing")
+        ids, matrix = index.snapshot()
+        assert ids == ["c", "b"]
+        assert "a" not in index
+        np.testing.assert_allclose(matrix[0], _unit(1, 1))
+
+    def test_top_k_orders_by_similarity(self):
+        index = VectorIndex.from_arrays(
+            ["x", "y", "xy"], [_unit(1, 0), _unit(0, 1), _unit(1, 1)], dims=2,
+        )
+        matches = index.top_k(_unit(1, 0.1), k=2)
+        assert [entry_id for entry_id, _ in matches] == ["x", "xy"]
+        assert matches[0][1] > matches[1][1]
+        assert len(index.top_k(_unit(1, 0), k=10)) == 3
@@ -357,6 +357,58 @@ class TestPendingBatch:
         db.close()
 
 
+class TestPendingEmbeddingWorker:
+    def test_worker_drains_backlog_in_background(self, tmp_path):
+        from semantic_memory.writer import PendingEmbeddingWorker
+
+        db_path = str(tmp_path / "memory.db")
+        db = MemoryDatabase(db_path)
+        for i in range(60):
+            db.upsert_entry({
+                "id": f"pending_{i}",
+                "name": f"Pending {i}",
+                "description": f"Pending description {i}",
+                "category": "patterns",
+                "source": "manual",
+                "source_project": str(tmp_path),
+                "source_hash": f"hash{i:014d}",
+                "created_at": "2026-01-01T00:00:00Z",
+                "updated_at": "2026-01-01T00:00:00Z",
+            })
+
+        worker = PendingEmbeddingWorker(
+            lambda: MemoryDatabase(db_path), _make_mock_provider(),
+        )
+        worker.start()
+        try:
+            worker.notify()
+            assert worker.wait_idle(timeout=10)
+        finally:
+            worker.stop()
+
+        # More than one 50-entry batch was processed
+        assert db.count_entries_without_embedding() == 0
+        assert db.get_metadata("pending_embeddings") == "0"
+        db.close()
+
+    def test_provider_errors_do_not_kill_worker(self, tmp_path, capsys):
+        from semantic_memory.writer import PendingEmbeddingWorker
+
+        def failing_factory():
+            raise RuntimeError("db unavailable")
+
+        worker = PendingEmbeddingWorker(failing_factory, _make_mock_provider())
+        worker.start()
+        try:
+            worker.notify()
+            assert worker.wait_idle(timeout=10)
+            worker.notify()
+            assert worker.wait_idle(timeout=10)
+        finally:
+            worker.stop()
+        assert capsys.readouterr().err.count("db unavailable") == 2
+
+
 # ---------------------------------------------------------------------------
 # Test: Provider migration (TD9)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,90 @@
+"""In-process embedding index shared by dedup and retrieval.
+
+MemoryDatabase keeps one VectorIndex per connection so that the store
+pipeline's duplicate checks and hybrid retrieval do not re-read and
+re-stack every embedding BLOB on each call. Rows live in a preallocated
+float32 matrix that grows geometrically; single-entry writes update it in
+place (amortised O(dims)) instead of forcing a reload.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+_MIN_CAPACITY = 64
+
+
+class VectorIndex:
+    """Row-per-entry embedding matrix with id lookup."""
+
+    def __init__(self, dims: int, capacity: int = _MIN_CAPACITY) -> None:
+        self.dims = dims
+        self._ids: list[str] = []
+        self._pos: dict[str, int] = {}
+        self._matrix = np.empty((max(capacity, _MIN_CAPACITY), dims), dtype=np.float32)
+
+    @classmethod
+    def from_arrays(cls, ids: list[str], vectors: list[np.ndarray], dims: int) -> VectorIndex:
+        """Build an index from parallel id / vector lists."""
+        index = cls(dims, capacity=len(ids) * 2)
+        if ids:
+            index._matrix[: len(ids)] = np.stack(vectors)
+            index._ids = list(ids)
+            index._pos = {entry_id: i for i, entry_id in enumerate(ids)}
+        return index
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, entry_id: str) -> bool:
+        return entry_id in self._pos
+
+    def upsert(self, entry_id: str, vector: np.ndarray) -> None:
+        """Insert or replace the vector for *entry_id*."""
+        row = self._pos.get(entry_id)
+        if row is None:
+            row = len(self._ids)
+            if row == self._matrix.shape[0]:
+                grown = np.empty((row * 2, self.dims), dtype=np.float32)
+                grown[:row] = self._matrix[:row]
+                self._matrix = grown
+            self._ids.append(entry_id)
+            self._pos[entry_id] = row
+        self._matrix[row] = vector
+
+    def remove(self, entry_id: str) -> None:
+        """Drop *entry_id* if present (swaps the last row into its slot)."""
+        row = self._pos.pop(entry_id, None)
+        if row is None:
+            return
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._ids[row] = moved
+            self._pos[moved] = row
+            self._matrix[row] = self._matrix[last]
+        self._ids.pop()
+
+    def snapshot(self) -> tuple[list[str], np.ndarray] | None:
+        """Return ``(ids, matrix)`` for the live rows, or None when empty.
+
+        The matrix is a read-only view; later writes to the index replace
+        rows in place, so callers must not hold it across writes.
+        """
+        if not self._ids:
+            return None
+        view = self._matrix[: len(self._ids)]
+        view.flags.writeable = False
+        return list(self._ids), view
+
+    def top_k(self, query: np.ndarray, k: int = 1) -> list[tuple[str, float]]:
+        """Return the *k* highest dot-product matches, best first."""
+        n = len(self._ids)
+        if n == 0 or k <= 0:
+            return []
+        scores = self._matrix[:n] @ query
+        if k >= n:
+            order = np.argsort(-scores)
+        else:
+            top = np.argpartition(-scores, k - 1)[:k]
+            order = top[np.argsort(-scores[top])]
+        return [(self._ids[i], float(scores[i])) for i in order]
@@ -13,7 +13,9 @@ if _lib_dir not in (os.path.normpath(p) for p in sys.path):
 
 import argparse
 import json
+import threading
 from datetime import datetime, timezone
+from typing import Callable
 
 from semantic_memory import content_hash, source_hash
 from semantic_memory.config import read_config
@@ -21,6 +23,7 @@ from semantic_memory.database import MemoryDatabase
 from semantic_memory.embedding import create_provider
 
 from semantic_memory.keywords import extract_keywords
+from semantic_memory.quantize import resolve_storage_format
 from semantic_memory import VALID_CATEGORIES
 
 
@@ -99,6 +102,7 @@ def _check_provider_migration(
         db.set_metadata("embedding_provider", current_provider)
         db.set_metadata("embedding_model", current_model)
         db.set_metadata("embedding_dimensions", str(provider.dimensions))
+        db.set_embedding_storage(resolve_storage_format(config, prefix="[writer]"))
 
 
 def _embed_text_for_entry(entry: dict) -> str:
@@ -145,6 +149,81 @@ def _process_pending_embeddings(db: MemoryDatabase, provider: object) -> int:
     return count
 
 
+class PendingEmbeddingWorker:
+    """Background thread that drains the pending-embedding backlog.
+
+    Long-lived writers (the memory MCP server) call :meth:`notify` after a
+    store instead of running ``_process_pending_embeddings`` inline, so
+    store latency does not grow with the backlog. The worker opens its own
+    database via ``db_factory`` (sqlite connections are thread-bound) and
+    keeps processing batches until one makes no progress.
+    """
+
+    def __init__(self, db_factory: Callable[[], MemoryDatabase], provider: object) -> None:
+        self._db_factory = db_factory
+        self._provider = provider
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the worker thread (idempotent)."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="pending-embeddings", daemon=True,
+        )
+        self._thread.start()
+
+    def notify(self) -> None:
+        """Request a backlog pass; returns immediately."""
+        with self._lock:
+            self._idle.clear()
+            self._wake.set()
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until every requested pass has finished. For tests/shutdown."""
+        return self._idle.wait(timeout)
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Ask the worker to exit after its current batch and join it."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        db = None
+        try:
+            while not self._stopping.is_set():
+                self._wake.wait()
+                self._wake.clear()
+                if self._stopping.is_set():
+                    break
+                try:
+                    if db is None:
+                        db = self._db_factory()
+                    while not self._stopping.is_set():
+                        if _process_pending_embeddings(db, self._provider) == 0:
+                            break
+                except Exception as exc:
+                    print(
+                        f"Warning: pending embedding scan failed: {exc}",
+                        file=sys.stderr,
+                    )
+                with self._lock:
+                    if not self._wake.is_set():
+                        self._idle.set()
+        finally:
+            self._idle.set()
+            if db is not None:
+                db.close()
+
+
 def _backfill_keywords(db: MemoryDatabase, config: dict) -> None:
     """Backfill keywords for all entries with empty keywords.
 
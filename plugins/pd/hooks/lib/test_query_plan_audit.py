@@ -0,0 +1,88 @@
+"""Tests for query_plan_audit."""
+import sqlite3
+
+import pytest
+
+from query_plan_audit import QueryRecorder, audit, plan_findings
+
+
+@pytest.fixture
+def conn():
+    c = sqlite3.connect(":memory:")
+    c.executescript(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, kind TEXT);"
+        "CREATE INDEX idx_items_kind ON items(kind);"
+        "CREATE TABLE tags (item_id INTEGER, tag TEXT);"
+        "CREATE TABLE log (msg TEXT);"
+        "CREATE TRIGGER items_ai AFTER INSERT ON items "
+        "BEGIN INSERT INTO log VALUES (new.name); END;"
+    )
+    yield c
+    c.close()
+
+
+def test_full_scan_is_flagged(conn):
+    findings = plan_findings(
+        conn, "SELECT * FROM items WHERE name = 'x'", hot_tables={"items"},
+    )
+    assert [(f.kind, f.table) for f in findings] == [("scan", "items")]
+
+
+def test_index_search_is_not_flagged(conn):
+    assert plan_findings(
+        conn, "SELECT * FROM items WHERE kind = 'x'", hot_tables={"items"},
+    ) == []
+
+
+def test_alias_resolves_to_table(conn):
+    findings = plan_findings(
+        conn, "SELECT i.* FROM items AS i WHERE i.name = 'x'",
+        hot_tables={"items"},
+    )
+    assert [f.table for f in findings] == ["items"]
+
+
+def test_cold_tables_are_ignored(conn):
+    assert plan_findings(
+        conn, "SELECT * FROM items WHERE name = 'x'", hot_tables={"tags"},
+    ) == []
+
+
+def test_automatic_index_is_flagged(conn):
+    findings = plan_findings(
+        conn,
+        "SELECT * FROM items i LEFT JOIN tags t ON t.item_id = i.id",
+        hot_tables={"tags"},
+    )
+    assert [f.kind for f in findings] == ["auto-index"]
+
+
+def test_sorts_are_flagged_only_on_request(conn):
+    sql = "SELECT * FROM items WHERE kind = 'x' ORDER BY name"
+    assert plan_findings(conn, sql, hot_tables={"items"}) == []
+    sorts = plan_findings(conn, sql, hot_tables={"items"}, flag_sorts=True)
+    assert [f.kind for f in sorts] == ["sort"]
+
+
+def test_non_query_statements_are_skipped(conn):
+    assert plan_findings(conn, "BEGIN", hot_tables={"items"}) == []
+    assert plan_findings(conn, "SELECT * FROM gone", hot_tables={"gone"}) == []
+
+
+def test_recorder_captures_statements_until_exit(conn):
+    with QueryRecorder(conn) as recorder:
+        conn.execute("INSERT INTO items (name, kind) VALUES ('a', 'k')")
+        conn.execute("SELECT * FROM items WHERE name = 'a'").fetchall()
+    conn.execute("SELECT 1")
+    assert set(recorder.statements) >= {
+        "INSERT INTO items (name, kind) VALUES ('a', 'k')",
+        "SELECT * FROM items WHERE name = 'a'",
+    }
+    assert "SELECT 1" not in recorder.statements
+    assert not any(s.startswith("--") for s in recorder.statements)
+
+
+def test_audit_deduplicates_statements(conn):
+    sql = "SELECT * FROM items WHERE name = 'x'"
+    findings = audit(conn, [sql, sql], hot_tables={"items"})
+    assert len(findings) == 1
@@ -14,7 +14,6 @@ plan Steps 3.3/4.1/4.3/4.4/6.1, AC-25/AC-26/AC-28/AC-29/AC-30/AC-35.
 """
 from __future__ import annotations
 
-import json
 import sqlite3
 import sys
 from dataclasses import dataclass, field
@@ -64,6 +63,9 @@ class CompletionResult:
         Updated parent progress value (None if no parent or cascade skipped).
     cascade_error:
         Error message if cascade failed (completion still persists).
+    cascade_deferred:
+        True if the cascade was queued in the outbox instead of run; the
+        unblocked/progress fields are then empty.
     """
 
     state: FeatureWorkflowState | None
@@ -73,6 +75,7 @@ class CompletionResult:
     unblocked_uuids: list[str] = field(default_factory=list)
     parent_progress: float | None = None
     cascade_error: str | None = None
+    cascade_deferred: bool = False
 
 
 class EntityWorkflowEngine:
@@ -95,8 +98,13 @@ class EntityWorkflowEngine:
         artifacts_root: str,
         notification_queue: NotificationQueue | None = None,
         project_root: str = "",
+        *,
+        defer_cascade: bool = False,
     ) -> None:
         self._db = db
+        # Queue Phase B in the outbox (workflow_engine.outbox) instead of
+        # running it before complete_phase returns.
+        self.defer_cascade = defer_cascade
         self._artifacts_root = artifacts_root
         self._project_root = project_root
         self._frozen_engine = WorkflowStateEngine(db, artifacts_root)
@@ -114,7 +122,10 @@ class EntityWorkflowEngine:
 
         Two-phase commit:
           Phase A: Completion (frozen engine for features, direct DB for tasks)
-          Phase B: Cascade (unblock + rollup + notify) in separate transaction
+          Phase B: Cascade (unblock + rollup + notify) in separate transaction,
+                   or with ``defer_cascade`` an outbox job that
+                   ``run_cascade`` executes later. Called inside the
+                   caller's transaction, the job commits with Phase A.
 
         Parameters
         ----------
@@ -156,6 +167,20 @@ class EntityWorkflowEngine:
         # Skip cascade if DB is unhealthy (degraded mode)
         if state is not None and state.source == self._SOURCE_DEGRADED:
             cascade_error = "cascade skipped: degraded mode"
+        elif self.defer_cascade:
+            from .outbox import CASCADE
+            self._db.enqueue_outbox(
+                CASCADE,
+                {"entity_uuid": entity_uuid, "phase": phase},
+                dedupe_key=f"{CASCADE}:{entity_uuid}:{phase}",
+            )
+            return CompletionResult(
+                state=state,
+                entity_type=entity_type,
+                entity_uuid=entity_uuid,
+                phase=phase,
+                cascade_deferred=True,
+            )
         else:
             try:
                 unblocked, parent_progress = self._run_cascade(entity_uuid)
@@ -179,6 +204,26 @@ class EntityWorkflowEngine:
             cascade_error=cascade_error,
         )
 
+    def run_cascade(
+        self, entity_uuid: str, phase: str
+    ) -> tuple[list[str], float | None]:
+        """Run Phase B for a completed phase (the outbox ``cascade`` job).
+
+        Unblock, rollup and notifications, then anomaly propagation.
+        Unblock and rollup recompute from current state and propagation
+        skips anomalies already recorded, so a retried job converges on the
+        same state (a notification may be pushed twice). Errors propagate
+        so the outbox can retry.
+
+        Returns (unblocked_uuids, parent_progress).
+        """
+        entity = self._db.get_entity_by_uuid(entity_uuid)
+        if entity is None:
+            return [], None
+        unblocked, parent_progress = self._run_cascade(entity_uuid)
+        self._propagate_anomaly(entity_uuid, entity["entity_type"], phase)
+        return unblocked, parent_progress
+
     def transition_phase(
         self, entity_uuid: str, target_phase: str
     ) -> TransitionResponse:
@@ -623,7 +668,7 @@ class EntityWorkflowEngine:
 
         now = datetime.now(timezone.utc).isoformat()
 
-        self._notification_queue.push(
+        notifications = [
             Notification(
                 message=f"Phase completed for {entity['type_id']}",
                 entity_type_id=entity["type_id"],
@@ -631,12 +676,11 @@ class EntityWorkflowEngine:
                 project_root=self._project_root,
                 timestamp=now,
             )
-        )
-
+        ]
         for uid in unblocked:
             unblocked_entity = self._db.get_entity_by_uuid(uid)
             if unblocked_entity is not None:
-                self._notification_queue.push(
+                notifications.append(
                     Notification(
                         message=(
                             f"Entity {unblocked_entity['type_id']} unblocked"
@@ -647,6 +691,8 @@ class EntityWorkflowEngine:
                         timestamp=now,
                     )
                 )
+        # One queue transaction for the whole cascade.
+        self._notification_queue.push_many(notifications)
 
     # ------------------------------------------------------------------
     # Private: Anomaly propagation (Task 6.1 / AC-35)
@@ -678,23 +724,16 @@ class EntityWorkflowEngine:
         if phase != phases[-1]:
             return  # not terminal phase
 
-        # Check for systemic_finding in entity metadata
-        raw_meta = entity.get("metadata")
-        if not raw_meta:
-            return
-        if isinstance(raw_meta, str):
-            meta = json.loads(raw_meta)
-        elif isinstance(raw_meta, dict):
-            meta = raw_meta
-        else:
-            return
-
-        finding = meta.get("systemic_finding")
+        # Check for systemic_finding in entity metadata and for a parent;
+        # only the two keys involved are read out of the metadata blobs.
+        parent_uuid = entity.get("parent_uuid")
+        fields = self._db.get_metadata_fields(
+            [entity_uuid] + ([parent_uuid] if parent_uuid else []),
+            ["systemic_finding", "anomalies"],
+        )
+        finding = fields.get(entity_uuid, {}).get("systemic_finding")
         if not finding:
             return
-
-        # Check for parent
-        parent_uuid = entity.get("parent_uuid")
         if not parent_uuid:
             return
 
@@ -709,16 +748,14 @@ class EntityWorkflowEngine:
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
-        # Read existing parent anomalies
-        parent_raw_meta = parent.get("metadata")
-        if parent_raw_meta and isinstance(parent_raw_meta, str):
-            parent_meta = json.loads(parent_raw_meta)
-        elif isinstance(parent_raw_meta, dict):
-            parent_meta = parent_raw_meta
-        else:
-            parent_meta = {}
-
-        existing_anomalies = parent_meta.get("anomalies", [])
+        existing_anomalies = fields.get(parent_uuid, {}).get("anomalies") or []
+        if any(
+            isinstance(a, dict)
+            and a.get("source_type_id") == anomaly["source_type_id"]
+            and a.get("description") == finding
+            for a in existing_anomalies
+        ):
+            return  # already recorded (e.g. a retried cascade job)
         existing_anomalies.append(anomaly)
 
         # Write back via update_entity (shallow merge)
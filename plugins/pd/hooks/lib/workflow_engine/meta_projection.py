@@ -0,0 +1,199 @@
+"""Projection of feature state from the DB onto ``.meta.json`` files.
+
+``.meta.json`` is derived data: ``build_meta_document`` builds it from the
+feature's entity row and its last completed phase, and the result is only
+written when it differs from the file on disk (``meta_file_matches``).
+
+``MetaProjector`` projects many features at once. It reads every entity
+and workflow row in chunked bulk queries instead of a ``get_entity`` plus
+``get_state`` round trip per feature, skips byte-identical files, and
+reports which files it wrote, left unchanged or could not project. Rapid
+successive updates are coalesced upstream: the workflow MCP server queues
+projections as outbox jobs with a short delay and a per-feature dedupe
+key, so a burst of updates becomes one job that reads the latest state.
+"""
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from entity_registry.database import EntityDatabase
+from entity_registry.metadata import parse_metadata
+from workflow_engine.feature_lifecycle import _atomic_json_write, _iso_now
+
+
+@dataclass(frozen=True)
+class ProjectionReport:
+    """Outcome of a ``MetaProjector.project`` call, by feature type_id."""
+
+    written: tuple[str, ...] = ()
+    skipped: tuple[str, ...] = ()  # file already held the projected content
+    failed: dict[str, str] = field(default_factory=dict)  # type_id -> warning
+
+
+def build_meta_document(
+    entity: dict, metadata: dict, last_completed: str | None,
+) -> dict:
+    """Build the ``.meta.json`` document for a feature.
+
+    *metadata* is the entity's parsed metadata; *last_completed* is the
+    caller's authoritative value (workflow state when available, else the
+    metadata copy). Phase timing details (iterations, reviewerNotes) come
+    from metadata only.
+    """
+    phase_timing = metadata.get("phase_timing", {})
+
+    meta = {
+        "id": metadata.get("id", ""),
+        "slug": metadata.get("slug", ""),
+        "mode": metadata.get("mode", "standard"),
+        "status": entity.get("status") or "active",
+        "created": entity.get("created_at") or _iso_now(),
+        "branch": metadata.get("branch", ""),
+    }
+
+    # Top-level completed timestamp for terminal statuses (R1/R2/R4)
+    # Also trigger on last_completed == "finish" as a defensive fallback
+    # when entity status hasn't propagated yet (e.g., status=None in DB).
+    if meta["status"] in ("completed", "abandoned") or last_completed == "finish":
+        finish_completed = phase_timing.get("finish", {}).get("completed")
+        meta["completed"] = finish_completed or _iso_now()
+
+    # Optional fields -- only include when present
+    if metadata.get("brainstorm_source"):
+        meta["brainstorm_source"] = metadata["brainstorm_source"]
+    if metadata.get("backlog_source"):
+        meta["backlog_source"] = metadata["backlog_source"]
+
+    meta["lastCompletedPhase"] = last_completed
+
+    # Phases from phase_timing metadata
+    phases = {}
+    for phase_name, timing in phase_timing.items():
+        phase_entry = {}
+        if timing.get("started"):
+            phase_entry["started"] = timing["started"]
+        if timing.get("completed"):
+            phase_entry["completed"] = timing["completed"]
+        if timing.get("iterations") is not None:
+            phase_entry["iterations"] = timing["iterations"]
+        if timing.get("reviewerNotes"):
+            phase_entry["reviewerNotes"] = timing["reviewerNotes"]
+        if phase_entry:
+            phases[phase_name] = phase_entry
+    meta["phases"] = phases
+
+    # Skipped phases
+    if metadata.get("skipped_phases"):
+        meta["skippedPhases"] = metadata["skipped_phases"]
+
+    # Backward travel fields (feature 073)
+    if metadata.get("backward_context"):
+        meta["backward_context"] = metadata["backward_context"]
+    if metadata.get("backward_return_target"):
+        meta["backward_return_target"] = metadata["backward_return_target"]
+    # backward_history is audit-only — stays in DB, not projected to .meta.json
+
+    # Phase summaries (feature 075)
+    if metadata.get("phase_summaries"):
+        meta["phase_summaries"] = metadata["phase_summaries"]
+
+    return meta
+
+
+def meta_file_matches(path: str, meta: dict) -> bool:
+    """Whether *path* already holds exactly what ``_atomic_json_write`` would write."""
+    expected = (json.dumps(meta, indent=2) + "\n").encode("utf-8")
+    try:
+        if os.path.getsize(path) != len(expected):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == expected
+    except OSError:
+        return False
+
+
+class MetaProjector:
+    """Writes ``.meta.json`` for batches of features.
+
+    Parameters
+    ----------
+    db:
+        Source of entity and workflow_phases rows.
+    engine:
+        Optional ``WorkflowStateEngine``. With an engine, the bulk-read
+        workflow_phases row supplies ``lastCompletedPhase`` and the engine
+        is only asked about features without one. Without an engine the
+        metadata copy is used, as in the single-feature projection.
+    """
+
+    def __init__(self, db: EntityDatabase, engine=None) -> None:
+        self._db = db
+        self._engine = engine
+
+    def project(
+        self,
+        type_ids: Iterable[str],
+        *,
+        feature_dirs: dict[str, str] | None = None,
+    ) -> ProjectionReport:
+        """Project each feature in *type_ids*; duplicates are projected once.
+
+        *feature_dirs* overrides the entity's ``artifact_path`` per type_id.
+        A feature that cannot be projected is reported in ``failed`` with
+        the same warning the single-feature projection returns.
+        """
+        wanted = list(dict.fromkeys(type_ids))
+        feature_dirs = feature_dirs or {}
+        entities = self._db.get_entities_by_type_ids(wanted)
+        phases = {
+            row["type_id"]: row
+            for row in self._db.list_workflow_phases(type_ids=list(entities))
+        }
+
+        written: list[str] = []
+        skipped: list[str] = []
+        failed: dict[str, str] = {}
+        for type_id in wanted:
+            entity = entities.get(type_id)
+            if entity is None:
+                failed[type_id] = f"entity not found: {type_id}"
+                continue
+            feature_dir = feature_dirs.get(type_id) or entity.get("artifact_path")
+            if not feature_dir:
+                failed[type_id] = (
+                    f"artifact_path not set and no feature_dir provided: {type_id}"
+                )
+                continue
+
+            metadata = parse_metadata(entity.get("metadata"))
+            meta = build_meta_document(
+                entity, metadata,
+                self._last_completed(type_id, phases.get(type_id), metadata),
+            )
+            meta_path = os.path.join(feature_dir, ".meta.json")
+            if meta_file_matches(meta_path, meta):
+                skipped.append(type_id)
+                continue
+            try:
+                _atomic_json_write(meta_path, meta)
+            except Exception as exc:
+                failed[type_id] = f"projection failed: {exc}"
+                continue
+            written.append(type_id)
+
+        return ProjectionReport(
+            written=tuple(written), skipped=tuple(skipped), failed=failed,
+        )
+
+    def _last_completed(
+        self, type_id: str, row: dict | None, metadata: dict,
+    ) -> str | None:
+        if self._engine is None:
+            return metadata.get("last_completed_phase")
+        if row is not None:
+            return row["last_completed_phase"]
+        state = self._engine.get_state(type_id)
+        return state.last_completed_phase if state else None
@@ -0,0 +1,167 @@
+"""Contention benchmark for the notification queue.
+
+Starts ``--sessions`` processes that each behave like a Claude session:
+push notifications for one of ``--projects`` project roots (in batches of
+``--batch``, as a completion cascade does) and drain their project every
+``--drain-every`` pushes. Reports per-operation latency percentiles and
+checks that every pushed notification was drained exactly once.
+
+Usage (from plugins/pd, with hooks/lib on PYTHONPATH):
+    python -m workflow_engine.notification_bench --sessions 32 --pushes 500
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from workflow_engine.notifications import Notification, NotificationQueue
+
+
+def _session(
+    queue_path: str,
+    session_id: int,
+    pushes: int,
+    projects: int,
+    batch: int,
+    drain_every: int,
+    results: multiprocessing.Queue,
+) -> None:
+    queue = NotificationQueue(queue_path=queue_path)
+    project_root = f"/bench/project-{session_id % projects}"
+    push_ms: list[float] = []
+    drain_ms: list[float] = []
+    drained = 0
+    sent = 0
+    while sent < pushes:
+        size = min(batch, pushes - sent)
+        notes = [
+            Notification(
+                message=f"session {session_id} event {sent + i}",
+                entity_type_id=f"feature:{session_id:03d}-bench",
+                event="phase_completed" if (sent + i) % 3 else "unblocked",
+                project_root=project_root,
+                timestamp="2026-01-01T00:00:00+00:00",
+            )
+            for i in range(size)
+        ]
+        start = time.perf_counter()
+        queue.push_many(notes)
+        push_ms.append((time.perf_counter() - start) * 1000)
+        sent += size
+        if sent % drain_every < size:
+            start = time.perf_counter()
+            drained += len(queue.drain(project_root))
+            drain_ms.append((time.perf_counter() - start) * 1000)
+    queue.close()
+    results.put((sent, drained, push_ms, drain_ms))
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _summarise(values: list[float]) -> dict:
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered), 3) if ordered else 0.0,
+        "p50_ms": round(_percentile(ordered, 50), 3),
+        "p99_ms": round(_percentile(ordered, 99), 3),
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+    }
+
+
+def run_bench(
+    queue_path: str,
+    *,
+    sessions: int,
+    pushes: int,
+    projects: int,
+    batch: int = 1,
+    drain_every: int = 10,
+) -> dict:
+    """Run the benchmark against ``queue_path`` and return the report."""
+    results: multiprocessing.Queue = multiprocessing.Queue()
+    procs = [
+        multiprocessing.Process(
+            target=_session,
+            args=(queue_path, sid, pushes, projects, batch, drain_every, results),
+        )
+        for sid in range(sessions)
+    ]
+    start = time.perf_counter()
+    for proc in procs:
+        proc.start()
+    collected = [results.get(timeout=300) for _ in procs]
+    for proc in procs:
+        proc.join(timeout=30)
+    elapsed = time.perf_counter() - start
+
+    pushed = sum(r[0] for r in collected)
+    drained = sum(r[1] for r in collected)
+    # Sessions stop pushing at different times; sweep what is left.
+    queue = NotificationQueue(queue_path=queue_path)
+    for p in range(projects):
+        drained += len(queue.drain(f"/bench/project-{p}"))
+    queue.close()
+
+    return {
+        "sessions": sessions,
+        "projects": projects,
+        "batch": batch,
+        "pushed": pushed,
+        "drained": drained,
+        "elapsed_s": round(elapsed, 3),
+        "pushes_per_s": round(pushed / elapsed, 1) if elapsed else 0.0,
+        "push": _summarise([v for r in collected for v in r[2]]),
+        "drain": _summarise([v for r in collected for v in r[3]]),
+        "failed_sessions": sum(1 for proc in procs if proc.exitcode != 0),
+    }
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(description="Notification queue contention benchmark")
+    parser.add_argument("--queue", help="Queue database path (default: temp file)")
+    parser.add_argument("--sessions", type=int, default=16)
+    parser.add_argument("--pushes", type=int, default=200,
+                        help="Notifications pushed per session")
+    parser.add_argument("--projects", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=1,
+                        help="Notifications per push_many call")
+    parser.add_argument("--drain-every", type=int, default=10)
+    parsed = parser.parse_args(args)
+
+    tmpdir = None
+    queue_path = parsed.queue
+    if queue_path is None:
+        tmpdir = tempfile.TemporaryDirectory(prefix="pd-notify-bench-")
+        queue_path = os.path.join(tmpdir.name, "notifications.db")
+    try:
+        report = run_bench(
+            queue_path,
+            sessions=parsed.sessions,
+            pushes=parsed.pushes,
+            projects=parsed.projects,
+            batch=max(1, parsed.batch),
+            drain_every=max(1, parsed.drain_every),
+        )
+    finally:
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+    print(json.dumps(report, indent=2))
+    ok = report["pushed"] == report["drained"] and not report["failed_sessions"]
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,50 @@
 """Notification queue for entity state change events.
 
-File-backed JSONL queue with project-scoped drain. Uses fcntl.flock()
-for concurrency safety across multiple Claude sessions.
+SQLite-backed queue with project-scoped drain. Every Claude session appends
+to and drains from one WAL database; rows are indexed by
+``(project_root, event, seq)`` so a drain reads and deletes only the
+matching rows instead of rewriting every project's backlog, and pushes
+from other sessions only wait for the short drain transaction.
+
+Queues written by earlier versions (``notifications.jsonl`` next to the
+database) are imported once, under the legacy file's ``flock``, the first
+time the database is opened.
 """
 from __future__ import annotations
 
 import fcntl
 import json
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
-_DEFAULT_QUEUE_PATH = "~/.claude/pd/notifications.jsonl"
+_DEFAULT_QUEUE_PATH = "~/.claude/pd/notifications.db"
+_LEGACY_QUEUE_NAME = "notifications.jsonl"
+
+_BUSY_TIMEOUT_MS = 10_000
+
+# Free pages a drain leaves behind before it hands some back to the OS.
+# Each compaction step is bounded so a drain never holds the write lock
+# for long.
+_COMPACT_FREE_PAGES = 256
+
+_COLUMNS = ("message", "entity_type_id", "event", "project_root", "timestamp")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notifications (
+    seq            INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_root   TEXT NOT NULL,
+    event          TEXT NOT NULL,
+    entity_type_id TEXT NOT NULL,
+    message        TEXT NOT NULL,
+    timestamp      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_notifications_project
+    ON notifications(project_root, event, seq);
+"""
 
 
 @dataclass(frozen=True)
@@ -25,63 +59,134 @@ class Notification:
 
 
 class NotificationQueue:
-    """File-backed notification queue. Notifications surfaced at interaction boundaries.
+    """SQLite-backed notification queue. Notifications surfaced at interaction boundaries.
 
-    Thread/process safety: all file operations use fcntl.flock(LOCK_EX)
-    to prevent TOCTOU races between concurrent Claude sessions.
+    Process safety comes from SQLite's write lock (``BEGIN IMMEDIATE`` with
+    a busy timeout); one connection per queue object is shared between
+    threads under a lock.
     """
 
-    def __init__(self, queue_path: str = _DEFAULT_QUEUE_PATH) -> None:
+    def __init__(
+        self,
+        queue_path: str = _DEFAULT_QUEUE_PATH,
+        *,
+        legacy_path: str | None = None,
+    ) -> None:
         self._path = Path(queue_path).expanduser()
-
-    def push(self, notification: Notification) -> None:
-        """Append a notification to the JSONL queue file.
-
-        Creates parent directories if they don't exist.
+        legacy = (
+            Path(legacy_path).expanduser()
+            if legacy_path is not None
+            else self._path.with_name(_LEGACY_QUEUE_NAME)
+        )
+        self._legacy_path = legacy if legacy != self._path else None
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Connection
+    # ------------------------------------------------------------------
+
+    def _connection(self, *, create: bool) -> sqlite3.Connection | None:
+        """Return the shared connection, opening it on first use.
+
+        With ``create=False`` a queue whose database and legacy file are
+        both absent returns None instead of creating an empty database.
         """
+        if self._conn is not None:
+            return self._conn
+        if not create and not self._path.exists() and not (
+            self._legacy_path is not None and self._legacy_path.exists()
+        ):
+            return None
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._path, "a") as f:
+        conn = sqlite3.connect(
+            str(self._path),
+            timeout=_BUSY_TIMEOUT_MS / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        try:
+            conn.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
+            # auto_vacuum only takes effect before the first table exists.
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(_SCHEMA)
+            self._import_legacy(conn)
+        except Exception:
+            conn.close()
+            raise
+        self._conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self, conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _import_legacy(self, conn: sqlite3.Connection) -> None:
+        """Move notifications from a pre-SQLite JSONL queue into the table."""
+        legacy = self._legacy_path
+        if legacy is None or not legacy.exists():
+            return
+        with open(legacy, "r+") as f:
             fcntl.flock(f, fcntl.LOCK_EX)
             try:
-                f.write(json.dumps(asdict(notification)) + "\n")
+                rows = []
+                for line in f:
+                    stripped = line.strip()
+                    if not stripped:
+                        continue
+                    try:
+                        rows.append(_row(Notification(**json.loads(stripped))))
+                    except (ValueError, TypeError):
+                        continue  # unreadable line; nothing could drain it
+                with self._transaction(conn):
+                    _insert(conn, rows)
+                f.truncate(0)
             finally:
                 fcntl.flock(f, fcntl.LOCK_UN)
+        legacy.unlink(missing_ok=True)
 
-    def drain(self, project_root: str) -> list[Notification]:
-        """Read and remove notifications matching project_root.
+    def close(self) -> None:
+        """Close the underlying connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
-        Returns matched notifications. Non-matching entries are preserved
-        in the queue file. Uses exclusive file lock around the
-        read-filter-rewrite cycle to prevent concurrent data loss.
-        """
-        if not self._path.exists():
-            return []
+    # ------------------------------------------------------------------
+    # Queue operations
+    # ------------------------------------------------------------------
 
-        with open(self._path, "r+") as f:
-            fcntl.flock(f, fcntl.LOCK_EX)
-            try:
-                lines = f.readlines()
-                matched: list[Notification] = []
-                remaining: list[str] = []
+    def push(self, notification: Notification) -> None:
+        """Append a notification to the queue.
 
-                for line in lines:
-                    stripped = line.strip()
-                    if not stripped:
-                        continue
-                    data = json.loads(stripped)
-                    if data.get("project_root") == project_root:
-                        matched.append(Notification(**data))
-                    else:
-                        remaining.append(stripped + "\n")
-
-                # Rewrite file with only non-matched entries
-                f.seek(0)
-                f.writelines(remaining)
-                f.truncate()
-            finally:
-                fcntl.flock(f, fcntl.LOCK_UN)
+        Creates parent directories if they don't exist.
+        """
+        self.push_many([notification])
+
+    def push_many(self, notifications: Iterable[Notification]) -> None:
+        """Append several notifications in one transaction."""
+        rows = [_row(n) for n in notifications]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connection(create=True)
+            with self._transaction(conn):
+                _insert(conn, rows)
 
-        return matched
+    def drain(self, project_root: str) -> list[Notification]:
+        """Read and remove notifications matching project_root.
+
+        Returns matched notifications in push order. Other projects'
+        entries are neither read nor rewritten.
+        """
+        return self.drain_filtered(project_root)
 
     def drain_filtered(
         self, project_root: str, event_types: list[str] | None = None
@@ -99,38 +204,65 @@ class NotificationQueue:
         Returns
         -------
         list[Notification]
-            Matched + filtered notifications.
+            Matched + filtered notifications, in push order.
         """
-        if not self._path.exists():
+        if event_types is not None and not event_types:
             return []
-
-        with open(self._path, "r+") as f:
-            fcntl.flock(f, fcntl.LOCK_EX)
-            try:
-                lines = f.readlines()
-                matched: list[Notification] = []
-                remaining: list[str] = []
-
-                for line in lines:
-                    stripped = line.strip()
-                    if not stripped:
-                        continue
-                    data = json.loads(stripped)
-                    if data.get("project_root") == project_root:
-                        if event_types is None or data.get("event") in event_types:
-                            matched.append(Notification(**data))
-                        else:
-                            remaining.append(stripped + "\n")
-                    else:
-                        remaining.append(stripped + "\n")
-
-                f.seek(0)
-                f.writelines(remaining)
-                f.truncate()
-            finally:
-                fcntl.flock(f, fcntl.LOCK_UN)
-
-        return matched
+        where = "project_root = ?"
+        params: list[str] = [project_root]
+        if event_types is not None:
+            where += f" AND event IN ({', '.join('?' * len(event_types))})"
+            params.extend(event_types)
+
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return []
+            with self._transaction(conn):
+                rows = conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM notifications "
+                    f"WHERE {where} ORDER BY seq",
+                    params,
+                ).fetchall()
+                if rows:
+                    conn.execute(f"DELETE FROM notifications WHERE {where}", params)
+            if rows:
+                self._compact(conn)
+        return [Notification(*row) for row in rows]
+
+    def pending(self, project_root: str | None = None) -> int:
+        """Number of queued notifications (for one project, or all)."""
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return 0
+            if project_root is None:
+                row = conn.execute("SELECT COUNT(*) FROM notifications").fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT COUNT(*) FROM notifications WHERE project_root = ?",
+                    (project_root,),
+                ).fetchone()
+        return row[0]
+
+    def _compact(self, conn: sqlite3.Connection) -> None:
+        """Release a bounded number of free pages once enough accumulate."""
+        free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if free >= _COMPACT_FREE_PAGES:
+            conn.execute(f"PRAGMA incremental_vacuum({_COMPACT_FREE_PAGES})")
+
+
+def _row(notification: Notification) -> tuple[str, ...]:
+    data = asdict(notification)
+    return tuple(data[column] for column in _COLUMNS)
+
+
+def _insert(conn: sqlite3.Connection, rows: list[tuple[str, ...]]) -> None:
+    conn.executemany(
+        f"INSERT INTO notifications ({', '.join(_COLUMNS)}) "
+        f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+        rows,
+    )
 
 
 def format_human(notifications: list[Notification]) -> str:
@@ -192,7 +324,10 @@ def auto_drain_hook(project_root: str, queue_path: str | None = None) -> str:
     else:
         queue = NotificationQueue()
 
-    notifications = queue.drain(project_root)
+    try:
+        notifications = queue.drain(project_root)
+    finally:
+        queue.close()
     if not notifications:
         return ""
     return format_human(notifications)
@@ -0,0 +1,290 @@
+"""Outbox worker: runs post-commit work queued in the entities.db outbox.
+
+Phase completion writes its follow-up work (the cascade, the .meta.json
+projection) as outbox rows inside the transaction that completes the
+phase, so the work is durable exactly when the completion is. This module
+drains those rows:
+
+``OutboxWorker``
+    Claims due jobs, dispatches each to the handler registered for its
+    ``kind`` and records the outcome. A ``BatchHandler`` receives every
+    claimed job of its kind in one call (e.g. one bulk projection for many
+    features). A job that raises is retried with
+    exponential backoff and parked as ``failed`` after ``max_attempts``.
+    Jobs leased by a worker that died are handed back by
+    ``EntityDatabase.recover_outbox`` at the start of every run.
+
+``BackgroundOutboxWorker``
+    Runs an ``OutboxWorker`` on a daemon thread with its own connection
+    (``EntityDatabase`` connections are bound to their thread). The thread
+    wakes on ``notify()`` after a commit, when the next delayed job falls
+    due, and polls as a fallback.
+
+Handlers receive the decoded payload and must be idempotent: a job can run
+again after a crash between the handler returning and the row being
+deleted.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from entity_registry.database import EntityDatabase
+
+# Job kinds enqueued by EntityWorkflowEngine and the workflow MCP server.
+CASCADE = "cascade"
+META_PROJECTION = "meta_projection"
+
+Handler = Callable[[dict], None]
+
+
+@dataclass(frozen=True)
+class BatchHandler:
+    """Handler that runs all claimed jobs of its kind in one call.
+
+    ``run`` receives the payloads in claim order and returns one item per
+    payload: ``None`` when that job succeeded, or the exception to record
+    against it. If ``run`` itself raises, every job in the batch failed.
+    """
+
+    run: Callable[[list[dict]], list[Exception | None]]
+
+
+@dataclass(frozen=True)
+class OutboxRun:
+    """Outcome counts of one ``OutboxWorker.run_pending`` call."""
+
+    done: int = 0
+    retried: int = 0
+    failed: int = 0
+    recovered: int = 0
+
+
+class OutboxWorker:
+    """Claims outbox jobs from *db* and runs them through *handlers*.
+
+    Parameters
+    ----------
+    db:
+        Database holding the outbox; used from the calling thread only.
+    handlers:
+        Mapping of job kind to a per-job handler or a ``BatchHandler``.
+        Jobs of an unknown kind fail permanently on their first attempt.
+    max_attempts:
+        Attempts before a job is parked as ``failed``.
+    retry_base_seconds:
+        Delay before the first retry; doubles per attempt, capped at
+        ``retry_max_seconds``.
+    lease_seconds:
+        How long a claimed job is reserved before it counts as abandoned.
+    """
+
+    def __init__(
+        self,
+        db: EntityDatabase,
+        handlers: dict[str, Handler | BatchHandler],
+        *,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 2.0,
+        retry_max_seconds: float = 300.0,
+        lease_seconds: float = 300.0,
+        batch_size: int = 20,
+    ) -> None:
+        self._db = db
+        self._handlers = dict(handlers)
+        self._max_attempts = max_attempts
+        self._retry_base = retry_base_seconds
+        self._retry_max = retry_max_seconds
+        self._lease_seconds = lease_seconds
+        self._batch_size = batch_size
+
+    def retry_delay(self, attempts: int) -> float:
+        """Backoff before the next try of a job that has run *attempts* times."""
+        return min(self._retry_base * (2 ** max(attempts - 1, 0)), self._retry_max)
+
+    def run_pending(self, *, max_jobs: int | None = None) -> OutboxRun:
+        """Run due jobs until none are left (or *max_jobs* have been claimed).
+
+        Jobs whose retry is not yet due are left for a later run.
+        """
+        done = retried = failed = 0
+        recovered = self._db.recover_outbox()
+        claimed = 0
+        while max_jobs is None or claimed < max_jobs:
+            limit = self._batch_size
+            if max_jobs is not None:
+                limit = min(limit, max_jobs - claimed)
+            jobs = self._db.claim_outbox(
+                limit=limit, lease_seconds=self._lease_seconds,
+            )
+            if not jobs:
+                break
+            claimed += len(jobs)
+            for outcome in self._run_jobs(jobs):
+                if outcome == "done":
+                    done += 1
+                elif outcome == "retried":
+                    retried += 1
+                else:
+                    failed += 1
+        return OutboxRun(
+            done=done, retried=retried, failed=failed, recovered=recovered,
+        )
+
+    def _run_jobs(self, jobs: list[dict]) -> list[str]:
+        batches: dict[str, list[dict]] = {}
+        outcomes = []
+        for job in jobs:
+            handler = self._handlers.get(job["kind"])
+            if isinstance(handler, BatchHandler):
+                batches.setdefault(job["kind"], []).append(job)
+            else:
+                outcomes.append(self._run_job(job, handler))
+        for kind, batch in batches.items():
+            try:
+                errors = self._handlers[kind].run([j["payload"] for j in batch])
+            except Exception as exc:
+                errors = [exc] * len(batch)
+            outcomes.extend(
+                self._record(job, error) for job, error in zip(batch, errors)
+            )
+        return outcomes
+
+    def _run_job(self, job: dict, handler: Handler | None) -> str:
+        if handler is None:
+            self._db.fail_outbox(job["id"], f"no handler for kind {job['kind']!r}")
+            return "failed"
+        try:
+            handler(job["payload"])
+        except Exception as exc:
+            return self._record(job, exc)
+        return self._record(job, None)
+
+    def _record(self, job: dict, exc: Exception | None) -> str:
+        if exc is None:
+            self._db.finish_outbox(job["id"])
+            return "done"
+        error = f"{type(exc).__name__}: {exc}"
+        print(
+            f"outbox: {job['kind']} job {job['id']} failed "
+            f"(attempt {job['attempts']}): {error}",
+            file=sys.stderr,
+        )
+        if job["attempts"] >= self._max_attempts:
+            self._db.fail_outbox(job["id"], error)
+            return "failed"
+        self._db.retry_outbox(
+            job["id"], error, delay_seconds=self.retry_delay(job["attempts"]),
+        )
+        return "retried"
+
+
+class BackgroundOutboxWorker:
+    """Daemon thread that drains the outbox.
+
+    Parameters
+    ----------
+    open_db:
+        Opens the thread's own ``EntityDatabase`` (called on the thread).
+    build_handlers:
+        Builds the handler mapping around that database.
+    poll_interval:
+        Seconds between runs when nobody calls ``notify()``; also bounds
+        how late a retry runs after it falls due.
+    **worker_options:
+        Passed to ``OutboxWorker``.
+    """
+
+    def __init__(
+        self,
+        open_db: Callable[[], EntityDatabase],
+        build_handlers: Callable[
+            [EntityDatabase], dict[str, Handler | BatchHandler]
+        ],
+        *,
+        poll_interval: float = 30.0,
+        **worker_options,
+    ) -> None:
+        self._open_db = open_db
+        self._build_handlers = build_handlers
+        self._poll_interval = poll_interval
+        self._worker_options = worker_options
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._idle = threading.Condition()
+        self._busy = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the thread; its first run sweeps jobs left by a previous process."""
+        if self._thread is not None:
+            return
+        self.notify()
+        self._thread = threading.Thread(
+            target=self._run, name="outbox-worker", daemon=True,
+        )
+        self._thread.start()
+
+    def notify(self) -> None:
+        """Wake the thread: new jobs were committed."""
+        with self._idle:
+            self._busy = True
+        self._wake.set()
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until every notified job has been attempted. True if idle.
+
+        Jobs delayed (or retrying) into the next ``poll_interval`` count as
+        outstanding.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._busy, timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the thread; unfinished jobs stay queued for the next start."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        try:
+            db = self._open_db()
+        except Exception as exc:
+            print(f"outbox: worker could not open database: {exc}", file=sys.stderr)
+            with self._idle:
+                self._busy = False
+                self._idle.notify_all()
+            return
+        try:
+            worker = OutboxWorker(
+                db, self._build_handlers(db), **self._worker_options,
+            )
+            wait = self._poll_interval
+            while not self._stop.is_set():
+                self._wake.wait(wait)
+                if self._stop.is_set():
+                    break
+                with self._idle:
+                    self._wake.clear()
+                next_due = None
+                try:
+                    worker.run_pending()
+                    next_due = db.next_outbox_due()
+                except Exception as exc:
+                    print(f"outbox: worker run failed: {exc}", file=sys.stderr)
+                soon = next_due is not None and next_due < self._poll_interval
+                wait = next_due if soon else self._poll_interval
+                with self._idle:
+                    if not self._wake.is_set() and not soon:
+                        self._busy = False
+                        self._idle.notify_all()
+        finally:
+            with self._idle:
+                self._busy = False
+                self._idle.notify_all()
+            db.close()
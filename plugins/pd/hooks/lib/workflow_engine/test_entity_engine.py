@@ -159,6 +159,32 @@ class TestFeatureCompletePhase:
         assert result.state.current_phase == "specify"
         assert result.state.last_completed_phase == "brainstorm"
 
+    def test_complete_phase_rereads_rows_from_row_cache(self, tmp_path):
+        """Repeat entity / workflow_phase reads during completion hit the cache."""
+        selects = {}
+        for cached in (False, True):
+            db = EntityDatabase(":memory:", row_cache=cached)
+            slug = "010-cached"
+            artifacts_root = str(tmp_path / str(cached))
+            _create_meta_json(artifacts_root, slug, mode="standard")
+            _register(db, "project", "P1", "Project")
+            uuid = _register(db, "feature", slug, "Cached Feature",
+                             parent_type_id="project:P1")
+            _with_phase(db, f"feature:{slug}", "specify", mode="standard",
+                        last_completed_phase="brainstorm")
+            engine = _make_engine(db, artifacts_root)
+
+            statements: list[str] = []
+            db.set_trace_callback(statements.append)
+            result = engine.complete_phase(uuid, "specify")
+            db.set_trace_callback(None)
+
+            assert result.state.last_completed_phase == "specify"
+            selects[cached] = sum(s.startswith("SELECT") for s in statements)
+            if cached:
+                assert db.row_cache_stats()["hits"] >= 5
+        assert selects[True] < selects[False]
+
 
 # ---------------------------------------------------------------------------
 # Test 2: Task complete_phase → task state update + cascade
@@ -484,8 +510,10 @@ class TestWithoutNotificationQueue:
         result = engine.complete_phase(uuid, "brainstorm")
 
         assert result.cascade_error is None
-        # Notification should have been pushed
-        assert queue.push.called
+        # Notifications should have been pushed in one batch
+        queue.push_many.assert_called_once()
+        (pushed,), _ = queue.push_many.call_args
+        assert [n.event for n in pushed] == ["phase_completed"]
 
 
 # ---------------------------------------------------------------------------
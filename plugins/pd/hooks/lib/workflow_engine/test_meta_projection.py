@@ -0,0 +1,145 @@
+"""Tests for workflow_engine.meta_projection."""
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from entity_registry.database import EntityDatabase
+from workflow_engine.engine import WorkflowStateEngine
+from workflow_engine.meta_projection import (
+    MetaProjector,
+    ProjectionReport,
+    build_meta_document,
+    meta_file_matches,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = EntityDatabase(str(tmp_path / "entities.db"))
+    yield database
+    database.close()
+
+
+def _feature(db, root, slug, *, phase="design", last_completed="specify"):
+    feature_dir = os.path.join(str(root), "features", slug)
+    os.makedirs(feature_dir, exist_ok=True)
+    db.register_entity(
+        "feature", slug, slug, status="active", artifact_path=feature_dir,
+        metadata={"id": slug.split("-", 1)[0], "slug": slug.split("-", 1)[1],
+                  "mode": "standard", "phase_timing": {
+                      "specify": {"started": "2026-01-01T00:00:00Z",
+                                  "completed": "2026-01-02T00:00:00Z"}}},
+        project_id="__unknown__",
+    )
+    db.create_workflow_phase(
+        f"feature:{slug}", workflow_phase=phase,
+        last_completed_phase=last_completed,
+    )
+    return os.path.join(feature_dir, ".meta.json")
+
+
+def _read(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+class TestMetaProjector:
+    def test_projects_batch_and_skips_unchanged_files(self, db, tmp_path):
+        paths = [_feature(db, tmp_path, f"00{i}-f{i}") for i in range(3)]
+        type_ids = [f"feature:00{i}-f{i}" for i in range(3)]
+        projector = MetaProjector(db, WorkflowStateEngine(db, str(tmp_path)))
+
+        first = projector.project(type_ids)
+        assert first == ProjectionReport(written=tuple(type_ids))
+        assert _read(paths[0])["lastCompletedPhase"] == "specify"
+        assert _read(paths[0])["phases"]["specify"]["completed"] == "2026-01-02T00:00:00Z"
+
+        mtime = os.stat(paths[1]).st_mtime_ns
+        db.update_workflow_phase(type_ids[0], last_completed_phase="design")
+        second = projector.project(type_ids)
+        assert second.written == (type_ids[0],)
+        assert second.skipped == tuple(type_ids[1:])
+        assert os.stat(paths[1]).st_mtime_ns == mtime
+        assert _read(paths[0])["lastCompletedPhase"] == "design"
+
+    def test_matches_single_feature_projection(self, db, tmp_path):
+        from entity_registry.metadata import parse_metadata
+
+        path = _feature(db, tmp_path, "010-same")
+        MetaProjector(db, WorkflowStateEngine(db, str(tmp_path))).project(
+            ["feature:010-same"],
+        )
+        entity = db.get_entity("feature:010-same")
+        expected = build_meta_document(
+            entity, parse_metadata(entity["metadata"]), "specify",
+        )
+        assert meta_file_matches(path, expected)
+
+    def test_reads_rows_in_bulk(self, db, tmp_path):
+        type_ids = []
+        for i in range(20):
+            _feature(db, tmp_path, f"{i:03d}-bulk")
+            type_ids.append(f"feature:{i:03d}-bulk")
+        statements = []
+        db._conn.set_trace_callback(statements.append)
+        try:
+            MetaProjector(db, WorkflowStateEngine(db, str(tmp_path))).project(type_ids)
+        finally:
+            db._conn.set_trace_callback(None)
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert len(selects) == 2
+
+    def test_reports_unprojectable_features(self, db, tmp_path):
+        db.register_entity(
+            "feature", "011-nopath", "No path", status="active",
+            project_id="__unknown__",
+        )
+        report = MetaProjector(db).project(
+            ["feature:011-nopath", "feature:999-missing"],
+        )
+        assert report.written == () and report.skipped == ()
+        assert report.failed == {
+            "feature:011-nopath":
+                "artifact_path not set and no feature_dir provided: feature:011-nopath",
+            "feature:999-missing": "entity not found: feature:999-missing",
+        }
+
+    def test_write_error_is_reported_per_feature(self, db, tmp_path, monkeypatch):
+        import workflow_engine.meta_projection as mp
+
+        _feature(db, tmp_path, "012-ok")
+        _feature(db, tmp_path, "013-bad")
+
+        real_write = mp._atomic_json_write
+
+        def flaky_write(path, data):
+            if "013-bad" in path:
+                raise OSError("disk full")
+            real_write(path, data)
+
+        monkeypatch.setattr(mp, "_atomic_json_write", flaky_write)
+        report = MetaProjector(db).project(["feature:012-ok", "feature:013-bad"])
+        assert report.written == ("feature:012-ok",)
+        assert report.failed == {"feature:013-bad": "projection failed: disk full"}
+
+    def test_without_engine_uses_metadata_last_completed(self, db, tmp_path):
+        path = _feature(db, tmp_path, "014-meta")
+        db.update_entity(
+            "feature:014-meta",
+            metadata={"last_completed_phase": "brainstorm"},
+        )
+        MetaProjector(db).project(["feature:014-meta"])
+        assert _read(path)["lastCompletedPhase"] == "brainstorm"
+
+
+def test_meta_file_matches_requires_identical_bytes(tmp_path):
+    path = str(tmp_path / ".meta.json")
+    meta = {"id": "1", "phases": {}}
+    assert not meta_file_matches(path, meta)
+    with open(path, "w") as f:
+        f.write(json.dumps(meta, indent=2) + "\n")
+    assert meta_file_matches(path, meta)
+    assert not meta_file_matches(path, {**meta, "id": "2"})
@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import json
 import os
+import sqlite3
 import tempfile
+from dataclasses import asdict
 from pathlib import Path
 
 import pytest
@@ -19,7 +21,7 @@ from workflow_engine.notifications import (
 @pytest.fixture
 def queue_path(tmp_path: Path) -> Path:
     """Return a temp file path for the notification queue."""
-    return tmp_path / "notifications.jsonl"
+    return tmp_path / "notifications.db"
 
 
 @pytest.fixture
@@ -71,31 +73,44 @@ class TestPush:
         queue.push(_make_notification())
         assert queue_path.exists()
 
-    def test_push_appends_jsonl(self, queue: NotificationQueue, queue_path: Path) -> None:
+    def test_push_appends_in_order(self, queue: NotificationQueue) -> None:
         queue.push(_make_notification(message="first"))
         queue.push(_make_notification(message="second"))
-        lines = queue_path.read_text().strip().split("\n")
-        assert len(lines) == 2
-        assert json.loads(lines[0])["message"] == "first"
-        assert json.loads(lines[1])["message"] == "second"
+        assert queue.pending() == 2
+        drained = queue.drain(project_root="/projects/alpha")
+        assert [n.message for n in drained] == ["first", "second"]
 
     def test_push_creates_parent_directories(self, tmp_path: Path) -> None:
-        deep_path = tmp_path / "a" / "b" / "notifications.jsonl"
+        deep_path = tmp_path / "a" / "b" / "notifications.db"
         q = NotificationQueue(queue_path=str(deep_path))
         q.push(_make_notification())
         assert deep_path.exists()
 
-    def test_push_json_roundtrip(self, queue: NotificationQueue, queue_path: Path) -> None:
-        n = _make_notification()
-        queue.push(n)
-        data = json.loads(queue_path.read_text().strip())
-        assert data == {
-            "message": "Phase completed",
-            "entity_type_id": "feature:042-test",
-            "event": "completion_ripple",
-            "project_root": "/projects/alpha",
-            "timestamp": "2026-03-22T10:00:00Z",
-        }
+    def test_push_stores_every_field(self, queue: NotificationQueue, queue_path: Path) -> None:
+        queue.push(_make_notification())
+        queue.close()
+        conn = sqlite3.connect(queue_path)
+        row = conn.execute(
+            "SELECT message, entity_type_id, event, project_root, timestamp"
+            " FROM notifications"
+        ).fetchone()
+        conn.close()
+        assert row == (
+            "Phase completed",
+            "feature:042-test",
+            "completion_ripple",
+            "/projects/alpha",
+            "2026-03-22T10:00:00Z",
+        )
+
+    def test_push_many_is_one_batch(self, queue: NotificationQueue) -> None:
+        queue.push_many(
+            _make_notification(message=str(i), project_root=f"/projects/{i % 2}")
+            for i in range(5)
+        )
+        queue.push_many([])
+        assert queue.pending() == 5
+        assert [n.message for n in queue.drain("/projects/0")] == ["0", "2", "4"]
 
 
 # --- Drain ---
@@ -124,13 +139,17 @@ class TestDrain:
         assert len(drained) == 2
 
         # beta entry should remain
-        remaining = queue_path.read_text().strip().split("\n")
-        assert len(remaining) == 1
-        assert json.loads(remaining[0])["project_root"] == "/projects/beta"
+        assert queue.pending("/projects/alpha") == 0
+        assert queue.pending() == 1
+        assert queue.drain(project_root="/projects/beta")[0].message == "b"
 
-    def test_drain_returns_empty_when_file_missing(self, queue: NotificationQueue) -> None:
+    def test_drain_returns_empty_when_file_missing(
+        self, queue: NotificationQueue, queue_path: Path
+    ) -> None:
         result = queue.drain(project_root="/projects/alpha")
         assert result == []
+        # Draining never creates the queue database
+        assert not queue_path.exists()
 
     def test_drain_returns_empty_when_file_empty(
         self, queue: NotificationQueue, queue_path: Path
@@ -139,14 +158,12 @@ class TestDrain:
         result = queue.drain(project_root="/projects/alpha")
         assert result == []
 
-    def test_drain_removes_file_when_all_drained(
-        self, queue: NotificationQueue, queue_path: Path
+    def test_drain_empties_queue_when_all_drained(
+        self, queue: NotificationQueue
     ) -> None:
         queue.push(_make_notification(project_root="/projects/alpha"))
         queue.drain(project_root="/projects/alpha")
-        # File should either not exist or be empty
-        if queue_path.exists():
-            assert queue_path.read_text().strip() == ""
+        assert queue.pending() == 0
 
     def test_drain_preserves_notification_fields(self, queue: NotificationQueue) -> None:
         original = _make_notification(
@@ -273,6 +290,66 @@ class TestDrainFiltered:
         assert len(remaining) == 1
 
 
+class TestLegacyJsonlImport:
+    def test_jsonl_queue_imported_once(self, tmp_path: Path) -> None:
+        legacy = tmp_path / "notifications.jsonl"
+        legacy.write_text(
+            json.dumps(asdict(_make_notification(message="old-a"))) + "\n"
+            + "\n"
+            + "{not json\n"
+            + json.dumps(asdict(_make_notification(
+                message="old-b", project_root="/projects/beta",
+            ))) + "\n"
+        )
+        q = NotificationQueue(queue_path=str(tmp_path / "notifications.db"))
+        assert [n.message for n in q.drain("/projects/alpha")] == ["old-a"]
+        assert not legacy.exists()
+        assert [n.message for n in q.drain("/projects/beta")] == ["old-b"]
+
+    def test_legacy_file_alone_is_drained(self, tmp_path: Path) -> None:
+        legacy = tmp_path / "legacy.jsonl"
+        legacy.write_text(json.dumps(asdict(_make_notification())) + "\n")
+        q = NotificationQueue(
+            queue_path=str(tmp_path / "q.db"), legacy_path=str(legacy),
+        )
+        assert len(q.drain("/projects/alpha")) == 1
+
+
+class TestCompaction:
+    def test_drain_releases_free_pages(
+        self, queue: NotificationQueue, queue_path: Path, monkeypatch
+    ) -> None:
+        from workflow_engine import notifications
+
+        monkeypatch.setattr(notifications, "_COMPACT_FREE_PAGES", 4)
+        queue.push_many(
+            _make_notification(message="x" * 500, project_root="/p/a")
+            for _ in range(200)
+        )
+        queue.push(_make_notification(project_root="/p/b"))
+        queue.drain("/p/a")
+        conn = queue._connection(create=False)
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        free_after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        # 200 x ~500B rows span far more than 4 pages; most were released.
+        assert free_after < page_count
+        assert queue.pending() == 1
+
+
+def test_contention_bench_smoke(tmp_path: Path, capsys) -> None:
+    from workflow_engine import notification_bench
+
+    exit_code = notification_bench.main([
+        "--queue", str(tmp_path / "bench.db"),
+        "--sessions", "4", "--pushes", "25", "--projects", "3",
+    ])
+    report = json.loads(capsys.readouterr().out)
+    assert exit_code == 0
+    assert report["pushed"] == report["drained"] == 100
+    assert report["push"]["p99_ms"] >= report["push"]["p50_ms"]
+
+
 # ---------------------------------------------------------------------------
 # Task 2C.1: format_human tests
 # ---------------------------------------------------------------------------
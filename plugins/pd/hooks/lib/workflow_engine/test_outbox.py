@@ -0,0 +1,223 @@
+"""Tests for workflow_engine.outbox and the deferred cascade."""
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from entity_registry.database import EntityDatabase
+from workflow_engine.entity_engine import EntityWorkflowEngine
+from workflow_engine.outbox import (
+    CASCADE,
+    BackgroundOutboxWorker,
+    BatchHandler,
+    OutboxRun,
+    OutboxWorker,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = EntityDatabase(str(tmp_path / "entities.db"))
+    yield database
+    database.close()
+
+
+class TestOutboxWorker:
+    def test_runs_jobs_and_deletes_them(self, db):
+        seen = []
+        db.enqueue_outbox("echo", {"n": 1})
+        db.enqueue_outbox("echo", {"n": 2})
+        run = OutboxWorker(db, {"echo": seen.append}).run_pending()
+        assert run == OutboxRun(done=2)
+        assert seen == [{"n": 1}, {"n": 2}]
+        assert db.list_outbox() == []
+
+    def test_failing_job_is_retried_with_backoff(self, db):
+        db.enqueue_outbox("flaky", {})
+
+        def flaky(payload):
+            raise OSError("disk busy")
+
+        worker = OutboxWorker(db, {"flaky": flaky}, retry_base_seconds=60)
+        assert worker.run_pending() == OutboxRun(retried=1)
+        (job,) = db.list_outbox("pending")
+        assert job["last_error"] == "OSError: disk busy"
+        # Not due yet, so the next run leaves it alone.
+        assert worker.run_pending() == OutboxRun()
+
+    def test_job_fails_after_max_attempts(self, db):
+        db.enqueue_outbox("flaky", {})
+
+        def flaky(payload):
+            raise ValueError("bad")
+
+        worker = OutboxWorker(
+            db, {"flaky": flaky}, max_attempts=2, retry_base_seconds=0,
+        )
+        assert worker.run_pending() == OutboxRun(retried=1, failed=1)
+        assert db.outbox_counts() == {"pending": 0, "running": 0, "failed": 1}
+
+    def test_unknown_kind_fails_immediately(self, db):
+        db.enqueue_outbox("mystery", {})
+        assert OutboxWorker(db, {}).run_pending() == OutboxRun(failed=1)
+
+    def test_abandoned_lease_is_recovered(self, db):
+        db.enqueue_outbox("echo", {"n": 1})
+        db.claim_outbox(lease_seconds=-1)  # a worker that died mid-job
+        seen = []
+        run = OutboxWorker(db, {"echo": seen.append}).run_pending()
+        assert run == OutboxRun(done=1, recovered=1)
+        assert seen == [{"n": 1}]
+
+    def test_retry_delay_doubles_up_to_cap(self, db):
+        worker = OutboxWorker(
+            db, {}, retry_base_seconds=2, retry_max_seconds=10,
+        )
+        assert [worker.retry_delay(n) for n in (1, 2, 3, 4)] == [2, 4, 8, 10]
+
+    def test_batch_handler_gets_all_jobs_of_its_kind(self, db):
+        batches, seen = [], []
+        db.enqueue_outbox("bulk", {"n": 1})
+        db.enqueue_outbox("echo", {"n": 2})
+        db.enqueue_outbox("bulk", {"n": 3})
+
+        def bulk(payloads):
+            batches.append(payloads)
+            return [None, OSError("locked")]
+
+        worker = OutboxWorker(
+            db, {"bulk": BatchHandler(bulk), "echo": seen.append},
+            retry_base_seconds=60,
+        )
+        assert worker.run_pending() == OutboxRun(done=2, retried=1)
+        assert batches == [[{"n": 1}, {"n": 3}]]
+        assert seen == [{"n": 2}]
+        (job,) = db.list_outbox("pending")
+        assert job["payload"] == {"n": 3}
+        assert job["last_error"] == "OSError: locked"
+
+    def test_batch_handler_raising_fails_whole_batch(self, db):
+        db.enqueue_outbox("bulk", {"n": 1})
+        db.enqueue_outbox("bulk", {"n": 2})
+
+        def bulk(payloads):
+            raise RuntimeError("db gone")
+
+        worker = OutboxWorker(
+            db, {"bulk": BatchHandler(bulk)}, retry_base_seconds=60,
+        )
+        assert worker.run_pending() == OutboxRun(retried=2)
+
+
+class TestBackgroundOutboxWorker:
+    def test_notify_runs_jobs_on_own_connection(self, db, tmp_path):
+        seen = []
+        worker = BackgroundOutboxWorker(
+            lambda: EntityDatabase(str(tmp_path / "entities.db")),
+            lambda wdb: {"echo": seen.append},
+            poll_interval=60,
+        )
+        worker.start()
+        try:
+            assert worker.wait_idle(5)  # startup sweep of an empty outbox
+            db.enqueue_outbox("echo", {"n": 1})
+            worker.notify()
+            assert worker.wait_idle(5)
+        finally:
+            worker.stop()
+        assert seen == [{"n": 1}]
+        assert db.list_outbox() == []
+
+    def test_start_sweeps_jobs_left_by_previous_process(self, db, tmp_path):
+        db.enqueue_outbox("echo", {"n": 1})
+        seen = []
+        worker = BackgroundOutboxWorker(
+            lambda: EntityDatabase(str(tmp_path / "entities.db")),
+            lambda wdb: {"echo": seen.append},
+            poll_interval=60,
+        )
+        worker.start()
+        try:
+            assert worker.wait_idle(5)
+        finally:
+            worker.stop()
+        assert seen == [{"n": 1}]
+
+    def test_wakes_when_delayed_job_falls_due(self, db, tmp_path):
+        seen = []
+        worker = BackgroundOutboxWorker(
+            lambda: EntityDatabase(str(tmp_path / "entities.db")),
+            lambda wdb: {"echo": seen.append},
+            poll_interval=60,
+        )
+        worker.start()
+        try:
+            assert worker.wait_idle(5)
+            db.enqueue_outbox("echo", {"n": 1}, delay_seconds=0.2)
+            worker.notify()
+            # Idle only once the delayed job ran, well before the next poll.
+            assert worker.wait_idle(5)
+        finally:
+            worker.stop()
+        assert seen == [{"n": 1}]
+
+
+def _feature_with_parent(db, artifacts_root, slug="010-deferred"):
+    feature_dir = os.path.join(artifacts_root, "features", slug)
+    os.makedirs(feature_dir, exist_ok=True)
+    with open(os.path.join(feature_dir, ".meta.json"), "w") as f:
+        json.dump({
+            "id": slug.split("-", 1)[0], "slug": slug, "mode": "standard",
+            "status": "active", "lastCompletedPhase": "design", "phases": {},
+        }, f)
+    db.register_entity("project", "P1", "Project", project_id="__unknown__")
+    uuid = db.register_entity(
+        "feature", slug, "Deferred", status="active",
+        parent_type_id="project:P1", project_id="__unknown__",
+    )
+    db.create_workflow_phase(
+        f"feature:{slug}", workflow_phase="finish", mode="standard",
+        last_completed_phase="implement",
+    )
+    return uuid
+
+
+class TestDeferredCascade:
+    def test_complete_phase_queues_cascade_in_callers_transaction(self, db, tmp_path):
+        uuid = _feature_with_parent(db, str(tmp_path))
+        engine = EntityWorkflowEngine(db, str(tmp_path), defer_cascade=True)
+        with db.transaction():
+            result = engine.complete_phase(uuid, "finish")
+        assert result.cascade_deferred is True
+        assert result.parent_progress is None
+        (job,) = db.list_outbox("pending")
+        assert job["kind"] == CASCADE
+        assert job["payload"] == {"entity_uuid": uuid, "phase": "finish"}
+        # Parent untouched until the job runs.
+        parent = db.get_entity("project:P1")
+        assert "progress" not in json.loads(parent["metadata"] or "{}")
+
+    def test_worker_applies_queued_cascade(self, db, tmp_path):
+        uuid = _feature_with_parent(db, str(tmp_path))
+        engine = EntityWorkflowEngine(db, str(tmp_path), defer_cascade=True)
+        engine.complete_phase(uuid, "finish")
+
+        sync_engine = EntityWorkflowEngine(db, str(tmp_path))
+        handlers = {CASCADE: lambda p: sync_engine.run_cascade(p["entity_uuid"], p["phase"])}
+        assert OutboxWorker(db, handlers).run_pending() == OutboxRun(done=1)
+        parent = db.get_entity("project:P1")
+        assert json.loads(parent["metadata"])["progress"] == 1.0
+
+    def test_rerun_cascade_records_anomaly_once(self, db, tmp_path):
+        uuid = _feature_with_parent(db, str(tmp_path))
+        db.update_entity(uuid, metadata={"systemic_finding": "flaky CI"})
+        engine = EntityWorkflowEngine(db, str(tmp_path), defer_cascade=True)
+        engine.complete_phase(uuid, "finish")
+        sync_engine = EntityWorkflowEngine(db, str(tmp_path))
+        sync_engine.run_cascade(uuid, "finish")
+        sync_engine.run_cascade(uuid, "finish")
+        parent = db.get_entity("project:P1")
+        anomalies = json.loads(parent["metadata"])["anomalies"]
+        assert [a["description"] for a in anomalies] == ["flaky CI"]
@@ -618,6 +618,8 @@ except Exception:
 }
 
 # Run doctor auto-fix: apply safe fixes for detected issues.
+# --incremental reuses cached results for checks whose inputs are unchanged
+# since the previous session (state under ~/.claude/pd/doctor/).
 # Returns single summary line via stdout (empty if healthy).
 run_doctor_autofix() {
     local python_cmd="$PLUGIN_ROOT/.venv/bin/python"
@@ -641,6 +643,7 @@ run_doctor_autofix() {
         --memory-db "$memory_db" \
         --project-root "$PROJECT_ROOT" \
         --artifacts-root "$artifacts_root" \
+        --incremental \
         --fix 2>/dev/null) || true
 
     # FR-1.1: single-quoted Python source + positional arg (no bash expansion).
@@ -25,14 +25,19 @@ from semantic_memory.config_utils import resolve_float_config
 from semantic_memory.database import MemoryDatabase
 from semantic_memory.embedding import EmbeddingProvider, create_provider
 from semantic_memory.refresh import hybrid_retrieve
-from semantic_memory.dedup import check_duplicate
+from semantic_memory.dedup import dedup_result, nearest_entries
 from semantic_memory.keywords import extract_keywords
+from semantic_memory.quantize import decode_embedding, resolve_storage_format
 
 try:
     import numpy as np
 except ImportError:
     np = None  # type: ignore[assignment]
-from semantic_memory.writer import _embed_text_for_entry, _process_pending_embeddings
+from semantic_memory.writer import (
+    PendingEmbeddingWorker,
+    _embed_text_for_entry,
+    _process_pending_embeddings,
+)
 
 from sqlite_retry import with_retry
 from server_lifecycle import write_pid, remove_pid, start_parent_watchdog
@@ -57,9 +62,15 @@ def _process_store_memory(
     source: str = "session-capture",
     source_project: str = "",
     config: dict | None = None,
+    embedding_worker: PendingEmbeddingWorker | None = None,
 ) -> str:
     """Store a learning in the semantic memory database.
 
+    One similarity pass over the database's cached embedding index serves
+    both the near-duplicate gate and the dedup merge threshold. When
+    *embedding_worker* is given, the pending-embedding backlog is handed to
+    it instead of being processed before returning.
+
     Returns a confirmation string on success or an error string on
     validation failure.  Never raises.
     """
@@ -118,8 +129,11 @@ def _process_store_memory(
 
     # -- Tier 1 gate: near-duplicate rejection (0.95, stricter than dedup merge) --
     cfg = config or {}
+    # One top-k pass over the shared embedding index serves both thresholds.
+    matches: list[tuple[str, float]] = []
     if embedding_vec is not None:
-        neardupe_result = check_duplicate(embedding_vec, db, threshold=0.95)
+        matches = nearest_entries(embedding_vec, db)
+        neardupe_result = dedup_result(matches, threshold=0.95)
         if neardupe_result.is_duplicate:
             matched_entry = db.get_entry(neardupe_result.existing_entry_id)
             matched_name = matched_entry["name"] if matched_entry else "unknown"
@@ -141,9 +155,9 @@ def _process_store_memory(
         clamp=(0.0, 1.0),
     )
     if embedding_vec is not None:
-        dedup_result = check_duplicate(embedding_vec, db, threshold)
-        if dedup_result.is_duplicate:
-            merged = db.merge_duplicate(dedup_result.existing_entry_id, keywords, config=cfg)
+        merge_result = dedup_result(matches, threshold)
+        if merge_result.is_duplicate:
+            merged = db.merge_duplicate(merge_result.existing_entry_id, keywords, config=cfg)
             return f"Reinforced: {merged['name']} (observation #{merged['observation_count']})"
 
     # -- Build entry dict --
@@ -176,7 +190,9 @@ def _process_store_memory(
         db.update_embedding(entry_id, embedding_vec.tobytes())
 
     # -- Process pending embeddings batch --
-    if provider is not None:
+    if embedding_worker is not None:
+        embedding_worker.notify()
+    elif provider is not None:
         try:
             _process_pending_embeddings(db, provider)
         except Exception as exc:
@@ -313,9 +329,10 @@ def _process_record_influence_by_content(
 ) -> tuple[str, float]:
     """Record influence using embedding similarity instead of name matching.
 
-    Chunks the output by paragraph, computes per-chunk embeddings, and
-    compares against stored entry embeddings. Records influence for entries
-    where max chunk similarity >= threshold.
+    Chunks the output by paragraph, embeds all chunks in one batch, and
+    compares them against the injected entries' stored embeddings as one
+    (chunks x entries) matrix product. Records influence for entries where
+    max chunk similarity >= threshold, in a single transaction.
 
     Returns ``(json_body_str, resolved_threshold)``. Feature 085 (FR-6)
     changed the return shape from plain ``str`` to ``tuple[str, float]``
@@ -370,14 +387,17 @@ def _process_record_influence_by_content(
             "warning": "no valid chunks",
         }), threshold
 
-    # Compute embeddings for each chunk
-    chunk_embeddings = []
-    for chunk in chunks:
-        try:
-            emb = provider.embed(chunk, task_type="query")
-            chunk_embeddings.append(emb)
-        except Exception:
-            continue
+    # Embed all chunks in one provider call; fall back to per-chunk calls
+    # so a single bad chunk does not discard the rest.
+    try:
+        chunk_embeddings = list(provider.embed_batch(chunks, task_type="query"))
+    except Exception:
+        chunk_embeddings = []
+        for chunk in chunks:
+            try:
+                chunk_embeddings.append(provider.embed(chunk, task_type="query"))
+            except Exception:
+                continue
 
     if not chunk_embeddings:
         return json.dumps({
@@ -385,28 +405,39 @@ def _process_record_influence_by_content(
             "warning": "chunk embedding failed",
         }), threshold
 
-    # Compare against each injected entry
-    matched = []
-    skipped = 0
-    for entry_name in injected_entry_names:
-        entry = db.find_entry_by_name(entry_name)
-        if entry is None or entry.get("embedding") is None:
-            skipped += 1
-            continue
+    chunk_matrix = np.stack(chunk_embeddings).astype(np.float32, copy=False)
+    dims = chunk_matrix.shape[1]
 
-        try:
-            entry_emb = np.frombuffer(entry["embedding"], dtype=np.float32)
-            # Embeddings are pre-normalized by NormalizingWrapper, so dot product = cosine similarity
-            max_sim = max(float(np.dot(chunk_emb, entry_emb)) for chunk_emb in chunk_embeddings)
-        except (ValueError, TypeError):
-            skipped += 1
-            continue
-
-        if max_sim >= threshold:
-            db.record_influence(entry["id"], agent_role, feature_type_id)
+    # Resolve every injected entry in one lookup; entries without a usable
+    # embedding (missing or wrong dimensionality) are skipped.
+    entries = db.find_entries_by_names(
+        injected_entry_names, columns=("id", "embedding"),
+    )
+    storage = db.embedding_storage
+    vectors = {
+        i: decode_embedding(entry["embedding"], dims, storage)
+        for i, entry in enumerate(entries)
+        if entry is not None and entry["embedding"] is not None
+    }
+    usable = [i for i, vector in vectors.items() if vector is not None]
+
+    # (chunks x entries) similarities; embeddings are pre-normalized by
+    # NormalizingWrapper, so dot product = cosine similarity.
+    best: dict[int, float] = {}
+    if usable:
+        entry_matrix = np.stack([vectors[i] for i in usable])
+        best = dict(zip(usable, (chunk_matrix @ entry_matrix.T).max(axis=0).tolist()))
+
+    matched = []
+    matched_ids = []
+    for i, entry_name in enumerate(injected_entry_names):
+        max_sim = best.get(i)
+        if max_sim is not None and max_sim >= threshold:
+            matched_ids.append(entries[i]["id"])
             matched.append({"name": entry_name, "similarity": round(max_sim, 3)})
-        else:
-            skipped += 1
+    skipped = len(injected_entry_names) - len(matched)
+
+    db.record_influences(matched_ids, agent_role, feature_type_id)
 
     return json.dumps({"matched": matched, "skipped": skipped}), threshold
 
@@ -435,6 +466,7 @@ _db: MemoryDatabase | None = None
 _provider: EmbeddingProvider | None = None
 _config: dict = {}
 _project_root: str = ""
+_embedding_worker: PendingEmbeddingWorker | None = None
 
 # ---------------------------------------------------------------------------
 # Influence tuning + diagnostics state (feature 080-influence-wiring)
@@ -610,7 +642,7 @@ def _emit_influence_diagnostic(
 @asynccontextmanager
 async def lifespan(server):
     """Manage DB connection and providers lifecycle."""
-    global _db, _provider, _config, _project_root
+    global _db, _provider, _config, _project_root, _embedding_worker
 
     write_pid("memory_server")
     start_parent_watchdog()
@@ -618,7 +650,8 @@ async def lifespan(server):
     global_store = os.path.expanduser("~/.claude/pd/memory")
     os.makedirs(global_store, exist_ok=True)
 
-    _db = MemoryDatabase(os.path.join(global_store, "memory.db"))
+    db_path = os.path.join(global_store, "memory.db")
+    _db = MemoryDatabase(db_path)
 
     # Read config from the project root (cwd at server start).
     project_root = os.getcwd()
@@ -633,6 +666,13 @@ async def lifespan(server):
             f"model={_provider.model_name}",
             file=sys.stderr,
         )
+        _db.set_embedding_storage(
+            resolve_storage_format(config, prefix="[memory-server]")
+        )
+        _embedding_worker = PendingEmbeddingWorker(
+            lambda: MemoryDatabase(db_path), _provider,
+        )
+        _embedding_worker.start()
     else:
         print("memory-server: no embedding provider available", file=sys.stderr)
 
@@ -640,6 +680,9 @@ async def lifespan(server):
         yield {}
     finally:
         remove_pid("memory_server")
+        if _embedding_worker is not None:
+            _embedding_worker.stop()
+            _embedding_worker = None
         if _db is not None:
             _db.close()
             _db = None
@@ -703,6 +746,7 @@ async def store_memory(
             source=source,
             source_project=_project_root,
             config=_config,
+            embedding_worker=_embedding_worker,
         )
     except Exception as exc:
         return json.dumps({"error": str(exc)})
@@ -41,6 +41,7 @@ if [ -n "$_PROVIDER" ]; then
         openai)  _PKG="openai>=1.0,<3"; _IMPORT="openai" ;;
         voyage)  _PKG="voyageai>=0.3,<1"; _IMPORT="voyageai" ;;
         ollama)  _PKG="ollama>=0.4,<1"; _IMPORT="ollama" ;;
+        local)   _PKG=""; _IMPORT="" ;;  # numpy only, no SDK
         *)       _PKG=""; _IMPORT="" ;;
     esac
     if [ -n "$_PKG" ] && [ -n "$_IMPORT" ]; then
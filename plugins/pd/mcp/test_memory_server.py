@@ -2455,3 +2455,121 @@ class TestInfluenceDebugLogRotationFR3:
         assert memory_server._influence_debug_write_failed is False, (
             "rotation failure must NOT set _influence_debug_write_failed"
         )
+
+
+# ---------------------------------------------------------------------------
+# Single-pass store pipeline
+# ---------------------------------------------------------------------------
+
+
+class TestStoreMemorySinglePass:
+    """Both dedup thresholds share one similarity pass; backfill is deferred."""
+
+    def _store(self, db, provider, name, description, **kwargs):
+        return _process_store_memory(
+            db=db,
+            provider=provider,
+            name=name,
+            description=description,
+            reasoning="Single-pass pipeline test",
+            category="patterns",
+            references=[],
+            **kwargs,
+        )
+
+    def test_embeddings_loaded_once_per_store(self, db: MemoryDatabase, monkeypatch):
+        provider = NormalizedFakeProvider()
+        for i in range(3):
+            self._store(db, provider, f"Seed {i}", f"Seed entry number {i} for the index")
+
+        calls = []
+        original = db.get_all_embeddings
+        monkeypatch.setattr(
+            db, "get_all_embeddings",
+            lambda *a, **kw: calls.append(1) or original(*a, **kw),
+        )
+        result = self._store(db, provider, "Fresh entry", "A completely fresh entry to store")
+
+        assert result.startswith("Stored:")
+        assert len(calls) == 1
+
+    def test_pending_backlog_handed_to_worker(self, db: MemoryDatabase):
+        from unittest.mock import MagicMock
+
+        db.upsert_entry({
+            "id": "pending-1",
+            "name": "Pending",
+            "description": "Entry waiting for an embedding",
+            "category": "patterns",
+            "source": "manual",
+            "source_project": "/tmp/project",
+            "source_hash": "0" * 16,
+            "created_at": "2026-01-01T00:00:00Z",
+            "updated_at": "2026-01-01T00:00:00Z",
+        })
+        worker = MagicMock()
+
+        result = self._store(
+            db, NormalizedFakeProvider(), "Worker entry",
+            "Store that should defer the pending backlog", embedding_worker=worker,
+        )
+
+        assert result.startswith("Stored:")
+        worker.notify.assert_called_once_with()
+        assert [e["id"] for e in db.get_entries_without_embedding()] == ["pending-1"]
+
+
+class TestInfluenceByContentBatching:
+    """Chunks embed in one batch; lookups and writes are batched."""
+
+    _OUTPUT = "\n\n".join(
+        f"Paragraph {i} of subagent output, long enough to be a chunk." for i in range(4)
+    )
+
+    def test_one_embed_batch_call_and_one_write(self, db: MemoryDatabase, monkeypatch):
+        from memory_server import _process_record_influence_by_content
+
+        _seed_influence_entry(db, "b1", "Batched one")
+        _seed_influence_entry(db, "b2", "Batched two")
+        provider = _FixedSimilarityProvider(0.9)
+        batch_calls = []
+        monkeypatch.setattr(
+            provider, "embed_batch",
+            lambda texts, task_type="document": batch_calls.append(len(texts))
+            or [provider.embed(t, task_type) for t in texts],
+        )
+        write_calls = []
+        original = db.record_influences
+        monkeypatch.setattr(
+            db, "record_influences",
+            lambda ids, *a: write_calls.append(list(ids)) or original(ids, *a),
+        )
+
+        body, _ = _process_record_influence_by_content(
+            db, provider, self._OUTPUT,
+            ["Batched one", "missing entry", "batched two"],
+            "implementer", threshold=0.5,
+        )
+
+        result = json.loads(body)
+        assert [m["name"] for m in result["matched"]] == ["Batched one", "batched two"]
+        assert result["matched"][0]["similarity"] == 0.9
+        assert result["skipped"] == 1
+        assert batch_calls == [4]
+        assert write_calls == [["b1", "b2"]]
+        assert db.get_entry("b1")["influence_count"] == 1
+
+    def test_embed_batch_failure_falls_back_to_single_embeds(self, db: MemoryDatabase):
+        from memory_server import _process_record_influence_by_content
+
+        _seed_influence_entry(db, "f1", "Fallback entry")
+
+        class BatchlessProvider(_FixedSimilarityProvider):
+            def embed_batch(self, texts, task_type="document"):
+                raise RuntimeError("batch endpoint unavailable")
+
+        body, _ = _process_record_influence_by_content(
+            db, BatchlessProvider(0.8), self._OUTPUT, ["Fallback entry"],
+            "implementer", threshold=0.5,
+        )
+        assert json.loads(body)["matched"] == [{"name": "Fallback entry", "similarity": 0.8}]
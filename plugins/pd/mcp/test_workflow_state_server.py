@@ -19,9 +19,11 @@ if _hooks_lib not in sys.path:
 from entity_registry.database import EntityDatabase
 from transition_gate.models import Severity, TransitionResult
 from workflow_engine.engine import WorkflowStateEngine
+from workflow_engine.entity_engine import EntityWorkflowEngine
 from workflow_engine.models import FeatureWorkflowState, TransitionResponse
 
 from entity_registry.frontmatter_sync import DriftReport, FieldMismatch
+from semantic_memory.database import MemoryDatabase
 from workflow_engine.reconciliation import (
     ReconcileAction,
     WorkflowDriftReport,
@@ -901,6 +903,114 @@ class TestCompletePhaseEntityMetadata:
         assert meta["completed"] == expected_ts
 
 
+class TestCompletePhaseDeferredCascade:
+    """workflow_deferred_cascade: cascade and projection go to the outbox."""
+
+    def _setup(self, db, tmp_path, monkeypatch, coalesce_seconds=0):
+        import workflow_state_server as wss
+        monkeypatch.setattr(
+            wss, "_config",
+            {"workflow_projection_coalesce_seconds": coalesce_seconds},
+        )
+        db.register_entity("project", "P1", "Project", project_id="__unknown__")
+        db.set_parent("feature:009-test", "project:P1")
+        feat_dir = os.path.join(str(tmp_path), "features", "009-test")
+        db.update_entity(
+            "feature:009-test", artifact_path=feat_dir,
+            metadata={"id": "009", "slug": "test", "mode": "standard",
+                      "phase_timing": {}},
+        )
+        monkeypatch.setattr(wss, "_artifacts_root", str(tmp_path))
+        return feat_dir, EntityWorkflowEngine(
+            db, str(tmp_path), defer_cascade=True,
+        )
+
+    def test_response_returns_before_cascade_and_projection(
+        self, seeded_engine, db, tmp_path, monkeypatch,
+    ):
+        feat_dir, entity_engine = self._setup(db, tmp_path, monkeypatch)
+        data = json.loads(_process_complete_phase(
+            seeded_engine, "feature:009-test", "specify",
+            db=db, entity_engine=entity_engine,
+        ))
+        assert data["last_completed_phase"] == "specify"
+        assert data["cascade_deferred"] is True
+        assert data["projection_deferred"] is True
+        assert "parent_progress" not in data
+        assert "T" in data["completed_at"]
+        assert sorted(j["kind"] for j in db.list_outbox("pending")) == [
+            "cascade", "meta_projection",
+        ]
+        with open(os.path.join(feat_dir, ".meta.json")) as f:
+            assert "lastCompletedPhase" not in json.load(f)
+
+    def test_outbox_handlers_apply_deferred_work(
+        self, seeded_engine, db, tmp_path, monkeypatch,
+    ):
+        import workflow_state_server as wss
+        from workflow_engine.outbox import OutboxRun, OutboxWorker
+
+        feat_dir, entity_engine = self._setup(db, tmp_path, monkeypatch)
+        _process_complete_phase(
+            seeded_engine, "feature:009-test", "specify",
+            db=db, entity_engine=entity_engine,
+        )
+        run = OutboxWorker(db, wss._outbox_handlers(db)).run_pending()
+        assert run == OutboxRun(done=2)
+        with open(os.path.join(feat_dir, ".meta.json")) as f:
+            assert json.load(f)["lastCompletedPhase"] == "specify"
+        parent = json.loads(db.get_entity("project:P1")["metadata"])
+        assert "progress" in parent
+
+    def test_enqueue_rolls_back_with_failed_completion(
+        self, seeded_engine, db, tmp_path, monkeypatch,
+    ):
+        _, entity_engine = self._setup(db, tmp_path, monkeypatch)
+
+        def boom(*args, **kwargs):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr(db, "update_workflow_phase", boom)
+        _process_complete_phase(
+            seeded_engine, "feature:009-test", "specify",
+            db=db, entity_engine=entity_engine,
+        )
+        assert db.list_outbox() == []
+
+    def test_projection_updates_coalesce_into_one_delayed_job(
+        self, seeded_engine, db, tmp_path, monkeypatch,
+    ):
+        import workflow_state_server as wss
+        from workflow_engine.outbox import OutboxRun, OutboxWorker
+
+        feat_dir, entity_engine = self._setup(
+            db, tmp_path, monkeypatch, coalesce_seconds=60,
+        )
+        with open(os.path.join(feat_dir, "spec.md"), "w") as f:
+            f.write("# Spec\n")
+        _process_complete_phase(
+            seeded_engine, "feature:009-test", "specify",
+            db=db, entity_engine=entity_engine,
+        )
+        data = json.loads(_process_transition_phase(
+            seeded_engine, "feature:009-test", "design", True,
+            db=db, entity_engine=entity_engine,
+        ))
+        assert data["transitioned"] is True
+        assert data["projection_deferred"] is True
+        projections = [
+            j for j in db.list_outbox("pending") if j["kind"] == "meta_projection"
+        ]
+        assert len(projections) == 1
+
+        # Not due yet: only the cascade runs.
+        worker = OutboxWorker(db, wss._outbox_handlers(db))
+        assert worker.run_pending() == OutboxRun(done=1)
+        assert 0 < db.next_outbox_due() <= 60
+        with open(os.path.join(feat_dir, ".meta.json")) as f:
+            assert "lastCompletedPhase" not in json.load(f)
+
+
 # ---------------------------------------------------------------------------
 # _process_validate_prerequisites tests (Task 2.6)
 # ---------------------------------------------------------------------------
@@ -8356,6 +8466,108 @@ class TestCompletePhaseMemoryRefresh:
             )
 
 
+
+class TestCompletePhaseMemoryRefreshPrefetch:
+    """complete_phase serves the prefetched digest while the memory store's
+    content_generation is unchanged; transition_phase requests the prefetch."""
+
+    DIGEST = {
+        "query": "refresh-test design",
+        "count": 1,
+        "entries": [{"name": "A", "category": "patterns", "description": "alpha"}],
+    }
+
+    def _wire(self, monkeypatch, memory_db):
+        import workflow_state_server
+        from semantic_memory.refresh import RefreshDigestCache, RefreshPrefetcher
+
+        cache = RefreshDigestCache()
+        prefetcher = RefreshPrefetcher(
+            lambda: memory_db, object(), {}, cache,
+        )  # never started: only its wanted set is used here
+        monkeypatch.setattr(
+            workflow_state_server, "_config",
+            {"memory_refresh_enabled": True, "memory_refresh_limit": 5},
+        )
+        monkeypatch.setattr(workflow_state_server, "_memory_db", memory_db)
+        monkeypatch.setattr(workflow_state_server, "_provider", object())
+        monkeypatch.setattr(workflow_state_server, "_refresh_cache", cache)
+        monkeypatch.setattr(workflow_state_server, "_refresh_prefetcher", prefetcher)
+        return cache, prefetcher
+
+    def test_cache_hit_skips_inline_retrieval(self, db, tmp_path, monkeypatch):
+        import workflow_state_server
+
+        engine = TestCompletePhaseMemoryRefresh()._seed(db, tmp_path)
+        memory_db = MemoryDatabase(":memory:")
+        try:
+            cache, prefetcher = self._wire(monkeypatch, memory_db)
+            prefetcher.want("refresh-test design", 5)
+            cache.store(
+                "refresh-test design", 5, memory_db.content_generation(),
+                self.DIGEST,
+            )
+
+            def exploding_refresh(*a, **kw):
+                raise AssertionError("digest should come from the cache")
+
+            monkeypatch.setattr(
+                workflow_state_server, "refresh_memory_digest", exploding_refresh,
+            )
+            data = json.loads(_process_complete_phase(
+                engine, "feature:081-refresh-test", "specify",
+                db=db, iterations=None, reviewer_notes=None,
+            ))
+            assert data["memory_refresh"] == self.DIGEST
+            assert prefetcher.wanted() == []
+        finally:
+            memory_db.close()
+
+    def test_memory_write_invalidates_cached_digest(self, db, tmp_path, monkeypatch):
+        import workflow_state_server
+
+        engine = TestCompletePhaseMemoryRefresh()._seed(db, tmp_path)
+        memory_db = MemoryDatabase(":memory:")
+        try:
+            cache, _ = self._wire(monkeypatch, memory_db)
+            cache.store(
+                "refresh-test design", 5, memory_db.content_generation(),
+                {"query": "stale", "count": 0, "entries": []},
+            )
+            memory_db.insert_test_entry_for_testing(
+                entry_id="new-entry", created_at="2026-01-01T00:00:00Z",
+            )
+            monkeypatch.setattr(
+                workflow_state_server, "refresh_memory_digest",
+                lambda *a, **kw: self.DIGEST,
+            )
+            data = json.loads(_process_complete_phase(
+                engine, "feature:081-refresh-test", "specify",
+                db=db, iterations=None, reviewer_notes=None,
+            ))
+            assert data["memory_refresh"] == self.DIGEST
+        finally:
+            memory_db.close()
+
+    def test_transition_phase_requests_prefetch(self, db, tmp_path, monkeypatch):
+        db.register_entity(
+            "feature", "083-prefetch", "Prefetch", status="active",
+            project_id="__unknown__",
+        )
+        db.create_workflow_phase("feature:083-prefetch", workflow_phase="brainstorm")
+        memory_db = MemoryDatabase(":memory:")
+        try:
+            _, prefetcher = self._wire(monkeypatch, memory_db)
+            data = json.loads(_process_transition_phase(
+                WorkflowStateEngine(db, str(tmp_path)),
+                "feature:083-prefetch", "specify", False, db=db,
+            ))
+            assert data["transitioned"] is True
+            # The query complete_phase('specify') will issue.
+            assert prefetcher.wanted() == [("prefetch design", 5)]
+        finally:
+            memory_db.close()
+
 # ---------------------------------------------------------------------------
 # Feature 084: Phase Events Dual-Write Tests
 # ---------------------------------------------------------------------------
@@ -8741,6 +8953,135 @@ class TestQueryPhaseAnalytics:
         assert all(r["project_id"] == "P002" for r in result["results"])
         assert len(result["results"]) > 0
 
+    def test_daily_rollup_reads_per_day_counts(self, analytics_db):
+        """daily_rollup returns rollup rows per day, phase and event type."""
+        import asyncio
+        import workflow_state_server
+
+        result = json.loads(asyncio.run(
+            workflow_state_server.query_phase_analytics(
+                query_type="daily_rollup", project_id="*", phase="specify",
+            )
+        ))
+        assert result["query_type"] == "daily_rollup"
+        rows = [
+            (r["day"], r["event_type"], r["event_count"], r["iterations_sum"])
+            for r in result["results"]
+        ]
+        assert rows == [
+            ("2026-01-01", "completed", 1, 4),
+            ("2026-01-01", "started", 1, 0),
+            ("2026-01-02", "completed", 1, 1),
+            ("2026-01-02", "started", 1, 0),
+            ("2026-01-03", "backward", 1, 0),
+        ]
+
+    def test_daily_rollup_limit_keeps_latest_rows(self, analytics_db):
+        import asyncio
+        import workflow_state_server
+
+        result = json.loads(asyncio.run(
+            workflow_state_server.query_phase_analytics(
+                query_type="daily_rollup", project_id="*", limit=1,
+            )
+        ))
+        assert [r["day"] for r in result["results"]] == ["2026-01-03"]
+        assert result["total"] > 1
+
+    def test_duration_histogram_buckets_durations(self, analytics_db):
+        """duration_histogram summarises paired durations per phase."""
+        import asyncio
+        import workflow_state_server
+
+        result = json.loads(asyncio.run(
+            workflow_state_server.query_phase_analytics(
+                query_type="duration_histogram", project_id="*",
+            )
+        ))
+        bounds = result["bucket_upper_bounds_seconds"]
+        by_phase = {r["phase"]: r for r in result["results"]}
+        # 1h and 2h brainstorms fall in the [1h, 4h) bucket.
+        assert by_phase["brainstorm"]["buckets"][bounds.index(14400)] == 2
+        assert by_phase["specify"]["count"] == 2
+        assert by_phase["specify"]["mean_seconds"] == pytest.approx(4500, abs=0.01)
+
+    def test_since_until_bound_raw_events(self, analytics_db):
+        import asyncio
+        import workflow_state_server
+
+        result = json.loads(asyncio.run(
+            workflow_state_server.query_phase_analytics(
+                query_type="raw_events", project_id="*",
+                since="2026-01-02", until="2026-01-03",
+            )
+        ))
+        assert result["total"] > 0
+        assert all(
+            r["timestamp"].startswith("2026-01-02") for r in result["results"]
+        )
+
+    def test_export_phase_events_writes_npz(self, analytics_db, tmp_path, monkeypatch):
+        import asyncio
+        import workflow_state_server
+        from entity_registry.phase_analytics import load_phase_events_npz
+
+        monkeypatch.setattr(workflow_state_server, "_artifacts_root", str(tmp_path))
+        result = json.loads(asyncio.run(
+            workflow_state_server.export_phase_events(
+                output_path="analytics/events.npz", project_id="*",
+            )
+        ))
+        assert result["rows"] == 11
+        assert result["path"] == str(tmp_path / "analytics" / "events.npz")
+        columns = load_phase_events_npz(result["path"])
+        assert set(columns["project_id"]) == {"P001", "P002"}
+
+    def test_include_archive_spans_archived_events(self, tmp_path, monkeypatch):
+        """Raw-event query types read archived events only when asked."""
+        import asyncio
+        import workflow_state_server
+
+        db = EntityDatabase(str(tmp_path / "entities.db"))
+        try:
+            for ts in ("2025-01-01T10:00:00Z", "2026-01-01T10:00:00Z"):
+                db.insert_phase_event(
+                    type_id="feature:a-001", project_id="P001",
+                    phase="design", event_type="backward", timestamp=ts,
+                )
+            db.archive_phase_events(before="2025-06-01")
+            monkeypatch.setattr(workflow_state_server, "_db", db)
+
+            def backward_count(**kwargs):
+                result = json.loads(asyncio.run(
+                    workflow_state_server.query_phase_analytics(
+                        query_type="backward_frequency", project_id="*",
+                        **kwargs,
+                    )
+                ))
+                return result["results"][0]["backward_count"]
+
+            assert backward_count() == 1
+            assert backward_count(include_archive=True) == 2
+        finally:
+            db.close()
+
+    def test_export_phase_events_rejects_path_outside_root(
+        self, analytics_db, tmp_path, monkeypatch,
+    ):
+        import asyncio
+        import workflow_state_server
+
+        monkeypatch.setattr(
+            workflow_state_server, "_artifacts_root", str(tmp_path / "docs"),
+        )
+        result = json.loads(asyncio.run(
+            workflow_state_server.export_phase_events(
+                output_path="../outside.npz", project_id="*",
+            )
+        ))
+        assert result["error_type"] == "invalid_input"
+        assert not (tmp_path / "outside.npz").exists()
+
 
 # ---------------------------------------------------------------------------
 # Feature 088 Bundle D: cross-project isolation + record_backward_event hardening
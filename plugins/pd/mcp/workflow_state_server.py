@@ -32,7 +32,7 @@ if _hooks_lib not in (os.path.normpath(p) for p in sys.path):
 from server_lifecycle import write_pid, remove_pid, start_parent_watchdog
 from sqlite_retry import with_retry, is_transient
 
-from entity_registry.database import EntityDatabase
+from entity_registry.database import PHASE_DURATION_BUCKETS, EntityDatabase
 from entity_registry.project_identity import detect_project_id
 from entity_registry.entity_lifecycle import (
     init_entity_workflow as _lib_init_entity_workflow,
@@ -45,10 +45,14 @@ from entity_registry.frontmatter_sync import (
     scan_all,
 )
 from entity_registry.metadata import parse_metadata
+from entity_registry.phase_analytics import export_phase_events_npz
+from entity_registry.server_helpers import resolve_output_path
 from semantic_memory.config import read_config
 from semantic_memory.database import MemoryDatabase
 from semantic_memory.embedding import EmbeddingProvider, create_provider
 from semantic_memory.refresh import (
+    RefreshDigestCache,
+    RefreshPrefetcher,
     refresh_memory_digest,
     build_refresh_query,
     _resolve_int_config,
@@ -66,6 +70,11 @@ from workflow_engine.feature_lifecycle import (
     init_project_state as _lib_init_project_state,
 )
 from workflow_engine.kanban import derive_kanban
+from workflow_engine.meta_projection import (
+    MetaProjector,
+    build_meta_document,
+    meta_file_matches,
+)
 from workflow_engine.task_promotion import (
     TaskAlreadyPromotedError,
     TaskNotFoundError,
@@ -75,6 +84,12 @@ from workflow_engine.task_promotion import (
 from workflow_engine.models import FeatureWorkflowState, TransitionResponse
 from workflow_engine.rollup import get_ancestor_progress as _lib_get_ancestor_progress
 from workflow_engine.notifications import NotificationQueue
+from workflow_engine.outbox import (
+    CASCADE,
+    META_PROJECTION,
+    BackgroundOutboxWorker,
+    BatchHandler,
+)
 from workflow_engine.reconciliation import (
     ReconcileAction,
     WorkflowDriftReport,
@@ -97,6 +112,9 @@ _artifacts_root: str = ""
 _project_root: str = ""
 _project_id: str = ""
 _notification_queue: NotificationQueue | None = None
+# Runs outbox jobs (deferred cascades and .meta.json projections) when
+# workflow_deferred_cascade is on; see _start_outbox_worker.
+_outbox_worker: BackgroundOutboxWorker | None = None
 
 # Feature 081: memory refresh digest — separate MemoryDatabase
 # (~/.claude/pd/memory/memory.db, distinct from entities.db above) plus
@@ -104,6 +122,10 @@ _notification_queue: NotificationQueue | None = None
 _config: dict = {}
 _provider: EmbeddingProvider | None = None
 _memory_db: MemoryDatabase | None = None
+# Digests precomputed off the request path (memory_refresh_prefetch); both
+# stay None when prefetch is off and complete_phase computes inline.
+_refresh_cache: RefreshDigestCache | None = None
+_refresh_prefetcher: RefreshPrefetcher | None = None
 
 # ---------------------------------------------------------------------------
 # Degraded mode helpers
@@ -141,6 +163,7 @@ def _start_recovery_thread(
 
     def _recover():
         global _db, _db_unavailable, _engine, _entity_engine, _notification_queue, _project_root, _artifacts_root
+        global _outbox_worker
         while True:
             time.sleep(poll_interval)
             try:
@@ -152,9 +175,13 @@ def _start_recovery_thread(
                 _artifacts_root = os.path.join(project_root, str(config.get("artifacts_root", "docs")))
                 _engine = WorkflowStateEngine(new_db, _artifacts_root)
                 _notification_queue = NotificationQueue()
+                deferred = bool(config.get("workflow_deferred_cascade", False))
                 _entity_engine = EntityWorkflowEngine(
-                    new_db, _artifacts_root, _notification_queue, project_root=_project_root
+                    new_db, _artifacts_root, _notification_queue, project_root=_project_root,
+                    defer_cascade=deferred,
                 )
+                if deferred and _outbox_worker is None:
+                    _outbox_worker = _start_outbox_worker(db_path)
                 _db = new_db
                 _db_unavailable = False
                 print("workflow-engine: DB recovered", file=sys.stderr)
@@ -167,6 +194,120 @@ def _start_recovery_thread(
     return thread
 
 
+def _refresh_limit() -> int:
+    return _resolve_int_config(
+        _config, "memory_refresh_limit", 5,
+        clamp=(1, 20), warned=_refresh_warned_fields,
+    )
+
+
+def _start_refresh_prefetch(memory_db_path: str) -> None:
+    """Start the memory-refresh prefetcher and warm active features.
+
+    Each active feature's digest is the one ``complete_phase`` will need
+    for its current phase.
+    """
+    global _refresh_cache, _refresh_prefetcher
+    _refresh_cache = RefreshDigestCache()
+    _refresh_prefetcher = RefreshPrefetcher(
+        lambda: MemoryDatabase(memory_db_path), _provider, _config,
+        _refresh_cache,
+    )
+    _refresh_prefetcher.start()
+    try:
+        for state in _engine.list_by_status("active"):
+            if state.current_phase:
+                _prefetch_memory_refresh(
+                    state.feature_type_id, state.current_phase,
+                )
+    except Exception as e:
+        print(
+            f"[workflow-state] memory_refresh warm-up skipped: {e}",
+            file=sys.stderr,
+        )
+
+
+def _prefetch_memory_refresh(feature_type_id: str, phase: str) -> None:
+    """Ask the prefetcher to warm the digest for completing *phase*."""
+    if _refresh_prefetcher is None:
+        return
+    query = build_refresh_query(feature_type_id, phase)
+    if query:
+        _refresh_prefetcher.want(query, _refresh_limit())
+
+
+def _outbox_handlers(db: EntityDatabase) -> dict:
+    """Handlers for the outbox jobs this server enqueues, bound to *db*.
+
+    Cascade notifications go to the server's queue, which is safe to share
+    between threads.
+    """
+    engine = WorkflowStateEngine(db, _artifacts_root)
+    entity_engine = EntityWorkflowEngine(
+        db, _artifacts_root, _notification_queue, project_root=_project_root
+    )
+
+    def _cascade(payload: dict) -> None:
+        entity_engine.run_cascade(payload["entity_uuid"], payload["phase"])
+
+    def _project(payloads: list[dict]) -> list[Exception | None]:
+        report = MetaProjector(db, engine).project(
+            p["feature_type_id"] for p in payloads
+        )
+        print(
+            f"[workflow-state] deferred projection: {len(report.written)} "
+            f"written, {len(report.skipped)} unchanged, "
+            f"{len(report.failed)} failed",
+            file=sys.stderr,
+        )
+        errors: list[Exception | None] = []
+        for payload in payloads:
+            warning = report.failed.get(payload["feature_type_id"])
+            if warning and warning.startswith("projection failed"):
+                errors.append(RuntimeError(warning))  # I/O error: retry
+                continue
+            if warning:
+                print(
+                    f"[workflow-state] deferred projection skipped: {warning}",
+                    file=sys.stderr,
+                )
+            errors.append(None)
+        return errors
+
+    return {CASCADE: _cascade, META_PROJECTION: BatchHandler(_project)}
+
+
+def _enqueue_projection(db: EntityDatabase, feature_type_id: str) -> None:
+    """Queue a deferred .meta.json projection for *feature_type_id*.
+
+    The job waits ``workflow_projection_coalesce_seconds`` and shares a
+    dedupe key with any other pending projection of the feature, so a burst
+    of updates is written once, from the latest state.
+    """
+    delay = _config.get("workflow_projection_coalesce_seconds", 1.0)
+    if not isinstance(delay, (int, float)) or isinstance(delay, bool) or delay < 0:
+        delay = 1.0
+    db.enqueue_outbox(
+        META_PROJECTION,
+        {"feature_type_id": feature_type_id},
+        dedupe_key=f"{META_PROJECTION}:{feature_type_id}",
+        delay_seconds=float(delay),
+    )
+
+
+def _start_outbox_worker(db_path: str) -> BackgroundOutboxWorker:
+    """Start the thread that runs deferred cascades and .meta.json projections.
+
+    The thread opens its own connection and engines. Its first run also
+    picks up jobs a previous server process left queued.
+    """
+    worker = BackgroundOutboxWorker(
+        lambda: EntityDatabase(db_path), _outbox_handlers,
+    )
+    worker.start()
+    return worker
+
+
 def _check_db_available() -> str | None:
     """Return error JSON if DB is unavailable, else None."""
     if _db_unavailable:
@@ -179,7 +320,8 @@ async def lifespan(server):
     """Manage DB connection and engine lifecycle."""
     global _db, _db_unavailable, _recovery_thread
     global _engine, _entity_engine, _artifacts_root, _project_root, _project_id, _notification_queue
-    global _config, _provider, _memory_db
+    global _config, _provider, _memory_db, _outbox_worker
+    global _refresh_cache, _refresh_prefetcher
 
     write_pid("workflow_state_server")
     start_parent_watchdog()
@@ -204,9 +346,15 @@ async def lifespan(server):
 
         _engine = WorkflowStateEngine(_db, _artifacts_root)
         _notification_queue = NotificationQueue()
+        deferred = bool(config.get("workflow_deferred_cascade", False))
         _entity_engine = EntityWorkflowEngine(
-            _db, _artifacts_root, _notification_queue, project_root=_project_root
+            _db, _artifacts_root, _notification_queue, project_root=_project_root,
+            defer_cascade=deferred,
         )
+        # Also started when disabled if an earlier run left jobs queued.
+        counts = _db.outbox_counts()
+        if deferred or counts["pending"] or counts["running"]:
+            _outbox_worker = _start_outbox_worker(db_path)
 
         # Feature 081: populate memory-refresh globals (provider + memory.db).
         # Failures are non-fatal — memory_refresh silently omits, but operator
@@ -219,15 +367,21 @@ async def lifespan(server):
                 f"[workflow-state] memory_refresh disabled for this process: provider init failed: {e}",
                 file=sys.stderr,
             )
+        memory_db_path = str(Path.home() / ".claude" / "pd" / "memory" / "memory.db")
         try:
-            _memory_db = MemoryDatabase(
-                str(Path.home() / ".claude" / "pd" / "memory" / "memory.db")
-            )
+            _memory_db = MemoryDatabase(memory_db_path)
         except Exception as e:
             print(
                 f"[workflow-state] memory_refresh disabled for this process: memory_db init failed: {e}",
                 file=sys.stderr,
             )
+        if (
+            _memory_db is not None
+            and _provider is not None
+            and config.get("memory_refresh_enabled", True)
+            and config.get("memory_refresh_prefetch", True)
+        ):
+            _start_refresh_prefetch(memory_db_path)
 
         print(f"workflow-engine: started (db={db_path}, artifacts={_artifacts_root})", file=sys.stderr)
 
@@ -235,6 +389,13 @@ async def lifespan(server):
         yield {}
     finally:
         remove_pid("workflow_state_server")
+        if _refresh_prefetcher is not None:
+            _refresh_prefetcher.stop()
+            _refresh_prefetcher = None
+        _refresh_cache = None
+        if _outbox_worker is not None:
+            _outbox_worker.stop()
+            _outbox_worker = None
         if _db is not None:
             _db.close()
             _db = None
@@ -353,7 +514,9 @@ def _project_meta_json(
     Uses engine.get_state() as authoritative source for last_completed_phase
     and current_phase. Falls back to entity metadata if engine is None or
     engine state unavailable. Phase timing details (iterations, reviewerNotes)
-    come from entity metadata only (engine doesn't track these).
+    come from entity metadata only (engine doesn't track these). The file is
+    left untouched when it already holds the projected content; batches of
+    features go through ``MetaProjector`` instead.
     """
     entity = db.get_entity(feature_type_id)
     if entity is None:
@@ -373,8 +536,6 @@ def _project_meta_json(
     else:
         metadata = {}
 
-    phase_timing = metadata.get("phase_timing", {})
-
     # Get authoritative state from engine when available
     if engine is not None:
         engine_state = engine.get_state(feature_type_id)
@@ -384,62 +545,9 @@ def _project_meta_json(
     else:
         last_completed = metadata.get("last_completed_phase")
 
-    # Build .meta.json structure
-    meta = {
-        "id": metadata.get("id", ""),
-        "slug": metadata.get("slug", ""),
-        "mode": metadata.get("mode", "standard"),
-        "status": entity.get("status") or "active",
-        "created": entity.get("created_at") or _iso_now(),
-        "branch": metadata.get("branch", ""),
-    }
-
-    # Top-level completed timestamp for terminal statuses (R1/R2/R4)
-    # Also trigger on last_completed == "finish" as a defensive fallback
-    # when entity status hasn't propagated yet (e.g., status=None in DB).
-    if meta["status"] in ("completed", "abandoned") or last_completed == "finish":
-        finish_completed = phase_timing.get("finish", {}).get("completed")
-        meta["completed"] = finish_completed or _iso_now()
-
-    # Optional fields -- only include when present
-    if metadata.get("brainstorm_source"):
-        meta["brainstorm_source"] = metadata["brainstorm_source"]
-    if metadata.get("backlog_source"):
-        meta["backlog_source"] = metadata["backlog_source"]
-
-    # Workflow state (engine is authoritative when available)
-    meta["lastCompletedPhase"] = last_completed
-
-    # Phases from phase_timing metadata
-    phases = {}
-    for phase_name, timing in phase_timing.items():
-        phase_entry = {}
-        if timing.get("started"):
-            phase_entry["started"] = timing["started"]
-        if timing.get("completed"):
-            phase_entry["completed"] = timing["completed"]
-        if timing.get("iterations") is not None:
-            phase_entry["iterations"] = timing["iterations"]
-        if timing.get("reviewerNotes"):
-            phase_entry["reviewerNotes"] = timing["reviewerNotes"]
-        if phase_entry:
-            phases[phase_name] = phase_entry
-    meta["phases"] = phases
-
-    # Skipped phases
-    if metadata.get("skipped_phases"):
-        meta["skippedPhases"] = metadata["skipped_phases"]
-
-    # Backward travel fields (feature 073)
-    if metadata.get("backward_context"):
-        meta["backward_context"] = metadata["backward_context"]
-    if metadata.get("backward_return_target"):
-        meta["backward_return_target"] = metadata["backward_return_target"]
-    # backward_history is audit-only — stays in DB, not projected to .meta.json
-
-    # Phase summaries (feature 075)
-    if metadata.get("phase_summaries"):
-        meta["phase_summaries"] = metadata["phase_summaries"]
+    meta = build_meta_document(entity, metadata, last_completed)
+    if meta_file_matches(meta_path, meta):
+        return None  # already current
 
     # Atomic write (fail-open)
     try:
@@ -617,6 +725,8 @@ def _process_transition_phase(
     entity = None
     ts: str | None = None
     skipped_list: list[str] = []
+    # Deferred mode queues the .meta.json projection like complete_phase.
+    deferred = entity_engine is not None and entity_engine.defer_cascade
 
     if db is not None:
         with db.transaction():
@@ -670,6 +780,9 @@ def _process_transition_phase(
                 if feature_type_id.startswith("feature:"):
                     kanban = derive_kanban("active", target_phase)
                     db.update_workflow_phase(feature_type_id, kanban_column=kanban)
+
+                if deferred:
+                    _enqueue_projection(db, feature_type_id)
     else:
         response = engine.transition_phase(feature_type_id, target_phase, yolo_active)
         transitioned = all(r.allowed for r in response.results)
@@ -714,7 +827,12 @@ def _process_transition_phase(
 
     # Filesystem write AFTER transaction committed
     if transitioned and db is not None:
-        warning = _project_meta_json(db, engine, feature_type_id)
+        if deferred:
+            result["projection_deferred"] = True
+            if _outbox_worker is not None:
+                _outbox_worker.notify()
+        else:
+            warning = _project_meta_json(db, engine, feature_type_id)
 
         # Retrieve started_at from committed data
         entity = db.get_entity(feature_type_id)
@@ -730,6 +848,9 @@ def _process_transition_phase(
         if warning:
             result["projection_warning"] = warning
 
+    if transitioned and _config.get("memory_refresh_enabled", True):
+        _prefetch_memory_refresh(feature_type_id, target_phase)
+
     return json.dumps(result)
 
 
@@ -816,6 +937,7 @@ def _process_complete_phase(
     # the transaction aborted before these were populated.
     entity = None
     ts: str | None = None
+    deferred = False
 
     # First db.get_entity for UUID resolution stays OUTSIDE transaction
     if db is not None:
@@ -824,6 +946,7 @@ def _process_complete_phase(
                 entity = db.get_entity(feature_type_id)
                 if entity is not None:
                     completion = entity_engine.complete_phase(entity["uuid"], phase)
+                    deferred = completion.cascade_deferred
                     state = completion.state
                     if state is None:
                         return _make_error(
@@ -879,6 +1002,11 @@ def _process_complete_phase(
                 status = "completed" if phase == "finish" else "active"
                 kanban = derive_kanban(status, state.current_phase)
                 db.update_workflow_phase(feature_type_id, kanban_column=kanban)
+
+            # Deferred mode: the .meta.json projection joins the cascade in
+            # the outbox and commits with this transaction.
+            if deferred:
+                _enqueue_projection(db, feature_type_id)
     else:
         state = engine.complete_phase(feature_type_id, phase)
 
@@ -921,10 +1049,17 @@ def _process_complete_phase(
             result["parent_progress"] = completion.parent_progress
         if completion.cascade_error:
             result["cascade_warning"] = completion.cascade_error
+        if deferred:
+            result["cascade_deferred"] = True
+            if _outbox_worker is not None:
+                _outbox_worker.notify()
 
     # Filesystem write AFTER transaction committed
     if db is not None:
-        warning = _project_meta_json(db, engine, feature_type_id)
+        if deferred:
+            result["projection_deferred"] = True
+        else:
+            warning = _project_meta_json(db, engine, feature_type_id)
 
         # Read committed timing data
         entity = db.get_entity(feature_type_id)
@@ -959,16 +1094,21 @@ def _process_complete_phase(
     ):
         query = build_refresh_query(feature_type_id, phase)
         if query:
-            limit = _resolve_int_config(
-                _config, "memory_refresh_limit", 5,
-                clamp=(1, 20), warned=_refresh_warned_fields,
-            )
-            digest = refresh_memory_digest(
-                _memory_db, _provider, query, limit,
-                config=_config,
-                feature_type_id=feature_type_id,
-                completed_phase=phase,
-            )
+            limit = _refresh_limit()
+            # Prefetched on transition_phase; compute inline on a miss.
+            hit, digest = False, None
+            if _refresh_cache is not None:
+                hit, digest = _refresh_cache.lookup(
+                    query, limit, _memory_db.content_generation(),
+                )
+                _refresh_prefetcher.forget(query, limit)
+            if not hit:
+                digest = refresh_memory_digest(
+                    _memory_db, _provider, query, limit,
+                    config=_config,
+                    feature_type_id=feature_type_id,
+                    completed_phase=phase,
+                )
             if digest:
                 result["memory_refresh"] = digest
 
@@ -1890,10 +2030,25 @@ async def query_phase_analytics(
     project_id: str | None = None,
     phase: str | None = None,
     limit: int = 50,
+    since: str | None = None,
+    until: str | None = None,
+    include_archive: bool = False,
 ) -> str:
     """Query structured phase execution data for analytics.
 
-    query_type: 'phase_duration' | 'iteration_summary' | 'backward_frequency' | 'raw_events'
+    query_type: 'phase_duration' | 'iteration_summary' | 'backward_frequency'
+    | 'raw_events' | 'daily_rollup' | 'duration_histogram'
+
+    since / until: optional ISO-8601 bounds on the event timestamp (since
+    inclusive, until exclusive). 'daily_rollup' and 'duration_histogram'
+    read the per-day rollups kept on insert instead of raw events, so they
+    cover every event without a scan cap; they use only the date part of
+    the bounds and ignore feature_type_id. 'daily_rollup' returns the most
+    recent `limit` rows, oldest first.
+
+    include_archive: also read events moved to the archive database by
+    phase_events retention (`phase_events_retention_days`). The rollup
+    query types always cover archived events.
 
     Cross-project isolation (feature 088, FR-2.1): by default, results are
     scoped to the current project (`_project_id`). Pass `project_id="*"` to
@@ -1930,12 +2085,14 @@ async def query_phase_analytics(
         started = _db.query_phase_events(
             type_id=feature_type_id, project_id=resolved_project_id,
             phase=phase, event_type="started",
-            limit=_ANALYTICS_EVENT_SCAN_LIMIT,
+            limit=_ANALYTICS_EVENT_SCAN_LIMIT, since=since, until=until,
+            include_archive=include_archive,
         )
         completed = _db.query_phase_events(
             type_id=feature_type_id, project_id=resolved_project_id,
             phase=phase, event_type="completed",
-            limit=_ANALYTICS_EVENT_SCAN_LIMIT,
+            limit=_ANALYTICS_EVENT_SCAN_LIMIT, since=since, until=until,
+            include_archive=include_archive,
         )
         events = list(started) + list(completed)
         results = _compute_durations(events)
@@ -1953,7 +2110,8 @@ async def query_phase_analytics(
         events = _db.query_phase_events(
             type_id=feature_type_id, project_id=resolved_project_id,
             phase=phase, event_type="completed",
-            limit=_ANALYTICS_EVENT_SCAN_LIMIT,
+            limit=_ANALYTICS_EVENT_SCAN_LIMIT, since=since, until=until,
+            include_archive=include_archive,
         )
         results = [
             {
@@ -1976,6 +2134,7 @@ async def query_phase_analytics(
         events = _db.query_phase_events(
             type_id=feature_type_id, project_id=resolved_project_id,
             event_type="backward", limit=_ANALYTICS_EVENT_SCAN_LIMIT,
+            since=since, until=until, include_archive=include_archive,
         )
         freq: dict[str, int] = {}
         for e in events:
@@ -1993,7 +2152,8 @@ async def query_phase_analytics(
     elif query_type == "raw_events":
         events = _db.query_phase_events(
             type_id=feature_type_id, project_id=resolved_project_id,
-            phase=phase, limit=limit,
+            phase=phase, limit=limit, since=since, until=until,
+            include_archive=include_archive,
         )
         return json.dumps({
             "query_type": "raw_events",
@@ -2001,9 +2161,85 @@ async def query_phase_analytics(
             "total": len(events),
         })
 
+    elif query_type == "daily_rollup":
+        results = _db.query_phase_rollups(
+            project_id=resolved_project_id, phase=phase,
+            since=since, until=until,
+        )
+        return json.dumps({
+            "query_type": "daily_rollup",
+            "results": results[-limit:] if limit > 0 else [],
+            "total": len(results),
+        })
+
+    elif query_type == "duration_histogram":
+        results = _db.query_phase_duration_histogram(
+            project_id=resolved_project_id, phase=phase,
+            since=since, until=until,
+        )
+        return json.dumps({
+            "query_type": "duration_histogram",
+            "bucket_upper_bounds_seconds": list(PHASE_DURATION_BUCKETS),
+            "results": results,
+            "total": len(results),
+        })
+
     return json.dumps({"error": f"Unknown query_type: {query_type}"})
 
 
+@mcp.tool()
+async def export_phase_events(
+    output_path: str,
+    project_id: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    include_archive: bool = False,
+) -> str:
+    """Export phase_events as a compressed columnar NumPy .npz file.
+
+    output_path: destination, relative paths resolved against artifacts_root;
+    must stay inside it.
+    project_id / since / until / include_archive: as in
+    query_phase_analytics.
+
+    See entity_registry.phase_analytics for the file layout.
+    """
+    err = _check_db_available()
+    if err:
+        return err
+    if _db is None:
+        return _NOT_INITIALIZED
+
+    if project_id is not None and project_id != "*" and project_id != _project_id:
+        return _make_error(
+            "forbidden",
+            f'cross-project export requires project_id="*" or current '
+            f'project ({_project_id!r}); got {project_id!r}',
+            'Pass project_id=None for current, "*" for all projects',
+        )
+    resolved_project_id = None if project_id == "*" else (project_id or _project_id)
+
+    resolved_path = resolve_output_path(output_path, _artifacts_root)
+    if resolved_path is None:
+        return _make_error(
+            "invalid_input",
+            f"output_path escapes artifacts_root: {output_path!r}",
+            "Use a path inside the artifacts root",
+        )
+    try:
+        os.makedirs(os.path.dirname(resolved_path), exist_ok=True)
+        rows = export_phase_events_npz(
+            _db, resolved_path, project_id=resolved_project_id,
+            since=since, until=until, include_archive=include_archive,
+        )
+    except (OSError, RuntimeError) as exc:
+        return _make_error(
+            "export_failed", str(exc),
+            "Check the output path and that numpy is installed",
+        )
+    return json.dumps({"path": resolved_path, "rows": rows})
+
+
 def _compute_durations(events: list[dict]) -> list[dict]:
     """Pair `started` / `completed` phase_events for each (type_id, phase).
 
@@ -97,7 +97,9 @@ def create_app(db_path: str | None = None) -> FastAPI:
     Returns
     -------
     FastAPI application instance. If the DB file does not exist,
-    app.state.db is set to None (board route renders error page).
+    app.state.db is set to None (board route renders error page);
+    otherwise it is an EntityDatabasePool, so each request's DB calls run
+    on their own bounded, deadline-guarded connection.
     """
     # Resolve DB path: param -> env -> default
     if db_path is None:
@@ -109,10 +111,11 @@ def create_app(db_path: str | None = None) -> FastAPI:
     app = FastAPI(title="pd UI")
 
     # Database: open if file exists, else None (board route shows error page)
-    from entity_registry.database import EntityDatabase
+    from ui.db_pool import EntityDatabasePool
 
     if os.path.isfile(db_path):
-        app.state.db = EntityDatabase(db_path, check_same_thread=False)
+        app.state.db = EntityDatabasePool(db_path)
+        app.router.on_shutdown.append(app.state.db.close)
     else:
         app.state.db = None
 
@@ -137,4 +140,11 @@ def create_app(db_path: str | None = None) -> FastAPI:
     app.include_router(board_router)
     app.include_router(entities_router)
 
+    # Per-request caches and instrumentation
+    from ui.instrumentation import install_instrumentation
+    from ui.routes.entities import LineageCache
+
+    app.state.lineage_cache = LineageCache()
+    install_instrumentation(app, app.state.db)
+
     return app
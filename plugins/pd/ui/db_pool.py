@@ -0,0 +1,157 @@
+"""Bounded pool of entity DB connections for the pd UI server.
+
+Sync route handlers run on Starlette's thread pool. Sharing one
+``EntityDatabase(check_same_thread=False)`` across those threads serialises
+nothing at the Python level, so concurrent requests interleave cursors on
+one connection. EntityDatabasePool instead hands each DB call its own
+connection, checked out for the duration of the call:
+
+- at most ``size`` calls touch SQLite at once; further callers wait up to
+  ``acquire_timeout`` seconds, then get PoolTimeout
+- every checkout carries a ``query_timeout`` deadline enforced by a sqlite3
+  progress handler, so a runaway query is interrupted instead of pinning
+  a worker thread
+- ``change_token()`` runs on one dedicated connection, so the frequent
+  board-feed polls never wait behind a checkout
+
+The pool exposes the EntityDatabase method surface (``pool.list_entities``
+etc.), so route code and tests use it exactly like a single database.
+"""
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from entity_registry.database import EntityDatabase
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_ACQUIRE_TIMEOUT = 5.0
+DEFAULT_QUERY_TIMEOUT = 5.0
+
+# VM instructions between deadline checks (cheap; ~sub-millisecond apart).
+_PROGRESS_INTERVAL = 10_000
+
+
+class PoolTimeout(TimeoutError):
+    """No pooled connection became free within the acquire timeout."""
+
+
+class EntityDatabasePool:
+    """Thread-safe, bounded set of EntityDatabase connections."""
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        size: int = DEFAULT_POOL_SIZE,
+        acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT,
+        query_timeout: float | None = DEFAULT_QUERY_TIMEOUT,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"pool size must be >= 1, got {size}")
+        self.db_path = db_path
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self.query_timeout = query_timeout
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: queue.LifoQueue[EntityDatabase] = queue.LifoQueue()
+        self._all: list[EntityDatabase] = []
+        self._all_lock = threading.Lock()
+        self._trace_callback: Callable[[str], None] | None = None
+        self._closed = False
+
+        # Opening the first connection runs any pending migrations before
+        # request threads race to do the same.
+        self._token_db = self._open()
+        self._token_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Connection lifecycle
+    # ------------------------------------------------------------------
+
+    def _open(self) -> EntityDatabase:
+        db = EntityDatabase(self.db_path, check_same_thread=False)
+        with self._all_lock:
+            self._all.append(db)
+            if self._trace_callback is not None:
+                db.set_trace_callback(self._trace_callback)
+        return db
+
+    @contextmanager
+    def connection(self) -> Iterator[EntityDatabase]:
+        """Check out one connection for the duration of the block.
+
+        Raises PoolTimeout when all ``size`` connections stay busy for
+        ``acquire_timeout`` seconds. Statements still running when
+        ``query_timeout`` elapses are aborted with
+        ``sqlite3.OperationalError``.
+        """
+        if self._closed:
+            raise RuntimeError("EntityDatabasePool is closed")
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise PoolTimeout(
+                f"no entity DB connection free after {self.acquire_timeout}s "
+                f"(pool size {self.size})"
+            )
+        try:
+            try:
+                db = self._idle.get_nowait()
+            except queue.Empty:
+                db = self._open()
+
+            if self.query_timeout is not None:
+                deadline = time.monotonic() + self.query_timeout
+                db.set_progress_handler(
+                    lambda: time.monotonic() > deadline, _PROGRESS_INTERVAL,
+                )
+            try:
+                yield db
+            finally:
+                db.set_progress_handler(None, _PROGRESS_INTERVAL)
+                self._idle.put(db)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Close every connection the pool opened."""
+        self._closed = True
+        with self._all_lock:
+            for db in self._all:
+                try:
+                    db.close()
+                except Exception:
+                    pass
+            self._all.clear()
+
+    # ------------------------------------------------------------------
+    # EntityDatabase surface
+    # ------------------------------------------------------------------
+
+    def change_token(self) -> str:
+        """EntityDatabase.change_token on the pool's dedicated connection."""
+        with self._token_lock:
+            return self._token_db.change_token()
+
+    def set_trace_callback(self, callback: Callable[[str], None] | None) -> None:
+        """Apply a trace callback to every current and future connection."""
+        with self._all_lock:
+            self._trace_callback = callback
+            for db in self._all:
+                db.set_trace_callback(callback)
+
+    def __getattr__(self, name: str):
+        # Only reached for names not set on the instance, so tests can still
+        # patch individual methods (pool.get_entity = MagicMock(...)).
+        if name.startswith("_") or not callable(getattr(EntityDatabase, name, None)):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+        def call(*args, **kwargs):
+            with self.connection() as db:
+                return getattr(db, name)(*args, **kwargs)
+
+        call.__name__ = name
+        return call
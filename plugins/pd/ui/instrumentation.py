@@ -0,0 +1,128 @@
+"""Per-route latency and SQL query-count instrumentation for the pd UI.
+
+InstrumentationMiddleware times every HTTP request up to its response
+headers and counts the SQL statements the entity DB connection executed
+for it (via a sqlite3 trace callback routed through a ContextVar, so
+concurrent requests on the threadpool do not mix counts). Each response
+carries ``Server-Timing`` and ``X-Query-Count`` headers; aggregates per
+route template are served as JSON from ``GET /metrics``.
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+_request_queries: ContextVar[list[int] | None] = ContextVar(
+    "pd_ui_request_queries", default=None
+)
+
+
+def count_query(_statement: str) -> None:
+    """sqlite3 trace callback: attribute one statement to the current request."""
+    counter = _request_queries.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+@dataclass
+class RouteStats:
+    """Running latency/query totals for one ``METHOD /route/template``."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    queries: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "avg_queries": round(self.queries / self.count, 2) if self.count else 0.0,
+            "total_queries": self.queries,
+        }
+
+
+class RequestMetrics:
+    """Thread-safe per-route aggregation of request latency and query counts."""
+
+    def __init__(self) -> None:
+        self._routes: dict[str, RouteStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, route: str, elapsed_ms: float, queries: int) -> None:
+        with self._lock:
+            stats = self._routes.setdefault(route, RouteStats())
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.queries += queries
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                route: stats.to_dict()
+                for route, stats in sorted(self._routes.items())
+            }
+
+
+def _route_label(scope: dict) -> str:
+    """``METHOD /template`` for the matched route, else the raw path."""
+    route = scope.get("route")
+    path = getattr(route, "path", None) or "<unmatched>"
+    return f"{scope.get('method', '')} {path}"
+
+
+class InstrumentationMiddleware:
+    """Pure ASGI middleware (streams such as SSE pass through untouched)."""
+
+    def __init__(self, app, metrics: RequestMetrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        counter = [0]
+        reset_token = _request_queries.set(counter)
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                queries = counter[0]
+                self.metrics.record(_route_label(scope), elapsed_ms, queries)
+                headers = list(message.get("headers", []))
+                headers.append((
+                    b"server-timing",
+                    f'app;dur={elapsed_ms:.1f}, db;desc="{queries} queries"'.encode(),
+                ))
+                headers.append((b"x-query-count", str(queries).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_queries.reset(reset_token)
+
+
+def install_instrumentation(app, db) -> RequestMetrics:
+    """Attach the middleware, the DB trace hook and ``GET /metrics`` to app."""
+    from fastapi.responses import JSONResponse
+
+    metrics = RequestMetrics()
+    app.state.metrics = metrics
+    if db is not None:
+        db.set_trace_callback(count_query)
+    app.add_middleware(InstrumentationMiddleware, metrics=metrics)
+
+    @app.get("/metrics", include_in_schema=False)
+    def route_metrics() -> JSONResponse:
+        """Per-route latency and SQL query counts since server start."""
+        return JSONResponse(metrics.snapshot())
+
+    return metrics
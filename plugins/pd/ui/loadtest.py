@@ -0,0 +1,291 @@
+"""Load test for the pd UI server.
+
+Builds (or reuses) a synthetic entity database, serves it with uvicorn in a
+background thread unless ``--url`` points at a running server, then drives
+the board, entity list (first and keyset pages) and entity detail routes
+from ``--concurrency`` client threads. Reports throughput, latency
+percentiles and status counts per route.
+
+Usage (from plugins/pd, with hooks/lib on PYTHONPATH):
+    python -m ui.loadtest --entities 50000 --requests 2000 --concurrency 16
+    python -m ui.loadtest --url http://127.0.0.1:8718 --requests 500
+
+Only the standard library is used on the client side so the numbers are not
+skewed by a client framework's own event loop.
+"""
+
+import argparse
+import html
+import http.client
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import uuid as uuid_mod
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+
+_ENTITY_TYPES = ("feature", "brainstorm", "backlog", "project")
+_STATUSES = ("active", "planned", "completed", "abandoned")
+_COLUMNS = (
+    "backlog", "prioritised", "wip", "agent_review",
+    "human_review", "blocked", "documenting", "completed",
+)
+_FEATURE_PHASES = (
+    "brainstorm", "specify", "design", "create-plan", "implement", "finish",
+)
+
+
+def build_synthetic_db(
+    db_path: str, entities: int, *, seed: int = 0, board_size: int = 500,
+) -> None:
+    """Populate db_path with ``entities`` rows in a single transaction.
+
+    The first ``board_size`` features also get a workflow_phases row so the
+    board has realistic card counts.
+    """
+    from entity_registry.database import EntityDatabase
+
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    entity_rows = []
+    phase_rows = []
+    for i in range(entities):
+        entity_type = _ENTITY_TYPES[i % len(_ENTITY_TYPES)]
+        entity_id = f"{i:06d}-load-{entity_type}"
+        type_id = f"{entity_type}:{entity_id}"
+        stamp = (base + timedelta(minutes=rng.randrange(500_000))).isoformat()
+        row_uuid = str(uuid_mod.UUID(int=rng.getrandbits(128), version=4))
+        entity_rows.append((
+            row_uuid, type_id, "__unknown__", entity_type, entity_id,
+            f"Load test {entity_type} {i}", rng.choice(_STATUSES),
+            f"docs/{entity_type}s/{entity_id}", stamp, stamp,
+        ))
+        if entity_type == "feature" and len(phase_rows) < board_size:
+            phase_rows.append((
+                type_id, rng.choice(_FEATURE_PHASES), rng.choice(_COLUMNS),
+                stamp, row_uuid,
+            ))
+
+    db = EntityDatabase(db_path)
+    try:
+        with db.begin_immediate() as conn:
+            conn.executemany(
+                "INSERT INTO entities (uuid, type_id, project_id, entity_type,"
+                " entity_id, name, status, artifact_path, created_at,"
+                " updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                entity_rows,
+            )
+            conn.executemany(
+                "INSERT INTO workflow_phases (type_id, workflow_phase,"
+                " kanban_column, updated_at, uuid) VALUES (?, ?, ?, ?, ?)",
+                phase_rows,
+            )
+    finally:
+        db.close()
+
+
+def _serve(db_path: str) -> tuple[str, object, threading.Thread]:
+    """Start the app under uvicorn on a free port; return (url, server, thread)."""
+    import socket
+
+    import uvicorn
+
+    from ui import create_app
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    app = create_app(db_path)
+    config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("uvicorn did not start within 10s")
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}", server, thread
+
+
+def _get(conn: http.client.HTTPConnection, path: str) -> tuple[int, bytes]:
+    conn.request("GET", path)
+    resp = conn.getresponse()
+    return resp.status, resp.read()
+
+
+_DETAIL_LINK = re.compile(r'href="/entities/([^"]+)"')
+_PAGE_LINK = re.compile(r'href="/entities\?([^"]*cursor=[^"]*)"')
+
+
+def _discover_paths(base_url: str, pages: int) -> list[tuple[str, str]]:
+    """Return the (route label, path) mix the workers cycle through.
+
+    Follows the list's next-page links ``pages`` deep so keyset pages are
+    exercised, and samples detail pages from the listings it saw.
+    """
+    parts = urlsplit(base_url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+    paths: list[tuple[str, str]] = [("board", "/"), ("entities", "/entities")]
+    type_ids: list[str] = []
+    path = "/entities"
+    try:
+        for _ in range(pages):
+            status, body = _get(conn, path)
+            if status != 200:
+                break
+            text = body.decode()
+            type_ids.extend(_DETAIL_LINK.findall(text)[:2])
+            page_links = [
+                html.unescape(query) for query in _PAGE_LINK.findall(text)
+            ]
+            if not page_links:
+                break
+            # The last cursor link on a page is "Next page".
+            path = f"/entities?{page_links[-1]}"
+            paths.append(("entities?cursor", path))
+    finally:
+        conn.close()
+    paths.extend(("entity detail", f"/entities/{t}") for t in type_ids)
+    return paths
+
+
+def run_load(
+    base_url: str, requests: int, concurrency: int, paths: list[tuple[str, str]],
+) -> dict:
+    """Issue ``requests`` GETs over ``concurrency`` keep-alive connections."""
+    parts = urlsplit(base_url)
+    latencies: dict[str, list[float]] = defaultdict(list)
+    statuses: dict[str, Counter] = defaultdict(Counter)
+    lock = threading.Lock()
+    counter = iter(range(requests))
+    counter_lock = threading.Lock()
+
+    def worker(worker_id: int) -> None:
+        conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=60)
+        local_lat: dict[str, list[float]] = defaultdict(list)
+        local_status: dict[str, Counter] = defaultdict(Counter)
+        try:
+            while True:
+                with counter_lock:
+                    i = next(counter, None)
+                if i is None:
+                    break
+                label, path = paths[(i + worker_id) % len(paths)]
+                start = time.perf_counter()
+                try:
+                    status, _ = _get(conn, path)
+                except (OSError, http.client.HTTPException):
+                    conn.close()
+                    conn = http.client.HTTPConnection(
+                        parts.hostname, parts.port, timeout=60,
+                    )
+                    status = 0
+                local_lat[label].append((time.perf_counter() - start) * 1000)
+                local_status[label][status] += 1
+        finally:
+            conn.close()
+        with lock:
+            for label, values in local_lat.items():
+                latencies[label].extend(values)
+            for label, counts in local_status.items():
+                statuses[label].update(counts)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    all_latencies = [v for values in latencies.values() for v in values]
+    return {
+        "requests": len(all_latencies),
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(all_latencies) / elapsed, 1) if elapsed else 0.0,
+        "overall": _summarise(all_latencies),
+        "routes": {
+            label: {**_summarise(values), "status": dict(statuses[label])}
+            for label, values in sorted(latencies.items())
+        },
+    }
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _summarise(values: list[float]) -> dict:
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered), 2) if ordered else 0.0,
+        "p50_ms": round(_percentile(ordered, 50), 2),
+        "p99_ms": round(_percentile(ordered, 99), 2),
+        "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+    }
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(description="pd UI load test")
+    parser.add_argument("--url", help="Target a running server instead of starting one")
+    parser.add_argument("--db", help="Entity DB to serve (built if missing)")
+    parser.add_argument("--entities", type=int, default=50_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--pages", type=int, default=5,
+                        help="Keyset pages to follow when building the request mix")
+    parser.add_argument("--seed", type=int, default=0)
+    parsed = parser.parse_args(args)
+
+    server = thread = None
+    tmpdir = None
+    base_url = parsed.url
+    if base_url is None:
+        db_path = parsed.db
+        if db_path is None:
+            tmpdir = tempfile.TemporaryDirectory(prefix="pd-ui-load-")
+            db_path = os.path.join(tmpdir.name, "entities.db")
+        if not os.path.exists(db_path):
+            start = time.perf_counter()
+            build_synthetic_db(db_path, parsed.entities, seed=parsed.seed)
+            print(
+                f"built {parsed.entities} entities in "
+                f"{time.perf_counter() - start:.1f}s at {db_path}",
+                file=sys.stderr,
+            )
+        base_url, server, thread = _serve(db_path)
+
+    try:
+        paths = _discover_paths(base_url, parsed.pages)
+        report = run_load(base_url, parsed.requests, parsed.concurrency, paths)
+    finally:
+        if server is not None:
+            server.should_exit = True
+            thread.join(timeout=10)
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+    print(json.dumps(report, indent=2))
+    failures = sum(
+        count
+        for route in report["routes"].values()
+        for status, count in route["status"].items()
+        if status >= 500 or status == 0
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
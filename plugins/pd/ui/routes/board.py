@@ -1,11 +1,20 @@
-"""Board route — Kanban board view."""
+"""Board route — Kanban board view and live change feed."""
 
+import asyncio
+import json
 import sys
 
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 
-from ui.routes.helpers import DB_ERROR_USER_MESSAGE, missing_db_response
+from ui.routes.helpers import (
+    DB_ERROR_USER_MESSAGE,
+    etag_headers,
+    etag_matches,
+    make_etag,
+    missing_db_response,
+    not_modified_response,
+)
 
 router = APIRouter()
 
@@ -20,6 +29,12 @@ COLUMN_ORDER = [
     "completed",
 ]
 
+# Change-feed cadence: how often the stream checks the DB change token, and
+# how long it may stay silent before sending an SSE comment to keep proxies
+# from closing the connection.
+SSE_POLL_INTERVAL = 1.0
+SSE_KEEPALIVE_INTERVAL = 15.0
+
 
 def _group_by_column(rows: list[dict]) -> dict[str, list[dict]]:
     """Group workflow_phases rows by kanban_column.
@@ -37,14 +52,15 @@ def _group_by_column(rows: list[dict]) -> dict[str, list[dict]]:
 
 
 @router.get("/", response_class=HTMLResponse)
-def board(request: Request) -> HTMLResponse:
+def board(request: Request) -> Response:
     """Serve the Kanban board.
 
-    4 code paths:
+    5 code paths:
     1. Missing DB (app.state.db is None) -> error.html
     2. DB query error -> error.html
-    3. HX-Request header present -> _board_content.html partial
-    4. Normal request -> board.html full page
+    3. If-None-Match matches the current ETag -> 304, no query or render
+    4. HX-Request header present -> _board_content.html partial
+    5. Normal request -> board.html full page
     """
     db = request.app.state.db
     db_path = request.app.state.db_path
@@ -54,8 +70,17 @@ def board(request: Request) -> HTMLResponse:
     if db is None:
         return missing_db_response(templates, request, db_path)
 
+    is_partial = bool(request.headers.get("HX-Request"))
+
     # Path 2: DB query error
     try:
+        change_token = db.change_token()
+        etag = make_etag(change_token, "board", is_partial)
+
+        # Path 3: Unchanged since the client's copy
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+
         rows = db.list_workflow_phases()
     except Exception as exc:
         print(f"DB query error: {exc}", file=sys.stderr)
@@ -71,8 +96,8 @@ def board(request: Request) -> HTMLResponse:
 
     columns = _group_by_column(rows)
 
-    # Path 3: HTMX partial refresh
-    if request.headers.get("HX-Request"):
+    # Path 4: HTMX partial refresh
+    if is_partial:
         return templates.TemplateResponse(
             request=request,
             name="_board_content.html",
@@ -81,9 +106,10 @@ def board(request: Request) -> HTMLResponse:
                 "column_order": COLUMN_ORDER,
                 "active_page": "board",
             },
+            headers=etag_headers(etag),
         )
 
-    # Path 4: Full page load
+    # Path 5: Full page load
     return templates.TemplateResponse(
         request=request,
         name="board.html",
@@ -91,5 +117,137 @@ def board(request: Request) -> HTMLResponse:
             "columns": columns,
             "column_order": COLUMN_ORDER,
             "active_page": "board",
+            "change_token": change_token,
         },
+        headers=etag_headers(etag),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Live change feed (Server-Sent Events)
+# ---------------------------------------------------------------------------
+
+
+def _render_cards(templates, rows: list[dict]) -> dict[str, tuple[str, str]]:
+    """Return {type_id: (kanban_column, card html)} for the board's rows."""
+    card = templates.get_template("_card.html")
+    return {
+        item["type_id"]: (col, card.render(item=item))
+        for col, items in _group_by_column(rows).items()
+        for item in items
+    }
+
+
+def _diff_cards(
+    previous: dict[str, tuple[str, str]],
+    current: dict[str, tuple[str, str]],
+) -> list[tuple[str, dict]]:
+    """Return (event, payload) pairs that turn ``previous`` into ``current``.
+
+    Only moved or re-rendered cards produce a ``card`` event; cards that left
+    the board produce ``remove``.
+    """
+    events: list[tuple[str, dict]] = []
+    for type_id, (col, html) in current.items():
+        if previous.get(type_id) != (col, html):
+            events.append(
+                ("card", {"type_id": type_id, "column": col, "html": html})
+            )
+    for type_id in previous.keys() - current.keys():
+        events.append(("remove", {"type_id": type_id}))
+    return events
+
+
+def _format_sse(event: str, data: dict, event_id: str | None = None) -> str:
+    """Serialise one SSE message."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def _board_state(db, templates) -> tuple[str, dict[str, tuple[str, str]]]:
+    """Return the current (change token, rendered cards) pair."""
+    token = db.change_token()
+    return token, _render_cards(templates, db.list_workflow_phases())
+
+
+async def board_event_stream(
+    db,
+    templates,
+    token: str,
+    cards: dict[str, tuple[str, str]],
+    since: str | None,
+    is_disconnected,
+    poll_interval: float = SSE_POLL_INTERVAL,
+    keepalive_interval: float = SSE_KEEPALIVE_INTERVAL,
+):
+    """Yield SSE messages for board changes until the client disconnects.
+
+    ``token``/``cards`` is the state the stream starts from (see
+    _board_state). Idle cost is one ``_metadata`` lookup per poll: rows
+    are only re-read and cards re-rendered when the change token moves.
+    ``since`` is the token the client last rendered; if it is stale the
+    client is told to reload the whole board once, then receives deltas.
+    """
+    if since and since != token:
+        yield _format_sse("reload", {}, token)
+
+    idle = 0.0
+    while not await is_disconnected():
+        await asyncio.sleep(poll_interval)
+        current_token = await asyncio.to_thread(db.change_token)
+        if current_token == token:
+            idle += poll_interval
+            if idle >= keepalive_interval:
+                idle = 0.0
+                yield ": keepalive\n\n"
+            continue
+
+        current_token, current = await asyncio.to_thread(
+            _board_state, db, templates,
+        )
+        token = current_token
+        idle = 0.0
+        events = _diff_cards(cards, current)
+        cards = current
+        for event, data in events:
+            yield _format_sse(event, data, token)
+        if not events:
+            # Advance the client's Last-Event-ID without dispatching an event
+            yield f"id: {token}\n\n"
+
+
+@router.get("/board/events")
+async def board_events(request: Request) -> Response:
+    """Stream board card changes as Server-Sent Events.
+
+    Events: ``card`` (card moved or updated; carries column and html),
+    ``remove`` (card left the board) and ``reload`` (client state too old
+    for deltas). Reconnects resume from the Last-Event-ID header. Without a
+    usable database the route answers 204, which tells EventSource not to
+    retry.
+    """
+    db = request.app.state.db
+    if db is None:
+        return Response(status_code=204)
+
+    templates = request.app.state.templates
+    since = request.headers.get("Last-Event-ID") or request.query_params.get(
+        "since"
+    )
+    try:
+        token, cards = await asyncio.to_thread(_board_state, db, templates)
+    except Exception as exc:
+        print(f"DB query error: {exc}", file=sys.stderr)
+        return Response(status_code=204)
+
+    return StreamingResponse(
+        board_event_stream(
+            db, templates, token, cards, since, request.is_disconnected,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
@@ -1,22 +1,105 @@
 """Entities route — entity list and detail views."""
 
+import base64
+import binascii
 import json
 import sys
+import threading
+import time
+from collections import OrderedDict
 
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 
 from ui.mermaid import build_mermaid_dag
-from ui.routes.helpers import DB_ERROR_USER_MESSAGE, missing_db_response
+from ui.routes.helpers import (
+    DB_ERROR_USER_MESSAGE,
+    etag_headers,
+    etag_matches,
+    make_etag,
+    missing_db_response,
+    not_modified_response,
+)
 
 router = APIRouter(prefix="/entities")
 
 ENTITY_TYPES = ["backlog", "brainstorm", "project", "feature"]
 
+# Entity list page size (override per request with ?limit=, capped at MAX).
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
 
-def _build_workflow_lookup(db) -> dict:
-    """Return {type_id: workflow_phase_row} from db.list_workflow_phases()."""
-    return {wp["type_id"]: wp for wp in db.list_workflow_phases()}
+
+def _build_workflow_lookup(db, type_ids: list[str] | None = None) -> dict:
+    """Return {type_id: workflow_phase_row} from db.list_workflow_phases().
+
+    With ``type_ids`` only those rows are fetched (one page of entities).
+    """
+    if type_ids is None:
+        rows = db.list_workflow_phases()
+    else:
+        rows = db.list_workflow_phases(type_ids=type_ids)
+    return {wp["type_id"]: wp for wp in rows}
+
+
+def _encode_cursor(entity: dict) -> str:
+    """Opaque keyset cursor for the entity a page ended on."""
+    raw = json.dumps([entity.get("updated_at") or "", entity["uuid"]])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str | None) -> tuple[str, str] | None:
+    """Inverse of _encode_cursor; malformed cursors restart at page one."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        updated_at, uuid = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError):
+        return None
+    if not isinstance(updated_at, str) or not isinstance(uuid, str):
+        return None
+    return updated_at, uuid
+
+
+def _page_size(limit: int | None) -> int:
+    if limit is None or limit < 1:
+        return PAGE_SIZE
+    return min(limit, MAX_PAGE_SIZE)
+
+
+class LineageCache:
+    """Bounded per-entity cache of lineage lists and the rendered DAG.
+
+    Entries are keyed by type_id and stamped with the DB change token they
+    were built under; any write to the registry (re-parenting, renames,
+    new children) moves the token, so a stale entry is never served.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, type_id: str, token: str) -> dict | None:
+        """Return the cached lineage view if built under ``token``."""
+        with self._lock:
+            entry = self._entries.get(type_id)
+            if entry is None or entry[0] != token:
+                return None
+            self._entries.move_to_end(type_id)
+            return entry[1]
+
+    def put(self, type_id: str, token: str, view: dict) -> None:
+        with self._lock:
+            self._entries[type_id] = (token, view)
+            self._entries.move_to_end(type_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
 
 
 def _strip_self_from_lineage(lineage: list[dict], type_id: str) -> list[dict]:
@@ -40,15 +123,22 @@ def entity_list(
     type: str | None = None,
     status: str | None = None,
     q: str | None = None,
-) -> HTMLResponse:
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> Response:
     """Serve the entity list page.
 
-    5 code paths:
+    Listing (no search) is keyset-paginated in SQL, newest first, with
+    ``cursor`` naming the last entity of the previous page. Search results
+    keep FTS ranking semantics and are capped at 100.
+
+    6 code paths:
     1. Missing DB (app.state.db is None) -> error.html
     2. DB query error -> error.html with stderr logging
-    3. Search with FTS unavailable (ValueError) -> fallback to list_entities
-    4. HX-Request header -> _entities_content.html partial
-    5. Normal request -> entities.html full page
+    3. If-None-Match matches the current ETag -> 304, no query or render
+    4. Search with FTS unavailable (ValueError) -> fallback to list_entities
+    5. HX-Request header -> _entities_content.html partial
+    6. Normal request -> entities.html full page
     """
     db = request.app.state.db
     db_path = request.app.state.db_path
@@ -58,30 +148,60 @@ def entity_list(
     if db is None:
         return missing_db_response(templates, request, db_path)
 
+    is_partial = bool(request.headers.get("HX-Request"))
+
     # Path 2: DB query error (wraps all DB calls)
     try:
+        # The minute bucket keeps the rendered timeago strings fresh
+        etag = make_etag(
+            db.change_token(), "entities", is_partial, type, status, q,
+            cursor, limit, int(time.time() // 60),
+        )
+
+        # Path 3: Unchanged since the client's copy
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+
         search_available = True
         type_filter = type if type in ENTITY_TYPES else None
+        page_size = _page_size(limit)
+        after = _decode_cursor(cursor)
+        next_cursor = None
+
+        def _list_page() -> list[dict]:
+            # Fetch one extra row to learn whether another page exists
+            nonlocal next_cursor
+            rows = db.list_entities(
+                entity_type=type_filter,
+                status=status or None,
+                limit=page_size + 1,
+                after=after,
+            )
+            if len(rows) > page_size:
+                rows = rows[:page_size]
+                next_cursor = _encode_cursor(rows[-1])
+            return rows
 
-        # Path 3: Search with FTS fallback
+        # Path 4: Search with FTS fallback
         if q:
             try:
                 entities = db.search_entities(q, entity_type=type_filter, limit=100)
+                # FTS does not filter status; apply it to the ranked hits
+                if status:
+                    entities = [e for e in entities if e.get("status") == status]
+                entities = sorted(
+                    entities, key=lambda e: e.get("updated_at", ""), reverse=True,
+                )
             except ValueError:
                 search_available = False
-                entities = db.list_entities(entity_type=type_filter)
+                entities = _list_page()
         else:
-            entities = db.list_entities(entity_type=type_filter)
+            entities = _list_page()
 
-        # Apply status filter in-memory (DB doesn't support combined filtering)
-        if status:
-            entities = [e for e in entities if e.get("status") == status]
-
-        # Sort by updated_at DESC (most recently updated first)
-        entities = sorted(entities, key=lambda e: e.get("updated_at", ""), reverse=True)
-
-        # Annotate entities with kanban_column from workflow phase data
-        workflow_lookup = _build_workflow_lookup(db)
+        # Annotate this page's entities with kanban_column
+        workflow_lookup = _build_workflow_lookup(
+            db, [e["type_id"] for e in entities],
+        )
         for e in entities:
             e["kanban_column"] = workflow_lookup.get(e["type_id"], {}).get("kanban_column")
 
@@ -105,21 +225,26 @@ def entity_list(
         "search_available": search_available,
         "entity_types": ENTITY_TYPES,
         "active_page": "entities",
+        "cursor": cursor if after is not None else None,
+        "next_cursor": next_cursor,
+        "page_size": page_size,
     }
 
-    # Path 4: HTMX partial refresh
-    if request.headers.get("HX-Request"):
+    # Path 5: HTMX partial refresh
+    if is_partial:
         return templates.TemplateResponse(
             request=request,
             name="_entities_content.html",
             context=context,
+            headers=etag_headers(etag),
         )
 
-    # Path 5: Full page load
+    # Path 6: Full page load
     return templates.TemplateResponse(
         request=request,
         name="entities.html",
         context=context,
+        headers=etag_headers(etag),
     )
 
 
@@ -131,7 +256,8 @@ def entity_detail(request: Request, identifier: str) -> HTMLResponse:
     1. Missing DB (app.state.db is None) -> error.html
     2. DB query error -> error.html with stderr logging
     3. Entity not found -> 404.html with status_code=404
-    4. Normal -> entity_detail.html
+    4. Normal -> entity_detail.html (lineage + Mermaid DAG served from
+       app.state.lineage_cache while the DB change token is unchanged)
     """
     db = request.app.state.db
     db_path = request.app.state.db_path
@@ -154,16 +280,28 @@ def entity_detail(request: Request, identifier: str) -> HTMLResponse:
                 status_code=404,
             )
 
-        # Path 4: Full detail — lineage, workflow, metadata
+        # Path 4: Full detail — lineage (cached per change token),
+        # workflow, metadata
         type_id = entity["type_id"]
+        lineage_cache = request.app.state.lineage_cache
+        token = db.change_token()
+
+        view = lineage_cache.get(type_id, token)
+        if view is None:
+            ancestor_lineage = db.get_lineage(type_id, "up", 10)
+            child_lineage = db.get_lineage(type_id, "down", 10)
+            ancestors = _strip_self_from_lineage(ancestor_lineage, type_id)
+            children = _strip_self_from_lineage(child_lineage, type_id)
+            view = {
+                "ancestors": ancestors,
+                "children": children,
+                "mermaid_dag": build_mermaid_dag(entity, ancestors, children),
+            }
+            lineage_cache.put(type_id, token, view)
 
-        ancestor_lineage = db.get_lineage(type_id, "up", 10)
-        ancestors = _strip_self_from_lineage(ancestor_lineage, type_id)
-
-        child_lineage = db.get_lineage(type_id, "down", 10)
-        children = _strip_self_from_lineage(child_lineage, type_id)
-
-        mermaid_dag = build_mermaid_dag(entity, ancestors, children)
+        ancestors = view["ancestors"]
+        children = view["children"]
+        mermaid_dag = view["mermaid_dag"]
         workflow = db.get_workflow_phase(type_id)
         metadata_formatted = _format_metadata(entity.get("metadata"))
 
@@ -1,5 +1,9 @@
 """Shared helpers for UI route handlers."""
 
+import hashlib
+
+from fastapi.responses import Response
+
 # Generic message for DB errors shown to users. Detailed error goes to stderr.
 DB_ERROR_USER_MESSAGE = (
     "An error occurred while querying the database. "
@@ -22,3 +26,33 @@ def missing_db_response(templates, request, db_path):
             "db_path": db_path,
         },
     )
+
+
+def make_etag(token: str, *variant) -> str:
+    """Weak ETag for a rendered view: DB change token plus request variant.
+
+    ``variant`` covers everything else that shapes the body (partial vs full
+    page, query params), so one token never maps two bodies to one tag.
+    """
+    raw = "|".join([token, *(str(v) for v in variant)])
+    return f'W/"{hashlib.sha256(raw.encode()).hexdigest()[:16]}"'
+
+
+def etag_matches(request, etag: str) -> bool:
+    """True when the request's If-None-Match already names ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in header.split(","))
+
+
+def etag_headers(etag: str) -> dict[str, str]:
+    """Headers that make clients revalidate with If-None-Match each time."""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def not_modified_response(etag: str) -> Response:
+    """Empty 304 response carrying the current ETag."""
+    return Response(status_code=304, headers=etag_headers(etag))
@@ -451,3 +451,199 @@ def test_board_renders_with_join_data(tmp_path):
     assert response.status_code == 200
     assert "Feature One" in response.text
     assert "Brainstorm Title" in response.text
+
+
+# ===========================================================================
+# Conditional GET (ETag/304) and live board change feed (SSE)
+# ===========================================================================
+
+
+def _move_card(db_file, type_id, kanban_column):
+    """Update a card's column from a separate connection (like an MCP write)."""
+    conn = sqlite3.connect(db_file)
+    conn.execute(
+        "UPDATE workflow_phases SET kanban_column = ? WHERE type_id = ?",
+        (kanban_column, type_id),
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_board_returns_304_while_db_unchanged(tmp_path):
+    """A repeat request with the board's ETag gets an empty 304."""
+    db_file = str(tmp_path / "test.db")
+    EntityDatabase(db_file)
+    _seed_workflow_row(db_file, "feature:etag-a", kanban_column="wip")
+    from ui import create_app
+    client = TestClient(create_app(db_path=db_file))
+
+    first = client.get("/", headers={"HX-Request": "true"})
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    again = client.get(
+        "/", headers={"HX-Request": "true", "If-None-Match": etag},
+    )
+    assert again.status_code == 304
+    assert again.text == ""
+
+    # Full page and partial bodies never share a tag
+    assert client.get("/").headers["ETag"] != etag
+
+
+def test_board_etag_changes_after_external_write(tmp_path):
+    """A commit from another connection invalidates the board's ETag."""
+    db_file = str(tmp_path / "test.db")
+    EntityDatabase(db_file)
+    _seed_workflow_row(db_file, "feature:etag-b", kanban_column="wip")
+    from ui import create_app
+    client = TestClient(create_app(db_path=db_file))
+
+    etag = client.get("/").headers["ETag"]
+    _move_card(db_file, "feature:etag-b", "blocked")
+
+    response = client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_entities_list_etag_varies_by_filter(tmp_path):
+    """Entity list answers 304 per filter combination."""
+    db_file = str(tmp_path / "test.db")
+    EntityDatabase(db_file)
+    _seed_entity_and_workflow_row(db_file, "feature:list-a", name="List A")
+    from ui import create_app
+    client = TestClient(create_app(db_path=db_file))
+
+    etag = client.get("/entities?type=feature").headers["ETag"]
+    cached = client.get(
+        "/entities?type=feature", headers={"If-None-Match": etag},
+    )
+    assert cached.status_code == 304
+    other = client.get(
+        "/entities?type=backlog", headers={"If-None-Match": etag},
+    )
+    assert other.status_code == 200
+
+
+def test_board_full_page_wires_event_stream(tmp_path):
+    """The board page carries its change token for the SSE subscription."""
+    db_file = str(tmp_path / "test.db")
+    db = EntityDatabase(db_file)
+    from ui import create_app
+    app = create_app(db_path=db_file)
+    client = TestClient(app)
+
+    response = client.get("/")
+    assert f'data-token="{app.state.db.change_token()}"' in response.text
+    assert "/board/events" in response.text
+    db.close()
+
+
+def test_board_events_missing_db_returns_204():
+    """Without a DB the stream answers 204 so EventSource stops retrying."""
+    from ui import create_app
+    client = TestClient(create_app(db_path="/nonexistent/path.db"))
+
+    assert client.get("/board/events").status_code == 204
+
+
+def test_diff_cards_reports_moved_updated_and_removed():
+    """Only cards whose column or markup changed are sent."""
+    from ui.routes.board import _diff_cards
+
+    previous = {
+        "feature:same": ("wip", "<a>same</a>"),
+        "feature:moved": ("wip", "<a>moved</a>"),
+        "feature:gone": ("backlog", "<a>gone</a>"),
+    }
+    current = {
+        "feature:same": ("wip", "<a>same</a>"),
+        "feature:moved": ("blocked", "<a>moved</a>"),
+        "feature:new": ("backlog", "<a>new</a>"),
+    }
+
+    events = _diff_cards(previous, current)
+    assert ("card", {
+        "type_id": "feature:moved", "column": "blocked", "html": "<a>moved</a>",
+    }) in events
+    assert ("remove", {"type_id": "feature:gone"}) in events
+    assert {data["type_id"] for _, data in events} == {
+        "feature:moved", "feature:new", "feature:gone",
+    }
+
+
+def _collect_stream(app, since, on_poll):
+    """Drive board_event_stream for one poll; on_poll runs before it."""
+    import asyncio
+    from ui.routes.board import _board_state, board_event_stream
+
+    db = app.state.db
+    templates = app.state.templates
+    token, cards = _board_state(db, templates)
+    polls = []
+
+    async def is_disconnected():
+        polls.append(1)
+        if len(polls) == 1:
+            on_poll()
+            return False
+        return True
+
+    async def collect():
+        return [
+            message async for message in board_event_stream(
+                db, templates, token, cards, since, is_disconnected,
+                poll_interval=0,
+            )
+        ]
+
+    return asyncio.run(collect())
+
+
+def test_board_event_stream_pushes_only_moved_card(tmp_path):
+    """A column change produces one card event; idle cards stay silent."""
+    import json
+
+    db_file = str(tmp_path / "test.db")
+    EntityDatabase(db_file)
+    _seed_workflow_row(db_file, "feature:sse-move", kanban_column="wip")
+    _seed_workflow_row(db_file, "feature:sse-idle", kanban_column="wip")
+    from ui import create_app
+    app = create_app(db_path=db_file)
+
+    messages = _collect_stream(
+        app, None, lambda: _move_card(db_file, "feature:sse-move", "blocked"),
+    )
+
+    assert len(messages) == 1
+    lines = messages[0].strip().split("\n")
+    assert lines[0] == f"id: {app.state.db.change_token()}"
+    assert lines[1] == "event: card"
+    payload = json.loads(lines[2][len("data: "):])
+    assert payload["type_id"] == "feature:sse-move"
+    assert payload["column"] == "blocked"
+    assert "sse-move" in payload["html"]
+
+
+def test_board_event_stream_idle_sends_nothing(tmp_path):
+    """No DB change between polls means no messages at all."""
+    db_file = str(tmp_path / "test.db")
+    EntityDatabase(db_file)
+    _seed_workflow_row(db_file, "feature:sse-quiet", kanban_column="wip")
+    from ui import create_app
+    app = create_app(db_path=db_file)
+
+    assert _collect_stream(app, None, lambda: None) == []
+
+
+def test_board_event_stream_stale_client_gets_reload(tmp_path):
+    """A client whose token predates the stream is told to reload once."""
+    db_file = str(tmp_path / "test.db")
+    EntityDatabase(db_file)
+    from ui import create_app
+    app = create_app(db_path=db_file)
+
+    messages = _collect_stream(app, "stale-token", lambda: None)
+    assert len(messages) == 1
+    assert "event: reload" in messages[0]
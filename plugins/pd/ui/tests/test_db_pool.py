@@ -0,0 +1,132 @@
+"""Tests for the UI's bounded entity DB connection pool and load test."""
+
+import sqlite3
+import threading
+
+import pytest
+from starlette.testclient import TestClient
+
+from entity_registry.database import EntityDatabase
+from ui.db_pool import EntityDatabasePool, PoolTimeout
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    path = str(tmp_path / "test.db")
+    EntityDatabase(path).close()
+    return path
+
+
+def test_create_app_serves_through_pool(db_file):
+    from ui import create_app
+
+    app = create_app(db_path=db_file)
+    assert isinstance(app.state.db, EntityDatabasePool)
+    assert TestClient(app).get("/").status_code == 200
+
+
+def test_proxied_calls_use_pooled_connections(db_file):
+    pool = EntityDatabasePool(db_file, size=2)
+    pool.register_entity(
+        "feature", "001-pooled", "Pooled", project_id="__unknown__",
+    )
+    assert pool.get_entity("feature:001-pooled")["name"] == "Pooled"
+    assert [e["type_id"] for e in pool.list_entities()] == ["feature:001-pooled"]
+    pool.close()
+
+
+def test_unknown_and_private_attributes_raise(db_file):
+    pool = EntityDatabasePool(db_file)
+    with pytest.raises(AttributeError):
+        pool.no_such_method
+    with pytest.raises(AttributeError):
+        pool._conn
+    pool.close()
+
+
+def test_acquire_times_out_when_pool_exhausted(db_file):
+    pool = EntityDatabasePool(db_file, size=1, acquire_timeout=0.05)
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with pool.connection():
+            held.set()
+            release.wait(5)
+
+    worker = threading.Thread(target=hold)
+    worker.start()
+    held.wait(5)
+    try:
+        with pytest.raises(PoolTimeout):
+            pool.list_entities()
+    finally:
+        release.set()
+        worker.join()
+    # The slot is free again once the holder returns its connection
+    assert pool.list_entities() == []
+    pool.close()
+
+
+def test_query_timeout_interrupts_long_statement(db_file):
+    pool = EntityDatabasePool(db_file, query_timeout=0.05)
+    with pool.connection() as db, db.begin_immediate() as conn:
+        with pytest.raises(sqlite3.OperationalError, match="interrupt"):
+            conn.execute(
+                "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n)"
+                " SELECT count(*) FROM n"
+            ).fetchone()
+    # The connection is returned healthy, with a fresh deadline
+    assert pool.list_entities() == []
+    pool.close()
+
+
+def test_change_token_tracks_writes_from_other_connections(db_file):
+    pool = EntityDatabasePool(db_file)
+    before = pool.change_token()
+    assert pool.change_token() == before
+
+    writer = EntityDatabase(db_file)
+    writer.register_entity(
+        "feature", "001-write", "Write", project_id="__unknown__",
+    )
+    writer.close()
+    assert pool.change_token() != before
+    pool.close()
+
+
+def test_trace_callback_reaches_connections_opened_later(db_file):
+    pool = EntityDatabasePool(db_file, size=2)
+    seen = []
+    pool.set_trace_callback(seen.append)
+
+    # Two concurrent checkouts force the pool to open a second connection
+    with pool.connection() as first, pool.connection() as second:
+        assert first is not second
+        second.list_entities()
+    assert any("FROM entities" in stmt for stmt in seen)
+    pool.close()
+
+
+def test_loadtest_smoke(tmp_path, capsys):
+    import json
+
+    from ui import loadtest
+
+    db_path = str(tmp_path / "load.db")
+    loadtest.build_synthetic_db(db_path, 300, board_size=20)
+    check = EntityDatabase(db_path)
+    assert len(check.list_entities()) == 300
+    assert len(check.list_workflow_phases()) == 20
+    check.close()
+
+    exit_code = loadtest.main([
+        "--db", db_path, "--requests", "30", "--concurrency", "3", "--pages", "2",
+    ])
+    report = json.loads(capsys.readouterr().out)
+    assert exit_code == 0
+    assert report["requests"] == 30
+    assert {"board", "entities", "entities?cursor", "entity detail"} <= set(
+        report["routes"]
+    )
+    assert report["overall"]["p99_ms"] >= report["overall"]["p50_ms"]
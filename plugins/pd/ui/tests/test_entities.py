@@ -1528,3 +1528,162 @@ def test_entity_list_no_mermaid_script(tmp_path):
 
     assert response.status_code == 200
     assert "cdn.jsdelivr.net/npm/mermaid" not in response.text
+
+
+# ===========================================================================
+# Keyset pagination and lineage cache
+# ===========================================================================
+
+
+def _seed_many(db_file, count, entity_type="feature", status="active"):
+    """Insert ``count`` entities with strictly increasing updated_at."""
+    conn = sqlite3.connect(db_file)
+    conn.execute("PRAGMA foreign_keys = OFF")
+    for i in range(count):
+        ts = f"2026-03-08T00:{i // 60:02d}:{i % 60:02d}Z"
+        conn.execute(
+            "INSERT INTO entities "
+            "(type_id, uuid, entity_type, entity_id, name, status, "
+            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (f"{entity_type}:page-{i:03d}", f"uuid-page-{i:03d}", entity_type,
+             f"page-{i:03d}", f"Page Entity {i:03d}", status, ts, ts),
+        )
+    conn.commit()
+    conn.close()
+
+
+def test_entity_list_paginates_with_keyset_cursor(tmp_path):
+    """First page holds the newest PAGE_SIZE rows and links to the next."""
+    from ui import create_app
+    from ui.routes.entities import PAGE_SIZE
+
+    db_file = str(tmp_path / "test.db")
+    EntityDatabase(db_file)
+    _seed_many(db_file, PAGE_SIZE + 5)
+    client = TestClient(create_app(db_path=db_file))
+
+    first = client.get("/entities")
+    assert first.status_code == 200
+    assert f"Page Entity {PAGE_SIZE + 4:03d}" in first.text
+    assert "Page Entity 004" not in first.text
+    assert "Next page" in first.text
+
+    import re
+    cursor = re.search(r'cursor=([A-Za-z0-9_\-]+)', first.text).group(1)
+    second = client.get(f"/entities?cursor={cursor}")
+    assert "Page Entity 004" in second.text
+    assert "Page Entity 000" in second.text
+    assert f"Page Entity {PAGE_SIZE + 4:03d}" not in second.text
+    assert "Next page" not in second.text
+    assert "First page" in second.text
+
+
+def test_entity_list_limit_param_and_status_filter(tmp_path):
+    """?limit= sizes the page; status is filtered before paging."""
+    from ui import create_app
+
+    db_file = str(tmp_path / "test.db")
+    EntityDatabase(db_file)
+    _seed_many(db_file, 6)
+    conn = sqlite3.connect(db_file)
+    conn.execute(
+        "UPDATE entities SET status = 'completed' "
+        "WHERE type_id IN ('feature:page-001', 'feature:page-004')"
+    )
+    conn.commit()
+    conn.close()
+    client = TestClient(create_app(db_path=db_file))
+
+    response = client.get("/entities?status=completed&limit=1")
+    assert "Page Entity 004" in response.text
+    assert "Page Entity 001" not in response.text
+    assert "Next page" in response.text
+
+
+def test_entity_list_malformed_cursor_restarts(tmp_path):
+    """A garbage cursor falls back to the first page instead of erroring."""
+    from ui import create_app
+
+    db_file = str(tmp_path / "test.db")
+    EntityDatabase(db_file)
+    _seed_many(db_file, 3)
+    client = TestClient(create_app(db_path=db_file))
+
+    response = client.get("/entities?cursor=%%%not-base64")
+    assert response.status_code == 200
+    assert "Page Entity 002" in response.text
+
+
+def test_entity_list_workflow_lookup_scoped_to_page(tmp_path):
+    """Only the current page's type_ids are looked up in workflow_phases."""
+    from ui import create_app
+
+    db_file = str(tmp_path / "test.db")
+    EntityDatabase(db_file)
+    _seed_many(db_file, 3)
+    app = create_app(db_path=db_file)
+    original = app.state.db.list_workflow_phases
+    calls = []
+
+    def tracking(**kwargs):
+        calls.append(kwargs)
+        return original(**kwargs)
+
+    app.state.db.list_workflow_phases = tracking
+    TestClient(app).get("/entities?limit=2")
+
+    assert len(calls) == 1
+    assert len(calls[0]["type_ids"]) == 2
+
+
+def test_entity_detail_lineage_cached_until_db_changes(tmp_path):
+    """Repeat detail views reuse lineage/DAG until any registry write."""
+    from ui import create_app
+
+    db_file = str(tmp_path / "test.db")
+    EntityDatabase(db_file)
+    _seed_entity_with_parent(db_file, "project:cache-p", "Cache Parent", "project")
+    _seed_entity_with_parent(
+        db_file, "feature:cache-c", "Cache Child", "feature",
+        parent_type_id="project:cache-p",
+    )
+    app = create_app(db_path=db_file)
+    original = app.state.db.get_lineage
+    calls = []
+
+    def tracking(type_id, direction, max_depth):
+        calls.append(direction)
+        return original(type_id, direction, max_depth)
+
+    app.state.db.get_lineage = tracking
+    client = TestClient(app)
+
+    client.get("/entities/feature:cache-c")
+    client.get("/entities/feature:cache-c")
+    assert calls == ["up", "down"]
+
+    # A rename elsewhere moves the change token and invalidates the entry
+    conn = sqlite3.connect(db_file)
+    conn.execute(
+        "UPDATE entities SET name = 'Renamed Parent' WHERE type_id = 'project:cache-p'"
+    )
+    conn.commit()
+    conn.close()
+
+    response = client.get("/entities/feature:cache-c")
+    assert calls == ["up", "down", "up", "down"]
+    assert "Renamed Parent" in response.text
+
+
+def test_lineage_cache_evicts_least_recently_used():
+    from ui.routes.entities import LineageCache
+
+    cache = LineageCache(max_entries=2)
+    cache.put("a", "t1", {"v": 1})
+    cache.put("b", "t1", {"v": 2})
+    assert cache.get("a", "t1") == {"v": 1}
+    cache.put("c", "t1", {"v": 3})
+
+    assert cache.get("b", "t1") is None
+    assert cache.get("a", "t1") == {"v": 1}
+    assert cache.get("a", "t2") is None
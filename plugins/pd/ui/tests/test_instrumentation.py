@@ -0,0 +1,86 @@
+"""Tests for per-route latency and query-count instrumentation."""
+
+import sqlite3
+
+from starlette.testclient import TestClient
+
+from entity_registry.database import EntityDatabase
+
+
+def _seed_entity(db_file, type_id, name):
+    conn = sqlite3.connect(db_file)
+    conn.execute("PRAGMA foreign_keys = OFF")
+    now = "2026-03-08T00:00:00Z"
+    entity_type, entity_id = type_id.split(":", 1)
+    conn.execute(
+        "INSERT INTO entities (type_id, uuid, entity_type, entity_id, name, "
+        "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (type_id, f"uuid-{type_id}", entity_type, entity_id, name, now, now),
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_route_stats_averages():
+    from ui.instrumentation import RequestMetrics
+
+    metrics = RequestMetrics()
+    metrics.record("GET /", 10.0, 2)
+    metrics.record("GET /", 30.0, 4)
+
+    stats = metrics.snapshot()["GET /"]
+    assert stats["count"] == 2
+    assert stats["avg_ms"] == 20.0
+    assert stats["max_ms"] == 30.0
+    assert stats["avg_queries"] == 3.0
+    assert stats["total_queries"] == 6
+
+
+def test_count_query_ignores_statements_outside_requests():
+    from ui.instrumentation import count_query
+
+    # No active request: must be a silent no-op
+    count_query("SELECT 1")
+
+
+def test_responses_carry_timing_and_query_headers(tmp_path):
+    db_file = str(tmp_path / "test.db")
+    EntityDatabase(db_file)
+    _seed_entity(db_file, "feature:metric-a", "Metric A")
+
+    from ui import create_app
+    client = TestClient(create_app(db_path=db_file))
+
+    response = client.get("/entities")
+    assert response.status_code == 200
+    assert "app;dur=" in response.headers["Server-Timing"]
+    assert int(response.headers["X-Query-Count"]) >= 2
+
+
+def test_metrics_endpoint_aggregates_by_route_template(tmp_path):
+    db_file = str(tmp_path / "test.db")
+    EntityDatabase(db_file)
+    _seed_entity(db_file, "feature:metric-b", "Metric B")
+    _seed_entity(db_file, "feature:metric-c", "Metric C")
+
+    from ui import create_app
+    client = TestClient(create_app(db_path=db_file))
+
+    client.get("/entities/feature:metric-b")
+    client.get("/entities/feature:metric-c")
+    client.get("/")
+
+    data = client.get("/metrics").json()
+    detail = data["GET /entities/{identifier:path}"]
+    assert detail["count"] == 2
+    assert detail["total_queries"] > 0
+    assert data["GET /"]["count"] == 1
+
+
+def test_metrics_with_missing_db():
+    from ui import create_app
+    client = TestClient(create_app(db_path="/nonexistent/path.db"))
+
+    client.get("/")
+    data = client.get("/metrics").json()
+    assert data["GET /"]["total_queries"] == 0
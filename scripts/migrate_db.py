@@ -12,7 +12,6 @@ import hashlib
 import json
 import os
 import platform
-import shutil
 import sqlite3
 import sys
 import uuid as uuid_mod
@@ -227,58 +226,151 @@ def cmd_validate(args: argparse.Namespace) -> None:
     _json_out({"valid": valid, "errors": errors})
 
 
+_MERGE_MEMORY_COLUMNS = (
+    "id, name, description, reasoning, category, keywords, source, "
+    'source_project, "references", observation_count, confidence, '
+    "recall_count, last_recalled_at, embedding, created_at, updated_at, "
+    "source_hash, created_timestamp_utc"
+)
+
+MERGE_BATCH_SIZE = 500
+
+# Pages copied per step by _snapshot; other connections can use the
+# source between steps.
+SNAPSHOT_STEP_PAGES = 1024
+
+
+def _progress(command: str, message: str) -> None:
+    """Report progress of a long-running subcommand on stderr."""
+    print(f"{command}: {message}", file=sys.stderr, flush=True)
+
+
+def _snapshot(src_path: str, dst_path: str) -> None:
+    """Copy a database with the online backup API, in bounded steps.
+
+    Unlike a file copy this includes pages still in the source's WAL and
+    yields to other connections between steps.
+    """
+    src_conn = sqlite3.connect(src_path)
+    dst_conn = sqlite3.connect(dst_path)
+    try:
+        src_conn.backup(dst_conn, pages=SNAPSHOT_STEP_PAGES)
+    finally:
+        src_conn.close()
+        dst_conn.close()
+
+
+def _fts_sync_columns(conn: sqlite3.Connection) -> list[str] | None:
+    """Columns to index into entries_fts by hand after a merge batch.
+
+    Returns None when there is nothing to do: no entries_fts table, or
+    sync triggers that already index inserted rows.
+    """
+    names = {
+        r[0] for r in conn.execute(
+            "SELECT name FROM main.sqlite_master "
+            "WHERE name IN ('entries_fts', 'entries_ai')"
+        )
+    }
+    if "entries_fts" not in names or "entries_ai" in names:
+        return None
+    return [r[1] for r in conn.execute("PRAGMA main.table_info(entries_fts)")]
+
+
 def cmd_merge_memory(args: argparse.Namespace) -> None:
-    """Merge memory entries from source to destination database."""
-    dst = sqlite3.connect(args.dst_db)
+    """Merge memory entries from source to destination database.
+
+    Source rows are copied in rowid order, ``--batch-size`` rows per
+    transaction, skipping any whose source_hash the destination already
+    has (an indexed anti-join). Each batch is committed on its own, so the
+    write lock is held only briefly and an interrupted merge resumes by
+    running it again: rows from committed batches are skipped.
+    """
+    batch_size = max(1, getattr(args, "batch_size", MERGE_BATCH_SIZE))
+    dst = sqlite3.connect(args.dst_db, isolation_level=None)
     add_count = 0
     skip_count = 0
+    temp_index = False
     try:
         dst.execute("ATTACH DATABASE ? AS src", (args.src_db,))
-
-        # Count new vs existing entries by source_hash
-        add_count = dst.execute("""
-            SELECT count(*) FROM src.entries
-            WHERE source_hash NOT IN (SELECT source_hash FROM main.entries)
-        """).fetchone()[0]
-        skip_count = dst.execute(
-            "SELECT count(*) FROM src.entries"
-        ).fetchone()[0] - add_count
+        total = dst.execute("SELECT count(*) FROM src.entries").fetchone()[0]
 
         if args.dry_run:
-            _json_out({"added": add_count, "skipped": skip_count})
+            add_count = dst.execute("""
+                SELECT count(*) FROM src.entries s
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM main.entries m WHERE m.source_hash = s.source_hash
+                )
+            """).fetchone()[0]
+            _json_out({"added": add_count, "skipped": total - add_count})
             return
 
-        dst.execute("BEGIN")
-        dst.execute("""
-            INSERT OR IGNORE INTO main.entries (id, name, description, reasoning,
-                category, keywords, source, source_project, "references",
-                observation_count, confidence, recall_count, last_recalled_at,
-                embedding, created_at, updated_at, source_hash, created_timestamp_utc)
-            SELECT id, name, description, reasoning,
-                category, keywords, source, source_project, "references",
-                observation_count, confidence, recall_count, last_recalled_at,
-                embedding, created_at, updated_at, source_hash, created_timestamp_utc
-            FROM src.entries
-            WHERE source_hash NOT IN (SELECT source_hash FROM main.entries)
-        """)
-
-        # Rebuild FTS5
-        if add_count > 0:
+        # Stores at memory schema 9+ carry idx_entries_source_hash. For an
+        # older destination, build it for the duration of the merge only so
+        # the schema stays exactly as its migrations left it.
+        if not dst.execute(
+            "SELECT 1 FROM main.sqlite_master "
+            "WHERE type = 'index' AND name = 'idx_entries_source_hash'"
+        ).fetchone():
+            dst.execute(
+                "CREATE INDEX main.idx_entries_source_hash "
+                "ON entries(source_hash)"
+            )
+            temp_index = True
+        fts_columns = _fts_sync_columns(dst)
+
+        last_rowid = 0
+        done = 0
+        while True:
+            bounds = dst.execute(
+                "SELECT max(rowid), count(*) FROM ("
+                "SELECT rowid FROM src.entries WHERE rowid > ? "
+                "ORDER BY rowid LIMIT ?)",
+                (last_rowid, batch_size),
+            ).fetchone()
+            if not bounds[1]:
+                break
+            high, rows_in_batch = bounds
+            dst.execute("BEGIN IMMEDIATE")
             try:
-                dst.execute(
-                    "INSERT INTO entries_fts(entries_fts) VALUES('rebuild')"
-                )
-            except sqlite3.OperationalError:
-                pass
-
-        dst.execute("COMMIT")
-    except Exception:
-        try:
-            dst.execute("ROLLBACK")
-        except Exception:
-            pass
-        raise
+                first_new = dst.execute(
+                    "SELECT coalesce(max(rowid), 0) FROM main.entries"
+                ).fetchone()[0]
+                cur = dst.execute(f"""
+                    INSERT OR IGNORE INTO main.entries ({_MERGE_MEMORY_COLUMNS})
+                    SELECT {_MERGE_MEMORY_COLUMNS}
+                    FROM src.entries s
+                    WHERE s.rowid > ? AND s.rowid <= ?
+                      AND NOT EXISTS (
+                        SELECT 1 FROM main.entries m
+                        WHERE m.source_hash = s.source_hash
+                      )
+                    ORDER BY s.rowid
+                """, (last_rowid, high))
+                if fts_columns and cur.rowcount > 0:
+                    cols = ", ".join(fts_columns)
+                    dst.execute(
+                        f"INSERT INTO entries_fts(rowid, {cols}) "
+                        f"SELECT rowid, {cols} FROM main.entries WHERE rowid > ?",
+                        (first_new,),
+                    )
+                dst.execute("COMMIT")
+            except BaseException:
+                dst.execute("ROLLBACK")
+                raise
+            add_count += cur.rowcount
+            done += rows_in_batch
+            last_rowid = high
+            _progress(
+                "merge-memory", f"{done}/{total} source rows, {add_count} added"
+            )
+        skip_count = total - add_count
     finally:
+        if temp_index:
+            try:
+                dst.execute("DROP INDEX IF EXISTS main.idx_entries_source_hash")
+            except Exception:
+                pass
         try:
             dst.execute("DETACH DATABASE src")
         except Exception:
@@ -364,29 +456,34 @@ def cmd_merge_entities(args: argparse.Namespace) -> None:
                       AND parent_type_id IS NOT NULL
                 """, (tid,))
 
-        # Phase 5: FTS5 backfill (clear + re-index all entities)
+        # Phase 5: FTS5 backfill (clear + re-index all entities in one
+        # executemany, then fold the fresh segments together)
         dst.execute("DELETE FROM entities_fts")
         fts_rows = dst.execute(
             "SELECT rowid, name, entity_id, entity_type, status, metadata "
             "FROM entities"
         ).fetchall()
+        fts_values = []
         for fts_row in fts_rows:
             try:
                 meta_text = _flatten_metadata(
                     json.loads(fts_row[5]) if fts_row[5] else None
                 )
-                dst.execute(
-                    "INSERT INTO entities_fts(rowid, name, entity_id, "
-                    "entity_type, status, metadata_text) "
-                    "VALUES(?, ?, ?, ?, ?, ?)",
-                    (fts_row[0], fts_row[1], fts_row[2], fts_row[3],
-                     fts_row[4] or "", meta_text),
-                )
-            except (sqlite3.OperationalError, json.JSONDecodeError) as exc:
+            except json.JSONDecodeError as exc:
                 print(
                     f"WARNING: FTS index failed for rowid={fts_row[0]}: {exc}",
                     file=sys.stderr,
                 )
+                continue
+            fts_values.append((fts_row[0], fts_row[1], fts_row[2], fts_row[3],
+                               fts_row[4] or "", meta_text))
+        dst.executemany(
+            "INSERT INTO entities_fts(rowid, name, entity_id, "
+            "entity_type, status, metadata_text) "
+            "VALUES(?, ?, ?, ?, ?, ?)",
+            fts_values,
+        )
+        dst.execute("INSERT INTO entities_fts(entities_fts) VALUES('optimize')")
 
         dst.execute("COMMIT")
     except Exception:
@@ -486,7 +583,7 @@ def cmd_check_embeddings(args: argparse.Namespace) -> None:
 def cmd_migrate(args: argparse.Namespace) -> None:
     """Run schema migration on an entity database with backup.
 
-    1. Create timestamped backup of the DB file
+    1. Create timestamped backup of the DB (online backup API)
     2. Verify backup is openable and has correct row count
     3. Run migration by opening EntityDatabase (auto-runs pending migrations)
     4. Report pre/post schema versions and row counts
@@ -498,12 +595,12 @@ def cmd_migrate(args: argparse.Namespace) -> None:
         _json_out({"ok": False, "error": f"Database not found: {db_path}"})
         sys.exit(1)
 
-    # Dry-run: copy to tempfile, run migration on copy, report, delete copy
+    # Dry-run: snapshot to tempfile, run migration on copy, report, delete copy
     if dry_run:
         import tempfile
         with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
             tmp_path = tmp.name
-        shutil.copy2(db_path, tmp_path)
+        _snapshot(db_path, tmp_path)
         try:
             sys.path.insert(0, os.path.join(
                 os.path.dirname(__file__), "..", "plugins", "pd", "hooks", "lib"
@@ -576,7 +673,7 @@ def cmd_migrate(args: argparse.Namespace) -> None:
     # Step 1: Create timestamped backup
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     backup_path = f"{db_path}.bak.{timestamp}"
-    shutil.copy2(db_path, backup_path)
+    _snapshot(db_path, backup_path)
 
     # Step 2: Verify backup is openable and has correct row count
     backup_conn = sqlite3.connect(backup_path)
@@ -714,6 +811,132 @@ def cmd_rebuild_fts(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+def cmd_optimize_fts(args: argparse.Namespace) -> None:
+    """Merge entities_fts index segments into one (FTS5 'optimize')."""
+    db_path = args.db_path
+    if not os.path.exists(db_path):
+        _json_out({"ok": False, "error": f"DB not found: {db_path}"})
+        sys.exit(1)
+
+    # No need to stop MCP servers: optimize is an ordinary write
+    # transaction and WAL readers keep working while it runs.
+    conn = sqlite3.connect(db_path, timeout=10.0)
+    conn.execute("PRAGMA busy_timeout = 10000")
+    try:
+        fts_exists = conn.execute(
+            "SELECT 1 FROM sqlite_master "
+            "WHERE type='table' AND name='entities_fts'"
+        ).fetchone()
+        if not fts_exists:
+            _json_out({
+                "ok": False,
+                "error": "entities_fts table not found — run migrate first",
+            })
+            sys.exit(1)
+
+        pages_before = conn.execute(
+            "SELECT COUNT(*) FROM entities_fts_data WHERE id > 10"
+        ).fetchone()[0]
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("INSERT INTO entities_fts(entities_fts) VALUES('optimize')")
+        conn.execute("COMMIT")
+        pages_after = conn.execute(
+            "SELECT COUNT(*) FROM entities_fts_data WHERE id > 10"
+        ).fetchone()[0]
+        fts_count = conn.execute(
+            "SELECT COUNT(*) FROM entities_fts"
+        ).fetchone()[0]
+    except sqlite3.OperationalError as exc:
+        _json_out({"ok": False, "error": str(exc)})
+        sys.exit(1)
+    finally:
+        conn.close()
+
+    _json_out({
+        "ok": True,
+        "fts_entries": fts_count,
+        "data_pages_before": pages_before,
+        "data_pages_after": pages_after,
+    })
+
+
+def _db_size_bytes(db_path: str) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    finally:
+        conn.close()
+    return (page_count - freelist) * page_size
+
+
+def cmd_convert_embeddings(args: argparse.Namespace) -> None:
+    """Rewrite memory.db embedding BLOBs in another storage format.
+
+    1. Snapshot the DB (online backup API) unless --no-backup
+    2. Re-encode embeddings in batches via MemoryDatabase.convert_embeddings
+    3. Optionally VACUUM to hand the freed pages back to the filesystem
+    """
+    db_path = args.db_path
+    if not os.path.exists(db_path):
+        _json_out({"ok": False, "error": f"DB not found: {db_path}"})
+        sys.exit(1)
+
+    sys.path.insert(0, os.path.join(
+        os.path.dirname(__file__), "..", "plugins", "pd", "hooks", "lib"
+    ))
+    from semantic_memory.database import MemoryDatabase
+
+    db = MemoryDatabase(db_path)
+    try:
+        dims = args.dims
+        if dims is None:
+            stored = db.get_metadata("embedding_dimensions")
+            if not stored:
+                _json_out({
+                    "ok": False,
+                    "error": "embedding_dimensions not recorded — pass --dims",
+                })
+                sys.exit(1)
+            dims = int(stored)
+
+        backup_path = None
+        if not args.no_backup:
+            timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            backup_path = f"{db_path}.bak.{timestamp}"
+            _snapshot(db_path, backup_path)
+
+        size_before = _db_size_bytes(db_path)
+        stats = db.convert_embeddings(
+            args.format,
+            dims,
+            batch_size=max(1, args.batch_size),
+            progress=lambda done, total: _progress(
+                "convert-embeddings", f"{done}/{total} embeddings"
+            ),
+        )
+    finally:
+        db.close()
+
+    if args.vacuum:
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+
+    _json_out({
+        "ok": True,
+        "format": args.format,
+        "dims": dims,
+        **stats,
+        "data_bytes_before": size_before,
+        "data_bytes_after": _db_size_bytes(db_path),
+        "backup_path": backup_path,
+    })
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build the argparse parser with all subcommands."""
     parser = argparse.ArgumentParser(
@@ -755,6 +978,12 @@ def build_parser() -> argparse.ArgumentParser:
     p_merge_memory.add_argument(
         "--dry-run", action="store_true", help="Preview without modifying"
     )
+    p_merge_memory.add_argument(
+        "--batch-size",
+        type=int,
+        default=MERGE_BATCH_SIZE,
+        help=f"Source rows copied per transaction (default: {MERGE_BATCH_SIZE})",
+    )
     p_merge_memory.set_defaults(func=cmd_merge_memory)
 
     # merge-entities
@@ -818,6 +1047,60 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_rebuild_fts.set_defaults(func=cmd_rebuild_fts)
 
+    # optimize-fts
+    p_optimize_fts = subparsers.add_parser(
+        "optimize-fts",
+        help="Merge FTS index segments after large imports or merges",
+    )
+    p_optimize_fts.add_argument(
+        "db_path",
+        nargs="?",
+        default=os.path.expanduser("~/.claude/pd/entities/entities.db"),
+        help="Path to entities.db (default: ~/.claude/pd/entities/entities.db)",
+    )
+    p_optimize_fts.set_defaults(func=cmd_optimize_fts)
+
+    # convert-embeddings
+    p_convert = subparsers.add_parser(
+        "convert-embeddings",
+        help="Rewrite memory embeddings as float32, float16 or int8",
+    )
+    p_convert.add_argument(
+        "db_path",
+        nargs="?",
+        default=os.path.expanduser("~/.claude/pd/memory/memory.db"),
+        help="Path to memory.db (default: ~/.claude/pd/memory/memory.db)",
+    )
+    p_convert.add_argument(
+        "--format",
+        required=True,
+        choices=("float32", "float16", "int8"),
+        help="Target storage format",
+    )
+    p_convert.add_argument(
+        "--dims",
+        type=int,
+        default=None,
+        help="Embedding dimensions (default: _metadata.embedding_dimensions)",
+    )
+    p_convert.add_argument(
+        "--batch-size",
+        type=int,
+        default=MERGE_BATCH_SIZE,
+        help=f"Embeddings rewritten per transaction (default: {MERGE_BATCH_SIZE})",
+    )
+    p_convert.add_argument(
+        "--no-backup",
+        action="store_true",
+        help="Skip the pre-conversion snapshot (conversion to int8/float16 is lossy)",
+    )
+    p_convert.add_argument(
+        "--vacuum",
+        action="store_true",
+        help="VACUUM afterwards to shrink the file",
+    )
+    p_convert.set_defaults(func=cmd_convert_embeddings)
+
     return parser
 
 
@@ -24,6 +24,8 @@ SUBCOMMANDS = [
     "check-embeddings",
     "migrate",
     "rebuild-fts",
+    "optimize-fts",
+    "convert-embeddings",
 ]
 
 
@@ -59,6 +61,8 @@ SUBCOMMAND_ARGS = [
     ("check-embeddings", ["manifest.json", "dst-memory.db"]),
     ("migrate", ["entities.db"]),
     ("rebuild-fts", ["--skip-kill", "test.db"]),
+    ("optimize-fts", ["test.db"]),
+    ("convert-embeddings", ["memory.db", "--format", "int8"]),
 ]
 
 
@@ -67,13 +71,18 @@ SUBCOMMAND_ARGS = [
     SUBCOMMAND_ARGS,
     ids=[t[0] for t in SUBCOMMAND_ARGS],
 )
-def test_subcommand_stubs(subcommand: str, args: list[str]) -> None:
+def test_subcommand_stubs(
+    subcommand: str, args: list[str], tmp_path: Path
+) -> None:
     """Each subcommand with minimal args outputs valid JSON and exits 0."""
+    # Run inside tmp_path so the relative file arguments (and anything a
+    # subcommand creates for them) never land in the caller's working tree.
     result = subprocess.run(
         [sys.executable, SCRIPT, subcommand, *args],
         capture_output=True,
         text=True,
         timeout=10,
+        cwd=tmp_path,
     )
     # Allow stubs that still return {} and real implementations that may fail
     # on missing files — but skip validation for stubs that are not yet implemented
@@ -546,6 +555,157 @@ class TestMergeMemory:
         assert len(rows) == 1
         assert "alpha" in rows[0][0]
 
+    def test_merge_memory_batched_with_progress(self, tmp_path: Path) -> None:
+        """Small batches: same result as one pass, progress on stderr."""
+        src = str(tmp_path / "src.db")
+        dst = str(tmp_path / "dst.db")
+
+        src_entries = [
+            {"source_hash": f"hash-{i}", "name": f"batched-{i}"} for i in range(7)
+        ]
+        create_memory_db(src, src_entries)
+        create_memory_db(dst, [src_entries[1], src_entries[4]])
+
+        result = subprocess.run(
+            [sys.executable, SCRIPT, "merge-memory", src, dst, "--batch-size", "2"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout) == {"added": 5, "skipped": 2}
+        progress = [
+            line for line in result.stderr.splitlines()
+            if line.startswith("merge-memory:")
+        ]
+        assert len(progress) == 4
+        assert progress[-1] == "merge-memory: 7/7 source rows, 5 added"
+
+        conn = sqlite3.connect(dst)
+        hashes = sorted(r[0] for r in conn.execute("SELECT source_hash FROM entries"))
+        fts_hits = conn.execute(
+            "SELECT count(*) FROM entries_fts WHERE entries_fts MATCH 'batched'"
+        ).fetchone()[0]
+        conn.close()
+        assert hashes == sorted(e["source_hash"] for e in src_entries)
+        assert fts_hits == 7
+
+    def test_merge_memory_rerun_resumes(self, tmp_path: Path) -> None:
+        """A failed batch keeps earlier batches; re-running adds only the rest."""
+        src = str(tmp_path / "src.db")
+        dst = str(tmp_path / "dst.db")
+
+        create_memory_db(
+            src, [{"source_hash": f"hash-{i}", "name": f"entry-{i}"} for i in range(6)]
+        )
+        create_memory_db(dst, [])
+        conn = sqlite3.connect(dst)
+        conn.execute("""
+            CREATE TRIGGER fail_hash_4 BEFORE INSERT ON entries
+            WHEN new.source_hash = 'hash-4'
+            BEGIN
+                SELECT RAISE(ABORT, 'injected failure');
+            END
+        """)
+        conn.commit()
+        conn.close()
+
+        result = subprocess.run(
+            [sys.executable, SCRIPT, "merge-memory", src, dst, "--batch-size", "2"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        assert result.returncode == 1
+
+        conn = sqlite3.connect(dst)
+        assert conn.execute("SELECT count(*) FROM entries").fetchone()[0] == 4
+        conn.execute("DROP TRIGGER fail_hash_4")
+        conn.commit()
+        conn.close()
+
+        result = run_cli("merge-memory", src, dst, "--batch-size", "2")
+        assert result == {"added": 2, "skipped": 4}
+
+        conn = sqlite3.connect(dst)
+        fts_hits = conn.execute(
+            "SELECT count(*) FROM entries_fts WHERE entries_fts MATCH 'entry'"
+        ).fetchone()[0]
+        conn.close()
+        assert fts_hits == 6
+
+    def test_merge_memory_uses_fts_triggers(self, tmp_path: Path) -> None:
+        """With sync triggers on dst, merged rows are indexed exactly once."""
+        src = str(tmp_path / "src.db")
+        dst = str(tmp_path / "dst.db")
+
+        create_memory_db(src, [{"source_hash": "trig-1", "name": "trigger-indexed"}])
+        create_memory_db(dst, [])
+        conn = sqlite3.connect(dst)
+        conn.execute("""
+            CREATE TRIGGER entries_ai AFTER INSERT ON entries BEGIN
+                INSERT INTO entries_fts(rowid, name, description, reasoning, keywords)
+                VALUES (new.rowid, new.name, new.description, new.reasoning,
+                        new.keywords);
+            END
+        """)
+        conn.commit()
+        conn.close()
+
+        assert run_cli("merge-memory", src, dst) == {"added": 1, "skipped": 0}
+
+        conn = sqlite3.connect(dst)
+        conn.execute("INSERT INTO entries_fts(entries_fts) VALUES('integrity-check')")
+        hits = conn.execute(
+            "SELECT count(*) FROM entries_fts WHERE entries_fts MATCH 'indexed'"
+        ).fetchone()[0]
+        conn.close()
+        assert hits == 1
+
+    def test_merge_memory_leaves_unmigrated_dst_schema_alone(
+        self, tmp_path: Path
+    ) -> None:
+        """The merge-only source_hash index is dropped again afterwards."""
+        src = str(tmp_path / "src.db")
+        dst = str(tmp_path / "dst.db")
+
+        create_memory_db(src, [{"source_hash": "idx-1", "name": "a"}])
+        create_memory_db(dst, [{"source_hash": "idx-2", "name": "b"}])
+
+        assert run_cli("merge-memory", src, dst) == {"added": 1, "skipped": 0}
+
+        conn = sqlite3.connect(dst)
+        index = conn.execute(
+            "SELECT 1 FROM sqlite_master "
+            "WHERE type = 'index' AND name = 'idx_entries_source_hash'"
+        ).fetchone()
+        conn.close()
+        assert index is None
+
+    def test_merge_memory_keeps_migrated_dst_index(self, tmp_path: Path) -> None:
+        """A destination at memory schema 9+ keeps its migration-owned index."""
+        src = str(tmp_path / "src.db")
+        dst = str(tmp_path / "dst.db")
+
+        create_memory_db(src, [{"source_hash": "idx-1", "name": "a"}])
+        create_memory_db(dst, [])
+        conn = sqlite3.connect(dst)
+        conn.execute(
+            "CREATE INDEX idx_entries_source_hash ON entries(source_hash)"
+        )
+        conn.commit()
+        conn.close()
+
+        assert run_cli("merge-memory", src, dst) == {"added": 1, "skipped": 0}
+
+        conn = sqlite3.connect(dst)
+        index = conn.execute(
+            "SELECT 1 FROM sqlite_master "
+            "WHERE type = 'index' AND name = 'idx_entries_source_hash'"
+        ).fetchone()
+        conn.close()
+        assert index is not None
+
 
 # ============================================================
 # Step 7: merge-entities subcommand tests
@@ -1396,6 +1556,34 @@ class TestMigration6:
         expected_type_ids = sorted(e["type_id"] for e in entities)
         assert post_type_ids == expected_type_ids
 
+    def test_migration_backup_includes_wal_pages(self, tmp_path: Path) -> None:
+        """Backup and dry-run snapshots see rows not yet checkpointed."""
+        db_path, entities, _ = self._make_test_db(tmp_path)
+
+        writer = sqlite3.connect(db_path)
+        try:
+            writer.execute("PRAGMA journal_mode = WAL")
+            writer.execute("PRAGMA wal_autocheckpoint = 0")
+            writer.execute(
+                "INSERT INTO entities (uuid, type_id, entity_type, entity_id, name,"
+                " status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (str(uuid.uuid4()), "feature:099-wal", "feature", "099-wal",
+                 "Only In WAL", "active", _now_iso(), _now_iso()),
+            )
+            writer.commit()
+
+            dry = run_cli("migrate", db_path, "--dry-run")
+            assert dry["entity_count"] == len(entities) + 1
+
+            result = run_cli("migrate", db_path)
+        finally:
+            writer.close()
+
+        conn = sqlite3.connect(result["backup_path"])
+        count = conn.execute("SELECT count(*) FROM entities").fetchone()[0]
+        conn.close()
+        assert count == len(entities) + 1
+
     # --- Test 3: Backup file exists and is valid ---
     def test_migration_creates_valid_backup(self, tmp_path: Path) -> None:
         """Backup file exists after migration and is a valid DB."""
@@ -1803,3 +1991,141 @@ class TestRebuildFts:
         )
         assert result["ok"] is False
         assert "entities_fts" in result["error"]
+
+
+# ============================================================
+# optimize-fts subcommand tests
+# ============================================================
+
+
+class TestOptimizeFts:
+    """Tests for the optimize-fts subcommand."""
+
+    def test_optimize_merges_segments(self, tmp_path: Path) -> None:
+        """optimize-fts leaves every entity searchable in fewer pages."""
+        db_path = str(tmp_path / "test.db")
+        create_entity_db(db_path, entities=[
+            {"type_id": f"feature:opt-{i:03d}", "name": f"OptimizeTest{i}"}
+            for i in range(40)
+        ])
+        result = run_cli("optimize-fts", db_path)
+        assert result["ok"] is True
+        assert result["fts_entries"] == 40
+        assert result["data_pages_after"] <= result["data_pages_before"]
+
+        conn = sqlite3.connect(db_path)
+        hits = conn.execute(
+            "SELECT COUNT(*) FROM entities_fts WHERE entities_fts MATCH 'OptimizeTest7'"
+        ).fetchone()[0]
+        conn.close()
+        assert hits == 1
+
+    def test_optimize_missing_db(self, tmp_path: Path) -> None:
+        """optimize-fts errors on nonexistent DB without creating it."""
+        missing = tmp_path / "nope.db"
+        result = run_cli("optimize-fts", str(missing), expect_rc=1)
+        assert result["ok"] is False
+        assert not missing.exists()
+
+
+# ============================================================
+# convert-embeddings subcommand tests
+# ============================================================
+
+
+def create_embedded_memory_db(path: str, count: int, dims: int) -> dict:
+    """Create a memory.db through MemoryDatabase with float32 embeddings.
+
+    Returns {entry_id: vector}.
+    """
+    import numpy as np
+
+    sys.path.insert(0, str(
+        Path(__file__).parent.parent / "plugins" / "pd" / "hooks" / "lib"
+    ))
+    from semantic_memory.database import MemoryDatabase
+
+    rng = np.random.default_rng(7)
+    db = MemoryDatabase(path)
+    vectors = {}
+    try:
+        db.set_metadata("embedding_dimensions", str(dims))
+        for i in range(count):
+            entry_id = f"entry-{i:03d}"
+            now = _now_iso()
+            db.upsert_entry({
+                "id": entry_id, "name": f"entry {i}", "description": f"desc {i}",
+                "category": "patterns", "keywords": "[]", "source": "manual",
+                "source_project": "test", "source_hash": f"hash-{i}",
+                "created_at": now, "updated_at": now,
+            })
+            vec = rng.standard_normal(dims).astype(np.float32)
+            vec /= np.linalg.norm(vec)
+            db.update_embedding(entry_id, vec.tobytes())
+            vectors[entry_id] = vec
+    finally:
+        db.close()
+    return vectors
+
+
+class TestConvertEmbeddings:
+    """Tests for the convert-embeddings subcommand."""
+
+    def test_convert_to_int8_and_back(self, tmp_path: Path) -> None:
+        """int8 shrinks every BLOB; converting back restores float32 sizes."""
+        import numpy as np
+
+        db_path = str(tmp_path / "memory.db")
+        vectors = create_embedded_memory_db(db_path, count=12, dims=64)
+
+        result = run_cli(
+            "convert-embeddings", db_path, "--format", "int8", "--batch-size", "5",
+        )
+        assert result["ok"] is True
+        assert result["dims"] == 64
+        assert result["converted"] == 12
+        assert result["skipped"] == 0
+        assert os.path.exists(result["backup_path"])
+
+        conn = sqlite3.connect(db_path)
+        sizes = {r[0] for r in conn.execute("SELECT length(embedding) FROM entries")}
+        storage = conn.execute(
+            "SELECT value FROM _metadata WHERE key = 'embedding_storage'"
+        ).fetchone()[0]
+        conn.close()
+        assert sizes == {64 + 4}
+        assert storage == "int8"
+
+        result = run_cli(
+            "convert-embeddings", db_path, "--format", "float32", "--no-backup",
+        )
+        assert result["converted"] == 12
+        assert result["backup_path"] is None
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute("SELECT id, embedding FROM entries").fetchall()
+        conn.close()
+        for entry_id, blob in rows:
+            restored = np.frombuffer(blob, dtype=np.float32)
+            assert float(restored @ vectors[entry_id]) > 0.99
+
+    def test_convert_is_idempotent(self, tmp_path: Path) -> None:
+        """A second run to the same format rewrites nothing."""
+        db_path = str(tmp_path / "memory.db")
+        create_embedded_memory_db(db_path, count=3, dims=16)
+
+        run_cli("convert-embeddings", db_path, "--format", "float16", "--no-backup")
+        result = run_cli(
+            "convert-embeddings", db_path, "--format", "float16", "--no-backup",
+        )
+        assert result["converted"] == 0
+        assert result["unchanged"] == 3
+
+    def test_convert_missing_db(self, tmp_path: Path) -> None:
+        """convert-embeddings errors on nonexistent DB without creating it."""
+        missing = tmp_path / "nope.db"
+        result = run_cli(
+            "convert-embeddings", str(missing), "--format", "int8", expect_rc=1,
+        )
+        assert result["ok"] is False
+        assert not missing.exists()